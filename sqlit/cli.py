@@ -42,7 +42,7 @@ def _extract_connection_url(argv: list[str]) -> tuple[str | None, list[str]]:
     """
     from sqlit.domains.connections.app.url_parser import is_connection_url
 
-    subcommands = {"connections", "connection", "connect", "query"}
+    subcommands = {"connections", "connection", "connect", "query", "import"}
     result_argv = []
     url = None
 
@@ -458,7 +458,13 @@ def main() -> int:
         add_schema_arguments(provider_parser, schema, include_name=True, name_required=False)
 
     query_parser = subparsers.add_parser("query", help="Execute a SQL query")
-    query_parser.add_argument("--connection", "-c", required=True, help="Connection name to use")
+    query_parser.add_argument(
+        "--connection",
+        "-c",
+        required=True,
+        action="append",
+        help="Connection name to use (repeat to run the query on several connections at once)",
+    )
     query_parser.add_argument("--database", "-d", help="Database to query (overrides connection default)")
     query_parser.add_argument("--query", "-q", help="SQL query to execute")
     query_parser.add_argument("--file", "-f", help="SQL file to execute")
@@ -476,6 +482,43 @@ def main() -> int:
         default=1000,
         help="Maximum rows to fetch (default: 1000, use 0 for unlimited)",
     )
+    query_parser.add_argument(
+        "--limit-pushdown",
+        action="store_true",
+        help="Add the row limit to simple SELECTs so the server stops early",
+    )
+    query_parser.add_argument(
+        "--parallel",
+        "-p",
+        type=int,
+        default=8,
+        help="With several connections, how many to query at once (default: 8)",
+    )
+    query_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=0,
+        help="With several connections, seconds before a connection's query is cancelled (default: 0, no timeout)",
+    )
+
+    import_parser = subparsers.add_parser("import", help="Bulk-load a CSV, Parquet or NDJSON file into a table")
+    import_parser.add_argument("file", help="File to import")
+    import_parser.add_argument("--connection", "-c", required=True, help="Connection name to use")
+    import_parser.add_argument("--table", "-t", required=True, help="Existing table to load into")
+    import_parser.add_argument("--schema", "-s", help="Schema of the target table")
+    import_parser.add_argument("--database", "-d", help="Database to use (overrides connection default)")
+    import_parser.add_argument(
+        "--format",
+        choices=["csv", "parquet", "ndjson"],
+        help="Input format (default: inferred from the file extension)",
+    )
+    import_parser.add_argument("--delimiter", help="CSV field delimiter (default: ',' or tab for .tsv)")
+    import_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=5000,
+        help="Rows per insert batch when rows are streamed (default: 5000)",
+    )
 
     # Docker discovery command
     docker_parser = subparsers.add_parser("docker", help="Docker container discovery")
@@ -539,7 +582,7 @@ def main() -> int:
         cmd_connection_edit,
         cmd_connection_list,
     )
-    from sqlit.domains.query.cli.commands import cmd_query
+    from sqlit.domains.query.cli.commands import cmd_import, cmd_query
 
     if args.command == "connect":
         with startup_span("import_ssmstui"):
@@ -593,6 +636,9 @@ def main() -> int:
     if args.command == "query":
         return cmd_query(args, services=services)
 
+    if args.command == "import":
+        return cmd_import(args, services=services)
+
     if args.command == "docker":
         from sqlit.domains.connections.cli.commands import cmd_docker_list
 
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from sqlit.core.vim import VimMode
 
 
-@dataclass
+@dataclass(frozen=True)
 class InputContext:
     """Snapshot of UI input state for key routing/state evaluation."""
 
@@ -33,3 +33,5 @@ class InputContext:
     last_result_is_error: bool
     has_results: bool
     stacked_result_count: int = 0
+    results_cache_age_s: float | None = None
+    pending_edit_count: int = 0
@@ -29,13 +29,13 @@ def resolve_action(
                 return cmd.binding_action
         return None
 
+    candidates = get_keymap().dispatch_table().candidates.get(key)
+    if not candidates:
+        return None
     contexts = get_binding_contexts(ctx)
-    keymap = get_keymap()
-    for action_key in keymap.get_action_keys():
-        if action_key.key != key:
-            continue
-        if action_key.context is not None and action_key.context not in contexts:
+    for context, action in candidates:
+        if context is not None and context not in contexts:
             continue
-        if is_allowed(action_key.action):
-            return action_key.action
+        if is_allowed(action):
+            return action
     return None
@@ -63,9 +63,48 @@ class ActionKeyDef:
     priority: bool = False  # Whether to give priority to this binding
 
 
+@dataclass(frozen=True)
+class KeyDispatchTable:
+    """Lookup tables compiled once from a keymap's action keys.
+
+    ``candidates`` maps a key to its ``(context, action)`` bindings in keymap
+    order, so resolving a key press only visits the bindings for that key.
+    """
+
+    candidates: dict[str, tuple[tuple[str | None, str], ...]]
+    keys_by_action: dict[str, tuple[str, ...]]
+    primary_keys_by_action: dict[str, tuple[str, ...]]
+
+    @classmethod
+    def compile(cls, action_keys: list[ActionKeyDef]) -> KeyDispatchTable:
+        candidates: dict[str, list[tuple[str | None, str]]] = {}
+        primary: dict[str, list[str]] = {}
+        secondary: dict[str, list[str]] = {}
+        for ak in action_keys:
+            candidates.setdefault(ak.key, []).append((ak.context, ak.action))
+            bucket = primary if ak.primary else secondary
+            keys = bucket.setdefault(ak.action, [])
+            if ak.key not in keys:
+                keys.append(ak.key)
+
+        keys_by_action: dict[str, tuple[str, ...]] = {}
+        for action in {**primary, **secondary}:
+            ordered = list(primary.get(action, []))
+            ordered += [key for key in secondary.get(action, []) if key not in ordered]
+            keys_by_action[action] = tuple(ordered)
+
+        return cls(
+            candidates={key: tuple(entries) for key, entries in candidates.items()},
+            keys_by_action=keys_by_action,
+            primary_keys_by_action={action: tuple(keys) for action, keys in primary.items()},
+        )
+
+
 class KeymapProvider(ABC):
     """Abstract base class for keymap providers."""
 
+    _dispatch_table: KeyDispatchTable | None = None
+
     @abstractmethod
     def get_leader_commands(self) -> list[LeaderCommandDef]:
         """Get all leader command definitions."""
@@ -76,6 +115,12 @@ class KeymapProvider(ABC):
         """Get all regular action key definitions."""
         raise NotImplementedError
 
+    def dispatch_table(self) -> KeyDispatchTable:
+        """Get the compiled key lookup tables, building them on first use."""
+        if self._dispatch_table is None:
+            self._dispatch_table = KeyDispatchTable.compile(self.get_action_keys())
+        return self._dispatch_table
+
     def leader(self, action: str, menu: str | None = "leader") -> str | None:
         """Get the key for a leader command action."""
         for cmd in self.get_leader_commands():
@@ -85,37 +130,20 @@ class KeymapProvider(ABC):
 
     def action(self, action_name: str) -> str | None:
         """Get the key for a regular action."""
-        primary = None
-        fallback = None
-        for ak in self.get_action_keys():
-            if ak.action != action_name:
-                continue
-            if fallback is None:
-                fallback = ak.key
-            if ak.primary and primary is None:
-                primary = ak.key
-        return primary or fallback
+        table = self.dispatch_table()
+        keys = table.primary_keys_by_action.get(action_name) or table.keys_by_action.get(action_name)
+        return keys[0] if keys else None
 
     def keys_for_action(self, action_name: str, *, include_secondary: bool = True) -> list[str]:
         """Get all keys for an action, primary first."""
-        primary_keys: list[str] = []
-        secondary_keys: list[str] = []
-        seen: set[str] = set()
-        for ak in self.get_action_keys():
-            if ak.action != action_name:
-                continue
-            if ak.key in seen:
-                continue
-            seen.add(ak.key)
-            if ak.primary:
-                primary_keys.append(ak.key)
-            elif include_secondary:
-                secondary_keys.append(ak.key)
-        return primary_keys + secondary_keys
+        table = self.dispatch_table()
+        if include_secondary:
+            return list(table.keys_by_action.get(action_name, ()))
+        return list(table.primary_keys_by_action.get(action_name, ()))
 
     def actions_for_key(self, key: str) -> list[str]:
         """Get all actions bound to a key."""
-        return [ak.action for ak in self.get_action_keys() if ak.key == key]
+        return [action for _context, action in self.dispatch_table().candidates.get(key, ())]
 
 
 class DefaultKeymapProvider(KeymapProvider):
@@ -193,6 +221,12 @@ class DefaultKeymapProvider(KeymapProvider):
             # Actions
             LeaderCommandDef("z", "cancel_operation", "Cancel", "Actions", guard="query_executing"),
             LeaderCommandDef("t", "change_theme", "Change Theme", "Actions"),
+            LeaderCommandDef("r", "toggle_results_target", "Query Results", "Actions"),
+            LeaderCommandDef("b", "execute_query_background", "Run in Background", "Actions", guard="has_connection"),
+            LeaderCommandDef("j", "show_query_jobs", "Background Jobs", "Actions"),
+            LeaderCommandDef(
+                "o", "execute_query_fan_out", "Run on Selected", "Actions", guard="has_connection_selection"
+            ),
             LeaderCommandDef("h", "show_help", "Help", "Actions"),
             LeaderCommandDef("space", "telescope", "Telescope", "Actions"),
             LeaderCommandDef("slash", "telescope_filter", "Telescope Search", "Actions"),
@@ -301,6 +335,7 @@ class DefaultKeymapProvider(KeymapProvider):
             ActionKeyDef("v", "exit_tree_visual_mode", "tree_visual", primary=False),
             ActionKeyDef("escape", "clear_connection_selection", "tree"),
             ActionKeyDef("s", "select_table", "tree"),
+            ActionKeyDef("I", "import_table_data", "tree"),
             ActionKeyDef("f", "refresh_tree", "tree"),
             ActionKeyDef("R", "refresh_tree", "tree", primary=False),
             ActionKeyDef("e", "edit_connection", "tree"),
@@ -367,9 +402,19 @@ class DefaultKeymapProvider(KeymapProvider):
             ActionKeyDef("V", "view_cell_full", "results"),
             ActionKeyDef("u", "edit_cell", "results"),
             ActionKeyDef("d", "delete_row", "results"),
+            ActionKeyDef("c", "stage_cell_edit", "results"),
+            ActionKeyDef("X", "stage_row_delete", "results"),
+            ActionKeyDef("ctrl+s", "commit_pending_edits", "results"),
+            ActionKeyDef("U", "discard_pending_edits", "results"),
             ActionKeyDef("y", "results_yank_leader_key", "results"),
             ActionKeyDef("x", "clear_results", "results"),
+            ActionKeyDef("R", "refresh_results", "results"),
+            ActionKeyDef("T", "show_query_timings", "results"),
             ActionKeyDef("slash", "results_filter", "results"),
+            ActionKeyDef("s", "sort_results_column", "results"),
+            ActionKeyDef("S", "results_column_stats", "results"),
+            ActionKeyDef("p", "pin_result", "results"),
+            ActionKeyDef("D", "diff_results", "results"),
             ActionKeyDef("h", "results_cursor_left", "results"),
             ActionKeyDef("j", "results_cursor_down", "results"),
             ActionKeyDef("k", "results_cursor_up", "results"),
@@ -11,6 +11,7 @@ from sqlit.core.keymap import get_keymap
 LEADER_GUARDS: dict[str, Callable[[InputContext], bool]] = {
     "has_connection": lambda ctx: ctx.has_connection,
     "query_executing": lambda ctx: ctx.query_executing,
+    "has_connection_selection": lambda ctx: ctx.tree_multi_select_active,
 }
 
 
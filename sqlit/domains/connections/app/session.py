@@ -77,7 +77,7 @@ class ConnectionSession:
         provider_factory: Optional factory for creating providers.
             Defaults to get_provider from the provider catalog.
             tunnel_factory: Optional factory for creating SSH tunnels.
-                Defaults to create_ssh_tunnel from the connection tunnel module.
+                Defaults to leasing a shared tunnel from the tunnel broker.
 
         Returns:
             A new ConnectionSession instance.
@@ -87,14 +87,14 @@ class ConnectionSession:
             ImportError: If required database driver is not installed.
             Any database-specific connection errors.
         """
-        from sqlit.domains.connections.app.tunnel import create_ssh_tunnel
+        from sqlit.domains.connections.app.tunnel_broker import get_tunnel_broker
         from sqlit.domains.connections.providers.adapter_provider import build_adapter_provider
         from sqlit.domains.connections.providers.catalog import get_provider, get_provider_schema, get_provider_spec
         from sqlit.domains.connections.providers.config_service import normalize_connection_config
         from sqlit.domains.connections.providers.model import DatabaseProvider
 
         get_provider_fn = provider_factory or get_provider
-        create_tunnel_fn = tunnel_factory or create_ssh_tunnel
+        create_tunnel_fn = tunnel_factory or get_tunnel_broker().acquire
 
         config = normalize_connection_config(config)
 
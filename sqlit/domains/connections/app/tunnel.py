@@ -26,47 +26,51 @@ def ensure_ssh_tunnel_available() -> None:
         ) from e
 
 
-def create_ssh_tunnel(config: ConnectionConfig) -> tuple[Any, str, int]:
-    """Create an SSH tunnel for the connection if SSH is enabled.
+def start_ssh_forwarder(config: ConnectionConfig, *, keepalive_s: float | None = None) -> Any:
+    """Start an SSH port forwarder to the config's database endpoint.
+
+    Args:
+        config: Connection config with an enabled tunnel and a TCP endpoint.
+        keepalive_s: Interval for SSH keepalive packets, or None for the
+            sshtunnel default.
 
     Returns:
-        Tuple of (tunnel_object, local_host, local_port) if SSH enabled,
-        or (None, original_server, original_port) if SSH not enabled.
+        The started ``SSHTunnelForwarder``.
     """
-    endpoint = config.tcp_endpoint
-    if endpoint is None:
-        return None, "", 0
-    if not config.tunnel or not config.tunnel.enabled:
-        port = int(endpoint.port) if endpoint.port else 0
-        return None, endpoint.host, port
-
     ensure_ssh_tunnel_available()
 
     from sshtunnel import SSHTunnelForwarder
 
+    endpoint = config.tcp_endpoint
+    tunnel_config = config.tunnel
+    assert endpoint is not None and tunnel_config is not None
+
     # Parse remote database host and port
     remote_host = endpoint.host
     remote_port = int(endpoint.port) if endpoint.port else 0
 
     # SSH connection settings
-    ssh_host = config.tunnel.host
-    ssh_port = int(config.tunnel.port) if config.tunnel.port else 22
-    ssh_username = config.tunnel.username
+    ssh_host = tunnel_config.host
+    ssh_port = int(tunnel_config.port) if tunnel_config.port else 22
+    ssh_username = tunnel_config.username
 
     # Build SSH auth kwargs
     ssh_kwargs: dict[str, Any] = {
         "ssh_username": ssh_username,
     }
 
-    if config.tunnel.auth_type == "key":
+    if tunnel_config.auth_type == "key":
         # Expand ~ in path
-        key_path = os.path.expanduser(config.tunnel.key_path)
+        key_path = os.path.expanduser(tunnel_config.key_path)
         if Path(key_path).exists():
             ssh_kwargs["ssh_pkey"] = key_path
         else:
             raise ValueError(f"SSH key file not found: {key_path}")
     else:
-        ssh_kwargs["ssh_password"] = config.tunnel.password
+        ssh_kwargs["ssh_password"] = tunnel_config.password
+
+    if keepalive_s is not None:
+        ssh_kwargs["set_keepalive"] = keepalive_s
 
     # Create tunnel
     tunnel = SSHTunnelForwarder(
@@ -75,7 +79,24 @@ def create_ssh_tunnel(config: ConnectionConfig) -> tuple[Any, str, int]:
         **ssh_kwargs,
     )
     tunnel.start()
+    return tunnel
+
+
+def create_ssh_tunnel(config: ConnectionConfig) -> tuple[Any, str, int]:
+    """Create an SSH tunnel for the connection if SSH is enabled.
+
+    Returns:
+        Tuple of (tunnel_object, local_host, local_port) if SSH enabled,
+        or (None, original_server, original_port) if SSH not enabled.
+    """
+    endpoint = config.tcp_endpoint
+    if endpoint is None:
+        return None, "", 0
+    if not config.tunnel or not config.tunnel.enabled:
+        port = int(endpoint.port) if endpoint.port else 0
+        return None, endpoint.host, port
 
+    tunnel = start_ssh_forwarder(config)
     return tunnel, "127.0.0.1", tunnel.local_bind_port
 
 
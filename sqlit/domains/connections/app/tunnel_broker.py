@@ -0,0 +1,283 @@
+"""Shared, reference-counted SSH tunnels.
+
+Opening an SSH tunnel costs a TCP connect, key exchange and authentication.
+The broker keeps one tunnel per SSH target and database endpoint, hands out
+leases to sessions, queries and the process worker, and keeps a tunnel open
+for an idle period after its last lease is released, so reconnecting or
+switching back to a connection reuses it.
+
+Tunnels listen on 127.0.0.1, so the process worker can connect through a
+tunnel owned by the UI process given just the local port.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sqlit.domains.connections.domain.config import ConnectionConfig
+
+# Seconds an unused tunnel stays open before it is closed.
+DEFAULT_TUNNEL_IDLE_TTL_S = 300.0
+# Seconds between SSH keepalive packets on brokered tunnels.
+DEFAULT_TUNNEL_KEEPALIVE_S = 30.0
+
+LOCAL_TUNNEL_HOST = "127.0.0.1"
+
+TunnelStarter = Callable[["ConnectionConfig", float], Any]
+
+
+def tunnel_key(config: ConnectionConfig) -> tuple[Any, ...] | None:
+    """Identity of the tunnel a config needs, or None when it has no tunnel."""
+    tunnel = config.tunnel
+    endpoint = config.tcp_endpoint
+    if tunnel is None or not tunnel.enabled or endpoint is None:
+        return None
+    return (
+        tunnel.host,
+        tunnel.port,
+        tunnel.username,
+        tunnel.auth_type,
+        tunnel.password,
+        tunnel.key_path,
+        endpoint.host,
+        endpoint.port,
+    )
+
+
+def _default_starter(config: ConnectionConfig, keepalive_s: float) -> Any:
+    from sqlit.domains.connections.app.tunnel import start_ssh_forwarder
+
+    return start_ssh_forwarder(config, keepalive_s=keepalive_s)
+
+
+def _forwarder_is_active(forwarder: Any) -> bool:
+    try:
+        return bool(getattr(forwarder, "is_active", True))
+    except Exception:
+        return False
+
+
+def _stop_forwarder(forwarder: Any) -> None:
+    try:
+        forwarder.stop()
+    except Exception:
+        pass
+
+
+@dataclass
+class _BrokeredTunnel:
+    key: tuple[Any, ...]
+    forwarder: Any
+    local_port: int
+    refs: int = 0
+    idle_since: float | None = None
+
+
+@dataclass
+class TunnelBrokerStats:
+    """Counters for tunnel reuse."""
+
+    started: int = 0
+    reused: int = 0
+    expired: int = 0
+
+
+class TunnelLease:
+    """A handle on a brokered tunnel.
+
+    Mirrors the parts of ``SSHTunnelForwarder`` that callers use, so a lease
+    can stand in for a tunnel: ``stop()`` releases the lease rather than
+    closing the shared tunnel.
+    """
+
+    def __init__(self, broker: TunnelBroker, entry: _BrokeredTunnel) -> None:
+        self._broker = broker
+        self._entry = entry
+        self._released = False
+
+    @property
+    def local_bind_host(self) -> str:
+        return LOCAL_TUNNEL_HOST
+
+    @property
+    def local_bind_port(self) -> int:
+        return self._entry.local_port
+
+    @property
+    def local_bind_address(self) -> tuple[str, int]:
+        return LOCAL_TUNNEL_HOST, self._entry.local_port
+
+    @property
+    def is_active(self) -> bool:
+        return not self._released and _forwarder_is_active(self._entry.forwarder)
+
+    def stop(self) -> None:
+        """Release the lease. Safe to call more than once."""
+        if self._released:
+            return
+        self._released = True
+        self._broker._release(self._entry)
+
+
+class TunnelBroker:
+    """Hands out shared SSH tunnels keyed by ``tunnel_key``.
+
+    Usage:
+        broker = get_tunnel_broker()
+        lease, host, port = broker.acquire(config)
+        ...
+        if lease:
+            lease.stop()
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_ttl_s: float = DEFAULT_TUNNEL_IDLE_TTL_S,
+        keepalive_s: float = DEFAULT_TUNNEL_KEEPALIVE_S,
+        start_tunnel: TunnelStarter | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.idle_ttl_s = idle_ttl_s
+        self.keepalive_s = keepalive_s
+        self.stats = TunnelBrokerStats()
+        self._start_tunnel = start_tunnel or _default_starter
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[Any, ...], _BrokeredTunnel] = {}
+        self._starting: dict[tuple[Any, ...], threading.Lock] = {}
+        self._prune_timer: threading.Timer | None = None
+        self._closed = False
+
+    def acquire(self, config: ConnectionConfig) -> tuple[TunnelLease | None, str, int]:
+        """Lease a tunnel for ``config``.
+
+        Matches the ``tunnel_factory`` signature: returns (lease, host, port),
+        or (None, original host, original port) when SSH is not enabled.
+        """
+        endpoint = config.tcp_endpoint
+        if endpoint is None:
+            return None, "", 0
+        key = tunnel_key(config)
+        if key is None:
+            port = int(endpoint.port) if endpoint.port else 0
+            return None, endpoint.host, port
+
+        with self._lock:
+            start_lock = self._starting.setdefault(key, threading.Lock())
+
+        # One handshake per key; other keys are not blocked meanwhile.
+        with start_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and _forwarder_is_active(entry.forwarder):
+                    entry.refs += 1
+                    entry.idle_since = None
+                    self.stats.reused += 1
+                    return TunnelLease(self, entry), LOCAL_TUNNEL_HOST, entry.local_port
+                stale = self._entries.pop(key, None)
+            if stale is not None:
+                _stop_forwarder(stale.forwarder)
+
+            forwarder = self._start_tunnel(config, self.keepalive_s)
+            entry = _BrokeredTunnel(key=key, forwarder=forwarder, local_port=int(forwarder.local_bind_port), refs=1)
+            with self._lock:
+                self._entries[key] = entry
+                self.stats.started += 1
+            return TunnelLease(self, entry), LOCAL_TUNNEL_HOST, entry.local_port
+
+    def _release(self, entry: _BrokeredTunnel) -> None:
+        with self._lock:
+            entry.refs = max(0, entry.refs - 1)
+            if entry.refs:
+                return
+            if self.idle_ttl_s <= 0 or self._closed:
+                if self._entries.get(entry.key) is entry:
+                    del self._entries[entry.key]
+                expired = True
+            else:
+                entry.idle_since = self._clock()
+                expired = False
+        if expired:
+            _stop_forwarder(entry.forwarder)
+        else:
+            self._schedule_prune()
+
+    def prune(self) -> int:
+        """Close tunnels that have been idle longer than the TTL."""
+        now = self._clock()
+        with self._lock:
+            expired = [
+                entry
+                for entry in self._entries.values()
+                if entry.refs == 0 and entry.idle_since is not None and now - entry.idle_since >= self.idle_ttl_s
+            ]
+            for entry in expired:
+                del self._entries[entry.key]
+            self.stats.expired += len(expired)
+        for entry in expired:
+            _stop_forwarder(entry.forwarder)
+        return len(expired)
+
+    def _schedule_prune(self) -> None:
+        with self._lock:
+            if self._prune_timer is not None or self._closed:
+                return
+            timer = threading.Timer(self.idle_ttl_s, self._run_scheduled_prune)
+            timer.daemon = True
+            self._prune_timer = timer
+        timer.start()
+
+    def _run_scheduled_prune(self) -> None:
+        with self._lock:
+            self._prune_timer = None
+        self.prune()
+        with self._lock:
+            has_idle = any(entry.refs == 0 for entry in self._entries.values())
+        if has_idle:
+            self._schedule_prune()
+
+    @property
+    def open_tunnels(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def close_all(self) -> None:
+        """Close every tunnel, including leased ones."""
+        with self._lock:
+            self._closed = True
+            entries = list(self._entries.values())
+            self._entries.clear()
+            timer = self._prune_timer
+            self._prune_timer = None
+        if timer is not None:
+            timer.cancel()
+        for entry in entries:
+            _stop_forwarder(entry.forwarder)
+
+
+_broker: TunnelBroker | None = None
+_broker_lock = threading.Lock()
+
+
+def get_tunnel_broker() -> TunnelBroker:
+    """Get the process-wide tunnel broker."""
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = TunnelBroker()
+        return _broker
+
+
+def close_tunnel_broker() -> None:
+    """Close all brokered tunnels and drop the process-wide broker."""
+    global _broker
+    with _broker_lock:
+        broker, _broker = _broker, None
+    if broker is not None:
+        broker.close_all()
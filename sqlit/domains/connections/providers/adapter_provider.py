@@ -92,6 +92,7 @@ def build_adapter_provider(spec: ProviderSpec, schema: ConnectionSchema, adapter
         supports_sequences=bool(getattr(adapter, "supports_sequences", False)),
         default_schema=str(getattr(adapter, "default_schema", "")),
         system_databases=frozenset(getattr(adapter, "system_databases", frozenset())),
+        supports_multi_row_insert=bool(getattr(adapter, "supports_multi_row_insert", False)),
     )
 
     def display_info(config: ConnectionConfig) -> str:
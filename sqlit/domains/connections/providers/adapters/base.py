@@ -7,6 +7,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from .cancel import ActiveCursors
+from .fetch import INITIAL_FETCH_BATCH_ROWS, apply_fetch_hints, fetch_rows
+
 if TYPE_CHECKING:
     from sqlit.domains.connections.domain.config import ConnectionConfig
 
@@ -36,6 +39,14 @@ def resolve_file_path(path_str: str) -> Path:
     return file_path.resolve()
 
 
+def prefix_unless_short(column: str, prefix: str, size: str, length: int) -> str:
+    """Return ``prefix`` for values longer than ``length`` and ``column`` itself otherwise.
+
+    Used by ``lob_preview_expressions`` so short values keep their type.
+    """
+    return f"CASE WHEN {size} > {length} THEN {prefix} ELSE {column} END"
+
+
 @dataclass
 class ColumnInfo:
     """Information about a database column."""
@@ -78,8 +89,13 @@ class DatabaseAdapter(ABC):
 
     Adapters handle database connectivity and introspection.
     Connection schema/metadata is defined in provider schema modules.
+    Adapters whose driver cancels per cursor register the executing cursor
+    in ``_active_cursors`` so ``cancel_query`` can reach it from another
+    thread.
     """
 
+    _active_cursors = ActiveCursors()
+
     @property
     def driver_import_names(self) -> tuple[str, ...]:
         """Import names used to verify required driver dependencies are installed."""
@@ -194,6 +210,14 @@ class DatabaseAdapter(ABC):
         """
         return False
 
+    @property
+    def supports_multi_row_insert(self) -> bool:
+        """Whether INSERT ... VALUES accepts several row tuples in one statement.
+
+        Override in subclasses. Defaults to False since some dialects (Oracle, Firebird) lack it.
+        """
+        return False
+
     @property
     def test_query(self) -> str:
         """A simple query to test the connection.
@@ -424,6 +448,14 @@ class DatabaseAdapter(ABC):
         """
         pass
 
+    def apply_row_limit(self, query: str, limit: int, select_end: int | None) -> str | None:
+        """Append a LIMIT clause to a top-level SELECT.
+
+        Override for dialects that spell the limit differently, see
+        ``RowLimitDialect``.
+        """
+        return f"{query}\nLIMIT {limit}"
+
     @abstractmethod
     def execute_query(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[list[str], list[tuple], bool]:
         """Execute a query and return (columns, rows, truncated).
@@ -449,30 +481,26 @@ class CursorBasedAdapter(DatabaseAdapter):
     """Base class for adapters using cursor-based execution (most SQL databases).
 
     Provides common implementations for execute_query and execute_non_query.
+    Rows are fetched in adaptive, byte-budgeted batches (see ``fetch.py``).
     """
 
     def execute_query(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[list[str], list[tuple], bool]:
         """Execute a query using cursor-based approach with optional row limit."""
         cursor = conn.cursor()
-        cursor.execute(query)
-        if cursor.description:
-            columns = [col[0] for col in cursor.description]
-            if max_rows is not None:
-                # Fetch one extra row to detect if there are more
-                rows = cursor.fetchmany(max_rows + 1)
-                truncated = len(rows) > max_rows
-                if truncated:
-                    rows = rows[:max_rows]
-            else:
-                rows = cursor.fetchall()
-                truncated = False
-            return columns, [tuple(row) for row in rows], truncated
+        apply_fetch_hints(cursor, INITIAL_FETCH_BATCH_ROWS)
+        with self._active_cursors.tracking(conn, cursor):
+            cursor.execute(query)
+            if cursor.description:
+                columns = [col[0] for col in cursor.description]
+                rows, truncated = fetch_rows(cursor, max_rows)
+                return columns, rows, truncated
         return [], [], False
 
     def execute_non_query(self, conn: Any, query: str) -> int:
         """Execute a non-query using cursor-based approach."""
         cursor = conn.cursor()
-        cursor.execute(query)
+        with self._active_cursors.tracking(conn, cursor):
+            cursor.execute(query)
         rowcount = int(cursor.rowcount)
         conn.commit()
         return rowcount
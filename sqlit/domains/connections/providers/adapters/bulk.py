@@ -0,0 +1,121 @@
+"""Helpers for bulk-loading rows through DB-API drivers.
+
+Adapters use these to implement ``RowBulkLoader``: building parameterized
+INSERTs for the driver's paramstyle, running ``executemany`` over streamed
+batches in a single transaction, and exposing batches as a CSV stream for
+COPY-style loaders.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+
+def driver_paramstyle(conn: Any, default: str = "qmark") -> str:
+    """DB-API ``paramstyle`` of the driver module that created ``conn``."""
+    module = sys.modules.get(type(conn).__module__.split(".")[0])
+    return str(getattr(module, "paramstyle", default))
+
+
+def insert_placeholders(paramstyle: str, count: int) -> str:
+    """Comma-separated positional placeholders for ``count`` parameters."""
+    if paramstyle in ("format", "pyformat"):
+        return ", ".join(["%s"] * count)
+    if paramstyle in ("numeric", "named"):
+        return ", ".join(f":{i}" for i in range(1, count + 1))
+    return ", ".join(["?"] * count)
+
+
+def build_insert_sql(table: str, quoted_columns: Sequence[str], paramstyle: str) -> str:
+    """Parameterized single-row INSERT for ``executemany``."""
+    cols = ", ".join(quoted_columns)
+    return f"INSERT INTO {table} ({cols}) VALUES ({insert_placeholders(paramstyle, len(quoted_columns))})"
+
+
+def executemany_batches(
+    conn: Any,
+    sql: str,
+    batches: Iterable[Sequence[Sequence[Any]]],
+    *,
+    prepare_cursor: Any = None,
+) -> int:
+    """Run ``executemany`` for each batch and commit once at the end.
+
+    Rolls back and re-raises if any batch fails.
+    """
+    cursor = conn.cursor()
+    if prepare_cursor is not None:
+        prepare_cursor(cursor)
+    total = 0
+    try:
+        for batch in batches:
+            if not batch:
+                continue
+            cursor.executemany(sql, batch)
+            total += len(batch)
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        raise
+    return total
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    return value
+
+
+class CsvBatchStream(io.RawIOBase):
+    """Readable byte stream that renders row batches as CSV on demand.
+
+    NULLs are written as unquoted empty fields, which PostgreSQL's
+    ``COPY ... (FORMAT csv)`` reads as NULL.
+    """
+
+    def __init__(self, batches: Iterable[Sequence[Sequence[Any]]]) -> None:
+        super().__init__()
+        self._batches: Iterator[Sequence[Sequence[Any]]] = iter(batches)
+        self._buffer = b""
+        self._pos = 0
+        self.rows = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def _render(self, batch: Sequence[Sequence[Any]]) -> bytes:
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerows([_csv_value(value) for value in row] for row in batch)
+        self.rows += len(batch)
+        return out.getvalue().encode("utf-8")
+
+    def read(self, size: int = -1) -> bytes:
+        available = len(self._buffer) - self._pos
+        while size < 0 or available < size:
+            batch = next(self._batches, None)
+            if batch is None:
+                break
+            self._buffer = self._buffer[self._pos :] + self._render(batch)
+            self._pos = 0
+            available = len(self._buffer)
+        if size < 0 or size > available:
+            size = available
+        chunk = self._buffer[self._pos : self._pos + size]
+        self._pos += size
+        return chunk
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
@@ -0,0 +1,49 @@
+"""Helpers for cancelling a running statement from another thread.
+
+Adapters implement ``QueryCanceller`` with these. Drivers that cancel at the
+connection level (psycopg2, oracledb, sqlite3, duckdb) need nothing extra;
+drivers that cancel a cursor or a server-side query ID need to know which
+cursor is executing, so adapters register it in ``ActiveCursors`` while a
+statement runs.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+
+class ActiveCursors:
+    """The cursor currently executing on each connection."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cursors: dict[int, Any] = {}
+
+    @contextmanager
+    def tracking(self, conn: Any, cursor: Any) -> Iterator[Any]:
+        """Register ``cursor`` as running on ``conn`` for the duration of the block."""
+        key = id(conn)
+        with self._lock:
+            self._cursors[key] = cursor
+        try:
+            yield cursor
+        finally:
+            with self._lock:
+                if self._cursors.get(key) is cursor:
+                    del self._cursors[key]
+
+    def get(self, conn: Any) -> Any | None:
+        with self._lock:
+            return self._cursors.get(id(conn))
+
+
+def call_cancel(target: Any, method: str = "cancel") -> bool:
+    """Call ``target.<method>()`` if the driver provides it; True if it was called."""
+    cancel = getattr(target, method, None) if target is not None else None
+    if not callable(cancel):
+        return False
+    cancel()
+    return True
@@ -0,0 +1,202 @@
+"""Adaptive batched fetching for DB-API cursors.
+
+Rows are pulled with ``fetchmany`` in batches sized from the measured width
+of the rows already fetched, so a batch stays within a byte budget: wide rows
+(JSON documents, LOBs) get small batches, narrow rows get large ones.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlit.shared.core.columnar_rows import ColumnarRows, ColumnarRowsBuilder
+from sqlit.shared.core.debug_events import emit_debug_event
+from sqlit.shared.core.query_timing import record_query_span
+
+DEFAULT_FETCH_BUDGET_BYTES = 8 * 1024 * 1024
+INITIAL_FETCH_BATCH_ROWS = 256
+MIN_FETCH_BATCH_ROWS = 16
+MAX_FETCH_BATCH_ROWS = 50_000
+
+# Rows sampled per batch when estimating row width.
+_ROW_SAMPLE_SIZE = 32
+# Weight of the newest batch in the running bytes-per-row estimate.
+_ESTIMATE_SMOOTHING = 0.5
+# Cursor attributes drivers read as fetch-size hints:
+# arraysize (DB-API, oracledb, mssql-python, pyodbc), prefetchrows (oracledb)
+# and itersize (psycopg2 named cursors).
+_FETCH_HINT_ATTRS = ("arraysize", "prefetchrows", "itersize")
+
+
+def estimate_value_bytes(value: Any) -> int:
+    """Approximate in-memory size of a single cell value."""
+    if value is None:
+        return 8
+    if isinstance(value, (str, bytes, bytearray)):
+        return 33 + len(value)
+    if isinstance(value, memoryview):
+        return 33 + value.nbytes
+    if isinstance(value, (bool, int, float)):
+        return 28
+    try:
+        return sys.getsizeof(value)
+    except TypeError:
+        return 64
+
+
+def estimate_row_bytes(rows: Sequence[Sequence[Any]]) -> float:
+    """Estimate the average size of a row from an evenly spaced sample."""
+    if not rows:
+        return 0.0
+    step = max(1, len(rows) // _ROW_SAMPLE_SIZE)
+    sample = rows[::step][:_ROW_SAMPLE_SIZE]
+    total = 0
+    for row in sample:
+        total += 56 + 8 * len(row) + sum(estimate_value_bytes(value) for value in row)
+    return total / len(sample)
+
+
+@dataclass
+class FetchStats:
+    """Throughput of a single fetch."""
+
+    rows: int = 0
+    batches: int = 0
+    bytes: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def as_debug_data(self) -> dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "batches": self.batches,
+            "bytes": self.bytes,
+            "elapsed_ms": round(self.elapsed_s * 1000, 2),
+            "rows_per_s": round(self.rows_per_second, 1),
+            "mb_per_s": round(self.bytes_per_second / (1024 * 1024), 2),
+        }
+
+
+class AdaptiveFetchPlanner:
+    """Chooses fetchmany batch sizes from a byte budget and observed row width."""
+
+    def __init__(
+        self,
+        budget_bytes: int = DEFAULT_FETCH_BUDGET_BYTES,
+        *,
+        initial_rows: int = INITIAL_FETCH_BATCH_ROWS,
+        min_rows: int = MIN_FETCH_BATCH_ROWS,
+        max_rows: int = MAX_FETCH_BATCH_ROWS,
+    ) -> None:
+        self.budget_bytes = max(1, int(budget_bytes))
+        self.min_rows = max(1, int(min_rows))
+        self.max_rows = max(self.min_rows, int(max_rows))
+        self.batch_rows = min(self.max_rows, max(self.min_rows, int(initial_rows)))
+        self.bytes_per_row: float | None = None
+
+    def next_batch_size(self, remaining: int | None = None) -> int:
+        """Rows to request next, capped by the rows still wanted."""
+        if remaining is not None:
+            return max(1, min(self.batch_rows, remaining))
+        return self.batch_rows
+
+    def observe(self, batch: Sequence[Sequence[Any]]) -> float:
+        """Update the row-width estimate from a fetched batch.
+
+        Returns the estimated size of the batch in bytes.
+        """
+        if not batch:
+            return 0.0
+        row_bytes = estimate_row_bytes(batch)
+        if self.bytes_per_row is None:
+            self.bytes_per_row = row_bytes
+        else:
+            self.bytes_per_row += _ESTIMATE_SMOOTHING * (row_bytes - self.bytes_per_row)
+        target = int(self.budget_bytes / max(self.bytes_per_row, 1.0))
+        self.batch_rows = min(self.max_rows, max(self.min_rows, target))
+        return row_bytes * len(batch)
+
+
+def apply_fetch_hints(cursor: Any, batch_rows: int) -> None:
+    """Tell the driver how many rows to transfer per round trip.
+
+    Call before ``execute`` so hints read at execute time (oracledb's
+    ``prefetchrows``) take effect. Drivers without a given attribute, or that
+    reject it, are left alone.
+    """
+    for attr in _FETCH_HINT_ATTRS:
+        if not hasattr(cursor, attr):
+            continue
+        try:
+            setattr(cursor, attr, batch_rows)
+        except Exception:
+            pass
+
+
+def iter_fetch_batches(
+    cursor: Any,
+    *,
+    limit: int | None = None,
+    planner: AdaptiveFetchPlanner | None = None,
+    stats: FetchStats | None = None,
+) -> Iterator[list[Any]]:
+    """Yield row batches from ``cursor.fetchmany`` until exhausted or ``limit`` rows."""
+    planner = planner or AdaptiveFetchPlanner()
+    stats = stats if stats is not None else FetchStats()
+    start = time.perf_counter()
+    try:
+        while True:
+            remaining = None if limit is None else limit - stats.rows
+            if remaining is not None and remaining <= 0:
+                return
+            batch = cursor.fetchmany(planner.next_batch_size(remaining))
+            if not batch:
+                return
+            batch = list(batch)
+            stats.rows += len(batch)
+            stats.batches += 1
+            stats.bytes += int(planner.observe(batch))
+            stats.elapsed_s = time.perf_counter() - start
+            apply_fetch_hints(cursor, planner.batch_rows)
+            yield batch
+    finally:
+        stats.elapsed_s = time.perf_counter() - start
+
+
+def fetch_rows(
+    cursor: Any,
+    max_rows: int | None = None,
+    *,
+    planner: AdaptiveFetchPlanner | None = None,
+    stats: FetchStats | None = None,
+) -> tuple[ColumnarRows, bool]:
+    """Fetch up to max_rows rows from an executed cursor in adaptive batches.
+
+    Batches go straight into a compact column-wise container; no per-row
+    tuples are kept.
+
+    Returns:
+        Tuple of (rows, was_truncated).
+    """
+    stats = stats if stats is not None else FetchStats()
+    limit = None if max_rows is None else max_rows + 1
+    builder = ColumnarRowsBuilder()
+    for batch in iter_fetch_batches(cursor, limit=limit, planner=planner, stats=stats):
+        builder.extend(batch)
+    truncated = max_rows is not None and len(builder) > max_rows
+    if truncated and max_rows is not None:
+        builder.truncate(max_rows)
+    emit_debug_event("query.fetch", category="query", truncated=truncated, **stats.as_debug_data())
+    record_query_span("fetch", stats.elapsed_s * 1000)
+    return builder.build(), truncated
@@ -0,0 +1,75 @@
+"""Helpers for adapters that can return results as Arrow tables."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+
+def read_record_batches(
+    batches: Iterable[Any],
+    schema: Any,
+    max_rows: int | None = None,
+) -> tuple[Any, bool]:
+    """Collect record batches into a table, stopping once max_rows is exceeded.
+
+    Batches are consumed lazily, so a limited result never pulls more than
+    ``max_rows + 1`` rows (plus the remainder of the batch the limit falls in)
+    from the driver.
+
+    Args:
+        batches: Iterable of pyarrow RecordBatches (or Tables).
+        schema: Arrow schema used when no batches arrive (None if unknown).
+        max_rows: Maximum rows to keep. None means no limit.
+
+    Returns:
+        Tuple of (arrow_table, was_truncated).
+    """
+    import pyarrow as pa
+
+    collected: list[Any] = []
+    fetched = 0
+    for batch in batches:
+        if batch.num_rows == 0:
+            continue
+        if isinstance(batch, pa.Table):
+            collected.extend(batch.to_batches())
+        else:
+            collected.append(batch)
+        fetched += batch.num_rows
+        if max_rows is not None and fetched > max_rows:
+            break
+
+    if collected:
+        schema = collected[0].schema
+    if schema is None:
+        return pa.table({}), False
+    table = pa.Table.from_batches(collected, schema=schema)
+    if max_rows is not None and fetched > max_rows:
+        return table.slice(0, max_rows), True
+    return table, False
+
+
+def empty_arrow_table(columns: list[str] | None = None) -> Any:
+    """Build an empty Arrow table with the given (null-typed) columns."""
+    import pyarrow as pa
+
+    names = list(columns or [])
+    return pa.Table.from_arrays([pa.array([], type=pa.null()) for _ in names], names=names)
+
+
+def arrow_table_from_rows(columns: list[str], rows: Sequence[tuple]) -> Any:
+    """Build an Arrow table from row tuples, casting mixed columns to strings."""
+    import pyarrow as pa
+
+    column_values = getattr(rows, "column_values", None)
+    arrays = []
+    for idx in range(len(columns)):
+        values = column_values(idx) if column_values is not None else [row[idx] for row in rows]
+        try:
+            arrays.append(pa.array(values))
+        except (TypeError, ValueError, pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays.append(pa.array([str(v) if v is not None else None for v in values], type=pa.string()))
+    if not arrays:
+        return pa.table({})
+    return pa.Table.from_arrays(arrays, names=list(columns))
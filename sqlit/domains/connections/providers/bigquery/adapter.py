@@ -13,6 +13,7 @@ from sqlit.domains.connections.providers.adapters.base import (
     TableInfo,
     TriggerInfo,
 )
+from sqlit.domains.connections.providers.adapters.fetch import INITIAL_FETCH_BATCH_ROWS, apply_fetch_hints, fetch_rows
 
 if TYPE_CHECKING:
     from google.cloud import bigquery
@@ -191,33 +192,29 @@ class BigQueryAdapter(CursorBasedAdapter):
     def execute_query(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[list[str], list[tuple], bool]:
         """Execute a query with optional default dataset configuration."""
         cursor = conn.cursor()
+        apply_fetch_hints(cursor, INITIAL_FETCH_BATCH_ROWS)
         job_config = self._get_connection_job_config(conn)
-        if job_config is not None:
-            cursor.execute(query, job_config=job_config)
-        else:
-            cursor.execute(query)
-
-        if cursor.description:
-            columns = [col[0] for col in cursor.description]
-            if max_rows is not None:
-                rows = cursor.fetchmany(max_rows + 1)
-                truncated = len(rows) > max_rows
-                if truncated:
-                    rows = rows[:max_rows]
+        with self._active_cursors.tracking(conn, cursor):
+            if job_config is not None:
+                cursor.execute(query, job_config=job_config)
             else:
-                rows = cursor.fetchall()
-                truncated = False
-            return columns, [tuple(row) for row in rows], truncated
+                cursor.execute(query)
+
+            if cursor.description:
+                columns = [col[0] for col in cursor.description]
+                rows, truncated = fetch_rows(cursor, max_rows)
+                return columns, rows, truncated
         return [], [], False
 
     def execute_non_query(self, conn: Any, query: str) -> int:
         """Execute a non-query statement for BigQuery."""
         cursor = conn.cursor()
         job_config = self._get_connection_job_config(conn)
-        if job_config is not None:
-            cursor.execute(query, job_config=job_config)
-        else:
-            cursor.execute(query)
+        with self._active_cursors.tracking(conn, cursor):
+            if job_config is not None:
+                cursor.execute(query, job_config=job_config)
+            else:
+                cursor.execute(query)
 
         rowcount = int(getattr(cursor, "rowcount", -1) or -1)
         commit = getattr(conn, "commit", None)
@@ -228,6 +225,56 @@ class BigQueryAdapter(CursorBasedAdapter):
                 pass
         return rowcount
 
+    def cancel_query(self, conn: Any, config: ConnectionConfig) -> bool:
+        """Cancel the job the executing DB-API cursor is waiting on."""
+        job = getattr(self._active_cursors.get(conn), "_query_job", None)
+        if job is None:
+            return False
+        job.cancel()
+        return True
+
+    def _get_job(self, conn: Any, handle: dict[str, str]) -> Any:
+        client = self._get_client(conn)
+        if client is None:
+            raise RuntimeError("BigQuery connection has no client")
+        return client.get_job(handle["job_id"], location=handle.get("location") or None)
+
+    def submit_job(self, conn: Any, query: str) -> dict[str, str]:
+        """Start ``query`` as a BigQuery job and return its job ID and location."""
+        client = self._get_client(conn)
+        if client is None:
+            raise RuntimeError("BigQuery connection has no client")
+        job_config = self._get_connection_job_config(conn)
+        job = client.query(query, job_config=job_config) if job_config is not None else client.query(query)
+        return {"job_id": str(job.job_id), "location": str(job.location or "")}
+
+    def poll_job(self, conn: Any, handle: dict[str, str]) -> str | None:
+        """Return the job state, with completed query plan stages when known."""
+        job = self._get_job(conn, handle)
+        if job.state == "DONE":
+            return None
+        stages = list(getattr(job, "query_plan", None) or [])
+        if stages:
+            done = sum(1 for stage in stages if getattr(stage, "status", "") == "COMPLETE")
+            return f"{str(job.state).lower()} {done}/{len(stages)} stages"
+        return str(job.state).lower()
+
+    def fetch_job(
+        self, conn: Any, handle: dict[str, str], max_rows: int | None = None
+    ) -> tuple[list[str], list[tuple], bool]:
+        job = self._get_job(conn, handle)
+        result = job.result(max_results=max_rows + 1 if max_rows is not None else None)
+        columns = [field.name for field in result.schema or []]
+        if not columns:
+            return [], [], False
+        rows = [tuple(row.values()) for row in result]
+        truncated = max_rows is not None and len(rows) > max_rows
+        return columns, rows[:max_rows] if truncated else rows, truncated
+
+    def cancel_job(self, conn: Any, handle: dict[str, str]) -> bool:
+        self._get_job(conn, handle).cancel()
+        return True
+
     def _resolve_dataset(self, conn: Any, database: str | None, schema: str | None) -> str | None:
         if database:
             return database
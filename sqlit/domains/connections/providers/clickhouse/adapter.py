@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from sqlit.domains.connections.providers.adapters.base import (
@@ -64,6 +65,10 @@ class ClickHouseAdapter(DatabaseAdapter):
         # ClickHouse doesn't have traditional stored procedures
         return False
 
+    @property
+    def supports_multi_row_insert(self) -> bool:
+        return True
+
     def apply_database_override(self, config: ConnectionConfig, database: str) -> ConnectionConfig:
         """Apply a default database for unqualified queries."""
         if not database:
@@ -295,6 +300,20 @@ class ClickHouseAdapter(DatabaseAdapter):
             return f"SELECT * FROM {quoted_db}.{quoted_table} LIMIT {limit}"
         return f"SELECT * FROM {quoted_table} LIMIT {limit}"
 
+    def _limit_query(self, query: str, max_rows: int | None) -> str:
+        """Append LIMIT max_rows + 1 to simple SELECTs without their own limit.
+
+        This is more efficient than fetching all rows and truncating.
+        """
+        if max_rows is None:
+            return query
+        query_upper = query.upper().strip()
+        # Only add limit for SELECT queries that don't already have one
+        if query_upper.startswith("SELECT") and "LIMIT" not in query_upper:
+            # Fetch one extra to detect truncation
+            return f"{query.rstrip().rstrip(';')} LIMIT {max_rows + 1}"
+        return query
+
     def execute_query(
         self, conn: Any, query: str, max_rows: int | None = None
     ) -> tuple[list[str], list[tuple], bool]:
@@ -303,19 +322,8 @@ class ClickHouseAdapter(DatabaseAdapter):
         clickhouse-connect returns results differently than cursor-based adapters,
         so we implement this directly rather than using CursorBasedAdapter.
         """
-        # If we have a row limit, modify the query to add LIMIT if not present
-        # This is more efficient than fetching all rows and truncating
-        modified_query = query
         truncated = False
-
-        if max_rows is not None:
-            query_upper = query.upper().strip()
-            # Only add limit for SELECT queries that don't already have one
-            if query_upper.startswith("SELECT") and "LIMIT" not in query_upper:
-                # Fetch one extra to detect truncation
-                modified_query = f"{query.rstrip().rstrip(';')} LIMIT {max_rows + 1}"
-
-        result = conn.query(modified_query)
+        result = conn.query(self._limit_query(query, max_rows))
 
         if result.column_names:
             columns = list(result.column_names)
@@ -329,6 +337,17 @@ class ClickHouseAdapter(DatabaseAdapter):
 
         return [], [], False
 
+    def execute_query_arrow(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[Any, bool]:
+        """Execute a query on ClickHouse and return (arrow_table, truncated).
+
+        Uses clickhouse-connect's native Arrow format, decoding String columns
+        as Arrow strings rather than binary.
+        """
+        table = conn.query_arrow(self._limit_query(query, max_rows), use_strings=True)
+        if max_rows is not None and table.num_rows > max_rows:
+            return table.slice(0, max_rows), True
+        return table, False
+
     def execute_non_query(self, conn: Any, query: str) -> int:
         """Execute a non-query on ClickHouse (INSERT, ALTER, etc.).
 
@@ -338,3 +357,23 @@ class ClickHouseAdapter(DatabaseAdapter):
         conn.command(query)
         # ClickHouse command() doesn't return row count
         return -1
+
+    def load_file(
+        self, conn: Any, table: str, columns: Sequence[str], path: str, file_format: str, delimiter: str = ","
+    ) -> int | None:
+        """Stream a file to ClickHouse in its native input format."""
+        formats = {"csv": "CSVWithNames", "parquet": "Parquet", "ndjson": "JSONEachRow"}
+        fmt = formats.get(file_format)
+        if fmt is None:
+            return None
+        settings = {"format_csv_delimiter": delimiter} if file_format == "csv" and delimiter != "," else None
+        with open(path, "rb") as handle:
+            summary = conn.raw_insert(
+                table,
+                column_names=list(columns),
+                insert_block=handle,
+                settings=settings,
+                fmt=fmt,
+            )
+        written = getattr(summary, "written_rows", None)
+        return int(written) if written is not None else -1
@@ -70,6 +70,10 @@ class D1Adapter(DatabaseAdapter):
         """D1 is SQLite-based and does not support stored procedures."""
         return False
 
+    @property
+    def supports_multi_row_insert(self) -> bool:
+        return True
+
     @property
     def supports_cross_database_queries(self) -> bool:
         """D1 databases are isolated; cross-database queries not supported."""
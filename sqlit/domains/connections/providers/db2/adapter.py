@@ -188,3 +188,7 @@ class Db2Adapter(CursorBasedAdapter):
         if schema:
             return f'SELECT * FROM "{schema}"."{table}" FETCH FIRST {limit} ROWS ONLY'
         return f'SELECT * FROM "{table}" FETCH FIRST {limit} ROWS ONLY'
+
+    def apply_row_limit(self, query: str, limit: int, select_end: int | None) -> str | None:
+        """Append FETCH FIRST n ROWS ONLY."""
+        return f"{query}\nFETCH FIRST {limit} ROWS ONLY"
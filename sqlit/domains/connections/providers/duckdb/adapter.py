@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from sqlit.domains.connections.providers.adapters.base import (
@@ -11,8 +12,10 @@ from sqlit.domains.connections.providers.adapters.base import (
     SequenceInfo,
     TableInfo,
     TriggerInfo,
+    prefix_unless_short,
     resolve_file_path,
 )
+from sqlit.domains.connections.providers.adapters.cancel import call_cancel
 
 if TYPE_CHECKING:
     from sqlit.domains.connections.domain.config import ConnectionConfig
@@ -45,6 +48,10 @@ class DuckDBAdapter(DatabaseAdapter):
     def supports_stored_procedures(self) -> bool:
         return False
 
+    @property
+    def supports_multi_row_insert(self) -> bool:
+        return True
+
     @property
     def supports_triggers(self) -> bool:
         """DuckDB doesn't support triggers (columnar/OLAP database)."""
@@ -225,6 +232,16 @@ class DuckDBAdapter(DatabaseAdapter):
         schema = schema or "main"
         return f'SELECT * FROM "{schema}"."{table}" LIMIT {limit}'
 
+    def lob_preview_expressions(self, column: str, data_type: str, length: int) -> tuple[str, str] | None:
+        """Cut VARCHAR columns with LEFT; JSON is cut as text."""
+        declared = data_type.upper()
+        if declared in ("VARCHAR", "TEXT", "STRING"):
+            size = f"LENGTH({column})"
+            return prefix_unless_short(column, f"LEFT({column}, {length})", size, length), size
+        if declared == "JSON":
+            return f"LEFT({column}::VARCHAR, {length})", f"LENGTH({column}::VARCHAR)"
+        return None
+
     def execute_query(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[list[str], list[tuple], bool]:
         """Execute a query on DuckDB with optional row limit."""
         result = conn.execute(query)
@@ -241,6 +258,22 @@ class DuckDBAdapter(DatabaseAdapter):
             return columns, [tuple(row) for row in rows], truncated
         return [], [], False
 
+    def execute_query_arrow(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[Any, bool]:
+        """Execute a query on DuckDB and return (arrow_table, truncated).
+
+        Reads record batches from DuckDB's Arrow stream and stops once the
+        row limit is exceeded, so results never round-trip through tuples.
+        """
+        from sqlit.domains.connections.providers.arrow_results import empty_arrow_table, read_record_batches
+
+        result = conn.execute(query)
+        if not result.description:
+            return empty_arrow_table(), False
+        batch_size = 10_000 if max_rows is None else max(1, min(max_rows + 1, 10_000))
+        to_reader = getattr(result, "to_arrow_reader", None) or result.fetch_record_batch
+        reader = to_reader(batch_size)
+        return read_record_batches(reader, reader.schema, max_rows)
+
     def execute_non_query(self, conn: Any, query: str) -> int:
         """Execute a non-query on DuckDB."""
         result = conn.execute(query)
@@ -249,3 +282,24 @@ class DuckDBAdapter(DatabaseAdapter):
             return result.rowcount if hasattr(result, "rowcount") else -1
         except Exception:
             return -1
+
+    def cancel_query(self, conn: Any, config: ConnectionConfig) -> bool:
+        """Interrupt the running statement; the connection stays open."""
+        return call_cancel(conn, "interrupt")
+
+    def load_file(
+        self, conn: Any, table: str, columns: Sequence[str], path: str, file_format: str, delimiter: str = ","
+    ) -> int | None:
+        """Load a file with DuckDB's own readers (read_csv/read_parquet/read_json)."""
+        cols = ", ".join(self.quote_identifier(c) for c in columns)
+        if file_format == "csv":
+            source, params = "read_csv(?, header = true, delim = ?)", [path, delimiter]
+        elif file_format == "parquet":
+            source, params = "read_parquet(?)", [path]
+        elif file_format == "ndjson":
+            source, params = "read_json(?, format = 'newline_delimited')", [path]
+        else:
+            return None
+        row = conn.execute(f"INSERT INTO {table} ({cols}) SELECT {cols} FROM {source}", params).fetchone()
+        return int(row[0]) if row else -1
+
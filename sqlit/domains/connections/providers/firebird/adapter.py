@@ -337,6 +337,10 @@ class FirebirdAdapter(CursorBasedAdapter):
         """Build SELECT LIMIT query."""
         return f'SELECT * FROM "{table}" ROWS {limit}'
 
+    def apply_row_limit(self, query: str, limit: int, select_end: int | None) -> str | None:
+        """Append a ROWS clause."""
+        return f"{query}\nROWS {limit}"
+
     def execute_non_query(self, conn: Any, query: str) -> int:
         # Firebird has no autocommit mode, so we need to guarantee it ourselves.
         try:
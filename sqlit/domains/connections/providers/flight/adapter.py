@@ -375,44 +375,75 @@ class FlightSQLAdapter(DatabaseAdapter):
         data = table.to_pydict()
 
         # Transpose to rows
-        num_rows = len(table)
-        rows = []
-        for i in range(num_rows):
-            row = tuple(data[col][i] for col in columns)
-            rows.append(row)
+        rows = list(zip(*(data[col] for col in columns)))
 
         return columns, rows
 
+    def _fetch_arrow_table(self, cursor: Any, max_rows: int | None = None) -> tuple[Any, bool]:
+        """Fetch the current result as an Arrow table, stopping after max_rows.
+
+        Record batches are pulled from the cursor's reader one at a time so a
+        limited query never transfers more than ``max_rows + 1`` rows (plus the
+        remainder of the batch the limit falls in). The result stays columnar.
+
+        Returns:
+            Tuple of (arrow_table, was_truncated).
+        """
+        from sqlit.domains.connections.providers.arrow_results import read_record_batches
+
+        if not hasattr(cursor, "fetch_record_batch"):
+            table = cursor.fetch_arrow_table()
+            if max_rows is not None and table is not None and len(table) > max_rows:
+                return table.slice(0, max_rows), True
+            return table, False
+
+        reader = cursor.fetch_record_batch()
+        try:
+            return read_record_batches(reader, reader.schema, max_rows)
+        finally:
+            close_fn = getattr(reader, "close", None)
+            if callable(close_fn):
+                try:
+                    close_fn()
+                except Exception:
+                    pass
+
+    def execute_query_arrow(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[Any, bool]:
+        """Execute a query and return (arrow_table, truncated) without row conversion."""
+        with conn.cursor() as cursor:
+            cursor.execute(query)
+            return self._fetch_arrow_table(cursor, max_rows)
+
     def execute_query(
         self, conn: Any, query: str, max_rows: int | None = None
     ) -> tuple[list[str], list[tuple[Any, ...]], bool]:
         """Execute a query on Flight SQL server.
 
-        Uses DBAPI 2.0 cursor interface and optionally fetches Arrow table
-        for efficient data transfer.
+        Uses DBAPI 2.0 cursor interface and streams Arrow record batches,
+        stopping as soon as the row limit is exceeded.
         """
         with conn.cursor() as cursor:
             cursor.execute(query)
 
-            # Try to use Arrow table for efficiency if available
-            if hasattr(cursor, "fetch_arrow_table"):
-                table = cursor.fetch_arrow_table()
+            # Stream Arrow record batches when available
+            if hasattr(cursor, "fetch_record_batch") or hasattr(cursor, "fetch_arrow_table"):
+                table, truncated = self._fetch_arrow_table(cursor, max_rows)
                 columns, rows = self._arrow_table_to_tuples(table)
-            else:
-                # Fall back to standard DBAPI fetchall
-                if cursor.description:
-                    columns = [desc[0] for desc in cursor.description]
-                    rows = [tuple(row) for row in cursor.fetchall()]
-                else:
-                    columns, rows = [], []
-
-            # Handle row limiting
-            truncated = False
-            if max_rows is not None and len(rows) > max_rows:
-                truncated = True
-                rows = rows[:max_rows]
-
-            return columns, rows, truncated
+                if not columns and table is not None:
+                    columns = list(table.column_names)
+                return columns, rows, truncated
+
+            # Fall back to standard DBAPI fetching
+            if not cursor.description:
+                return [], [], False
+            columns = [desc[0] for desc in cursor.description]
+            if max_rows is not None:
+                rows = [tuple(row) for row in cursor.fetchmany(max_rows + 1)]
+                truncated = len(rows) > max_rows
+                if truncated:
+                    rows = rows[:max_rows]
+                return columns, rows, truncated
+            return columns, [tuple(row) for row in cursor.fetchall()], False
 
     def execute_non_query(self, conn: Any, query: str) -> int:
         """Execute a non-query statement (INSERT, UPDATE, DELETE, DDL).
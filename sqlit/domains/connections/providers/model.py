@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Sequence
 
     from sqlit.domains.connections.domain.config import ConnectionConfig
     from sqlit.domains.connections.providers.docker import DockerDetector
@@ -38,6 +38,7 @@ class SchemaCapabilities:
     supports_sequences: bool
     default_schema: str
     system_databases: frozenset[str]
+    supports_multi_row_insert: bool = False
 
 
 @runtime_checkable
@@ -53,6 +54,85 @@ class QueryExecutor(Protocol):
     def execute_non_query(self, conn: Any, query: str) -> int: ...
 
 
+@runtime_checkable
+class ArrowQueryExecutor(Protocol):
+    def execute_query_arrow(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[Any, bool]:
+        ...
+
+
+@runtime_checkable
+class BatchNonQueryExecutor(Protocol):
+    def execute_non_query_batch(self, conn: Any, statements: Sequence[str]) -> list[int]:
+        """Run several non-query statements in one round trip.
+
+        The batch must be atomic: if it raises, none of its statements took
+        effect. Returns rows affected per statement (-1 when unknown).
+        """
+        ...
+
+
+@runtime_checkable
+class QueryCanceller(Protocol):
+    def cancel_query(self, conn: Any, config: ConnectionConfig) -> bool:
+        """Ask the server to abort the statement running on ``conn``.
+
+        Called from another thread while the query runs; ``config`` is the
+        config ``conn`` was opened with. The executing call should then
+        raise, leaving ``conn`` usable. Returns False when nothing could be
+        sent, in which case callers fall back to closing the connection.
+        """
+        ...
+
+
+@runtime_checkable
+class RemoteJobExecutor(Protocol):
+    """Runs queries as server-side jobs that outlive the client connection.
+
+    A job handle is a small JSON-serializable dict (a query or job ID), so a
+    job can be persisted and picked up again from another connection or a
+    later session.
+    """
+
+    def submit_job(self, conn: Any, query: str) -> dict[str, str]:
+        """Start ``query`` on the server without waiting and return its handle."""
+        ...
+
+    def poll_job(self, conn: Any, handle: dict[str, str]) -> str | None:
+        """Return a short server status or progress label, or None once the job finished."""
+        ...
+
+    def fetch_job(
+        self, conn: Any, handle: dict[str, str], max_rows: int | None = None
+    ) -> tuple[list[str], list[tuple], bool]:
+        """Fetch a finished job's result as (columns, rows, truncated); raises if the job failed."""
+        ...
+
+    def cancel_job(self, conn: Any, handle: dict[str, str]) -> bool: ...
+
+
+@runtime_checkable
+class FileBulkLoader(Protocol):
+    def load_file(
+        self, conn: Any, table: str, columns: Sequence[str], path: str, file_format: str, delimiter: str = ","
+    ) -> int | None:
+        """Load a whole file into ``table`` with an engine-side reader.
+
+        ``table`` is a quoted table reference, ``columns`` the raw column names
+        and ``file_format`` one of "csv", "parquet" or "ndjson". Returns the
+        rows loaded, or None when the format or connection is unsupported.
+        """
+        ...
+
+
+@runtime_checkable
+class RowBulkLoader(Protocol):
+    def load_rows(
+        self, conn: Any, table: str, columns: Sequence[str], batches: Iterable[Sequence[Sequence[Any]]]
+    ) -> int:
+        """Insert streamed row batches into ``table`` and return the rows loaded."""
+        ...
+
+
 @runtime_checkable
 class Dialect(Protocol):
     def quote_identifier(self, name: str) -> str: ...
@@ -63,6 +143,32 @@ class Dialect(Protocol):
     def format_table_name(self, schema: str | None, table: str) -> str: ...
 
 
+@runtime_checkable
+class LobPreviewDialect(Protocol):
+    def lob_preview_expressions(self, column: str, data_type: str, length: int) -> tuple[str, str] | None:
+        """Return (prefix, length) SQL expressions for a large-typed column.
+
+        ``column`` is already quoted. The prefix expression yields at most
+        ``length`` characters (bytes for binary types) and should return
+        shorter values unchanged. The length expression yields the full
+        size. Return None to select the column as is.
+        """
+        ...
+
+
+@runtime_checkable
+class RowLimitDialect(Protocol):
+    def apply_row_limit(self, query: str, limit: int, select_end: int | None) -> str | None:
+        """Return ``query`` rewritten to return at most ``limit`` rows.
+
+        ``query`` is a single top-level SELECT without a row limit or a
+        trailing semicolon. ``select_end`` is the offset just past its main
+        ``SELECT [DISTINCT]`` keywords, or None for compound queries such as
+        UNIONs. Return None when the dialect cannot limit this query.
+        """
+        ...
+
+
 @runtime_checkable
 class SchemaInspector(Protocol):
     def get_databases(self, conn: Any) -> list[str]: ...
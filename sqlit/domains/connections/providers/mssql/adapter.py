@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, Any
 
 from sqlit.domains.connections.providers.adapters.base import (
@@ -11,7 +12,11 @@ from sqlit.domains.connections.providers.adapters.base import (
     SequenceInfo,
     TableInfo,
     TriggerInfo,
+    prefix_unless_short,
 )
+from sqlit.domains.connections.providers.adapters.bulk import build_insert_sql, executemany_batches
+from sqlit.domains.connections.providers.adapters.cancel import call_cancel
+from sqlit.domains.connections.providers.adapters.fetch import INITIAL_FETCH_BATCH_ROWS, apply_fetch_hints, fetch_rows
 from sqlit.domains.connections.providers.tls import (
     TLS_MODE_DEFAULT,
     TLS_MODE_DISABLE,
@@ -60,6 +65,10 @@ class SQLServerAdapter(DatabaseAdapter):
     def supports_stored_procedures(self) -> bool:
         return True
 
+    @property
+    def supports_multi_row_insert(self) -> bool:
+        return True
+
     @property
     def system_databases(self) -> frozenset[str]:
         return frozenset({"master", "tempdb", "model", "msdb"})
@@ -404,27 +413,71 @@ class SQLServerAdapter(DatabaseAdapter):
         schema = schema or "dbo"
         return f"SELECT TOP {limit} * FROM [{schema}].[{table}]"
 
+    def apply_row_limit(self, query: str, limit: int, select_end: int | None) -> str | None:
+        """Insert TOP after the main SELECT; compound queries are left alone."""
+        if select_end is None:
+            return None
+        return f"{query[:select_end]} TOP {limit}{query[select_end:]}"
+
+    def lob_preview_expressions(self, column: str, data_type: str, length: int) -> tuple[str, str] | None:
+        """Cut character and binary columns with SUBSTRING.
+
+        INFORMATION_SCHEMA does not say which varchar columns are ``(max)``,
+        so every variable-length column is projected; bounded ones are
+        never longer than the prefix and come back unchanged. SUBSTRING
+        counts characters for character types, so their size is in
+        characters too: LEN for varchar, DATALENGTH / 2 for the UTF-16
+        n-types, and DATALENGTH for text, which LEN does not accept. Binary
+        types are sized in bytes.
+        """
+        data_type = data_type.lower()
+        if data_type not in ("varchar", "nvarchar", "varbinary", "text", "ntext", "image"):
+            return None
+        if data_type == "varchar":
+            size = f"LEN({column})"
+        elif data_type in ("nvarchar", "ntext"):
+            size = f"(DATALENGTH({column}) / 2)"
+        else:
+            size = f"DATALENGTH({column})"
+        return prefix_unless_short(column, f"SUBSTRING({column}, 1, {length})", size, length), size
+
     def execute_query(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[list[str], list[tuple], bool]:
         """Execute a query on SQL Server with optional row limit."""
         cursor = conn.cursor()
-        cursor.execute(query)
-        if cursor.description:
-            columns = [col[0] for col in cursor.description]
-            if max_rows is not None:
-                rows = cursor.fetchmany(max_rows + 1)
-                truncated = len(rows) > max_rows
-                if truncated:
-                    rows = rows[:max_rows]
-            else:
-                rows = cursor.fetchall()
-                truncated = False
-            return columns, [tuple(row) for row in rows], truncated
+        apply_fetch_hints(cursor, INITIAL_FETCH_BATCH_ROWS)
+        with self._active_cursors.tracking(conn, cursor):
+            cursor.execute(query)
+            if cursor.description:
+                columns = [col[0] for col in cursor.description]
+                rows, truncated = fetch_rows(cursor, max_rows)
+                return columns, rows, truncated
         return [], [], False
 
     def execute_non_query(self, conn: Any, query: str) -> int:
         """Execute a non-query on SQL Server."""
         cursor = conn.cursor()
-        cursor.execute(query)
+        with self._active_cursors.tracking(conn, cursor):
+            cursor.execute(query)
         rowcount = int(cursor.rowcount)
         conn.commit()
         return rowcount
+
+    def cancel_query(self, conn: Any, config: ConnectionConfig) -> bool:
+        """Send a TDS attention signal through the executing cursor's ``cancel()``."""
+        return call_cancel(self._active_cursors.get(conn))
+
+    def load_rows(
+        self, conn: Any, table: str, columns: Sequence[str], batches: Iterable[Sequence[Sequence[Any]]]
+    ) -> int:
+        """Bulk insert with array-bound executemany in one transaction."""
+
+        def enable_fast_executemany(cursor: Any) -> None:
+            # pyodbc-style drivers only bind parameter arrays when asked to.
+            if hasattr(cursor, "fast_executemany"):
+                try:
+                    cursor.fast_executemany = True
+                except Exception:
+                    pass
+
+        sql = build_insert_sql(table, [self.quote_identifier(c) for c in columns], "qmark")
+        return executemany_batches(conn, sql, batches, prepare_cursor=enable_fast_executemany)
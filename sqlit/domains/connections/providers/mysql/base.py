@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -14,7 +15,28 @@ from sqlit.domains.connections.providers.adapters.base import (
     SequenceInfo,
     TableInfo,
     TriggerInfo,
+    prefix_unless_short,
 )
+from sqlit.domains.connections.providers.adapters.bulk import (
+    build_insert_sql,
+    driver_paramstyle,
+    executemany_batches,
+)
+
+# Client capability flag set when a connection allows LOAD DATA LOCAL INFILE.
+_CLIENT_LOCAL_FILES = 1 << 7
+# Column types that preview mode truncates server-side.
+_LOB_TYPES = frozenset({"text", "mediumtext", "longtext", "blob", "mediumblob", "longblob", "json"})
+
+
+def _connection_thread_id(conn: Any) -> int | None:
+    """Server thread ID of a PyMySQL, MariaDB or mysql-connector connection."""
+    thread_id = getattr(conn, "thread_id", None)
+    if callable(thread_id):
+        thread_id = thread_id()
+    if thread_id is None:
+        thread_id = getattr(conn, "connection_id", None)
+    return int(thread_id) if thread_id is not None else None
 
 
 class MySQLBaseAdapter(CursorBasedAdapter):
@@ -37,12 +59,31 @@ class MySQLBaseAdapter(CursorBasedAdapter):
     def supports_stored_procedures(self) -> bool:
         return True
 
+    @property
+    def supports_multi_row_insert(self) -> bool:
+        return True
+
     def apply_database_override(self, config: "ConnectionConfig", database: str) -> "ConnectionConfig":
         """Apply a default database for unqualified queries."""
         if not database:
             return config
         return config.with_endpoint(database=database)
 
+    def cancel_query(self, conn: Any, config: ConnectionConfig) -> bool:
+        """Abort the running statement with ``KILL QUERY`` from a sidecar connection.
+
+        Only the statement is killed; ``conn`` stays open.
+        """
+        thread_id = _connection_thread_id(conn)
+        if thread_id is None:
+            return False
+        sidecar = self.connect(config)
+        try:
+            sidecar.cursor().execute(f"KILL QUERY {thread_id}")
+        finally:
+            sidecar.close()
+        return True
+
     def get_databases(self, conn: Any) -> list[str]:
         """Get list of databases."""
         cursor = conn.cursor()
@@ -142,12 +183,62 @@ class MySQLBaseAdapter(CursorBasedAdapter):
         escaped = name.replace("`", "``")
         return f"`{escaped}`"
 
+    def load_file(
+        self, conn: Any, table: str, columns: Sequence[str], path: str, file_format: str, delimiter: str = ","
+    ) -> int | None:
+        """Load a CSV file with LOAD DATA LOCAL INFILE.
+
+        Only available when the connection was opened with local_infile
+        enabled; otherwise rows are streamed through ``load_rows``. Empty
+        fields load as NULL, matching the other import paths. Backslashes are
+        ordinary characters, as in standard CSV, and the line ending (LF or
+        CRLF) is taken from the file's first line.
+        """
+        if file_format != "csv" or not getattr(conn, "client_flag", 0) & _CLIENT_LOCAL_FILES:
+            return None
+        with open(path, "rb") as f:
+            first_line = f.readline()
+        line_terminator = "\r\n" if first_line.endswith(b"\r\n") else "\n"
+        variables = [f"@c{i}" for i in range(len(columns))]
+        assignments = ", ".join(
+            f"{self.quote_identifier(column)} = NULLIF({variable}, '')" for column, variable in zip(columns, variables)
+        )
+        sql = (
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY %s OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+            "LINES TERMINATED BY %s IGNORE 1 LINES "
+            f"({', '.join(variables)}) SET {assignments}"
+        )
+        cursor = conn.cursor()
+        cursor.execute(sql, (path, delimiter, line_terminator))
+        conn.commit()
+        return int(cursor.rowcount)
+
+    def load_rows(
+        self, conn: Any, table: str, columns: Sequence[str], batches: Iterable[Sequence[Sequence[Any]]]
+    ) -> int:
+        """Bulk insert with executemany (PyMySQL folds it into multi-row INSERTs)."""
+        sql = build_insert_sql(table, [self.quote_identifier(c) for c in columns], driver_paramstyle(conn, "format"))
+        return executemany_batches(conn, sql, batches)
+
     def build_select_query(self, table: str, limit: int, database: str | None = None, schema: str | None = None) -> str:
         """Build SELECT LIMIT query. Schema parameter is ignored (MySQL has no schemas)."""
         if database:
             return f"SELECT * FROM `{database}`.`{table}` LIMIT {limit}"
         return f"SELECT * FROM `{table}` LIMIT {limit}"
 
+    def lob_preview_expressions(self, column: str, data_type: str, length: int) -> tuple[str, str] | None:
+        """Cut TEXT, BLOB and JSON columns with LEFT.
+
+        LEFT counts characters for text and bytes for blobs, so the size is
+        CHAR_LENGTH for text and JSON and LENGTH (bytes) for blobs only.
+        """
+        data_type = data_type.lower()
+        if data_type not in _LOB_TYPES:
+            return None
+        size = f"LENGTH({column})" if data_type.endswith("blob") else f"CHAR_LENGTH({column})"
+        return prefix_unless_short(column, f"LEFT({column}, {length})", size, length), size
+
     def get_indexes(self, conn: Any, database: str | None = None) -> list[IndexInfo]:
         """Get indexes from MySQL/MariaDB."""
         cursor = conn.cursor()
@@ -12,6 +12,8 @@ from sqlit.domains.connections.providers.adapters.base import (
     TableInfo,
     TriggerInfo,
 )
+from sqlit.domains.connections.providers.adapters.cancel import call_cancel
+from sqlit.domains.connections.providers.adapters.fetch import INITIAL_FETCH_BATCH_ROWS, apply_fetch_hints, fetch_rows
 from sqlit.domains.connections.providers.registry import get_default_port
 
 if TYPE_CHECKING:
@@ -324,22 +326,26 @@ class OracleAdapter(DatabaseAdapter):
         """Build SELECT query with FETCH FIRST for Oracle 12c+. Schema parameter is ignored."""
         return f'SELECT * FROM "{table}" FETCH FIRST {limit} ROWS ONLY'
 
+    def apply_row_limit(self, query: str, limit: int, select_end: int | None) -> str | None:
+        """Append FETCH FIRST n ROWS ONLY."""
+        return f"{query}\nFETCH FIRST {limit} ROWS ONLY"
+
+    def lob_preview_expressions(self, column: str, data_type: str, length: int) -> tuple[str, str] | None:
+        """Cut CLOB, NCLOB and BLOB columns with DBMS_LOB.SUBSTR."""
+        if data_type.upper() not in ("CLOB", "NCLOB", "BLOB"):
+            return None
+        return f"DBMS_LOB.SUBSTR({column}, {length}, 1)", f"DBMS_LOB.GETLENGTH({column})"
+
     def execute_query(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[list[str], list[tuple], bool]:
         """Execute a query on Oracle with optional row limit."""
         cursor = conn.cursor()
+        apply_fetch_hints(cursor, INITIAL_FETCH_BATCH_ROWS)
         try:
             cursor.execute(query)
             if cursor.description:
                 columns = [col[0] for col in cursor.description]
-                if max_rows is not None:
-                    rows = cursor.fetchmany(max_rows + 1)
-                    truncated = len(rows) > max_rows
-                    if truncated:
-                        rows = rows[:max_rows]
-                else:
-                    rows = cursor.fetchall()
-                    truncated = False
-                return columns, [tuple(row) for row in rows], truncated
+                rows, truncated = fetch_rows(cursor, max_rows)
+                return columns, rows, truncated
             return [], [], False
         finally:
             cursor.close()
@@ -354,3 +360,7 @@ class OracleAdapter(DatabaseAdapter):
             return rowcount
         finally:
             cursor.close()
+
+    def cancel_query(self, conn: Any, config: ConnectionConfig) -> bool:
+        """Break the running call with oracledb's ``conn.cancel()``."""
+        return call_cancel(conn)
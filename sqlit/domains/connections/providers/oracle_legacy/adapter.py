@@ -73,3 +73,7 @@ class OracleLegacyAdapter(OracleAdapter):
     def build_select_query(self, table: str, limit: int, database: str | None = None, schema: str | None = None) -> str:
         """Build SELECT query with ROWNUM for Oracle 11g. Schema parameter is ignored."""
         return f'SELECT * FROM (SELECT * FROM "{table}") WHERE ROWNUM <= {limit}'
+
+    def apply_row_limit(self, query: str, limit: int, select_end: int | None) -> str | None:
+        """Wrap the query and filter on ROWNUM for Oracle 11g."""
+        return f"SELECT * FROM (\n{query}\n) WHERE ROWNUM <= {limit}"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
@@ -12,7 +13,10 @@ from sqlit.domains.connections.providers.adapters.base import (
     SequenceInfo,
     TableInfo,
     TriggerInfo,
+    prefix_unless_short,
 )
+from sqlit.domains.connections.providers.adapters.bulk import CsvBatchStream
+from sqlit.domains.connections.providers.adapters.cancel import call_cancel
 
 if TYPE_CHECKING:
     from sqlit.domains.connections.domain.config import ConnectionConfig
@@ -32,6 +36,10 @@ class PostgresBaseAdapter(CursorBasedAdapter):
     def supports_stored_procedures(self) -> bool:
         return True
 
+    @property
+    def supports_multi_row_insert(self) -> bool:
+        return True
+
     @property
     def system_databases(self) -> frozenset[str]:
         return frozenset({"template0", "template1"})
@@ -58,6 +66,41 @@ class PostgresBaseAdapter(CursorBasedAdapter):
         new_endpoint = replace(endpoint, database=database)
         return replace(config, endpoint=new_endpoint)
 
+    def cancel_query(self, conn: Any, config: ConnectionConfig) -> bool:
+        """Send a protocol-level cancel request (psycopg ``conn.cancel()``)."""
+        return call_cancel(conn)
+
+    def execute_non_query_batch(self, conn: Any, statements: Sequence[str]) -> list[int]:
+        """Run several DML statements in one round trip.
+
+        The statements are sent as one multi-statement simple query (what
+        ``psycopg2.extras.execute_batch`` does per page), which the server runs
+        as a single implicit transaction on autocommit connections. The server
+        only reports the row count of the last statement.
+        """
+        cursor = conn.cursor()
+        cursor.execute(";\n".join(statements))
+        rowcount = int(cursor.rowcount)
+        conn.commit()
+        if len(statements) == 1:
+            return [rowcount]
+        return [-1] * len(statements)
+
+    def load_rows(
+        self, conn: Any, table: str, columns: Sequence[str], batches: Iterable[Sequence[Sequence[Any]]]
+    ) -> int:
+        """Stream rows through ``COPY ... FROM STDIN`` as CSV.
+
+        Batches are rendered lazily while the driver reads, so the file is
+        never held in memory. Empty strings load as NULL.
+        """
+        cols = ", ".join(self.quote_identifier(c) for c in columns)
+        stream = CsvBatchStream(batches)
+        cursor = conn.cursor()
+        cursor.copy_expert(f"COPY {table} ({cols}) FROM STDIN WITH (FORMAT csv)", stream)
+        conn.commit()
+        return stream.rows
+
     def get_tables(self, conn: Any, database: str | None = None) -> list[TableInfo]:
         """Get list of tables from all schemas."""
         cursor = conn.cursor()
@@ -124,6 +167,16 @@ class PostgresBaseAdapter(CursorBasedAdapter):
         schema = schema or "public"
         return f'SELECT * FROM "{schema}"."{table}" LIMIT {limit}'
 
+    def lob_preview_expressions(self, column: str, data_type: str, length: int) -> tuple[str, str] | None:
+        """Cut text and bytea with SUBSTR; json, jsonb and xml are cut as text."""
+        declared = data_type.lower()
+        if declared in ("text", "character varying", "bytea"):
+            size = f"LENGTH({column})"
+            return prefix_unless_short(column, f"SUBSTR({column}, 1, {length})", size, length), size
+        if declared in ("json", "jsonb", "xml"):
+            return f"LEFT({column}::text, {length})", f"LENGTH({column}::text)"
+        return None
+
     @property
     def supports_sequences(self) -> bool:
         """PostgreSQL supports sequences."""
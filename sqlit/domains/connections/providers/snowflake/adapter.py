@@ -12,6 +12,7 @@ from sqlit.domains.connections.providers.adapters.base import (
     TableInfo,
     TriggerInfo,
 )
+from sqlit.domains.connections.providers.adapters.fetch import fetch_rows
 
 if TYPE_CHECKING:
     from sqlit.domains.connections.domain.config import ConnectionConfig
@@ -48,6 +49,10 @@ class SnowflakeAdapter(CursorBasedAdapter):
     def supports_stored_procedures(self) -> bool:
         return True
 
+    @property
+    def supports_multi_row_insert(self) -> bool:
+        return True
+
     def apply_database_override(self, config: ConnectionConfig, database: str) -> ConnectionConfig:
         """Apply a default database for unqualified queries."""
         if not database:
@@ -222,25 +227,86 @@ class SnowflakeAdapter(CursorBasedAdapter):
     def execute_query(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[list[str], list[tuple], bool]:
         """Execute query."""
         cursor = conn.cursor()
-        cursor.execute(query)
+        with self._active_cursors.tracking(conn, cursor):
+            cursor.execute(query)
+
+            columns = []
+            if cursor.description:
+                columns = [col[0] for col in cursor.description]
 
-        columns = []
-        if cursor.description:
-            columns = [col[0] for col in cursor.description]
+            rows, truncated = fetch_rows(cursor, max_rows)
+        return columns, rows, truncated
 
-        if max_rows is not None:
-            rows = cursor.fetchmany(max_rows + 1)
-            truncated = len(rows) > max_rows
-            if truncated:
-                rows = rows[:max_rows]
-        else:
-            rows = cursor.fetchall()
-            truncated = False
+    def execute_query_arrow(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[Any, bool]:
+        """Execute query and return (arrow_table, truncated).
 
-        return columns, [tuple(row) for row in rows], truncated
+        Streams the connector's Arrow result chunks and stops at the row
+        limit. Falls back to row fetching when the connector was installed
+        without its pyarrow extras.
+        """
+        from sqlit.domains.connections.providers.arrow_results import (
+            arrow_table_from_rows,
+            empty_arrow_table,
+            read_record_batches,
+        )
+
+        cursor = conn.cursor()
+        with self._active_cursors.tracking(conn, cursor):
+            cursor.execute(query)
+
+        columns = [col[0] for col in cursor.description] if cursor.description else []
+        fetch_batches = getattr(cursor, "fetch_arrow_batches", None)
+        if callable(fetch_batches):
+            try:
+                batches = fetch_batches()
+            except Exception:
+                # Missing pyarrow extras or a non-Arrow (JSON) result format.
+                batches = None
+            if batches is not None:
+                table, truncated = read_record_batches(batches, None, max_rows)
+                if table.num_columns == 0:
+                    table = empty_arrow_table(columns)
+                return table, truncated
+
+        rows, truncated = fetch_rows(cursor, max_rows)
+        return arrow_table_from_rows(columns, rows), truncated
 
     def execute_non_query(self, conn: Any, query: str) -> int:
         cursor = conn.cursor()
-        cursor.execute(query)
+        with self._active_cursors.tracking(conn, cursor):
+            cursor.execute(query)
         # Snowflake doesn't always return rowcount reliably for all ops, but try.
         return int(cursor.rowcount) if cursor.rowcount is not None else -1
+
+    def cancel_query(self, conn: Any, config: ConnectionConfig) -> bool:
+        """Cancel the running statement by query ID with ``SYSTEM$CANCEL_QUERY``."""
+        query_id = getattr(self._active_cursors.get(conn), "sfqid", None)
+        if not query_id:
+            return False
+        conn.cursor().execute("SELECT SYSTEM$CANCEL_QUERY(%s)", (query_id,))
+        return True
+
+    def submit_job(self, conn: Any, query: str) -> dict[str, str]:
+        """Start ``query`` with ``execute_async`` and return its query ID."""
+        cursor = conn.cursor()
+        cursor.execute_async(query)
+        return {"query_id": str(cursor.sfqid)}
+
+    def poll_job(self, conn: Any, handle: dict[str, str]) -> str | None:
+        status = conn.get_query_status(handle["query_id"])
+        if conn.is_still_running(status):
+            return str(status.name).replace("_", " ").lower()
+        return None
+
+    def fetch_job(
+        self, conn: Any, handle: dict[str, str], max_rows: int | None = None
+    ) -> tuple[list[str], list[tuple], bool]:
+        cursor = conn.cursor()
+        cursor.get_results_from_sfqid(handle["query_id"])
+        columns = [col[0] for col in cursor.description] if cursor.description else []
+        rows, truncated = fetch_rows(cursor, max_rows)
+        return columns, rows, truncated
+
+    def cancel_job(self, conn: Any, handle: dict[str, str]) -> bool:
+        conn.cursor().execute("SELECT SYSTEM$CANCEL_QUERY(%s)", (handle["query_id"],))
+        return True
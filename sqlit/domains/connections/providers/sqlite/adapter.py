@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, Any
 
 from sqlit.domains.connections.providers.adapters.base import (
@@ -11,8 +12,12 @@ from sqlit.domains.connections.providers.adapters.base import (
     SequenceInfo,
     TableInfo,
     TriggerInfo,
+    prefix_unless_short,
     resolve_file_path,
 )
+from sqlit.domains.connections.providers.adapters.bulk import build_insert_sql, executemany_batches
+from sqlit.domains.connections.providers.adapters.cancel import call_cancel
+from sqlit.domains.connections.providers.adapters.fetch import INITIAL_FETCH_BATCH_ROWS, apply_fetch_hints, fetch_rows
 
 if TYPE_CHECKING:
     from sqlit.domains.connections.domain.config import ConnectionConfig
@@ -33,6 +38,10 @@ class SQLiteAdapter(DatabaseAdapter):
     def supports_stored_procedures(self) -> bool:
         return False
 
+    @property
+    def supports_multi_row_insert(self) -> bool:
+        return True
+
     def connect(self, config: ConnectionConfig) -> Any:
         """Connect to SQLite database file."""
         import sqlite3
@@ -204,21 +213,23 @@ class SQLiteAdapter(DatabaseAdapter):
         """Build SELECT LIMIT query for SQLite. Schema parameter is ignored."""
         return f'SELECT * FROM "{table}" LIMIT {limit}'
 
+    def lob_preview_expressions(self, column: str, data_type: str, length: int) -> tuple[str, str] | None:
+        """Cut TEXT, BLOB, CLOB and JSON columns with SUBSTR (by declared type affinity)."""
+        declared = data_type.upper()
+        if not any(name in declared for name in ("TEXT", "BLOB", "CLOB", "JSON")):
+            return None
+        size = f"LENGTH({column})"
+        return prefix_unless_short(column, f"SUBSTR({column}, 1, {length})", size, length), size
+
     def execute_query(self, conn: Any, query: str, max_rows: int | None = None) -> tuple[list[str], list[tuple], bool]:
         """Execute a query on SQLite with optional row limit."""
         cursor = conn.cursor()
+        apply_fetch_hints(cursor, INITIAL_FETCH_BATCH_ROWS)
         cursor.execute(query)
         if cursor.description:
             columns = [col[0] for col in cursor.description]
-            if max_rows is not None:
-                rows = cursor.fetchmany(max_rows + 1)
-                truncated = len(rows) > max_rows
-                if truncated:
-                    rows = rows[:max_rows]
-            else:
-                rows = cursor.fetchall()
-                truncated = False
-            return columns, [tuple(row) for row in rows], truncated
+            rows, truncated = fetch_rows(cursor, max_rows)
+            return columns, rows, truncated
         return [], [], False
 
     def execute_non_query(self, conn: Any, query: str) -> int:
@@ -228,3 +239,14 @@ class SQLiteAdapter(DatabaseAdapter):
         rowcount = int(cursor.rowcount)
         conn.commit()
         return rowcount
+
+    def cancel_query(self, conn: Any, config: ConnectionConfig) -> bool:
+        """Interrupt the running statement; the connection stays open."""
+        return call_cancel(conn, "interrupt")
+
+    def load_rows(
+        self, conn: Any, table: str, columns: Sequence[str], batches: Iterable[Sequence[Sequence[Any]]]
+    ) -> int:
+        """Bulk insert with executemany, all batches in one transaction."""
+        sql = build_insert_sql(table, [self.quote_identifier(c) for c in columns], "qmark")
+        return executemany_batches(conn, sql, batches)
@@ -243,3 +243,9 @@ class TeradataAdapter(CursorBasedAdapter):
         if schema_name:
             return f'SELECT TOP {limit} * FROM "{schema_name}"."{table}"'
         return f'SELECT TOP {limit} * FROM "{table}"'
+
+    def apply_row_limit(self, query: str, limit: int, select_end: int | None) -> str | None:
+        """Insert TOP after the main SELECT; compound queries are left alone."""
+        if select_end is None:
+            return None
+        return f"{query[:select_end]} TOP {limit}{query[select_end:]}"
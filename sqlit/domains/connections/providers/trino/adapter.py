@@ -12,6 +12,7 @@ from sqlit.domains.connections.providers.adapters.base import (
     TableInfo,
     TriggerInfo,
 )
+from sqlit.domains.connections.providers.adapters.cancel import call_cancel
 from sqlit.domains.connections.providers.registry import get_default_port
 
 if TYPE_CHECKING:
@@ -108,6 +109,10 @@ class TrinoAdapter(CursorBasedAdapter):
 
         return trino_dbapi.connect(**connect_args)
 
+    def cancel_query(self, conn: Any, config: ConnectionConfig) -> bool:
+        """Cancel the executing cursor's query (a DELETE on its query URI)."""
+        return call_cancel(self._active_cursors.get(conn))
+
     def get_databases(self, conn: Any) -> list[str]:
         cursor = conn.cursor()
         cursor.execute("SHOW CATALOGS")
@@ -64,6 +64,10 @@ class TursoAdapter(DatabaseAdapter):
     def supports_stored_procedures(self) -> bool:
         return False
 
+    @property
+    def supports_multi_row_insert(self) -> bool:
+        return True
+
     def execute_test_query(self, conn: Any) -> None:
         """Execute a simple query to verify the connection works.
 
@@ -0,0 +1,244 @@
+"""Speculative prefetch of table previews.
+
+When the explorer cursor rests on a table or view, the next key press is
+usually Enter, which runs the preview query built by
+``dialect.build_select_query``. ``PreviewPrefetcher`` runs that query ahead
+of time on a dedicated connection and keeps the rows, so the preview appears
+without a round trip.
+
+Prefetching is configured per connection with the ``preview_prefetch``
+option:
+
+- ``"table"``: prefetch the highlighted table or view.
+- ``"neighbors"``: also prefetch the tables above and below it.
+- ``"off"``: never prefetch.
+
+It defaults to ``"table"``, except for warehouses that bill by query or by
+bytes scanned, where it defaults to ``"off"``.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlit.domains.query.app.result_cache import (
+    CachedResult,
+    QueryResultCache,
+    connection_identity,
+    is_cacheable_query,
+)
+
+if TYPE_CHECKING:
+    from sqlit.domains.connections.domain.config import ConnectionConfig
+    from sqlit.domains.connections.providers.model import DatabaseProvider
+
+PREFETCH_OPTION = "preview_prefetch"
+PREFETCH_OFF = "off"
+PREFETCH_TABLE = "table"
+PREFETCH_NEIGHBORS = "neighbors"
+
+# Warehouses that bill per query or per byte scanned.
+METERED_DB_TYPES = frozenset({"athena", "bigquery", "d1", "databricks", "redshift", "snowflake"})
+
+DEFAULT_PREFETCH_TTL_S = 30.0
+DEFAULT_PREFETCH_BUDGET_BYTES = 16 * 1024 * 1024
+DEFAULT_PREFETCH_CONCURRENCY = 1
+# How long a prefetch waits for a free slot before giving up.
+SLOT_WAIT_S = 2.0
+
+
+def prefetch_mode(config: ConnectionConfig) -> str:
+    """Return the prefetch mode configured for a connection."""
+    value = str(config.get_option(PREFETCH_OPTION, "") or "").strip().lower()
+    if value in {PREFETCH_OFF, "false", "0", "no", "none"}:
+        return PREFETCH_OFF
+    if value in {PREFETCH_NEIGHBORS, "neighbours"}:
+        return PREFETCH_NEIGHBORS
+    if value in {PREFETCH_TABLE, "true", "1", "yes", "on"}:
+        return PREFETCH_TABLE
+    return PREFETCH_OFF if config.db_type in METERED_DB_TYPES else PREFETCH_TABLE
+
+
+@dataclass(frozen=True)
+class PreviewRequest:
+    """A preview query to prefetch."""
+
+    config: ConnectionConfig
+    provider: DatabaseProvider
+    query: str
+    max_rows: int | None
+
+
+def _default_query_factory(request: PreviewRequest) -> Any:
+    from sqlit.domains.query.app.cancellable import CancellableQuery
+
+    return CancellableQuery(sql=request.query, config=request.config, provider=request.provider)
+
+
+class PreviewPrefetcher:
+    """Runs preview queries ahead of time and holds their results.
+
+    Each connection gets its own byte budget and a limit on concurrent
+    prefetch queries. ``cancel()`` aborts in-flight queries and stops any
+    batch that has not finished; results are handed out once by ``take()``.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float = DEFAULT_PREFETCH_TTL_S,
+        max_bytes_per_connection: int = DEFAULT_PREFETCH_BUDGET_BYTES,
+        max_concurrent_per_connection: int = DEFAULT_PREFETCH_CONCURRENCY,
+        query_factory: Callable[[PreviewRequest], Any] = _default_query_factory,
+    ) -> None:
+        self.ttl_s = ttl_s
+        self.max_bytes_per_connection = max_bytes_per_connection
+        self.max_concurrent_per_connection = max(1, max_concurrent_per_connection)
+        self._query_factory = query_factory
+        self._lock = threading.Lock()
+        self._caches: dict[tuple[str, ...], QueryResultCache] = {}
+        self._slots: dict[tuple[str, ...], threading.BoundedSemaphore] = {}
+        self._in_flight: list[tuple[tuple[str, ...], Any]] = []
+        self._pending: set[tuple[Any, ...]] = set()
+        self._generation = 0
+        self.completed = 0
+        self.cancelled = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def _cache_for(self, config: ConnectionConfig) -> QueryResultCache:
+        identity = connection_identity(config)
+        cache = self._caches.get(identity)
+        if cache is None:
+            cache = QueryResultCache(self.ttl_s, self.max_bytes_per_connection)
+            self._caches[identity] = cache
+            self._slots[identity] = threading.BoundedSemaphore(self.max_concurrent_per_connection)
+        return cache
+
+    def take(self, config: ConnectionConfig, query: str, max_rows: int | None) -> CachedResult | None:
+        """Hand out a prefetched result once."""
+        with self._lock:
+            cache = self._caches.get(connection_identity(config))
+        if cache is None:
+            return None
+        hit = cache.get(config, query, max_rows)
+        if hit is not None:
+            cache.invalidate_query(config, query, max_rows)
+        return hit
+
+    def has(self, config: ConnectionConfig, query: str, max_rows: int | None) -> bool:
+        with self._lock:
+            cache = self._caches.get(connection_identity(config))
+        return cache is not None and cache.contains(config, query, max_rows)
+
+    def run_batch(self, requests: list[PreviewRequest], generation: int) -> int:
+        """Prefetch requests in order until done or cancelled. Call off the UI thread."""
+        fetched = 0
+        for request in requests:
+            if generation != self._generation:
+                break
+            if self.run(request, generation):
+                fetched += 1
+        return fetched
+
+    def run(self, request: PreviewRequest, generation: int | None = None) -> bool:
+        """Prefetch one preview. Returns True when a result was stored."""
+        if generation is None:
+            generation = self._generation
+        if not is_cacheable_query(request.query):
+            return False
+        with self._lock:
+            cache = self._cache_for(request.config)
+            slots = self._slots[connection_identity(request.config)]
+        key = (connection_identity(request.config), request.query, request.max_rows)
+        if cache.contains(request.config, request.query, request.max_rows):
+            return False
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+        try:
+            if not slots.acquire(timeout=SLOT_WAIT_S):
+                return False
+            try:
+                return self._execute(request, cache, generation)
+            finally:
+                slots.release()
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def _execute(self, request: PreviewRequest, cache: QueryResultCache, generation: int) -> bool:
+        from sqlit.domains.query.app.query_service import QueryResult
+
+        query = self._query_factory(request)
+        identity = connection_identity(request.config)
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._in_flight.append((identity, query))
+        try:
+            result = query.execute(request.max_rows)
+        except Exception:
+            return False
+        finally:
+            with self._lock:
+                self._in_flight = [item for item in self._in_flight if item[1] is not query]
+        if not isinstance(result, QueryResult):
+            return False
+        # Checked under the lock so invalidate() cannot slip in before the put.
+        with self._lock:
+            if generation != self._generation:
+                return False
+            stored = cache.put(request.config, request.query, request.max_rows, result)
+        if stored:
+            self.completed += 1
+        return stored
+
+    def cancel(self) -> int:
+        """Stop running batches and abort in-flight prefetch queries."""
+        with self._lock:
+            self._generation += 1
+            in_flight = [query for _, query in self._in_flight]
+            self._in_flight.clear()
+        for query in in_flight:
+            try:
+                query.cancel()
+            except Exception:
+                pass
+        self.cancelled += len(in_flight)
+        return len(in_flight)
+
+    def invalidate(self, config: ConnectionConfig) -> None:
+        """Drop prefetched results for a connection after data may have changed.
+
+        Prefetches already running may have read the old data, so the
+        generation is bumped to discard their results and the connection's
+        in-flight queries are aborted.
+        """
+        identity = connection_identity(config)
+        with self._lock:
+            self._generation += 1
+            cache = self._caches.get(identity)
+            stale = [query for owner, query in self._in_flight if owner == identity]
+            self._in_flight = [item for item in self._in_flight if item[0] != identity]
+            if cache is not None:
+                cache.invalidate_connection(config)
+        for query in stale:
+            try:
+                query.cancel()
+            except Exception:
+                pass
+        self.cancelled += len(stale)
+
+    def clear(self) -> None:
+        self.cancel()
+        with self._lock:
+            caches = list(self._caches.values())
+        for cache in caches:
+            cache.clear()
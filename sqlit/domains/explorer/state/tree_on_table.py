@@ -13,6 +13,12 @@ class TreeOnTableState(State):
 
     def _setup_actions(self) -> None:
         self.allows("select_table", label="Select TOP 100", help="Select TOP 100 (table/view)")
+        self.allows(
+            "import_table_data",
+            lambda app: app.tree_node_kind == "table",
+            label="Import",
+            help="Import CSV/Parquet/NDJSON into table",
+        )
 
     def get_display_bindings(self, app: InputContext) -> tuple[list[DisplayBinding], list[DisplayBinding]]:
         left: list[DisplayBinding] = []
@@ -28,6 +34,15 @@ class TreeOnTableState(State):
             )
         )
         seen.add("select_table")
+        if app.tree_node_kind == "table":
+            left.append(
+                DisplayBinding(
+                    key=resolve_display_key("import_table_data") or "I",
+                    label="Import",
+                    action="import_table_data",
+                )
+            )
+            seen.add("import_table_data")
         left.append(
             DisplayBinding(
                 key=resolve_display_key("refresh_tree") or "f",
@@ -13,6 +13,8 @@ from ..tree import db_switching as tree_db_switching
 from ..tree import expansion_state as tree_expansion_state
 from ..tree import loaders as tree_loaders
 from ..tree import object_info as tree_object_info
+from ..tree import preview_prefetch as tree_preview_prefetch
+from ..tree import table_import as tree_table_import
 from .tree_labels import TreeLabelMixin
 from .tree_schema import TreeSchemaMixin
 
@@ -39,6 +41,7 @@ class TreeMixin(TreeSchemaMixin, TreeLabelMixin):
     _expanded_state_save_timer: Any | None = None
     _schema_service: Any | None = None
     _schema_service_session: Any | None = None
+    _preview_prefetcher: Any | None = None
 
     def _emit_debug(self: TreeMixinHost, name: str, **data: Any) -> None:
         emit = getattr(self, "emit_debug_event", None)
@@ -207,6 +210,7 @@ class TreeMixin(TreeSchemaMixin, TreeLabelMixin):
     def on_tree_node_highlighted(self: TreeMixinHost, event: Tree.NodeHighlighted) -> None:
         """Update footer when tree selection changes."""
         self._update_footer_bindings()
+        tree_preview_prefetch.schedule_preview_prefetch(self, event.node)
 
     def action_refresh_tree(self: TreeMixinHost) -> None:
         """Refresh the explorer."""
@@ -289,20 +293,22 @@ class TreeMixin(TreeSchemaMixin, TreeLabelMixin):
         data = node.data
 
         if self._get_node_kind(node) in ("table", "view"):
+            query = self.current_provider.dialect.build_select_query(
+                data.name,
+                100,
+                data.database,
+                data.schema,
+            )
             self._last_query_table = {
                 "database": data.database,
                 "schema": data.schema,
                 "name": data.name,
                 "columns": [],
+                "query": query,
             }
             self._prime_last_query_table_columns(data.database, data.schema, data.name)
 
-            self.query_input.text = self.current_provider.dialect.build_select_query(
-                data.name,
-                100,
-                data.database,
-                data.schema,
-            )
+            self.query_input.text = query
             self._query_target_database = data.database
             self.action_execute_query()
             return
@@ -319,6 +325,17 @@ class TreeMixin(TreeSchemaMixin, TreeLabelMixin):
             tree_object_info.show_sequence_info(self, data)
             return
 
+    def action_import_table_data(self: TreeMixinHost) -> None:
+        """Bulk-import a CSV, Parquet or NDJSON file into the selected table."""
+        if not self.current_provider or not self._session:
+            return
+
+        node = self.object_tree.cursor_node
+        if not node or not node.data or self._get_node_kind(node) != "table":
+            return
+
+        tree_table_import.prompt_import(self, node.data)
+
     def action_use_database(self: TreeMixinHost) -> None:
         """Toggle the selected database as the default for the current connection."""
         node = self.object_tree.cursor_node
@@ -0,0 +1,137 @@
+"""Speculative table preview prefetch for the explorer tree."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from sqlit.domains.explorer.app.preview_prefetch import (
+    PREFETCH_NEIGHBORS,
+    PREFETCH_OFF,
+    PreviewPrefetcher,
+    PreviewRequest,
+    prefetch_mode,
+)
+from sqlit.domains.query.app.result_cache import CachedResult
+from sqlit.shared.ui.protocols import TreeMixinHost
+
+IDLE_CALLBACK_NAME = "preview-prefetch"
+PREVIEW_ROW_LIMIT = 100
+PREFETCH_KINDS = ("table", "view")
+
+
+def get_prefetcher(host: TreeMixinHost) -> PreviewPrefetcher:
+    prefetcher = host._preview_prefetcher
+    if prefetcher is None:
+        prefetcher = PreviewPrefetcher()
+        host._preview_prefetcher = prefetcher
+    return prefetcher
+
+
+def _max_rows(host: TreeMixinHost) -> int:
+    from sqlit.domains.query.ui.mixins.query_constants import MAX_FETCH_ROWS
+
+    return host.services.runtime.max_rows or MAX_FETCH_ROWS
+
+
+def _build_request(host: TreeMixinHost, node: Any) -> PreviewRequest | None:
+    """Build the exact query and config that ``action_select_table`` would run."""
+    from sqlit.domains.query.app.query_runner import resolve_execution_config
+
+    provider = host.current_provider
+    config = host.current_config
+    data = getattr(node, "data", None)
+    if provider is None or config is None or data is None:
+        return None
+    query = provider.dialect.build_select_query(data.name, PREVIEW_ROW_LIMIT, data.database, data.schema)
+    config = resolve_execution_config(
+        config=config,
+        provider=provider,
+        target_db=data.database,
+        active_db=host._get_effective_database(),
+    )
+    return PreviewRequest(config=config, provider=provider, query=query, max_rows=_max_rows(host))
+
+
+def _targets(host: TreeMixinHost, node: Any, mode: str) -> list[Any]:
+    targets = [node]
+    if mode != PREFETCH_NEIGHBORS or node.parent is None:
+        return targets
+    siblings = list(node.parent.children)
+    try:
+        index = siblings.index(node)
+    except ValueError:
+        return targets
+    for neighbor_index in (index + 1, index - 1):
+        if 0 <= neighbor_index < len(siblings):
+            neighbor = siblings[neighbor_index]
+            if host._get_node_kind(neighbor) in PREFETCH_KINDS:
+                targets.append(neighbor)
+    return targets
+
+
+def cancel_preview_prefetch(host: TreeMixinHost) -> None:
+    """Drop queued prefetches and abort the one in flight."""
+    try:
+        from sqlit.domains.shell.app.idle_scheduler import get_idle_scheduler
+
+        get_idle_scheduler().cancel_all(IDLE_CALLBACK_NAME)
+    except Exception:
+        pass
+    if host._preview_prefetcher is not None:
+        host._preview_prefetcher.cancel()
+
+
+def schedule_preview_prefetch(host: TreeMixinHost, node: Any) -> None:
+    """Prefetch the preview for a highlighted table once the app is idle."""
+    cancel_preview_prefetch(host)
+    if node is None or host._get_node_kind(node) not in PREFETCH_KINDS:
+        return
+    config = host.current_config
+    if host.current_connection is None or config is None or host.current_provider is None:
+        return
+    if prefetch_mode(config) == PREFETCH_OFF:
+        return
+    if host.query_executing or getattr(host, "in_transaction", False):
+        return
+
+    try:
+        requests = [
+            request
+            for target in _targets(host, node, prefetch_mode(config))
+            if (request := _build_request(host, target)) is not None
+        ]
+    except Exception:
+        return
+    if not requests:
+        return
+
+    prefetcher = get_prefetcher(host)
+    generation = prefetcher.generation
+
+    def start() -> None:
+        if prefetcher.generation != generation or host.current_config is not config:
+            return
+        host.run_worker(
+            asyncio.to_thread(prefetcher.run_batch, requests, generation),
+            name=IDLE_CALLBACK_NAME,
+            group=IDLE_CALLBACK_NAME,
+        )
+
+    try:
+        from sqlit.domains.shell.app.idle_scheduler import Priority, get_idle_scheduler
+    except Exception:
+        scheduler = None
+    else:
+        scheduler = get_idle_scheduler()
+    if scheduler:
+        scheduler.request_idle_callback(start, priority=Priority.LOW, name=IDLE_CALLBACK_NAME)
+    else:
+        start()
+
+
+def take_prefetched(host: Any, config: Any, query: str, max_rows: int | None) -> CachedResult | None:
+    prefetcher = getattr(host, "_preview_prefetcher", None)
+    if prefetcher is None:
+        return None
+    return prefetcher.take(config, query, max_rows)
@@ -0,0 +1,115 @@
+"""Bulk file import into a table from the explorer tree."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+from sqlit.domains.explorer.domain.tree_nodes import TableNode
+from sqlit.shared.ui.protocols import TreeMixinHost
+
+# Minimum seconds between progress updates posted to the UI thread.
+PROGRESS_INTERVAL_S = 0.1
+
+
+def prompt_import(host: TreeMixinHost, data: TableNode) -> None:
+    """Ask for a file and import it into the table."""
+    from sqlit.domains.query.app.bulk_import import IMPORT_FILE_EXTENSIONS
+    from sqlit.shared.ui.screens.file_picker import FilePickerMode, FilePickerScreen
+
+    def handle_result(filename: str | None) -> None:
+        if filename:
+            start_import(host, data, filename)
+
+    host.push_screen(
+        FilePickerScreen(
+            mode=FilePickerMode.OPEN,
+            title=f"Import into {data.name}",
+            file_extensions=IMPORT_FILE_EXTENSIONS,
+        ),
+        handle_result,
+    )
+
+
+def start_import(host: TreeMixinHost, data: TableNode, filename: str) -> None:
+    """Run the import on a dedicated connection behind a progress screen."""
+    from sqlit.domains.query.app.bulk_import import (
+        BulkImporter,
+        ImportCancelledError,
+        ImportProgress,
+        detect_import_format,
+    )
+    from sqlit.shared.ui.screens.import_progress import ImportProgressScreen
+
+    provider = host.current_provider
+    config = host.current_config
+    if provider is None or config is None:
+        host.notify("Not connected", severity="error")
+        return
+
+    path = Path(filename).expanduser()
+    try:
+        detect_import_format(path)
+    except ValueError as error:
+        host.notify(str(error), severity="error")
+        return
+
+    if data.database:
+        config = provider.apply_database_override(config, data.database)
+
+    importer = BulkImporter(provider)
+    screen = ImportProgressScreen(f"Importing {path.name} into {data.name}", on_cancel=importer.cancel)
+    host.push_screen(screen)
+    last_update = 0.0
+
+    def on_progress(progress: ImportProgress) -> None:
+        nonlocal last_update
+        now = time.monotonic()
+        if now - last_update < PROGRESS_INTERVAL_S:
+            return
+        last_update = now
+        snapshot = ImportProgress(**vars(progress))
+        host.call_from_thread(screen.update_progress, snapshot)
+
+    def run() -> Any:
+        conn = provider.connection_factory.connect(config)
+        try:
+            try:
+                provider.post_connect(conn, config)
+            except Exception:
+                pass
+            return importer.run(conn, path, data.name, schema=data.schema or None, on_progress=on_progress)
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    async def work() -> None:
+        try:
+            result = await asyncio.to_thread(run)
+        except ImportCancelledError:
+            _dismiss(screen)
+            host.notify("Import cancelled; no rows were committed", severity="warning")
+            return
+        except Exception as error:
+            _dismiss(screen)
+            host.notify(f"Import failed: {error}", severity="error")
+            return
+        _dismiss(screen)
+        invalidate = getattr(host, "_invalidate_query_result_cache", None)
+        if callable(invalidate):
+            invalidate(config)
+        rows = f"{result.rows:,} rows" if result.rows >= 0 else "Rows"
+        host.notify(f"{rows} imported into {data.name} in {result.elapsed_s:.1f}s ({result.rows_per_second:,.0f} rows/s)")
+
+    host.run_worker(work(), name="table_import", exclusive=False)
+
+
+def _dismiss(screen: Any) -> None:
+    try:
+        screen.dismiss()
+    except Exception:
+        pass
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from multiprocessing.connection import Connection
 from typing import Any
 
+from sqlit.domains.connections.app.tunnel_broker import close_tunnel_broker, get_tunnel_broker, tunnel_key
 from sqlit.domains.connections.domain.config import ConnectionConfig
 from sqlit.domains.connections.providers.catalog import get_provider
 from sqlit.domains.connections.providers.config_service import normalize_connection_config
@@ -21,20 +22,7 @@ from sqlit.domains.connections.providers.model import (
 from sqlit.domains.query.app.cancellable import CancellableQuery
 from sqlit.domains.query.app.multi_statement import split_statements
 from sqlit.domains.query.app.query_service import NonQueryResult, QueryResult
-
-
-def _tunnel_key(config: ConnectionConfig) -> tuple[Any, ...] | None:
-    tunnel = config.tunnel
-    if tunnel is None or not tunnel.enabled:
-        return None
-    return (
-        tunnel.host,
-        tunnel.port,
-        tunnel.username,
-        tunnel.auth_type,
-        tunnel.password,
-        tunnel.key_path,
-    )
+from sqlit.shared.core.query_timing import QueryTimings, activate
 
 
 @dataclass
@@ -57,16 +45,16 @@ class _WorkerState:
                 pass
 
     def _ensure_tunnel(self, config: ConnectionConfig) -> Any | None:
-        key = _tunnel_key(config)
+        key = tunnel_key(config)
         if key is None:
             self._close_tunnel()
             return None
-        if key != self.tunnel_key:
+        if key != self.tunnel_key or not self.tunnel.is_active:
+            # Lease the new tunnel before releasing the old one so switching
+            # back and forth keeps both warm in the broker.
+            lease, _, _ = get_tunnel_broker().acquire(config)
             self._close_tunnel()
-            from sqlit.domains.connections.app.tunnel import create_ssh_tunnel
-
-            tunnel, _, _ = create_ssh_tunnel(config)
-            self.tunnel = tunnel
+            self.tunnel = lease
             self.tunnel_key = key
         return self.tunnel
 
@@ -118,7 +106,11 @@ class _WorkerState:
             )
             return
 
+        timings = QueryTimings(query)
+        tunnel_start = timings.elapsed_ms()
         tunnel = self._ensure_tunnel(config)
+        if tunnel is not None:
+            timings.record_since("tunnel", tunnel_start)
         cancellable = CancellableQuery(
             sql=query,
             config=config,
@@ -131,8 +123,10 @@ class _WorkerState:
         def run() -> None:
             start = time.perf_counter()
             try:
-                result = cancellable.execute(max_rows=max_rows)
+                with activate(timings):
+                    result = cancellable.execute(max_rows=max_rows)
                 elapsed_ms = (time.perf_counter() - start) * 1000
+                spans = timings.as_dict()["spans"]
                 if isinstance(result, QueryResult):
                     self.send(
                         {
@@ -141,6 +135,9 @@ class _WorkerState:
                             "kind": "query",
                             "result": result,
                             "elapsed_ms": elapsed_ms,
+                            "timings": spans,
+                            # Stamped before pickling so the UI side can time the transfer.
+                            "sent_at": time.time(),
                         }
                     )
                 elif isinstance(result, NonQueryResult):
@@ -151,6 +148,9 @@ class _WorkerState:
                             "kind": "non_query",
                             "result": result,
                             "elapsed_ms": elapsed_ms,
+                            "timings": spans,
+                            # Stamped before pickling so the UI side can time the transfer.
+                            "sent_at": time.time(),
                         }
                     )
                 else:
@@ -498,6 +498,7 @@ def run_process_worker(conn: Connection) -> None:
     finally:
         state._cancel_current(state.current_id or 0)
         state._close_tunnel()
+        close_tunnel_broker()
         try:
             conn.close()
         except Exception:
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import threading
-from dataclasses import dataclass
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from multiprocessing import get_context
 import os
 import sys
 from multiprocessing.connection import Connection
 from typing import Any
 
+from sqlit.domains.connections.app.tunnel_broker import get_tunnel_broker
 from sqlit.domains.connections.domain.config import ConnectionConfig
 from sqlit.domains.query.app.query_service import NonQueryResult, QueryResult
 from sqlit.domains.connections.providers.adapters.base import ColumnInfo
+from sqlit.shared.core.query_timing import current_query_timings
 
 from .process_worker import run_process_worker
 
@@ -25,6 +30,37 @@ class ProcessQueryOutcome:
     elapsed_ms: float
     cancelled: bool = False
     error: str | None = None
+    # Timing spans recorded in the worker, offsets relative to the worker's start.
+    spans: list[dict[str, Any]] = field(default_factory=list)
+    # Time from the worker sending the result to this process receiving it.
+    ipc_ms: float = 0.0
+
+
+@contextmanager
+def _worker_config(config: ConnectionConfig) -> Iterator[ConnectionConfig]:
+    """Route the worker through this process's SSH tunnel.
+
+    The broker's tunnels listen on 127.0.0.1, so the worker is sent a plain
+    config pointing at the local port and never opens its own tunnel. The
+    lease is held until the request finishes. If the tunnel cannot be opened
+    here, the original config is sent and the worker reports the error.
+    """
+    timings = current_query_timings()
+    start_ms = timings.elapsed_ms() if timings is not None else 0.0
+    try:
+        lease, host, port = get_tunnel_broker().acquire(config)
+    except Exception:
+        yield config
+        return
+    if lease is None:
+        yield config
+        return
+    if timings is not None:
+        timings.record_since("tunnel", start_ms)
+    try:
+        yield config.with_endpoint(host=host, port=str(port)).with_tunnel(enabled=False)
+    finally:
+        lease.stop()
 
 
 class ProcessWorkerClient:
@@ -97,7 +133,7 @@ class ProcessWorkerClient:
             pass
 
     def execute(self, query: str, config: ConnectionConfig, max_rows: int | None) -> ProcessQueryOutcome:
-        with self._execute_lock:
+        with self._execute_lock, _worker_config(config) as worker_config:
             if self._closed:
                 return ProcessQueryOutcome(result=None, elapsed_ms=0, error="Worker is closed.")
 
@@ -109,7 +145,7 @@ class ProcessWorkerClient:
                 "type": "exec",
                 "id": query_id,
                 "query": query,
-                "config": config.to_dict(include_passwords=True),
+                "config": worker_config.to_dict(include_passwords=True),
                 "db_type": config.db_type,
                 "max_rows": max_rows,
             }
@@ -125,9 +161,13 @@ class ProcessWorkerClient:
                         continue
                     msg_type = message.get("type")
                     if msg_type == "result":
+                        sent_at = message.get("sent_at")
+                        ipc_ms = max(0.0, (time.time() - float(sent_at)) * 1000) if sent_at else 0.0
                         return ProcessQueryOutcome(
                             result=message.get("result"),
                             elapsed_ms=float(message.get("elapsed_ms", 0)),
+                            spans=list(message.get("timings") or []),
+                            ipc_ms=ipc_ms,
                         )
                     if msg_type == "cancelled":
                         return ProcessQueryOutcome(result=None, elapsed_ms=0, cancelled=True)
@@ -148,7 +188,7 @@ class ProcessWorkerClient:
         schema: str | None,
         name: str,
     ) -> ProcessSchemaOutcome:
-        with self._execute_lock:
+        with self._execute_lock, _worker_config(config) as worker_config:
             if self._closed:
                 return ProcessSchemaOutcome(columns=None, error="Worker is closed.")
 
@@ -160,7 +200,7 @@ class ProcessWorkerClient:
                 "type": "schema",
                 "op": "columns",
                 "id": query_id,
-                "config": config.to_dict(include_passwords=True),
+                "config": worker_config.to_dict(include_passwords=True),
                 "db_type": config.db_type,
                 "database": database,
                 "schema": schema,
@@ -199,7 +239,7 @@ class ProcessWorkerClient:
         database: str | None,
         folder_type: str,
     ) -> ProcessFolderOutcome:
-        with self._execute_lock:
+        with self._execute_lock, _worker_config(config) as worker_config:
             if self._closed:
                 return ProcessFolderOutcome(items=None, error="Worker is closed.")
 
@@ -211,7 +251,7 @@ class ProcessWorkerClient:
                 "type": "schema",
                 "op": "folder_items",
                 "id": query_id,
-                "config": config.to_dict(include_passwords=True),
+                "config": worker_config.to_dict(include_passwords=True),
                 "db_type": config.db_type,
                 "database": database,
                 "folder_type": folder_type,
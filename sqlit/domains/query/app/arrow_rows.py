@@ -0,0 +1,112 @@
+"""Read-only row views over Arrow-backed query results."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Any, overload
+
+ARROW_ROW_CHUNK_SIZE = 1024
+
+
+def arrow_table_to_tuples(table: Any) -> list[tuple]:
+    """Convert an Arrow table (or slice) to row tuples column by column."""
+    if table.num_columns == 0:
+        return [()] * table.num_rows
+    return list(zip(*(column.to_pylist() for column in table.columns)))
+
+
+class ArrowRowView(Sequence[tuple]):
+    """Sequence of row tuples backed by a pyarrow Table.
+
+    Rows are materialized in chunks only when accessed, so holding the view
+    costs no more than the columnar table. Iteration converts one chunk at a
+    time without caching; random access keeps the most recent chunk.
+    """
+
+    def __init__(self, table: Any) -> None:
+        self.arrow_table = table
+        self._chunk_start = -1
+        self._chunk_rows: list[tuple] = []
+
+    def __len__(self) -> int:
+        return int(self.arrow_table.num_rows)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple]: ...
+
+    def __getitem__(self, index: int | slice) -> tuple | list[tuple]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return arrow_table_to_tuples(self.arrow_table.slice(start, max(0, stop - start)))
+            return [self[i] for i in range(start, stop, step)]
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError("row index out of range")
+        chunk_start = index - (index % ARROW_ROW_CHUNK_SIZE)
+        if chunk_start != self._chunk_start:
+            self._chunk_rows = arrow_table_to_tuples(self.arrow_table.slice(chunk_start, ARROW_ROW_CHUNK_SIZE))
+            self._chunk_start = chunk_start
+        return self._chunk_rows[index - chunk_start]
+
+    def __iter__(self) -> Iterator[tuple]:
+        for start in range(0, len(self), ARROW_ROW_CHUNK_SIZE):
+            yield from arrow_table_to_tuples(self.arrow_table.slice(start, ARROW_ROW_CHUNK_SIZE))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ArrowRowView):
+            return bool(self.arrow_table.equals(other.arrow_table))
+        if isinstance(other, Sequence):
+            return len(other) == len(self) and all(a == tuple(b) for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ArrowRowView(rows={len(self)}, columns={self.arrow_table.num_columns})"
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"arrow_table": self.arrow_table}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["arrow_table"])  # type: ignore[misc]
+
+
+def snapshot_rows(rows: Sequence[tuple]) -> Sequence[tuple]:
+    """Copy a mutable row list; read-only row views are shared as-is."""
+    if isinstance(rows, list):
+        return list(rows)
+    return rows
+
+
+def arrow_row_texts(table: Any) -> list[str]:
+    """Build one space-joined search string per row, vectorized per column.
+
+    String and integer columns are cast inside Arrow; other types go through
+    ``str()`` so the text matches what the tuple-based filter produces.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.types as pt
+
+    if table.num_columns == 0:
+        return [""] * table.num_rows
+
+    texts = []
+    for column in table.columns:
+        column = column.combine_chunks() if hasattr(column, "combine_chunks") else column
+        if pt.is_string(column.type) or pt.is_large_string(column.type) or pt.is_integer(column.type):
+            text = pc.cast(column, pa.string())
+        else:
+            text = pa.array(
+                [str(value) if value is not None else None for value in column.to_pylist()],
+                type=pa.string(),
+            )
+        texts.append(pc.fill_null(text, ""))
+    return list(pc.binary_join_element_wise(*texts, " ").to_pylist())
@@ -0,0 +1,367 @@
+"""Bulk data import for sqlit.
+
+Loads a CSV, Parquet or NDJSON file into an existing table using the
+fastest path the provider offers:
+- ``FileBulkLoader`` engines read the file themselves (DuckDB read_csv /
+  read_parquet / read_json, ClickHouse native formats, MySQL LOAD DATA LOCAL)
+- ``RowBulkLoader`` engines receive streamed row batches (PostgreSQL COPY,
+  SQLite and SQL Server executemany in one transaction)
+- anything else with a DB-API cursor gets batched ``executemany``
+
+When rows are streamed, reading and value coercion run on a background
+thread while the previous batch is being inserted.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sqlit.domains.connections.providers.model import DatabaseProvider
+
+IMPORT_FORMATS = ("csv", "parquet", "ndjson")
+IMPORT_FILE_EXTENSIONS = [".csv", ".tsv", ".parquet", ".ndjson", ".jsonl"]
+DEFAULT_IMPORT_BATCH_ROWS = 5000
+# Batches read ahead of the inserting thread.
+PREFETCH_BATCHES = 4
+
+_FORMAT_BY_EXTENSION = {
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+
+class ImportCancelledError(RuntimeError):
+    """Raised when an import is cancelled between batches."""
+
+
+def detect_import_format(path: str | Path) -> str:
+    """Infer the import format from a file extension."""
+    fmt = _FORMAT_BY_EXTENSION.get(Path(path).suffix.lower())
+    if fmt is None:
+        raise ValueError(f"Cannot infer import format from '{Path(path).name}'; use one of: {', '.join(IMPORT_FORMATS)}")
+    return fmt
+
+
+def default_delimiter(path: str | Path) -> str:
+    return "\t" if Path(path).suffix.lower() == ".tsv" else ","
+
+
+@dataclass
+class ImportProgress:
+    """Progress of a running import."""
+
+    rows: int = 0
+    bytes_read: int = 0
+    total_bytes: int = 0
+    elapsed_s: float = 0.0
+    method: str = ""
+
+    @property
+    def fraction(self) -> float:
+        if self.total_bytes <= 0:
+            return 0.0
+        return min(1.0, self.bytes_read / self.total_bytes)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+@dataclass
+class ImportResult:
+    """Outcome of a completed import."""
+
+    rows: int
+    elapsed_s: float
+    method: str
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_s if self.elapsed_s > 0 and self.rows > 0 else 0.0
+
+
+def format_import_progress(progress: ImportProgress, width: int = 30) -> str:
+    """One-line progress bar with row count and throughput."""
+    filled = int(progress.fraction * width)
+    bar = "#" * filled + "-" * (width - filled)
+    return (
+        f"[{bar}] {progress.fraction:4.0%}  {progress.rows:,} rows  "
+        f"{progress.rows_per_second:,.0f} rows/s"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Readers
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ImportSource:
+    """Column names and a batch iterator for one input file."""
+
+    columns: list[str]
+    batches: Iterator[list[tuple]]
+    bytes_read: Callable[[], int]
+    total_bytes: int
+    _close: Callable[[], None] = field(default=lambda: None, repr=False)
+
+    def close(self) -> None:
+        self._close()
+
+
+def _coerce_csv_row(row: list[str]) -> tuple:
+    return tuple(None if value == "" else value for value in row)
+
+
+def _coerce_json_value(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def _open_csv(path: Path, batch_rows: int, delimiter: str) -> ImportSource:
+    binary = open(path, "rb")
+    text = io.TextIOWrapper(binary, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text, delimiter=delimiter)
+    try:
+        columns = next(reader)
+    except StopIteration:
+        text.close()
+        raise ValueError(f"'{path.name}' is empty; a header row is required") from None
+
+    def batches() -> Iterator[list[tuple]]:
+        batch: list[tuple] = []
+        for row in reader:
+            if not row:
+                continue
+            batch.append(_coerce_csv_row(row))
+            if len(batch) >= batch_rows:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    return ImportSource(columns, batches(), binary.tell, path.stat().st_size, text.close)
+
+
+def _open_ndjson(path: Path, batch_rows: int) -> ImportSource:
+    binary = open(path, "rb")
+    first: dict[str, Any] | None = None
+    for line in binary:
+        if line.strip():
+            first = json.loads(line)
+            break
+    if not isinstance(first, dict):
+        binary.close()
+        raise ValueError(f"'{path.name}' has no JSON object rows")
+    columns = list(first)
+
+    def to_row(record: dict[str, Any]) -> tuple:
+        return tuple(_coerce_json_value(record.get(column)) for column in columns)
+
+    def batches() -> Iterator[list[tuple]]:
+        batch = [to_row(first)]
+        for line in binary:
+            if not line.strip():
+                continue
+            batch.append(to_row(json.loads(line)))
+            if len(batch) >= batch_rows:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    return ImportSource(columns, batches(), binary.tell, path.stat().st_size, binary.close)
+
+
+def _open_parquet(path: Path, batch_rows: int) -> ImportSource:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Parquet import requires pyarrow (pip install pyarrow)") from exc
+
+    parquet = pq.ParquetFile(path)
+    total_rows = max(1, parquet.metadata.num_rows)
+    total_bytes = path.stat().st_size
+    rows_read = 0
+
+    def batches() -> Iterator[list[tuple]]:
+        nonlocal rows_read
+        for record_batch in parquet.iter_batches(batch_size=batch_rows):
+            columns = [column.to_pylist() for column in record_batch.columns]
+            rows = [tuple(_coerce_json_value(value) for value in row) for row in zip(*columns)]
+            rows_read += len(rows)
+            yield rows
+
+    return ImportSource(
+        list(parquet.schema_arrow.names),
+        batches(),
+        lambda: int(total_bytes * rows_read / total_rows),
+        total_bytes,
+        parquet.close if hasattr(parquet, "close") else lambda: None,
+    )
+
+
+def open_import_source(
+    path: str | Path,
+    file_format: str | None = None,
+    *,
+    batch_rows: int = DEFAULT_IMPORT_BATCH_ROWS,
+    delimiter: str | None = None,
+) -> ImportSource:
+    """Open a file for batched reading."""
+    path = Path(path).expanduser()
+    fmt = file_format or detect_import_format(path)
+    if fmt == "csv":
+        return _open_csv(path, batch_rows, delimiter or default_delimiter(path))
+    if fmt == "ndjson":
+        return _open_ndjson(path, batch_rows)
+    if fmt == "parquet":
+        return _open_parquet(path, batch_rows)
+    raise ValueError(f"Unsupported import format '{fmt}'; use one of: {', '.join(IMPORT_FORMATS)}")
+
+
+def prefetch(batches: Iterable[list[tuple]], depth: int = PREFETCH_BATCHES) -> Iterator[list[tuple]]:
+    """Produce batches on a background thread, up to ``depth`` ahead."""
+    buffer: queue.Queue[Any] = queue.Queue(maxsize=max(1, depth))
+    done = object()
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            for batch in batches:
+                while not stop.is_set():
+                    try:
+                        buffer.put(batch, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+            buffer.put(done)
+        except BaseException as exc:  # Re-raised on the consuming thread
+            buffer.put(exc)
+
+    thread = threading.Thread(target=produce, name="sqlit-import-reader", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join(timeout=1)
+
+
+# ---------------------------------------------------------------------------
+# Import driver
+# ---------------------------------------------------------------------------
+
+
+def qualified_table_name(provider: DatabaseProvider, table: str, schema: str | None = None) -> str:
+    """Quoted ``schema.table`` reference for the provider's dialect."""
+    quote = provider.dialect.quote_identifier
+    return ".".join(quote(part) for part in (schema, table) if part)
+
+
+@dataclass
+class BulkImporter:
+    """Imports a file into a table over an open connection.
+
+    Usage:
+        importer = BulkImporter(provider)
+        result = importer.run(conn, "data.csv", "events", on_progress=print)
+    """
+
+    provider: DatabaseProvider
+    batch_rows: int = DEFAULT_IMPORT_BATCH_ROWS
+    _cancelled: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def cancel(self) -> None:
+        """Stop a streamed import before its next batch."""
+        self._cancelled.set()
+
+    def run(
+        self,
+        conn: Any,
+        path: str | Path,
+        table: str,
+        *,
+        schema: str | None = None,
+        file_format: str | None = None,
+        delimiter: str | None = None,
+        on_progress: Callable[[ImportProgress], None] | None = None,
+    ) -> ImportResult:
+        """Load ``path`` into ``table`` and return the row count and timing."""
+        from sqlit.domains.connections.providers.model import FileBulkLoader, RowBulkLoader
+
+        path = Path(path).expanduser()
+        fmt = file_format or detect_import_format(path)
+        delimiter = delimiter or default_delimiter(path)
+        target = qualified_table_name(self.provider, table, schema)
+        executor = self.provider.query_executor
+        start = time.perf_counter()
+
+        source = open_import_source(path, fmt, batch_rows=self.batch_rows, delimiter=delimiter)
+        progress = ImportProgress(total_bytes=source.total_bytes)
+        try:
+            if isinstance(executor, FileBulkLoader):
+                progress.method = f"{self.provider.metadata.display_name} file load"
+                rows = executor.load_file(conn, target, source.columns, str(path), fmt, delimiter)
+                if rows is not None:
+                    progress.rows = max(rows, 0)
+                    progress.bytes_read = progress.total_bytes
+                    progress.elapsed_s = time.perf_counter() - start
+                    if on_progress is not None:
+                        on_progress(progress)
+                    return ImportResult(rows=rows, elapsed_s=progress.elapsed_s, method=progress.method)
+
+            def tracked() -> Iterator[list[tuple]]:
+                for batch in prefetch(source.batches):
+                    if self._cancelled.is_set():
+                        raise ImportCancelledError("Import cancelled")
+                    yield batch
+                    progress.rows += len(batch)
+                    progress.bytes_read = source.bytes_read()
+                    progress.elapsed_s = time.perf_counter() - start
+                    if on_progress is not None:
+                        on_progress(progress)
+
+            if isinstance(executor, RowBulkLoader):
+                progress.method = f"{self.provider.metadata.display_name} bulk load"
+                rows = executor.load_rows(conn, target, source.columns, tracked())
+            elif callable(getattr(conn, "cursor", None)):
+                from sqlit.domains.connections.providers.adapters.bulk import (
+                    build_insert_sql,
+                    driver_paramstyle,
+                    executemany_batches,
+                )
+
+                progress.method = "executemany"
+                quoted = [self.provider.dialect.quote_identifier(column) for column in source.columns]
+                sql = build_insert_sql(target, quoted, driver_paramstyle(conn))
+                rows = executemany_batches(conn, sql, tracked())
+            else:
+                raise RuntimeError(f"{self.provider.metadata.display_name} does not support bulk import")
+        finally:
+            source.close()
+
+        return ImportResult(rows=rows, elapsed_s=time.perf_counter() - start, method=progress.method)
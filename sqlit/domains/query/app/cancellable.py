@@ -1,7 +1,8 @@
 """Cancellable query execution for sqlit.
 
 This module provides CancellableQuery which creates a dedicated connection
-for query execution that can be cancelled by closing the connection.
+for query execution. Cancelling asks the server to abort the statement when
+the provider supports it, and closes the connection otherwise.
 """
 
 from __future__ import annotations
@@ -12,6 +13,10 @@ from typing import TYPE_CHECKING, Any
 
 from sqlit.domains.query.app.query_service import KeywordQueryAnalyzer, QueryKind
 
+# How long a natively cancelled query may take to stop before its connection
+# is closed anyway.
+CANCEL_GRACE_SECONDS = 5.0
+
 if TYPE_CHECKING:
     from sqlit.domains.connections.domain.config import ConnectionConfig
     from sqlit.domains.connections.providers.model import DatabaseProvider
@@ -21,11 +26,13 @@ if TYPE_CHECKING:
 
 @dataclass
 class CancellableQuery:
-    """A query that can be cancelled by closing its dedicated connection.
+    """A query on a dedicated connection that can be cancelled from another thread.
 
     Unlike queries run on the shared connection, this creates a dedicated
-    connection for each query execution, allowing the query to be cancelled
-    by simply closing the connection - which works across all database types.
+    connection for each query execution. Cancelling uses the provider's
+    native cancel (``QueryCanceller``) when it has one, so the server stops
+    the statement promptly; closing the connection, which works across all
+    database types, is the fallback.
 
     Usage:
         query = CancellableQuery(
@@ -39,13 +46,14 @@ class CancellableQuery:
         future = executor.submit(query.execute, max_rows=1000)
 
         # To cancel from another thread:
-        query.cancel()  # This closes the connection, aborting the query
+        query.cancel()  # Aborts the statement server-side, or closes the connection
 
     Attributes:
         sql: The SQL query to execute.
         config: Connection configuration for creating dedicated connection.
         adapter: Database adapter for connection and query execution.
         tunnel: Optional existing SSH tunnel to reuse.
+        limit_pushdown: Rewrite simple SELECTs so the server applies max_rows.
     """
 
     sql: str
@@ -53,12 +61,15 @@ class CancellableQuery:
     provider: DatabaseProvider
     tunnel: Any | None = None
     analyzer: QueryAnalyzer = field(default_factory=KeywordQueryAnalyzer)
+    limit_pushdown: bool = False
 
     def __post_init__(self) -> None:
         """Initialize internal state."""
         self._connection: Any = None
+        self._connect_config: ConnectionConfig | None = None
         self._created_tunnel: Any = None
         self._lock = threading.Lock()
+        self._finished = threading.Event()
         self._cancelled = False
         self._executing = False
 
@@ -81,9 +92,10 @@ class CancellableQuery:
             RuntimeError: If already cancelled before execution started.
             Any database-specific errors from connection or query execution.
         """
-        from sqlit.domains.connections.app.tunnel import create_ssh_tunnel
+        from sqlit.domains.connections.app.tunnel_broker import get_tunnel_broker
+        from sqlit.shared.core.query_timing import query_span
 
-        from .query_service import NonQueryResult, QueryResult
+        from .query_service import NonQueryResult, execute_rows_query
 
         with self._lock:
             if self._cancelled:
@@ -97,8 +109,9 @@ class CancellableQuery:
                 host = "127.0.0.1"
                 port = self.tunnel.local_bind_port
             else:
-                # Create SSH tunnel if needed
-                self._created_tunnel, host, port = create_ssh_tunnel(self.config)
+                # Lease a shared SSH tunnel if needed
+                with query_span("tunnel"):
+                    self._created_tunnel, host, port = get_tunnel_broker().acquire(self.config)
 
             # Adjust config for tunnel
             if self.tunnel or self._created_tunnel:
@@ -110,62 +123,95 @@ class CancellableQuery:
             with self._lock:
                 if self._cancelled:
                     raise RuntimeError("Query was cancelled")
-                self._connection = self.provider.connection_factory.connect(connect_config)
-                try:
-                    self.provider.post_connect(self._connection, connect_config)
-                except Exception:
-                    pass
+                with query_span("connect"):
+                    self._connection = self.provider.connection_factory.connect(connect_config)
+                self._connect_config = connect_config
+                with query_span("post_connect"):
+                    try:
+                        self.provider.post_connect(self._connection, connect_config)
+                    except Exception:
+                        pass
+
+            sql = self.sql
+            if self.limit_pushdown:
+                from .limit_pushdown import limit_query
+
+                sql = limit_query(sql, max_rows, self.provider.dialect)
 
             # Execute query using adapter methods
-            if self.analyzer.classify(self.sql) == QueryKind.RETURNS_ROWS:
-                columns, rows, truncated = self.provider.query_executor.execute_query(
-                    self._connection,
-                    self.sql,
-                    max_rows,
-                )
-                return QueryResult(
-                    columns=columns,
-                    rows=rows,
-                    row_count=len(rows),
-                    truncated=truncated,
-                )
-            else:
+            with query_span("execute"):
+                if self.analyzer.classify(sql) == QueryKind.RETURNS_ROWS:
+                    return execute_rows_query(
+                        self.provider.query_executor,
+                        self._connection,
+                        sql,
+                        max_rows,
+                    )
                 # Non-SELECT query
-                rows_affected = self.provider.query_executor.execute_non_query(self._connection, self.sql)
+                rows_affected = self.provider.query_executor.execute_non_query(self._connection, sql)
                 return NonQueryResult(rows_affected=rows_affected)
 
         finally:
             self._cleanup()
 
     def cancel(self) -> bool:
-        """Cancel the query by closing the dedicated connection.
+        """Cancel the query, natively if the provider supports it.
 
-        This is safe to call from any thread. If the query is currently
-        executing, closing the connection will cause the database driver
-        to abort the query (behavior is driver-specific but generally
-        raises an exception in the executing thread).
+        This is safe to call from any thread and does not block. If the
+        query is executing and the provider implements ``QueryCanceller``,
+        the cancel request is sent from a background thread and the driver
+        raises in the executing thread. If no request could be sent, it
+        failed, or the query is still running after CANCEL_GRACE_SECONDS,
+        the connection is closed instead.
 
         Returns:
-            True if cancellation was initiated, False if already cancelled
-            or not yet started.
+            True if cancellation was initiated, False if already cancelled.
         """
+        from sqlit.domains.connections.providers.model import QueryCanceller
+
         with self._lock:
             if self._cancelled:
                 return False
             self._cancelled = True
-
-            # If we have a connection, close it to abort the query
-            if self._connection is not None:
-                try:
-                    close_fn = getattr(self._connection, "close", None)
-                    if callable(close_fn):
-                        close_fn()
-                except Exception:
-                    pass
-                self._connection = None
-
+            conn = self._connection
+            config = self._connect_config
+
+        if conn is None:
+            return True
+        executor = self.provider.query_executor
+        if isinstance(executor, QueryCanceller) and config is not None:
+            threading.Thread(
+                target=self._cancel_natively,
+                args=(executor, conn, config),
+                name="sqlit-query-cancel",
+                daemon=True,
+            ).start()
+        else:
+            self._close_connection(conn)
         return True
 
+    def _cancel_natively(self, executor: Any, conn: Any, config: ConnectionConfig) -> None:
+        try:
+            sent = executor.cancel_query(conn, config)
+        except Exception:
+            sent = False
+        if sent and self._finished.wait(CANCEL_GRACE_SECONDS):
+            return
+        self._close_connection(conn)
+
+    def _close_connection(self, conn: Any) -> None:
+        """Close ``conn`` if it is still this query's connection."""
+        with self._lock:
+            if self._connection is not conn:
+                return
+            try:
+                close_fn = getattr(conn, "close", None)
+                if callable(close_fn):
+                    close_fn()
+            except Exception:
+                pass
+            self._connection = None
+
     def _cleanup(self) -> None:
         """Clean up resources (connection and tunnel)."""
         with self._lock:
@@ -181,13 +227,14 @@ class CancellableQuery:
                     pass
                 self._connection = None
 
-            # Stop locally created SSH tunnel
+            # Release the leased SSH tunnel
             if self._created_tunnel is not None:
                 try:
                     self._created_tunnel.stop()
                 except Exception:
                     pass
                 self._created_tunnel = None
+            self._finished.set()
 
     @property
     def is_cancelled(self) -> bool:
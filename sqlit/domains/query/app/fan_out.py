@@ -0,0 +1,266 @@
+"""Run one query concurrently on several connections.
+
+Each connection ("shard") gets a CancellableQuery on its own dedicated
+connection. Shards run on a bounded thread pool; a shard still running
+after its timeout is cancelled the same way the editor cancels a query.
+Results are kept per shard and can be merged into one grid with a
+``__connection`` column identifying where each row came from.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlit.domains.connections.domain.config import ConnectionConfig
+    from sqlit.domains.connections.providers.model import DatabaseProvider
+
+    from .cancellable import CancellableQuery
+
+# Name of the column identifying the source connection in merged results.
+CONNECTION_COLUMN = "__connection"
+
+DEFAULT_FAN_OUT_WORKERS = 8
+DEFAULT_FAN_OUT_TIMEOUT_S = 60.0
+
+SUMMARY_COLUMNS = ["connection", "status", "rows", "latency_ms", "error"]
+
+
+@dataclass
+class ShardResult:
+    """Outcome of the query on one connection."""
+
+    connection_name: str
+    elapsed_ms: float = 0.0
+    columns: list[str] = field(default_factory=list)
+    rows: Sequence[tuple] = field(default_factory=list)
+    truncated: bool = False
+    rows_affected: int | None = None
+    error: str | None = None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def returns_rows(self) -> bool:
+        return self.ok and bool(self.columns)
+
+    @property
+    def status(self) -> str:
+        if self.timed_out:
+            return "timeout"
+        return "ok" if self.ok else "error"
+
+
+@dataclass
+class FanOutResult:
+    """Per-shard results in the order the connections were given."""
+
+    shards: list[ShardResult]
+    elapsed_ms: float = 0.0
+
+    @property
+    def failed(self) -> list[ShardResult]:
+        return [shard for shard in self.shards if not shard.ok]
+
+    @property
+    def truncated(self) -> bool:
+        return any(shard.truncated for shard in self.shards)
+
+    @property
+    def returns_rows(self) -> bool:
+        return any(shard.returns_rows for shard in self.shards)
+
+    def merged(self) -> tuple[list[str], list[tuple]]:
+        """All shard rows in one grid, prefixed with the ``__connection`` column.
+
+        When every shard returned the same columns, rows are concatenated
+        as they are. Otherwise shards are aligned on column name, with
+        repeated names suffixed (``id``, ``id_2``) so none is lost; columns
+        a shard did not return are NULL in its rows.
+        """
+        from sqlit.shared.core.utils import unique_column_names
+
+        shards = [shard for shard in self.shards if shard.returns_rows]
+        if shards and all(shard.columns == shards[0].columns for shard in shards):
+            rows = [(shard.connection_name, *row) for shard in shards for row in shard.rows]
+            return [CONNECTION_COLUMN, *shards[0].columns], rows
+
+        shard_columns = [unique_column_names(shard.columns) for shard in shards]
+        columns: list[str] = []
+        seen: set[str] = set()
+        for names in shard_columns:
+            for column in names:
+                if column not in seen:
+                    seen.add(column)
+                    columns.append(column)
+
+        rows = []
+        for shard, names in zip(shards, shard_columns, strict=True):
+            positions = {column: index for index, column in enumerate(names)}
+            for row in shard.rows:
+                rows.append(
+                    (
+                        shard.connection_name,
+                        *(row[positions[column]] if column in positions else None for column in columns),
+                    )
+                )
+        return [CONNECTION_COLUMN, *columns], rows
+
+    def summary_rows(self) -> list[tuple]:
+        """One row per shard matching SUMMARY_COLUMNS."""
+        rows: list[tuple] = []
+        for shard in self.shards:
+            if shard.returns_rows:
+                count: int | str | None = f"{len(shard.rows)}+" if shard.truncated else len(shard.rows)
+            else:
+                count = shard.rows_affected
+            rows.append((shard.connection_name, shard.status, count, round(shard.elapsed_ms, 1), shard.error))
+        return rows
+
+
+class FanOutQuery:
+    """Runs ``sql`` on every target connection with bounded concurrency.
+
+    Usage:
+        fan_out = FanOutQuery(sql, [(config, provider), ...], max_workers=4, timeout_s=30)
+        result = fan_out.execute(max_rows=1000)
+
+        # From another thread:
+        fan_out.cancel()
+    """
+
+    def __init__(
+        self,
+        sql: str,
+        targets: Sequence[tuple[ConnectionConfig, DatabaseProvider]],
+        *,
+        max_workers: int = DEFAULT_FAN_OUT_WORKERS,
+        timeout_s: float | None = DEFAULT_FAN_OUT_TIMEOUT_S,
+        limit_pushdown: bool = False,
+    ) -> None:
+        self.sql = sql
+        self.targets = list(targets)
+        self.max_workers = max(1, max_workers)
+        self.timeout_s = timeout_s if timeout_s and timeout_s > 0 else None
+        self.limit_pushdown = limit_pushdown
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._queries: list[CancellableQuery] = []
+
+    def execute(
+        self,
+        max_rows: int | None = None,
+        on_shard: Callable[[ShardResult], None] | None = None,
+    ) -> FanOutResult:
+        """Run the query on all targets and wait for every shard.
+
+        ``on_shard`` is called from worker threads as each shard finishes.
+        """
+        start = time.perf_counter()
+        workers = min(self.max_workers, len(self.targets)) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sqlit-fan-out") as pool:
+            futures = [
+                pool.submit(self._run_shard, config, provider, max_rows, on_shard)
+                for config, provider in self.targets
+            ]
+            shards = [future.result() for future in futures]
+        return FanOutResult(shards=shards, elapsed_ms=(time.perf_counter() - start) * 1000)
+
+    def cancel(self) -> None:
+        """Cancel running shards; shards that have not started are skipped."""
+        with self._lock:
+            self._cancelled = True
+            queries = list(self._queries)
+        for query in queries:
+            query.cancel()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def _run_shard(
+        self,
+        config: ConnectionConfig,
+        provider: DatabaseProvider,
+        max_rows: int | None,
+        on_shard: Callable[[ShardResult], None] | None,
+    ) -> ShardResult:
+        from sqlit.domains.query.app.query_service import DialectQueryAnalyzer, QueryResult
+
+        from .cancellable import CancellableQuery
+
+        shard = ShardResult(connection_name=config.name)
+        query = CancellableQuery(
+            sql=self.sql,
+            config=config,
+            provider=provider,
+            analyzer=DialectQueryAnalyzer(provider.dialect),
+            limit_pushdown=self.limit_pushdown,
+        )
+        timed_out = threading.Event()
+
+        def on_timeout() -> None:
+            timed_out.set()
+            query.cancel()
+
+        timer = threading.Timer(self.timeout_s, on_timeout) if self.timeout_s is not None else None
+        start = time.perf_counter()
+        try:
+            with self._lock:
+                if self._cancelled:
+                    raise RuntimeError("Query was cancelled")
+                self._queries.append(query)
+            if timer is not None:
+                timer.daemon = True
+                timer.start()
+            result = query.execute(max_rows=max_rows)
+            if isinstance(result, QueryResult):
+                shard.columns = list(result.columns)
+                shard.rows = result.rows
+                shard.truncated = result.truncated
+            else:
+                shard.rows_affected = result.rows_affected
+        except Exception as error:
+            shard.error = str(error) or type(error).__name__
+        finally:
+            if timer is not None:
+                timer.cancel()
+            with self._lock:
+                self._queries = [active for active in self._queries if active is not query]
+            shard.elapsed_ms = (time.perf_counter() - start) * 1000
+
+        # A timer firing just as the shard finished leaves its result intact;
+        # only a query that failed after the timer cancelled it timed out.
+        if timed_out.is_set() and not shard.ok:
+            shard.timed_out = True
+            shard.columns, shard.rows, shard.truncated = [], [], False
+            shard.error = f"Timed out after {self.timeout_s:g}s"
+
+        if on_shard is not None:
+            try:
+                on_shard(shard)
+            except Exception:
+                pass
+        return shard
+
+
+def format_fan_out_summary(result: FanOutResult) -> str:
+    """One-line outcome, e.g. "3/4 connections ok in 1.2s (slowest: db3 1.1s)"."""
+    from sqlit.shared.core.utils import format_duration_ms
+
+    total = len(result.shards)
+    ok = total - len(result.failed)
+    text = f"{ok}/{total} connections ok in {format_duration_ms(result.elapsed_ms)}"
+    if result.shards:
+        slowest = max(result.shards, key=lambda shard: shard.elapsed_ms)
+        text += f" (slowest: {slowest.connection_name} {format_duration_ms(slowest.elapsed_ms)})"
+    return text
+
@@ -0,0 +1,157 @@
+"""Push the fetch limit of ad-hoc queries down to the server.
+
+``max_rows`` is normally applied while fetching, so the server still plans,
+sorts and often materializes the whole result. When pushdown is enabled, a
+single top-level SELECT is rewritten with the dialect's own limit syntax
+(``LIMIT``, ``TOP``, ``FETCH FIRST``, ``ROWNUM``) for ``max_rows + 1`` rows,
+so truncation is still detected. Queries that already limit their rows,
+DML, scripts and anything the scanner does not recognise run unchanged.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from sqlit.domains.connections.providers.model import RowLimitDialect
+
+_WORD = re.compile(r"[A-Za-z_][A-Za-z0-9_$#]*")
+
+# Top-level keywords after which an appended limit is wrong or redundant.
+_LIMITING_WORDS = frozenset(
+    [
+        "LIMIT",
+        "TOP",
+        "FETCH",
+        "OFFSET",
+        "ROWNUM",
+        "ROWS",
+        "SAMPLE",
+        "INTO",
+        "FOR",
+        "OPTION",
+        "LOCK",
+        "SETTINGS",
+        "PROCEDURE",
+    ]
+)
+# Statements that change data, even when wrapped in a CTE.
+_DML_WORDS = frozenset(["INSERT", "UPDATE", "DELETE", "MERGE", "UPSERT", "CALL", "EXEC", "EXECUTE"])
+_SET_OPERATIONS = frozenset(["UNION", "INTERSECT", "EXCEPT", "MINUS"])
+_QUOTES = {"'": "'", '"': '"', "`": "`", "[": "]"}
+
+
+def _scan_words(sql: str) -> list[tuple[str, int, int]] | None:
+    """Return ``(WORD, end offset, paren depth)`` for words outside literals and comments.
+
+    Returns None for text the scanner cannot follow, such as unbalanced
+    parentheses or an unterminated literal.
+    """
+    words: list[tuple[str, int, int]] = []
+    depth = 0
+    i = 0
+    length = len(sql)
+    while i < length:
+        char = sql[i]
+        if char in _QUOTES:
+            close = _QUOTES[char]
+            end = sql.find(close, i + 1)
+            # Doubled quotes escape themselves.
+            while end != -1 and close != "]" and sql.startswith(close * 2, end):
+                end = sql.find(close, end + 2)
+            # Backslash escapes are dialect-specific, so give up on them.
+            if end == -1 or sql[end - 1] == "\\":
+                return None
+            i = end + 1
+        elif sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = length if end == -1 else end + 1
+        elif sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            if end == -1:
+                return None
+            i = end + 2
+        elif char == "(":
+            depth += 1
+            i += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                return None
+            i += 1
+        elif char == ";":
+            return None
+        else:
+            match = _WORD.match(sql, i)
+            if match is None or (i > 0 and (sql[i - 1].isalnum() or sql[i - 1] in "_$#")):
+                i += 1
+                continue
+            words.append((match.group().upper(), match.end(), depth))
+            i = match.end()
+    if depth != 0:
+        return None
+    return words
+
+
+def _strip_statement(query: str) -> str:
+    """Drop surrounding whitespace and trailing semicolons."""
+    stripped = query.strip()
+    while stripped.endswith(";"):
+        stripped = stripped[:-1].rstrip()
+    return stripped
+
+
+def push_down_limit(query: str, max_rows: int | None, dialect: Any) -> str | None:
+    """Rewrite ``query`` to fetch at most ``max_rows + 1`` rows on the server.
+
+    Returns None when the query should run unchanged: no row limit, a
+    dialect without ``apply_row_limit``, more than one statement, anything
+    other than a plain SELECT, or a query that already limits its rows.
+    """
+    from .multi_statement import split_statements
+
+    if max_rows is None or max_rows <= 0 or not isinstance(dialect, RowLimitDialect):
+        return None
+    statements = split_statements(query)
+    if len(statements) != 1:
+        return None
+    statement = _strip_statement(statements[0])
+    words = _scan_words(statement)
+    if not words or words[0][0] not in ("SELECT", "WITH") or words[0][2] != 0:
+        return None
+    if any(word in _DML_WORDS for word, _end, _depth in words):
+        return None
+    top_level = [(word, end) for word, end, depth in words if depth == 0]
+    if any(word in _LIMITING_WORDS for word, _end in top_level):
+        return None
+
+    select_end: int | None = None
+    if not any(word in _SET_OPERATIONS for word, _end in top_level):
+        # The main SELECT is the first one outside parentheses; CTE bodies are nested.
+        for index, (word, end) in enumerate(top_level):
+            if word == "SELECT":
+                select_end = end
+                following = top_level[index + 1] if index + 1 < len(top_level) else None
+                if following is not None and following[0] in ("DISTINCT", "ALL"):
+                    select_end = following[1]
+                break
+        if select_end is None:
+            return None
+    return dialect.apply_row_limit(statement, max_rows + 1, select_end)
+
+
+def limit_query(query: str, max_rows: int | None, dialect: Any) -> str:
+    """Return the pushed-down query, or ``query`` itself, and log any rewrite."""
+    rewritten = push_down_limit(query, max_rows, dialect)
+    if rewritten is None:
+        return query
+    from sqlit.shared.core.debug_events import emit_debug_event
+
+    emit_debug_event(
+        "query.limit_pushdown",
+        category="query",
+        limit=(max_rows or 0) + 1,
+        original=query,
+        rewritten=rewritten,
+    )
+    return rewritten
@@ -0,0 +1,195 @@
+"""Server-side truncation of large column values in table previews.
+
+Table previews run ``SELECT * ... LIMIT n``. This fetches every TEXT, BLOB,
+CLOB or JSON value in full, even though the grid shows only the first 100
+characters. In preview mode, the ``*`` is replaced with an explicit column
+list. Large-typed columns are projected through the dialect's prefix
+expression, followed by a hidden length column. ``LobPreviewPlan.apply``
+drops the length columns and records which cells were cut. Opening one of
+those cells fetches the whole value for that row by primary key, so preview
+mode only applies to tables with a primary key.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from sqlit.domains.connections.providers.model import LobPreviewDialect
+
+from .query_service import QueryResult
+
+if TYPE_CHECKING:
+    from sqlit.domains.connections.domain.config import ConnectionConfig
+    from sqlit.domains.connections.providers.model import DatabaseProvider
+
+DEFAULT_LOB_PREVIEW_CHARS = 256
+LENGTH_COLUMN_PREFIX = "__sqlit_len_"
+
+_SELECT_STAR = re.compile(
+    r"^\s*(?P<head>SELECT\s+(?:TOP\s+\d+\s+)?)\*\s+FROM\s+(?P<table>.+?)"
+    r"(?P<tail>\s+(?:LIMIT|FETCH|OFFSET)\b.*)?\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@dataclass
+class LobPreviewPlan:
+    """A rewritten preview query and the cells it truncated.
+
+    ``truncated`` maps ``(primary key values, column name)`` to the total
+    length reported by the server, so lookups survive filtering the grid.
+    """
+
+    query: str
+    source_query: str
+    table_ref: str
+    columns: tuple[str, ...]
+    lob_columns: tuple[str, ...]
+    key_columns: tuple[str, ...]
+    prefix_chars: int
+    truncated: dict[tuple[tuple, str], int] = field(default_factory=dict)
+    config: ConnectionConfig | None = None  # Connection the preview ran on
+
+    def apply(self, result: QueryResult) -> QueryResult:
+        """Drop the length columns from ``result`` and record truncated cells."""
+        names = list(result.columns)
+        keep = [index for index, name in enumerate(names) if not str(name).startswith(LENGTH_COLUMN_PREFIX)]
+        if len(keep) == len(names):
+            return result
+        # Each length column directly follows the value column it measures.
+        lengths = [
+            (index - 1, index)
+            for index, name in enumerate(names)
+            if str(name).startswith(LENGTH_COLUMN_PREFIX) and index > 0
+        ]
+        self.truncated = {}
+        rows: list[tuple] = []
+        for row in result.rows:
+            kept = tuple(row[index] for index in keep)
+            rows.append(kept)
+            for value_index, length_index in lengths:
+                total = row[length_index]
+                value = row[value_index]
+                if (
+                    isinstance(total, int)
+                    and isinstance(value, str | bytes | bytearray)
+                    and len(value) >= self.prefix_chars
+                    and total > len(value)
+                ):
+                    key = self.row_key(kept)
+                    if key is not None:
+                        self.truncated[(key, str(names[value_index]))] = total
+        return QueryResult(
+            columns=[names[index] for index in keep],
+            rows=rows,
+            row_count=result.row_count,
+            truncated=result.truncated,
+        )
+
+    def row_key(self, row: Sequence[Any]) -> tuple | None:
+        """Primary key values of a result row, or None if a key column is missing."""
+        try:
+            return tuple(row[self.columns.index(key)] for key in self.key_columns)
+        except (ValueError, IndexError):
+            return None
+
+    def truncated_length(self, row: Sequence[Any], column: str) -> int | None:
+        """Full length of a truncated cell, or None if the cell holds the whole value."""
+        key = self.row_key(row)
+        if key is None:
+            return None
+        return self.truncated.get((key, column))
+
+    def full_value_query(self, column: str, row: Sequence[Any], dialect: Any) -> str | None:
+        """Build the query that fetches one full value, or None without usable keys."""
+        key = self.row_key(row)
+        if key is None:
+            return None
+        conditions = []
+        for name, value in zip(self.key_columns, key, strict=True):
+            literal = sql_literal(value)
+            if literal is None:
+                return None
+            conditions.append(f"{dialect.quote_identifier(name)} = {literal}")
+        return (
+            f"SELECT {dialect.quote_identifier(column)} FROM {self.table_ref} "
+            f"WHERE {' AND '.join(conditions)}"
+        )
+
+
+def sql_literal(value: Any) -> str | None:
+    """Render a key value as a SQL literal; None for NULLs and unsupported types."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int | float):
+        return str(value)
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return None
+
+
+def build_lob_preview(
+    provider: DatabaseProvider,
+    query: str,
+    columns: list[Any],
+    prefix_chars: int = DEFAULT_LOB_PREVIEW_CHARS,
+) -> LobPreviewPlan | None:
+    """Rewrite a generated ``SELECT *`` preview to truncate large columns.
+
+    ``columns`` are the table's ``ColumnInfo`` entries. Returns None when
+    preview mode does not apply. That happens when the dialect has no prefix
+    expressions, the query is not a plain preview, no column is large, or
+    the table has no primary key to fetch full values by.
+    """
+    dialect = provider.dialect
+    if prefix_chars <= 0 or not columns or not isinstance(dialect, LobPreviewDialect):
+        return None
+    match = _SELECT_STAR.match(query)
+    if match is None:
+        return None
+    key_columns = tuple(column.name for column in columns if getattr(column, "is_primary_key", False))
+    if not key_columns:
+        return None
+
+    projection: list[str] = []
+    lob_columns: list[str] = []
+    for index, column in enumerate(columns):
+        quoted = dialect.quote_identifier(column.name)
+        expressions = dialect.lob_preview_expressions(quoted, str(column.data_type or ""), prefix_chars)
+        if expressions is None:
+            projection.append(quoted)
+            continue
+        prefix, length = expressions
+        projection.append(f"{prefix} AS {quoted}")
+        projection.append(f"{length} AS {dialect.quote_identifier(f'{LENGTH_COLUMN_PREFIX}{index}')}")
+        lob_columns.append(column.name)
+    if not lob_columns:
+        return None
+
+    tail = match.group("tail") or ""
+    rewritten = f"{match.group('head')}{', '.join(projection)} FROM {match.group('table')}{tail}"
+    return LobPreviewPlan(
+        query=rewritten,
+        source_query=query,
+        table_ref=match.group("table"),
+        columns=tuple(column.name for column in columns),
+        lob_columns=tuple(lob_columns),
+        key_columns=key_columns,
+        prefix_chars=prefix_chars,
+    )
+
+
+def fetch_full_value(config: ConnectionConfig, provider: DatabaseProvider, sql: str) -> Any:
+    """Run a single-value query on a dedicated connection. Call off the UI thread."""
+    from .cancellable import CancellableQuery
+
+    result = CancellableQuery(sql=sql, config=config, provider=provider).execute(max_rows=1)
+    rows = getattr(result, "rows", None)
+    if not rows:
+        raise LookupError("Row no longer exists")
+    return rows[0][0]
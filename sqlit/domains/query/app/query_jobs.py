@@ -0,0 +1,354 @@
+"""Background query jobs.
+
+A job runs one query on its own thread and connection, independent of the
+editor's foreground query, and keeps its result in a ResultStore (spilled
+to disk under memory pressure) until it is opened or dismissed.
+
+Providers that implement ``RemoteJobExecutor`` (Snowflake, BigQuery) run the
+query as a server-side job instead. Its handle is persisted in a
+``QueryJobStore`` while it runs, so a job started in one session shows up as
+detached in the next and can be reattached to fetch its result.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sqlit.domains.connections.domain.config import ConnectionConfig
+    from sqlit.domains.connections.providers.model import DatabaseProvider
+    from sqlit.domains.query.store.jobs import QueryJobStore
+    from sqlit.domains.results.store import ResultStore
+
+    from .cancellable import CancellableQuery
+
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_ERROR = "error"
+JOB_CANCELLED = "cancelled"
+# Persisted from an earlier session and not attached yet.
+JOB_DETACHED = "detached"
+
+# How often server-side jobs are polled for status.
+JOB_POLL_INTERVAL_S = 1.0
+
+
+@dataclass
+class QueryJob:
+    """State of one background query, updated by its worker thread."""
+
+    job_id: int
+    connection_name: str
+    db_type: str
+    sql: str
+    started_at: float = field(default_factory=time.time)
+    status: str = JOB_RUNNING
+    finished_at: float | None = None
+    server_status: str | None = None
+    error: str | None = None
+    columns: list[str] = field(default_factory=list)
+    rows: Sequence[tuple] | None = None
+    truncated: bool = False
+    rows_affected: int | None = None
+    remote: dict[str, str] | None = None
+    token: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+
+    @property
+    def elapsed_s(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return max(0.0, end - self.started_at)
+
+    @property
+    def is_running(self) -> bool:
+        return self.status == JOB_RUNNING
+
+    @property
+    def rows_fetched(self) -> int:
+        return len(self.rows) if self.rows is not None else 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Fields needed to reattach the job in a later session."""
+        return {
+            "connection_name": self.connection_name,
+            "db_type": self.db_type,
+            "sql": self.sql,
+            "started_at": self.started_at,
+            "remote": dict(self.remote or {}),
+        }
+
+
+@dataclass
+class _JobControl:
+    cancelled: threading.Event = field(default_factory=threading.Event)
+    query: CancellableQuery | None = None
+
+
+class QueryJobManager:
+    """Runs queries in the background and keeps their results.
+
+    Usage:
+        manager = QueryJobManager(result_store, on_change=refresh)
+        job = manager.submit("SELECT ...", config, provider, max_rows=100_000)
+        manager.cancel(job.job_id)
+
+    ``on_change`` is called from worker threads whenever a job's state changes.
+    """
+
+    def __init__(
+        self,
+        result_store: ResultStore,
+        job_store: QueryJobStore | None = None,
+        on_change: Callable[[QueryJob], None] | None = None,
+        *,
+        poll_interval_s: float = JOB_POLL_INTERVAL_S,
+    ) -> None:
+        self._result_store = result_store
+        self._job_store = job_store
+        self.on_change = on_change
+        self._poll_interval_s = poll_interval_s
+        self._lock = threading.Lock()
+        self._jobs: dict[int, QueryJob] = {}
+        self._controls: dict[int, _JobControl] = {}
+        self._next_id = 1
+        self._load_persisted()
+
+    @property
+    def jobs(self) -> list[QueryJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    @property
+    def running_count(self) -> int:
+        return sum(1 for job in self.jobs if job.is_running)
+
+    def get(self, job_id: int) -> QueryJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _add(self, job_factory: Callable[[int], QueryJob]) -> QueryJob:
+        with self._lock:
+            job = job_factory(self._next_id)
+            self._next_id += 1
+            self._jobs[job.job_id] = job
+        return job
+
+    def _load_persisted(self) -> None:
+        if self._job_store is None:
+            return
+        try:
+            entries = self._job_store.load_all()
+        except Exception:
+            return
+        for token, entry in sorted(entries.items(), key=lambda item: float(item[1].get("started_at") or 0)):
+            remote = entry.get("remote")
+            if not isinstance(remote, dict) or not remote:
+                continue
+            self._add(
+                lambda job_id, token=token, entry=entry, remote=remote: QueryJob(
+                    job_id=job_id,
+                    connection_name=str(entry.get("connection_name", "")),
+                    db_type=str(entry.get("db_type", "")),
+                    sql=str(entry.get("sql", "")),
+                    started_at=float(entry.get("started_at") or time.time()),
+                    status=JOB_DETACHED,
+                    remote={str(key): str(value) for key, value in remote.items()},
+                    token=token,
+                )
+            )
+
+    def submit(
+        self, sql: str, config: ConnectionConfig, provider: DatabaseProvider, max_rows: int | None = None
+    ) -> QueryJob:
+        """Start ``sql`` in the background and return its job."""
+        job = self._add(
+            lambda job_id: QueryJob(
+                job_id=job_id, connection_name=config.name, db_type=provider.metadata.db_type, sql=sql
+            )
+        )
+        self._start(job, config, provider, max_rows)
+        return job
+
+    def reattach(
+        self, job_id: int, config: ConnectionConfig, provider: DatabaseProvider, max_rows: int | None = None
+    ) -> QueryJob:
+        """Resume waiting for a detached server-side job."""
+        from sqlit.domains.connections.providers.model import RemoteJobExecutor
+
+        job = self.get(job_id)
+        if job is None or job.status != JOB_DETACHED or not job.remote:
+            raise ValueError("Only detached jobs can be reattached")
+        if not isinstance(provider.query_executor, RemoteJobExecutor):
+            raise ValueError(f"{provider.metadata.display_name} jobs cannot be reattached")
+        job.status = JOB_RUNNING
+        job.error = None
+        self._start(job, config, provider, max_rows)
+        return job
+
+    def _start(self, job: QueryJob, config: ConnectionConfig, provider: DatabaseProvider, max_rows: int | None) -> None:
+        with self._lock:
+            self._controls[job.job_id] = _JobControl()
+        thread = threading.Thread(
+            target=self._run,
+            args=(job, config, provider, max_rows),
+            name=f"sqlit-query-job-{job.job_id}",
+            daemon=True,
+        )
+        thread.start()
+        self._changed(job)
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a running job; returns False if it is not running."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            control = self._controls.get(job_id)
+        if job is None or control is None or not job.is_running:
+            return False
+        control.cancelled.set()
+        if control.query is not None:
+            control.query.cancel()
+        return True
+
+    def remove(self, job_id: int) -> bool:
+        """Forget a finished or detached job and release its result."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.is_running:
+                return False
+            del self._jobs[job_id]
+            self._controls.pop(job_id, None)
+        self._result_store.release_rows(job.rows or [])
+        job.rows = None
+        if job.status == JOB_DETACHED:
+            self._forget(job)
+        return True
+
+    def close(self) -> None:
+        """Cancel local jobs and release their results to the result store.
+
+        Server-side jobs keep running and stay persisted for the next session.
+        The result store itself belongs to the caller and is left open.
+        """
+        for job in self.jobs:
+            if job.is_running and not job.remote:
+                self.cancel(job.job_id)
+            else:
+                self._result_store.release_rows(job.rows or [])
+                job.rows = None
+
+    def _run(self, job: QueryJob, config: ConnectionConfig, provider: DatabaseProvider, max_rows: int | None) -> None:
+        from sqlit.domains.connections.providers.model import RemoteJobExecutor
+
+        control = self._controls[job.job_id]
+        executor = provider.query_executor
+        try:
+            if isinstance(executor, RemoteJobExecutor):
+                columns, rows, truncated, rows_affected = self._run_remote(job, executor, config, provider, max_rows)
+            else:
+                columns, rows, truncated, rows_affected = self._run_local(job, control, config, provider, max_rows)
+        except Exception as error:
+            if control.cancelled.is_set():
+                job.status = JOB_CANCELLED
+            else:
+                job.status = JOB_ERROR
+                job.error = str(error)
+        else:
+            if columns:
+                job.columns = list(columns)
+                job.rows = self._result_store.put(list(columns), rows)
+                job.truncated = truncated
+            else:
+                job.rows_affected = rows_affected
+            job.status = JOB_CANCELLED if control.cancelled.is_set() else JOB_DONE
+        finally:
+            job.finished_at = time.time()
+            job.server_status = None
+            if job.remote:
+                self._forget(job)
+            self._changed(job)
+
+    def _run_local(
+        self,
+        job: QueryJob,
+        control: _JobControl,
+        config: ConnectionConfig,
+        provider: DatabaseProvider,
+        max_rows: int | None,
+    ) -> tuple[list[str], Sequence[tuple], bool, int | None]:
+        from .cancellable import CancellableQuery
+        from .query_service import QueryResult
+
+        query = CancellableQuery(sql=job.sql, config=config, provider=provider)
+        control.query = query
+        if control.cancelled.is_set():
+            query.cancel()
+        result = query.execute(max_rows=max_rows)
+        if isinstance(result, QueryResult):
+            return result.columns, result.rows, result.truncated, None
+        return [], [], False, result.rows_affected
+
+    def _run_remote(
+        self,
+        job: QueryJob,
+        executor: Any,
+        config: ConnectionConfig,
+        provider: DatabaseProvider,
+        max_rows: int | None,
+    ) -> tuple[list[str], Sequence[tuple], bool, int | None]:
+        control = self._controls[job.job_id]
+        conn = provider.connection_factory.connect(config)
+        try:
+            try:
+                provider.post_connect(conn, config)
+            except Exception:
+                pass
+            if job.remote is None:
+                job.remote = executor.submit_job(conn, job.sql)
+                self._persist(job)
+            while True:
+                if control.cancelled.is_set():
+                    executor.cancel_job(conn, job.remote)
+                    raise RuntimeError("Query was cancelled")
+                label = executor.poll_job(conn, job.remote)
+                if label is None:
+                    break
+                if label != job.server_status:
+                    job.server_status = label
+                    self._changed(job)
+                control.cancelled.wait(self._poll_interval_s)
+            columns, rows, truncated = executor.fetch_job(conn, job.remote, max_rows)
+            return columns, rows, truncated, None if columns else -1
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _persist(self, job: QueryJob) -> None:
+        if self._job_store is None:
+            return
+        try:
+            self._job_store.save_job(job.token, job.to_dict())
+        except Exception:
+            pass
+
+    def _forget(self, job: QueryJob) -> None:
+        if self._job_store is None:
+            return
+        try:
+            self._job_store.remove_job(job.token)
+        except Exception:
+            pass
+
+    def _changed(self, job: QueryJob) -> None:
+        callback = self.on_change
+        if callback is None:
+            return
+        try:
+            callback(job)
+        except Exception:
+            pass
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
     from sqlit.domains.connections.domain.config import ConnectionConfig
     from sqlit.shared.core.protocols import HistoryStoreProtocol, QueryExecutorProtocol
 
+    from .result_cache import CachedResult, QueryResultCache
+
 # Query types that return result sets (SELECT-like queries)
 SELECT_KEYWORDS = frozenset(["SELECT", "WITH", "SHOW", "DESCRIBE", "EXPLAIN", "PRAGMA"])
 
@@ -119,6 +121,41 @@ class QueryResult:
     truncated: bool
 
 
+class ArrowQueryResult(QueryResult):
+    """QueryResult backed by a pyarrow Table.
+
+    ``rows`` is a lazy, read-only view over ``table``; the results grid renders
+    ``table`` directly so no Python tuples are created on the display path.
+    """
+
+    def __init__(self, table: Any, truncated: bool) -> None:
+        from .arrow_rows import ArrowRowView
+
+        super().__init__(
+            columns=list(table.column_names),
+            rows=ArrowRowView(table),  # type: ignore[arg-type]
+            row_count=int(table.num_rows),
+            truncated=truncated,
+        )
+        self.table = table
+
+
+def execute_rows_query(executor: Any, connection: Any, query: str, max_rows: int | None = None) -> QueryResult:
+    """Run a row-returning query, preferring the executor's Arrow capability."""
+    from sqlit.domains.connections.providers.model import ArrowQueryExecutor
+
+    if isinstance(executor, ArrowQueryExecutor):
+        table, truncated = executor.execute_query_arrow(connection, query, max_rows)
+        return ArrowQueryResult(table, truncated)
+    columns, rows, truncated = executor.execute_query(connection, query, max_rows)
+    return QueryResult(
+        columns=columns,
+        rows=rows,
+        row_count=len(rows),
+        truncated=truncated,
+    )
+
+
 @dataclass
 class NonQueryResult:
     """Result of a non-SELECT query execution (INSERT, UPDATE, DELETE, etc.)."""
@@ -135,15 +172,38 @@ class QueryService:
     Args:
         history_store: History store for saving queries.
         analyzer: Query analyzer strategy for selecting execution behavior.
+        result_cache: Optional cache for results of row-returning queries.
+        limit_dialect: Dialect used to push ``max_rows`` down to the server
+            as a LIMIT/TOP/FETCH FIRST clause. None fetches without rewriting.
     """
 
-    def __init__(self, history_store: HistoryStoreProtocol | None = None, analyzer: QueryAnalyzer | None = None):
+    def __init__(
+        self,
+        history_store: HistoryStoreProtocol | None = None,
+        analyzer: QueryAnalyzer | None = None,
+        result_cache: QueryResultCache | None = None,
+        limit_dialect: Any | None = None,
+    ):
         if history_store is None:
             from sqlit.domains.query.store.memory import InMemoryHistoryStore
 
             history_store = InMemoryHistoryStore()
         self._history_store = history_store
         self._analyzer = analyzer or KeywordQueryAnalyzer()
+        self._result_cache = result_cache
+        self._limit_dialect = limit_dialect
+
+    @property
+    def result_cache(self) -> QueryResultCache | None:
+        return self._result_cache
+
+    def limited_query(self, query: str, max_rows: int | None) -> str:
+        """Return ``query`` with ``max_rows`` pushed down when pushdown is enabled."""
+        if self._limit_dialect is None:
+            return query
+        from .limit_pushdown import limit_query
+
+        return limit_query(query, max_rows, self._limit_dialect)
 
     def execute(
         self,
@@ -153,6 +213,7 @@ class QueryService:
         config: ConnectionConfig | None = None,
         max_rows: int | None = None,
         save_to_history: bool = True,
+        use_cache: bool = True,
     ) -> QueryResult | NonQueryResult:
         """Execute a query and optionally save to history.
 
@@ -160,9 +221,11 @@ class QueryService:
             connection: The database connection object.
             executor: The query executor to use for execution.
             query: The SQL query string to execute.
-            config: Optional connection config (needed for history saving).
+            config: Optional connection config (needed for history saving
+                and result caching).
             max_rows: Optional maximum rows to fetch for SELECT queries.
             save_to_history: Whether to save the query to history.
+            use_cache: Whether a cached result may be returned.
 
         Returns:
             QueryResult for SELECT-type queries, NonQueryResult otherwise.
@@ -170,18 +233,19 @@ class QueryService:
         Raises:
             Any exceptions raised by the underlying database driver.
         """
+        in_transaction = bool(getattr(executor, "in_transaction", False))
         result: QueryResult | NonQueryResult
-        if self._analyzer.classify(query) == QueryKind.RETURNS_ROWS:
-            columns, rows, truncated = executor.execute_query(connection, query, max_rows)
-            result = QueryResult(
-                columns=columns,
-                rows=list(rows),
-                row_count=len(rows),
-                truncated=truncated,
-            )
+        run_query = self.limited_query(query, max_rows)
+        if self._analyzer.classify(run_query) == QueryKind.RETURNS_ROWS:
+            cached = self.cached_result(config, run_query, max_rows) if use_cache and not in_transaction else None
+            if cached is not None:
+                result = cached.result
+            else:
+                result = execute_rows_query(executor, connection, run_query, max_rows)
         else:
-            affected = executor.execute_non_query(connection, query)
+            affected = executor.execute_non_query(connection, run_query)
             result = NonQueryResult(rows_affected=affected)
+        self.record_result(config, run_query, max_rows, result, in_transaction=in_transaction)
 
         # Save to history if requested and config is available
         if save_to_history and config:
@@ -189,6 +253,48 @@ class QueryService:
 
         return result
 
+    def cached_result(
+        self, config: ConnectionConfig | None, query: str, max_rows: int | None
+    ) -> CachedResult | None:
+        """Look up a cached result for a row-returning query."""
+        if self._result_cache is None or config is None or not self._is_cacheable(query):
+            return None
+        return self._result_cache.get(config, query, max_rows)
+
+    def record_result(
+        self,
+        config: ConnectionConfig | None,
+        query: str,
+        max_rows: int | None,
+        result: QueryResult | NonQueryResult | None,
+        *,
+        in_transaction: bool = False,
+    ) -> None:
+        """Update the result cache after a statement ran.
+
+        Row results are cached unless they were read inside a transaction,
+        where they may include uncommitted changes. Any other statement may
+        have modified data, so it drops the connection's cached results.
+        """
+        cache = self._result_cache
+        if cache is None or config is None:
+            return
+        if isinstance(result, QueryResult) and self._is_cacheable(query):
+            if not in_transaction:
+                cache.put(config, query, max_rows, result)
+            return
+        cache.invalidate_connection(config)
+
+    def _is_cacheable(self, query: str) -> bool:
+        from .result_cache import is_cacheable_query
+
+        return self._analyzer.classify(query) == QueryKind.RETURNS_ROWS and is_cacheable_query(query)
+
+    def invalidate_cache(self, config: ConnectionConfig | None) -> None:
+        """Drop cached results for a connection after it may have changed data."""
+        if self._result_cache is not None and config is not None:
+            self._result_cache.invalidate_connection(config)
+
     def _save_to_history(self, connection_name: str, query: str) -> None:
         """Save a query to history.
 
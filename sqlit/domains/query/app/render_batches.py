@@ -0,0 +1,41 @@
+"""Convert result rows into Arrow batches for incremental table rendering.
+
+Type inference and value conversion are the expensive part of showing a
+large result. ``build_render_batches`` does both in one pass over each
+column, meant to run on a worker thread, and returns zero-copy slices that
+the UI thread appends to the results table one at a time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlit.domains.connections.providers.arrow_results import arrow_table_from_rows
+
+
+def build_render_batches(
+    columns: list[str],
+    rows: Sequence[tuple],
+    *,
+    row_limit: int,
+    first_batch_rows: int,
+    batch_rows: int,
+) -> list[Any]:
+    """Convert up to ``row_limit`` rows into Arrow tables sharing one schema.
+
+    Each column gets a single type inferred from all of its values (Decimal
+    precision and scale included); columns with mixed types become strings.
+    The first table holds ``first_batch_rows`` rows so the results table can
+    appear quickly; the rest hold ``batch_rows`` rows each.
+    """
+    if len(rows) > row_limit:
+        rows = rows[:row_limit]
+    table = arrow_table_from_rows([str(name) for name in columns], rows)
+    total = table.num_rows
+    first = max(1, min(first_batch_rows, total))
+    batches = [table.slice(0, first)]
+    step = max(1, batch_rows)
+    for offset in range(first, total, step):
+        batches.append(table.slice(offset, step))
+    return batches
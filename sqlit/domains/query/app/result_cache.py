@@ -0,0 +1,238 @@
+"""Opt-in cache of read-only query results.
+
+Re-running the same SELECT (a table preview from the explorer, a history
+entry, toggling between two queries) normally goes back to the database.
+``QueryResultCache`` keeps recent results keyed by connection, database and
+normalized SQL, expires them after a TTL, evicts least recently used results
+to stay under a byte budget, and drops every entry for a connection when a
+statement that may modify data runs on it.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sqlit.domains.connections.domain.config import ConnectionConfig
+
+    from .query_service import QueryResult
+
+DEFAULT_RESULT_CACHE_BUDGET_MB = 64.0
+
+_WHITESPACE = " \t\r\n\f\v"
+
+# Row-returning statements that can still change data or state, e.g.
+# ``WITH d AS (DELETE ... RETURNING *) SELECT ...`` or ``SELECT ... INTO``.
+_WRITE_PATTERN = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE|UPSERT|INTO|TRUNCATE|DROP|ALTER|CREATE|GRANT|REVOKE"
+    r"|CALL|EXEC|EXECUTE|NEXTVAL|SETVAL|LOCK)\b",
+    re.IGNORECASE,
+)
+
+
+def normalize_sql(query: str) -> str:
+    """Normalize SQL text for use as a cache key.
+
+    Drops comments, collapses whitespace and trailing semicolons outside of
+    quoted literals and identifiers. Case is preserved since literals and
+    quoted identifiers are case-sensitive.
+    """
+    out: list[str] = []
+    i = 0
+    n = len(query)
+    pending_space = False
+    while i < n:
+        ch = query[i]
+        if ch in "'\"`":
+            end = i + 1
+            while end < n:
+                if query[end] == ch:
+                    if end + 1 < n and query[end + 1] == ch:
+                        end += 2
+                        continue
+                    break
+                end += 1
+            token = query[i : end + 1]
+            i = end + 1
+        elif ch == "-" and query.startswith("--", i):
+            newline = query.find("\n", i)
+            i = n if newline == -1 else newline
+            pending_space = True
+            continue
+        elif ch == "/" and query.startswith("/*", i):
+            close = query.find("*/", i + 2)
+            i = n if close == -1 else close + 2
+            pending_space = True
+            continue
+        elif ch in _WHITESPACE:
+            pending_space = True
+            i += 1
+            continue
+        else:
+            token = ch
+            i += 1
+        if pending_space and out:
+            out.append(" ")
+        pending_space = False
+        out.append(token)
+    return "".join(out).rstrip("; ")
+
+
+def is_cacheable_query(query: str) -> bool:
+    """Whether a row-returning query is safe to answer from the cache."""
+    return _WRITE_PATTERN.search(normalize_sql(query)) is None
+
+
+def connection_identity(config: ConnectionConfig) -> tuple[str, ...]:
+    """Identify the server a config talks to, independent of database."""
+    endpoint = config.tcp_endpoint
+    if endpoint is not None:
+        return (config.db_type, config.name, endpoint.host, str(endpoint.port), endpoint.username)
+    return (config.db_type, config.name, config.file_path)
+
+
+def cache_key(config: ConnectionConfig, query: str, max_rows: int | None) -> tuple[Any, ...]:
+    endpoint = config.tcp_endpoint
+    database = endpoint.database if endpoint else ""
+    return (connection_identity(config), database or "", normalize_sql(query), max_rows)
+
+
+def format_cache_age(age_s: float) -> str:
+    """Format a cache entry age as 12s / 3m / 2h."""
+    age = max(0, int(age_s))
+    if age < 60:
+        return f"{age}s"
+    if age < 3600:
+        return f"{age // 60}m"
+    return f"{age // 3600}h"
+
+
+def _result_bytes(result: QueryResult) -> int:
+    from sqlit.domains.results.store import estimate_rows_bytes
+
+    return estimate_rows_bytes(result.rows) + 64 * len(result.columns) + 128
+
+
+@dataclass
+class CachedResult:
+    """A cache hit: the stored result and how old it is."""
+
+    result: QueryResult
+    age_s: float
+
+
+@dataclass
+class _CacheEntry:
+    result: QueryResult
+    stored_at: float
+    nbytes: int
+
+
+@dataclass
+class ResultCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class QueryResultCache:
+    """TTL + byte-budget LRU cache of query results.
+
+    Thread-safe: lookups run on the UI thread while results are stored from
+    query workers.
+    """
+
+    def __init__(
+        self,
+        ttl_s: float,
+        max_bytes: int = int(DEFAULT_RESULT_CACHE_BUDGET_MB * 1024 * 1024),
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_s = float(ttl_s)
+        self.max_bytes = int(max_bytes)
+        self.stats = ResultCacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[Any, ...], _CacheEntry] = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def bytes_used(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, config: ConnectionConfig, query: str, max_rows: int | None) -> CachedResult | None:
+        key = cache_key(config, query, max_rows)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            age = now - entry.stored_at
+            if age >= self.ttl_s:
+                self._drop(key)
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return CachedResult(result=entry.result, age_s=age)
+
+    def put(self, config: ConnectionConfig, query: str, max_rows: int | None, result: QueryResult) -> bool:
+        """Store a result. Returns False when it is larger than the whole budget."""
+        nbytes = _result_bytes(result)
+        if nbytes > self.max_bytes:
+            return False
+        key = cache_key(config, query, max_rows)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _CacheEntry(result=result, stored_at=self._clock(), nbytes=nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.stats.evictions += 1
+        return True
+
+    def contains(self, config: ConnectionConfig, query: str, max_rows: int | None) -> bool:
+        """Whether a fresh entry exists, without touching LRU order or stats."""
+        key = cache_key(config, query, max_rows)
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and self._clock() - entry.stored_at < self.ttl_s
+
+    def invalidate_query(self, config: ConnectionConfig, query: str, max_rows: int | None) -> None:
+        with self._lock:
+            self._drop(cache_key(config, query, max_rows))
+
+    def invalidate_connection(self, config: ConnectionConfig) -> int:
+        """Drop every cached result for the config's server, in any database."""
+        identity = connection_identity(config)
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == identity]
+            for key in keys:
+                self._drop(key)
+            if keys:
+                self.stats.invalidations += 1
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key: tuple[Any, ...]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.nbytes
@@ -0,0 +1,184 @@
+"""Parallel schema indexing across databases.
+
+Autocomplete needs the tables, views and procedures of every database on a
+server. Running those metadata calls through the session's single-threaded
+executor indexes one database at a time. ``SchemaIndexer`` opens a small
+pool of dedicated metadata connections, indexes databases concurrently,
+starts with the database the user is working in, and reports each database
+as soon as it is done.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from sqlit.domains.connections.providers.model import ProcedureInspector
+
+if TYPE_CHECKING:
+    from sqlit.domains.connections.domain.config import ConnectionConfig
+    from sqlit.domains.connections.providers.model import DatabaseProvider
+
+DEFAULT_SCHEMA_INDEX_CONCURRENCY = 4
+
+
+@dataclass
+class DatabaseSchema:
+    """Objects indexed for one database. ``errors`` maps object kind to the failure."""
+
+    database: str | None
+    tables: list[tuple[str, str]] | None = None
+    views: list[tuple[str, str]] | None = None
+    procedures: list[Any] | None = None
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+
+def prioritize_databases(databases: Sequence[str | None], current: str | None) -> list[str | None]:
+    """Return databases with ``current`` first, otherwise in their original order."""
+    ordered = list(databases)
+    if current:
+        lowered = current.lower()
+        for index, database in enumerate(ordered):
+            if database and database.lower() == lowered:
+                ordered.insert(0, ordered.pop(index))
+                break
+    return ordered
+
+
+class SchemaIndexer:
+    """Index databases concurrently on up to ``max_connections`` dedicated connections.
+
+    Each pool thread opens one connection the first time it needs it and
+    reuses it for every database it indexes. ``run()`` blocks until all
+    databases are done or ``cancel()`` is called; call it off the UI thread.
+    """
+
+    def __init__(
+        self,
+        config: ConnectionConfig,
+        provider: DatabaseProvider,
+        *,
+        max_connections: int = DEFAULT_SCHEMA_INDEX_CONCURRENCY,
+        include_procedures: bool = True,
+    ) -> None:
+        self.config = config
+        self.provider = provider
+        self.max_connections = max(1, max_connections)
+        self.include_procedures = include_procedures and isinstance(provider.schema_inspector, ProcedureInspector)
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self.connections_opened = 0
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Stop indexing; databases already being read finish, the rest are skipped."""
+        self._cancelled.set()
+
+    def run(
+        self,
+        databases: Sequence[str | None],
+        on_database: Callable[[DatabaseSchema], None],
+        *,
+        current: str | None = None,
+    ) -> int:
+        """Index databases and call ``on_database`` from a pool thread as each completes.
+
+        Returns the number of databases indexed.
+        """
+        pending = deque(prioritize_databases(databases, current))
+        if not pending:
+            return 0
+        indexed = 0
+
+        def worker() -> None:
+            nonlocal indexed
+            local = threading.local()
+            try:
+                while not self._cancelled.is_set():
+                    with self._lock:
+                        if not pending:
+                            return
+                    # Open before taking a database so a failed connection
+                    # leaves its work to the other pool threads.
+                    if getattr(local, "conn", None) is None:
+                        local.conn, local.lease = self._open()
+                    with self._lock:
+                        if not pending:
+                            return
+                        database = pending.popleft()
+                    schema = self._index_database(local.conn, database)
+                    if self._cancelled.is_set():
+                        return
+                    on_database(schema)
+                    with self._lock:
+                        indexed += 1
+            finally:
+                self._close(getattr(local, "conn", None), getattr(local, "lease", None))
+
+        workers = min(self.max_connections, len(pending))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sqlit-schema-index") as pool:
+            futures = [pool.submit(worker) for _ in range(workers)]
+            errors = [future.exception() for future in futures]
+        if indexed == 0 and not self._cancelled.is_set():
+            failure = next((error for error in errors if error is not None), None)
+            if failure is not None:
+                raise failure
+        return indexed
+
+    def _index_database(self, conn: Any, database: str | None) -> DatabaseSchema:
+        inspector = self.provider.schema_inspector
+        db_arg = database if self.provider.capabilities.supports_cross_database_queries else None
+        schema = DatabaseSchema(database=database)
+        try:
+            schema.tables = inspector.get_tables(conn, db_arg)
+        except Exception as error:
+            schema.errors["tables"] = error
+        try:
+            schema.views = inspector.get_views(conn, db_arg)
+        except Exception as error:
+            schema.errors["views"] = error
+        if self.include_procedures:
+            try:
+                schema.procedures = inspector.get_procedures(conn, db_arg)  # type: ignore[attr-defined]
+            except Exception as error:
+                schema.errors["procedures"] = error
+        return schema
+
+    def _open(self) -> tuple[Any, Any]:
+        from sqlit.domains.connections.app.tunnel_broker import get_tunnel_broker
+
+        lease, host, port = get_tunnel_broker().acquire(self.config)
+        config = self.config.with_endpoint(host=host, port=str(port)) if lease is not None else self.config
+        try:
+            conn = self.provider.connection_factory.connect(config)
+        except Exception:
+            if lease is not None:
+                lease.stop()
+            raise
+        try:
+            self.provider.post_connect(conn, config)
+        except Exception:
+            pass
+        with self._lock:
+            self.connections_opened += 1
+        return conn, lease
+
+    @staticmethod
+    def _close(conn: Any, lease: Any) -> None:
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        if lease is not None:
+            try:
+                lease.stop()
+            except Exception:
+                pass
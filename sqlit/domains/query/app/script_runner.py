@@ -0,0 +1,264 @@
+"""Single-connection script execution for sqlit.
+
+ScriptRunner executes a multi-statement script on one connection for the
+whole run instead of opening one per statement, and batches consecutive DML:
+- runs of single-row ``INSERT INTO t (...) VALUES (...)`` with the same
+  target are rewritten into multi-row INSERTs on dialects that accept them
+- other consecutive DML is sent in one round trip through executors that
+  implement ``BatchNonQueryExecutor``
+
+A failed batch is replayed one statement at a time so the error is reported
+against the statement that caused it, with the same stop-on-error behavior
+as MultiStatementExecutor.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlit.shared.core.query_timing import query_span
+
+from .multi_statement import MultiStatementResult, StatementResult
+from .query_service import KeywordQueryAnalyzer, NonQueryResult, QueryKind, execute_rows_query
+from .transaction import is_transaction_end, is_transaction_start
+
+if TYPE_CHECKING:
+    from sqlit.domains.connections.domain.config import ConnectionConfig
+    from sqlit.domains.connections.providers.model import DatabaseProvider
+
+# Upper bounds for one rewritten INSERT (SQL Server allows 1000 row tuples).
+MAX_INSERT_BATCH_ROWS = 500
+MAX_INSERT_BATCH_CHARS = 256 * 1024
+# Statements per BatchNonQueryExecutor round trip.
+MAX_DML_BATCH_STATEMENTS = 100
+
+_IDENTIFIER = r'(?:[\w$]+|"[^"]+"|`[^`]+`|\[[^\]]+\])'
+_INSERT_VALUES_PATTERN = re.compile(
+    rf"^INSERT\s+INTO\s+{_IDENTIFIER}(?:\s*\.\s*{_IDENTIFIER})*\s*(?:\([^()'\"]*\))?\s*VALUES\s*(?=\()",
+    re.IGNORECASE,
+)
+_DML_KEYWORDS = frozenset(["INSERT", "UPDATE", "DELETE", "MERGE", "UPSERT", "REPLACE"])
+_RETURNS_ROWS_PATTERN = re.compile(r"\b(RETURNING|OUTPUT)\b", re.IGNORECASE)
+
+ProgressCallback = Callable[[int, list[StatementResult]], None]
+
+
+def _tuple_end(sql: str, start: int) -> int:
+    """Return the index just past the parenthesized group starting at ``start``.
+
+    Returns -1 if the group is not closed.
+    """
+    depth = 0
+    quote: str | None = None
+    i = start
+    length = len(sql)
+    while i < length:
+        char = sql[i]
+        if quote is not None:
+            if char == "\\" and i + 1 < length:
+                i += 2
+                continue
+            if char == quote:
+                if i + 1 < length and sql[i + 1] == quote:
+                    i += 2
+                    continue
+                quote = None
+        elif char in ("'", '"'):
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return -1
+
+
+def parse_single_row_insert(statement: str) -> tuple[str, str] | None:
+    """Split ``INSERT INTO t (cols) VALUES (...)`` into its prefix and row tuple.
+
+    Only plain single-row inserts qualify: anything after the row tuple
+    (a second tuple, ON CONFLICT, RETURNING, ...) returns None.
+    """
+    match = _INSERT_VALUES_PATTERN.match(statement)
+    if match is None:
+        return None
+    end = _tuple_end(statement, match.end())
+    if end == -1 or statement[end:].strip():
+        return None
+    return " ".join(statement[: match.end()].split()), statement[match.end() : end]
+
+
+def is_batchable_dml(statement: str) -> bool:
+    """Whether a statement is DML that returns no rows."""
+    words = statement.split(None, 1)
+    if not words or words[0].upper() not in _DML_KEYWORDS:
+        return False
+    return _RETURNS_ROWS_PATTERN.search(statement) is None
+
+
+def can_run_as_script(statements: Sequence[str]) -> bool:
+    """Whether statements can run through ScriptRunner.
+
+    Scripts that open or close transactions stay on TransactionExecutor so the
+    transaction connection outlives the script.
+    """
+    return not any(is_transaction_start(s) or is_transaction_end(s) for s in statements)
+
+
+@dataclass
+class ScriptRunner:
+    """Executes a script's statements on a single connection.
+
+    Usage:
+        runner = ScriptRunner(config, provider)
+        result = runner.run(split_statements(sql), max_rows=1000)
+    """
+
+    config: ConnectionConfig
+    provider: DatabaseProvider
+
+    def run(
+        self,
+        statements: Sequence[str],
+        max_rows: int | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> MultiStatementResult:
+        """Execute statements in order, stopping at the first error.
+
+        Args:
+            statements: Statements as returned by ``split_statements``.
+            max_rows: Maximum rows to fetch for SELECT queries.
+            on_progress: Called from the executing thread with the index of the
+                first statement of each finished group and its results.
+
+        Returns:
+            MultiStatementResult covering every executed statement.
+        """
+        if not statements:
+            return MultiStatementResult(results=[], completed=True, error_index=None)
+
+        with query_span("connect"):
+            conn = self.provider.connection_factory.connect(self.config)
+        with query_span("post_connect"):
+            try:
+                self.provider.post_connect(conn, self.config)
+            except Exception:
+                pass
+
+        results: list[StatementResult] = []
+        try:
+            index = 0
+            while index < len(statements):
+                group, is_insert_run = self._next_group(statements, index)
+                with query_span("execute"):
+                    group_results = self._run_group(conn, group, is_insert_run, max_rows)
+                results.extend(group_results)
+                if on_progress is not None:
+                    on_progress(index, group_results)
+                if not group_results[-1].success:
+                    return MultiStatementResult(
+                        results=results,
+                        completed=False,
+                        error_index=len(results) - 1,
+                    )
+                index += len(group)
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+        return MultiStatementResult(results=results, completed=True, error_index=None)
+
+    def _next_group(self, statements: Sequence[str], start: int) -> tuple[list[str], bool]:
+        """Consecutive statements, from ``start``, that can run as one batch.
+
+        The flag is True for a run of same-target single-row INSERTs.
+        """
+        first = statements[start]
+        if self.provider.capabilities.supports_multi_row_insert:
+            shape = parse_single_row_insert(first)
+            if shape is not None:
+                group = [first]
+                size = len(first)
+                for statement in statements[start + 1 :]:
+                    if len(group) >= MAX_INSERT_BATCH_ROWS or size + len(statement) > MAX_INSERT_BATCH_CHARS:
+                        break
+                    next_shape = parse_single_row_insert(statement)
+                    if next_shape is None or next_shape[0] != shape[0]:
+                        break
+                    group.append(statement)
+                    size += len(statement)
+                if len(group) > 1:
+                    return group, True
+
+        if self._batch_executor is not None and is_batchable_dml(first):
+            group = [first]
+            for statement in statements[start + 1 :]:
+                if len(group) >= MAX_DML_BATCH_STATEMENTS or not is_batchable_dml(statement):
+                    break
+                group.append(statement)
+            return group, False
+
+        return [first], False
+
+    @property
+    def _batch_executor(self) -> Any | None:
+        from sqlit.domains.connections.providers.model import BatchNonQueryExecutor
+
+        executor = self.provider.query_executor
+        return executor if isinstance(executor, BatchNonQueryExecutor) else None
+
+    def _run_group(
+        self, conn: Any, group: list[str], is_insert_run: bool, max_rows: int | None
+    ) -> list[StatementResult]:
+        if len(group) == 1:
+            return [self._run_statement(conn, group[0], max_rows)]
+        try:
+            if is_insert_run:
+                counts = self._run_insert_run(conn, group)
+            else:
+                counts = self._run_dml_batch(conn, group)
+        except Exception:
+            # Nothing from the batch took effect; replay to find the failing statement.
+            replayed: list[StatementResult] = []
+            for statement in group:
+                replayed.append(self._run_statement(conn, statement, max_rows))
+                if not replayed[-1].success:
+                    break
+            return replayed
+        return [
+            StatementResult(statement=statement, result=NonQueryResult(rows_affected=count), success=True)
+            for statement, count in zip(group, counts)
+        ]
+
+    def _run_insert_run(self, conn: Any, group: list[str]) -> list[int]:
+        """Execute same-target single-row INSERTs as one multi-row INSERT."""
+        shapes = [parse_single_row_insert(statement) for statement in group]
+        prefix = shapes[0][0]  # type: ignore[index]
+        values = ", ".join(shape[1] for shape in shapes)  # type: ignore[index]
+        total = self.provider.query_executor.execute_non_query(conn, f"{prefix} {values}")
+        # Each statement inserted exactly one row when the totals agree.
+        return [1 if total == len(group) else -1] * len(group)
+
+    def _run_dml_batch(self, conn: Any, group: list[str]) -> list[int]:
+        executor = self._batch_executor
+        assert executor is not None
+        return list(executor.execute_non_query_batch(conn, group))
+
+    def _run_statement(self, conn: Any, statement: str, max_rows: int | None) -> StatementResult:
+        try:
+            result: Any
+            if KeywordQueryAnalyzer().classify(statement) == QueryKind.RETURNS_ROWS:
+                result = execute_rows_query(self.provider.query_executor, conn, statement, max_rows)
+            else:
+                rows_affected = self.provider.query_executor.execute_non_query(conn, statement)
+                result = NonQueryResult(rows_affected=rows_affected)
+        except Exception as e:
+            return StatementResult(statement=statement, result=None, success=False, error=str(e))
+        return StatementResult(statement=statement, result=result, success=True)
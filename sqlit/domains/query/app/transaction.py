@@ -13,7 +13,7 @@ import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from .query_service import KeywordQueryAnalyzer, NonQueryResult, QueryKind, QueryResult
+from .query_service import KeywordQueryAnalyzer, NonQueryResult, QueryKind, QueryResult, execute_rows_query
 
 if TYPE_CHECKING:
     from sqlit.domains.connections.domain.config import ConnectionConfig
@@ -178,6 +178,8 @@ class TransactionExecutor:
         Returns:
             QueryResult for SELECT queries, NonQueryResult for others.
         """
+        from sqlit.shared.core.query_timing import query_span
+
         from .multi_statement import normalize_for_execution, split_statements
 
         # Normalize SQL: convert blank-line-separated to semicolon-separated
@@ -199,24 +201,29 @@ class TransactionExecutor:
         if use_persistent:
             # Reuse or create a persistent connection for transaction scope
             if self._transaction_connection is None:
-                self._transaction_connection = self.provider.connection_factory.connect(self.config)
-                try:
-                    self.provider.post_connect(self._transaction_connection, self.config)
-                except Exception:
-                    pass
+                with query_span("connect"):
+                    self._transaction_connection = self.provider.connection_factory.connect(self.config)
+                with query_span("post_connect"):
+                    try:
+                        self.provider.post_connect(self._transaction_connection, self.config)
+                    except Exception:
+                        pass
             conn = self._transaction_connection
         else:
             # Not in transaction - use temporary connection
-            conn = self.provider.connection_factory.connect(self.config)
-            try:
-                self.provider.post_connect(conn, self.config)
-            except Exception:
-                pass
+            with query_span("connect"):
+                conn = self.provider.connection_factory.connect(self.config)
+            with query_span("post_connect"):
+                try:
+                    self.provider.post_connect(conn, self.config)
+                except Exception:
+                    pass
             is_temp_connection = True
 
         try:
             # Execute query
-            result = self._execute_on_connection(conn, sql, max_rows)
+            with query_span("execute"):
+                result = self._execute_on_connection(conn, sql, max_rows)
 
             # Update transaction state
             if self._state:
@@ -241,15 +248,7 @@ class TransactionExecutor:
     ) -> QueryResult | NonQueryResult:
         """Execute SQL on a specific connection."""
         if self._analyzer and self._analyzer.classify(sql) == QueryKind.RETURNS_ROWS:
-            columns, rows, truncated = self.provider.query_executor.execute_query(
-                conn, sql, max_rows
-            )
-            return QueryResult(
-                columns=columns,
-                rows=rows,
-                row_count=len(rows),
-                truncated=truncated,
-            )
+            return execute_rows_query(self.provider.query_executor, conn, sql, max_rows)
         else:
             rows_affected = self.provider.query_executor.execute_non_query(conn, sql)
             return NonQueryResult(rows_affected=rows_affected)
@@ -269,24 +268,29 @@ class TransactionExecutor:
         Raises:
             Exception: If any statement fails (after rollback).
         """
+        from sqlit.shared.core.query_timing import query_span
+
         from .multi_statement import normalize_for_execution
 
         # Normalize SQL: convert blank-line-separated to semicolon-separated
         sql = normalize_for_execution(sql)
 
         # Create a dedicated connection for this atomic operation
-        conn = self.provider.connection_factory.connect(self.config)
-        try:
-            self.provider.post_connect(conn, self.config)
-        except Exception:
-            pass
+        with query_span("connect"):
+            conn = self.provider.connection_factory.connect(self.config)
+        with query_span("post_connect"):
+            try:
+                self.provider.post_connect(conn, self.config)
+            except Exception:
+                pass
 
         try:
             # Start transaction
             self.provider.query_executor.execute_non_query(conn, "BEGIN")
 
             # Execute the SQL
-            result = self._execute_on_connection(conn, sql, max_rows)
+            with query_span("execute"):
+                result = self._execute_on_connection(conn, sql, max_rows)
 
             # Commit
             self.provider.query_executor.execute_non_query(conn, "COMMIT")
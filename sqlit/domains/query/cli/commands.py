@@ -11,6 +11,14 @@ from typing import Any
 from sqlit.domains.connections.app.session import ConnectionSession
 from sqlit.domains.connections.cli.prompts import prompt_for_password
 from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.adapters.fetch import (
+    INITIAL_FETCH_BATCH_ROWS,
+    FetchStats,
+    apply_fetch_hints,
+    iter_fetch_batches,
+)
+from sqlit.domains.query.app.bulk_import import BulkImporter, ImportProgress, format_import_progress
+from sqlit.domains.query.app.fan_out import FanOutQuery, FanOutResult, format_fan_out_summary
 from sqlit.domains.query.app.query_service import (
     DialectQueryAnalyzer,
     QueryKind,
@@ -46,10 +54,15 @@ def _get_query_service(
     services: AppServices,
     provider: Any,
     query_service: QueryService | None,
+    limit_pushdown: bool = False,
 ) -> QueryService:
     if query_service is not None:
         return query_service
-    return QueryService(services.history_store, analyzer=DialectQueryAnalyzer(provider.dialect))
+    return QueryService(
+        services.history_store,
+        analyzer=DialectQueryAnalyzer(provider.dialect),
+        limit_dialect=provider.dialect if limit_pushdown else None,
+    )
 
 
 def _should_stream_results(
@@ -63,32 +76,32 @@ def _should_stream_results(
     )
 
 
-def _stream_csv_output(cursor: Any, columns: list[str]) -> int:
-    """Stream CSV output from cursor using fetchmany."""
+def _format_fetch_throughput(stats: FetchStats) -> str:
+    mb_per_s = stats.bytes_per_second / (1024 * 1024)
+    return (
+        f"Fetched {stats.rows} row(s) in {stats.batches} batch(es), "
+        f"{stats.elapsed_s:.2f}s ({stats.rows_per_second:,.0f} rows/s, {mb_per_s:.1f} MB/s)"
+    )
+
+
+def _stream_csv_output(cursor: Any, columns: list[str], stats: FetchStats | None = None) -> int:
+    """Stream CSV output from cursor using adaptive fetchmany batches."""
     writer = csv.writer(sys.stdout)
     writer.writerow(columns)
     row_count = 0
-    batch_size = 1000
-    while True:
-        rows = cursor.fetchmany(batch_size)
-        if not rows:
-            break
+    for rows in iter_fetch_batches(cursor, stats=stats):
         for row in rows:
             writer.writerow(str(val) if val is not None else "" for val in row)
             row_count += 1
     return row_count
 
 
-def _stream_json_output(cursor: Any, columns: list[str]) -> int:
-    """Stream JSON output from cursor using fetchmany (JSON array format)."""
+def _stream_json_output(cursor: Any, columns: list[str], stats: FetchStats | None = None) -> int:
+    """Stream JSON output from cursor using adaptive fetchmany batches (JSON array format)."""
     print("[")
     first = True
     row_count = 0
-    batch_size = 1000
-    while True:
-        rows = cursor.fetchmany(batch_size)
-        if not rows:
-            break
+    for rows in iter_fetch_batches(cursor, stats=stats):
         for row in rows:
             if not first:
                 print(",")
@@ -145,9 +158,13 @@ def cmd_query(
     services = services or build_app_services(RuntimeConfig.from_env())
     connections = services.connection_store.load_all()
 
-    config = _find_connection(connections, args.connection)
+    names = args.connection if isinstance(args.connection, list) else [args.connection]
+    if len(names) > 1:
+        return _cmd_query_fan_out(args, names, connections, services, query_service)
+
+    config = _find_connection(connections, names[0])
     if config is None:
-        print(f"Error: Connection '{args.connection}' not found.")
+        print(f"Error: Connection '{names[0]}' not found.")
         return 1
 
     provider = services.provider_factory(config.db_type)
@@ -167,7 +184,8 @@ def cmd_query(
     max_rows = args.limit if args.limit > 0 else None
 
     create_session = session_factory or services.session_factory
-    service = _get_query_service(services, provider, query_service)
+    limit_pushdown = bool(getattr(args, "limit_pushdown", False) or services.runtime.limit_pushdown)
+    service = _get_query_service(services, provider, query_service, limit_pushdown)
     analyzer = DialectQueryAnalyzer(provider.dialect)
 
     try:
@@ -182,6 +200,7 @@ def cmd_query(
                 has_cursor=has_cursor,
             ):
                 cursor = session.connection.cursor()
+                apply_fetch_hints(cursor, INITIAL_FETCH_BATCH_ROWS)
                 cursor.execute(query)
 
                 if not cursor.description:
@@ -190,13 +209,15 @@ def cmd_query(
 
                 columns = [col[0] for col in cursor.description]
 
+                stats = FetchStats()
                 if args.format == "csv":
-                    row_count = _stream_csv_output(cursor, columns)
+                    row_count = _stream_csv_output(cursor, columns, stats)
                 else:
-                    row_count = _stream_json_output(cursor, columns)
+                    row_count = _stream_json_output(cursor, columns, stats)
 
                 service._save_to_history(config.name, query)
                 print(f"\n({row_count} row(s) returned)", file=sys.stderr)
+                print(_format_fetch_throughput(stats), file=sys.stderr)
                 return 0
 
             result = service.execute(
@@ -243,3 +264,150 @@ def cmd_query(
     except Exception as e:
         print(f"Error: {e}")
         return 1
+
+
+def _print_shard_summary(result: FanOutResult, file: Any) -> None:
+    """Per-connection status, row count and latency, then failures."""
+    width = max(len(shard.connection_name) for shard in result.shards)
+    for shard in result.shards:
+        if shard.returns_rows:
+            count = f"{len(shard.rows)}{'+' if shard.truncated else ''} row(s)"
+        elif shard.ok:
+            count = f"{shard.rows_affected} affected"
+        else:
+            count = "-"
+        line = f"  {shard.connection_name.ljust(width)}  {shard.status:<7}  {count:>14}  {shard.elapsed_ms:>9.1f} ms"
+        if shard.error:
+            line += f"  {shard.error}"
+        print(line, file=file)
+    print(format_fan_out_summary(result), file=file)
+
+
+def _cmd_query_fan_out(
+    args: Any,
+    names: list[str],
+    connections: list[ConnectionConfig],
+    services: AppServices,
+    query_service: QueryService | None,
+) -> int:
+    """Run the query on several connections concurrently and merge the results."""
+    if args.parallel <= 0:
+        print("Error: --parallel must be positive.")
+        return 1
+
+    targets = []
+    for name in dict.fromkeys(names):
+        config = _find_connection(connections, name)
+        if config is None:
+            print(f"Error: Connection '{name}' not found.")
+            return 1
+        provider = services.provider_factory(config.db_type)
+        if args.database:
+            config = provider.apply_database_override(config, args.database)
+        targets.append((prompt_for_password(config), provider))
+
+    query, error = _load_query_text(args)
+    if error:
+        print(error)
+        return 1
+    if query is None:
+        print("Error: No query provided.")
+        return 1
+
+    max_rows = args.limit if args.limit > 0 else None
+    limit_pushdown = bool(getattr(args, "limit_pushdown", False) or services.runtime.limit_pushdown)
+    fan_out = FanOutQuery(
+        query,
+        targets,
+        max_workers=args.parallel,
+        timeout_s=getattr(args, "timeout", None),
+        limit_pushdown=limit_pushdown,
+    )
+    result = fan_out.execute(max_rows=max_rows)
+
+    for (config, provider), shard in zip(targets, result.shards):
+        if shard.ok:
+            service = _get_query_service(services, provider, query_service)
+            service._save_to_history(config.name, query)
+
+    summary_file = sys.stdout if args.format == "table" else sys.stderr
+    if result.returns_rows:
+        columns, rows = result.merged()
+        if args.format == "csv":
+            writer = csv.writer(sys.stdout)
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow(str(val) if val is not None else "" for val in row)
+        elif args.format == "json":
+            json_result = [dict(zip(columns, row)) for row in rows]
+            print(json.dumps(json_result, indent=2, default=str))
+        else:
+            _output_table(columns, rows, result.truncated)
+        print(file=summary_file)
+    _print_shard_summary(result, summary_file)
+    return 1 if result.failed else 0
+
+
+def cmd_import(
+    args: Any,
+    *,
+    services: AppServices | None = None,
+    session_factory: Callable[[ConnectionConfig], ConnectionSession] | None = None,
+) -> int:
+    """Bulk-load a file into an existing table."""
+    services = services or build_app_services(RuntimeConfig.from_env())
+    connections = services.connection_store.load_all()
+
+    config = _find_connection(connections, args.connection)
+    if config is None:
+        print(f"Error: Connection '{args.connection}' not found.")
+        return 1
+
+    provider = services.provider_factory(config.db_type)
+    if args.database:
+        config = provider.apply_database_override(config, args.database)
+
+    config = prompt_for_password(config)
+
+    if args.batch_size <= 0:
+        print("Error: --batch-size must be positive.")
+        return 1
+
+    interactive = sys.stderr.isatty()
+
+    def show_progress(progress: ImportProgress) -> None:
+        if interactive:
+            print(f"\r{format_import_progress(progress)}", end="", file=sys.stderr, flush=True)
+
+    create_session = session_factory or services.session_factory
+    try:
+        with create_session(config) as session:
+            importer = BulkImporter(session.provider, batch_rows=args.batch_size)
+            result = importer.run(
+                session.connection,
+                args.file,
+                args.table,
+                schema=args.schema,
+                file_format=args.format,
+                delimiter=args.delimiter,
+                on_progress=show_progress,
+            )
+    except FileNotFoundError:
+        print(f"Error: File '{args.file}' not found.")
+        return 1
+    except ImportError as e:
+        print(f"Error: Required module not installed: {e}")
+        return 1
+    except Exception as e:
+        if interactive:
+            print(file=sys.stderr)
+        print(f"Error: {e}")
+        return 1
+
+    if interactive:
+        print(file=sys.stderr)
+    rows = f"{result.rows:,} row(s)" if result.rows >= 0 else "Rows"
+    print(
+        f"{rows} imported in {result.elapsed_s:.2f}s ({result.rows_per_second:,.0f} rows/s, {result.method})"
+    )
+    return 0
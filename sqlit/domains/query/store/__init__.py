@@ -1,6 +1,7 @@
 """Query persistence stores."""
 
 from .history import HistoryStore
+from .jobs import QueryJobStore
 from .memory import InMemoryHistoryStore, InMemoryStarredStore
 from .starred import StarredStore
 
@@ -8,5 +9,6 @@ __all__ = [
     "HistoryStore",
     "InMemoryHistoryStore",
     "InMemoryStarredStore",
+    "QueryJobStore",
     "StarredStore",
 ]
@@ -0,0 +1,42 @@
+"""Store for background query jobs that can be reattached after a restart."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from sqlit.shared.core.store import CONFIG_DIR, JSONFileStore
+
+
+class QueryJobStore(JSONFileStore):
+    """Store for server-side query jobs started from sqlit.
+
+    Jobs are stored as a JSON object in ~/.sqlit/query_jobs.json
+    Structure: { "token": {"connection_name": ..., "db_type": ..., "sql": ...,
+    "started_at": ..., "remote": {...}} }
+
+    Only jobs that run on the server independently of the client (Snowflake
+    async queries, BigQuery jobs) are stored. An entry is removed once its
+    result has been fetched or the job is dismissed.
+    """
+
+    def __init__(self, file_path: Path | None = None) -> None:
+        super().__init__(file_path or CONFIG_DIR / "query_jobs.json")
+
+    def load_all(self) -> dict[str, dict[str, Any]]:
+        data = self._read_json()
+        if not isinstance(data, dict):
+            return {}
+        return {token: entry for token, entry in data.items() if isinstance(entry, dict)}
+
+    def save_job(self, token: str, entry: dict[str, Any]) -> None:
+        data = self.load_all()
+        data[token] = entry
+        self._write_json(data)
+
+    def remove_job(self, token: str) -> bool:
+        data = self.load_all()
+        if data.pop(token, None) is None:
+            return False
+        self._write_json(data)
+        return True
@@ -177,12 +177,12 @@ class AutocompleteMixin(AutocompleteSchemaMixin, AutocompleteSuggestionsMixin):
         # Only queue if there are actually tables that need column loading
         scheduler = get_idle_scheduler()
         if scheduler and self._has_tables_needing_columns(text):
-            # Cancel any previous preload job - we'll queue a fresh one
-            scheduler.cancel_all(name="preload-columns")
+            # Replace any previous preload job with a fresh one
             scheduler.request_idle_callback(
                 self._preload_columns_for_query,
                 priority=Priority.LOW,
                 name="preload-columns",
+                replace=True,
             )
 
     def on_descendant_blur(self: AutocompleteMixinHost, event: Any) -> None:
@@ -27,6 +27,7 @@ class AutocompleteSchemaMixin:
     _schema_completed_jobs: int = 0
     _schema_scheduler: Any | None = None
     _schema_process_token: int = 0
+    _schema_indexer: Any | None = None
 
     def _run_db_call(self: AutocompleteMixinHost, fn: Any, *args: Any, **kwargs: Any) -> Any:
         session = getattr(self, "_session", None)
@@ -199,6 +200,9 @@ class AutocompleteSchemaMixin:
         # Cancel any existing schema worker
         if hasattr(self, "_schema_worker") and self._schema_worker is not None:
             self._schema_worker.cancel()
+        if self._schema_indexer is not None:
+            self._schema_indexer.cancel()
+            self._schema_indexer = None
 
         # Initialize empty cache immediately
         self._schema_cache = {
@@ -328,7 +332,14 @@ class AutocompleteSchemaMixin:
         self._schema_total_jobs = len(databases) * 3  # tables, views, procedures per db
         supports_procedures = caps.supports_stored_procedures and isinstance(provider.schema_inspector, ProcedureInspector)
 
+        if self._start_parallel_schema_index(databases, supports_procedures):
+            return
+
         # Spawn workers directly - they're threaded so won't block
+        self._load_database_objects(databases, supports_procedures)
+
+    def _load_database_objects(self: AutocompleteMixinHost, databases: list, supports_procedures: bool) -> None:
+        """Load tables, views and procedures per database through the session connection."""
         for database in databases:
             self._load_tables_job(database)
             self._load_views_job(database)
@@ -337,6 +348,97 @@ class AutocompleteSchemaMixin:
             else:
                 self._schema_completed_jobs += 1  # Skip procedures
 
+    def _start_parallel_schema_index(self: AutocompleteMixinHost, databases: list, supports_procedures: bool) -> bool:
+        """Index several databases at once on dedicated connections.
+
+        Returns False when the legacy per-job path should be used instead.
+        """
+        from sqlit.domains.query.app.schema_indexer import SchemaIndexer
+
+        provider = self.current_provider
+        config = self.current_config
+        concurrency = int(getattr(self.services.runtime, "schema_index_concurrency", 0) or 0)
+        if provider is None or config is None or concurrency <= 0:
+            return False
+
+        # Databases already in the shared cache (e.g. from tree expansion) load from it.
+        cached: list[str | None] = []
+        remaining: list[str | None] = []
+        for database in databases:
+            entry = self._db_object_cache.get(database or "__default__", {})
+            if "tables" in entry and "views" in entry and (not supports_procedures or "procedures" in entry):
+                cached.append(database)
+            else:
+                remaining.append(database)
+        if len(remaining) < 2:
+            return False
+
+        if self._schema_indexer is not None:
+            self._schema_indexer.cancel()
+        indexer = SchemaIndexer(
+            config,
+            provider,
+            max_connections=concurrency,
+            include_procedures=supports_procedures,
+        )
+        self._schema_indexer = indexer
+        token = self._schema_process_token
+        current = self._get_effective_database() if hasattr(self, "_get_effective_database") else None
+
+        if cached:
+            self._load_database_objects(cached, supports_procedures)
+        if not supports_procedures:
+            self._schema_completed_jobs += len(remaining)
+
+        def on_database(schema: Any) -> None:
+            self.call_from_thread(self._on_database_indexed, schema, token)
+
+        def work() -> None:
+            try:
+                indexer.run(remaining, on_database, current=current)
+            except Exception as error:
+                self.call_from_thread(self._on_schema_index_error, error, remaining, supports_procedures, token)
+
+        self.run_worker(work, thread=True, name="schema-index")
+        return True
+
+    def _on_database_indexed(self: AutocompleteMixinHost, schema: Any, token: int) -> None:
+        """Merge one database indexed by the parallel indexer into the completion index."""
+        if token != self._schema_process_token:
+            return
+        database = schema.database
+        cache_key = database or "__default__"
+        if "tables" in schema.errors:
+            self._on_tables_error(schema.errors["tables"], database)
+        else:
+            self._on_tables_loaded(schema.tables or [], database, cache_key)
+        if "views" in schema.errors:
+            self._on_views_error(schema.errors["views"], database)
+        else:
+            self._on_views_loaded(schema.views or [], database, cache_key)
+        if not self._schema_indexer or not self._schema_indexer.include_procedures:
+            return
+        if "procedures" in schema.errors:
+            self._on_procedures_error(schema.errors["procedures"], database)
+        else:
+            self._on_procedures_loaded(schema.procedures or [], database, cache_key)
+
+    def _on_schema_index_error(
+        self: AutocompleteMixinHost,
+        error: Exception,
+        databases: list,
+        supports_procedures: bool,
+        token: int,
+    ) -> None:
+        """Fall back to the session connection when no metadata connection could be opened."""
+        if token != self._schema_process_token:
+            return
+        self.log.error(f"Parallel schema indexing failed, falling back: {error}")
+        self._schema_indexer = None
+        if not supports_procedures:
+            self._schema_completed_jobs -= len(databases)
+        self._load_database_objects(databases, supports_procedures)
+
     def _on_databases_error(self: AutocompleteMixinHost, error: Exception) -> None:
         """Handle error getting databases list."""
         self.log.error(f"Error getting databases: {error}")
@@ -747,6 +849,9 @@ class AutocompleteSchemaMixin:
         if hasattr(self, "_schema_worker") and self._schema_worker is not None:
             self._schema_worker.cancel()
             self._schema_worker = None
+        if self._schema_indexer is not None:
+            self._schema_indexer.cancel()
+            self._schema_indexer = None
         self._schema_process_token = getattr(self, "_schema_process_token", 0) + 1
         self._stop_schema_spinner()
         self.notify("Schema indexing cancelled")
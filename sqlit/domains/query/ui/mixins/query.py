@@ -16,6 +16,8 @@ from .query_editing_operators import QueryEditingOperatorsMixin
 from .query_editing_selection import QueryEditingSelectionMixin
 from .query_editing_undo import QueryEditingUndoMixin
 from .query_execution import QueryExecutionMixin
+from .query_fan_out import QueryFanOutMixin
+from .query_jobs import QueryJobsMixin
 from .query_results import QueryResultsMixin
 
 
@@ -28,6 +30,8 @@ class QueryMixin(
     QueryEditingCommentsMixin,
     QueryEditingCursorMixin,
     QueryExecutionMixin,
+    QueryFanOutMixin,
+    QueryJobsMixin,
     QueryResultsMixin,
 ):
     """Mixin providing query execution functionality."""
@@ -44,4 +48,5 @@ class QueryMixin(
     _results_table_counter: int = 0  # Counter for unique table IDs
     _results_render_worker: Worker[Any] | None = None
     _results_render_token: int = 0
+    _stacked_results_auto_collapse: bool = False
     _query_target_database: str | None = None
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from sqlit.domains.explorer.ui.tree import db_switching as tree_db_switching
+from sqlit.domains.explorer.ui.tree import preview_prefetch as tree_preview_prefetch
 from sqlit.domains.process_worker.ui.mixins.process_worker_lifecycle import (
     ProcessWorkerLifecycleMixin,
 )
@@ -13,12 +14,21 @@ from sqlit.shared.ui.spinner import Spinner
 
 from .query_constants import MAX_FETCH_ROWS
 
+# Finished query timings kept for the breakdown popover and JSON export.
+QUERY_TIMINGS_HISTORY_LIMIT = 50
+# Query targets: the current connection, or the held results in a local DuckDB.
+QUERY_TARGET_DATABASE = "database"
+QUERY_TARGET_RESULTS = "results"
+
 if TYPE_CHECKING:
     from textual.worker import Worker
 
     from sqlit.domains.query.app.cancellable import CancellableQuery
+    from sqlit.domains.query.app.lob_preview import LobPreviewPlan
     from sqlit.domains.query.app.query_service import QueryService
+    from sqlit.domains.query.app.result_cache import QueryResultCache
     from sqlit.domains.query.app.transaction import TransactionExecutor
+    from sqlit.shared.core.query_timing import QueryTimings
 
 
 class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
@@ -26,6 +36,9 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
 
     _query_service: QueryService | None = None
     _query_service_db_type: str | None = None
+    _query_result_cache: QueryResultCache | None = None
+    _query_cache_bypass_once: bool = False
+    _last_cached_query: str | None = None
     _query_worker: Worker[Any] | None = None
     _cancellable_query: CancellableQuery | None = None
     _transaction_executor: TransactionExecutor | None = None
@@ -37,6 +50,9 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
     _schema_indexing: bool = False
     _pending_telescope_query: tuple[str, str] | None = None
     _telescope_auto_filter: bool = False
+    _query_timings_history: list[QueryTimings] = []
+    _lob_preview_plan: LobPreviewPlan | None = None
+    _query_target: str = QUERY_TARGET_DATABASE
 
     def action_execute_query(self: QueryMixinHost) -> None:
         """Execute the current query."""
@@ -58,6 +74,10 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
             self.notify("No query to execute", severity="warning")
             return
 
+        if getattr(self, "_fan_out_query", None) is not None:
+            self._fan_out_query.cancel()
+            self._fan_out_query = None
+
         if hasattr(self, "_query_worker") and self._query_worker is not None:
             self._query_worker.cancel()
 
@@ -71,7 +91,8 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
 
     def _execute_query_common(self: QueryMixinHost, keep_insert_mode: bool) -> None:
         """Common query execution logic."""
-        if self.current_connection is None or self.current_provider is None:
+        on_results = self._query_target == QUERY_TARGET_RESULTS
+        if not on_results and (self.current_connection is None or self.current_provider is None):
             self.notify("Connect to a server to execute queries", severity="warning")
             return
 
@@ -81,6 +102,10 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
             self.notify("No query to execute", severity="warning")
             return
 
+        if getattr(self, "_fan_out_query", None) is not None:
+            self._fan_out_query.cancel()
+            self._fan_out_query = None
+
         if hasattr(self, "_query_worker") and self._query_worker is not None:
             self._query_worker.cancel()
 
@@ -125,6 +150,19 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
             return store
         return self.services.history_store
 
+    def _get_query_result_cache(self: QueryMixinHost) -> QueryResultCache | None:
+        """Return the result cache, or None unless enabled with a positive TTL."""
+        if self._query_result_cache is None:
+            runtime = self.services.runtime
+            ttl_s = float(getattr(runtime, "result_cache_ttl_s", 0) or 0)
+            if ttl_s <= 0:
+                return None
+            from sqlit.domains.query.app.result_cache import QueryResultCache
+
+            budget_mb = float(getattr(runtime, "result_cache_budget_mb", 0) or 0)
+            self._query_result_cache = QueryResultCache(ttl_s, int(budget_mb * 1024 * 1024))
+        return self._query_result_cache
+
     def _get_query_service(self: QueryMixinHost, provider: Any) -> QueryService:
         if self._query_service is None or (
             self._query_service_db_type is not None
@@ -132,13 +170,120 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
         ):
             from sqlit.domains.query.app.query_service import DialectQueryAnalyzer, QueryService
 
+            limit_pushdown = bool(getattr(self.services.runtime, "limit_pushdown", False))
             self._query_service = QueryService(
                 self._get_history_store(),
                 analyzer=DialectQueryAnalyzer(provider.dialect),
+                result_cache=self._get_query_result_cache(),
+                limit_dialect=provider.dialect if limit_pushdown else None,
             )
             self._query_service_db_type = provider.metadata.db_type
         return self._query_service
 
+    def _invalidate_query_result_cache(self: QueryMixinHost, config: Any) -> None:
+        """Drop cached and prefetched results for a connection after data may have changed."""
+        if config is None:
+            return
+        cache = self._query_result_cache
+        if cache is not None:
+            cache.invalidate_connection(config)
+        prefetcher = getattr(self, "_preview_prefetcher", None)
+        if prefetcher is not None:
+            prefetcher.invalidate(config)
+
+    async def _save_query_history(self: QueryMixinHost, service: Any, connection_name: str, query: str) -> None:
+        """Save a query to history off the UI thread; failures are ignored."""
+        import asyncio
+
+        from sqlit.shared.core.query_timing import query_span
+
+        try:
+            with query_span("history"):
+                await asyncio.to_thread(service._save_to_history, connection_name, query)
+        except Exception:
+            pass
+
+    async def _plan_lob_preview(self: QueryMixinHost, query: str, config: Any) -> LobPreviewPlan | None:
+        """Plan server-side LOB truncation when ``query`` is the explorer's table preview."""
+        import asyncio
+
+        from sqlit.domains.query.app.lob_preview import build_lob_preview
+
+        chars = int(getattr(self.services.runtime, "lob_preview_chars", 0) or 0)
+        table_info = self._last_query_table
+        provider = self.current_provider
+        if chars <= 0 or provider is None or not table_info or table_info.get("query") != query:
+            return None
+        columns = table_info.get("columns") or []
+        if not columns:
+            schema_service = self._get_schema_service()
+            if schema_service is None:
+                return None
+            try:
+                columns = await asyncio.to_thread(
+                    schema_service.list_columns,
+                    table_info.get("database"),
+                    table_info.get("schema"),
+                    table_info["name"],
+                )
+            except Exception:
+                return None
+        plan = build_lob_preview(provider, query, list(columns), chars)
+        if plan is not None:
+            plan.config = config
+        return plan
+
+    def _apply_lob_preview(self: QueryMixinHost, plan: LobPreviewPlan | None, result: Any) -> Any:
+        """Strip preview length columns from ``result`` and remember the plan for full fetches."""
+        from sqlit.domains.query.app.query_service import QueryResult
+
+        if plan is None or not isinstance(result, QueryResult):
+            return result
+        self._lob_preview_plan = plan
+        return plan.apply(result)
+
+    def _finish_query_timings(self: QueryMixinHost, timings: QueryTimings, *, status: str | None = None) -> None:
+        """Close a query's timings, keep them for the popover and emit them as a debug event."""
+        from sqlit.shared.core.debug_events import emit_debug_event
+
+        if timings.finished:
+            return
+        timings.finish(status)
+        history = [*self._query_timings_history, timings]
+        self._query_timings_history = history[-QUERY_TIMINGS_HISTORY_LIMIT:]
+        emit_debug_event("query.timings", category="query", **timings.as_dict())
+
+    def action_show_query_timings(self: QueryMixinHost) -> None:
+        """Show where time went on the last query."""
+        from sqlit.shared.core.query_timing import format_breakdown
+        from sqlit.shared.core.utils import format_duration_ms
+        from sqlit.shared.ui.screens.message import MessageScreen
+
+        if not self._query_timings_history:
+            self.notify("No query timings recorded yet")
+            return
+        timings = self._query_timings_history[-1]
+        status = "" if timings.status == "ok" else f" ({timings.status})"
+        title = f"Query timings: {format_duration_ms(timings.total_ms or 0)}{status}"
+        self.push_screen(MessageScreen(title, format_breakdown(timings), enter_label="Close"))
+
+    def action_refresh_results(self: QueryMixinHost) -> None:
+        """Re-run the query behind the current results, bypassing the result cache."""
+        query = self._last_cached_query if self._last_result_cache_age_s is not None else None
+        if not query:
+            query = self.query_input.text.strip()
+        if self.current_connection is None or self.current_provider is None or not query:
+            return
+        if self._query_worker is not None:
+            self._query_worker.cancel()
+        self._query_cache_bypass_once = True
+        self._start_query_spinner()
+        self._query_worker = self.run_worker(
+            self._run_query_async(query, False),
+            name="query_execution",
+            exclusive=True,
+        )
+
     def _get_transaction_executor(self: QueryMixinHost, config: Any, provider: Any) -> Any:
         """Get or create a TransactionExecutor for the current connection."""
         from sqlit.domains.query.app.transaction import TransactionExecutor
@@ -164,6 +309,9 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
         if callable(parent_disconnect):
             parent_disconnect()
         self._reset_transaction_executor()
+        prefetcher = getattr(self, "_preview_prefetcher", None)
+        if prefetcher is not None:
+            prefetcher.clear()
 
     def _on_connect(self: QueryMixinHost) -> None:
         """Handle connect lifecycle event."""
@@ -213,15 +361,16 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
 
     async def _run_query_async(self: QueryMixinHost, query: str, keep_insert_mode: bool) -> None:
         """Run query asynchronously using TransactionExecutor for transaction support."""
-        import asyncio
         import time
 
-        from sqlit.domains.query.app.multi_statement import (
-            MultiStatementExecutor,
-            split_statements,
-        )
-        from sqlit.domains.query.app.query_service import QueryResult, parse_use_statement
-        from sqlit.domains.query.app.transaction import is_transaction_end, is_transaction_start
+        from sqlit.domains.query.app.multi_statement import split_statements
+        from sqlit.domains.query.app.query_service import parse_use_statement
+        from sqlit.domains.query.app.script_runner import can_run_as_script
+        from sqlit.shared.core.query_timing import QueryTimings, activate
+
+        if self._query_target == QUERY_TARGET_RESULTS:
+            await self._run_results_query_async(query, keep_insert_mode)
+            return
 
         provider = self.current_provider
         config = self.current_config
@@ -231,6 +380,79 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
             self._stop_query_spinner()
             return
 
+        config = self._resolve_query_config(provider, config)
+
+        # Handle USE database statements
+        db_name = parse_use_statement(query)
+        if db_name is not None:
+            self._stop_query_spinner()
+            self._display_non_query_result(0, 0)
+            tree_db_switching.set_default_database(self, db_name)
+            if keep_insert_mode:
+                self._restore_insert_mode()
+            return
+
+        # Use TransactionExecutor for transaction-aware query execution
+        executor = self._get_transaction_executor(config, provider)
+        service = self._get_query_service(provider)
+        bypass_cache = self._query_cache_bypass_once
+        self._query_cache_bypass_once = False
+
+        # Check if this is a multi-statement query
+        statements = split_statements(query)
+        is_multi_statement = len(statements) > 1
+        timings = QueryTimings(query, connection=config.name)
+        self._lob_preview_plan = None
+
+        with activate(timings):
+            try:
+                start_time = time.perf_counter()
+                max_rows = self.services.runtime.max_rows or MAX_FETCH_ROWS
+
+                completed = True
+                if is_multi_statement and not self.in_transaction and can_run_as_script(statements):
+                    await self._run_script_statements(service, config, provider, query, statements, max_rows, start_time)
+                elif is_multi_statement:
+                    await self._run_multi_statements(service, executor, config, query, max_rows, start_time)
+                else:
+                    # Table previews may run with large columns truncated server-side.
+                    lob_plan = None if self.in_transaction else await self._plan_lob_preview(query, config)
+                    run_query = service.limited_query(lob_plan.query if lob_plan is not None else query, max_rows)
+                    if bypass_cache or not await self._serve_cached_query(
+                        service, config, query, run_query, max_rows, lob_plan
+                    ):
+                        client = await self._get_query_process_worker(provider, statements)
+                        if client is not None:
+                            completed = await self._run_query_in_process_worker(
+                                client, service, config, query, run_query, max_rows, lob_plan, timings
+                            )
+                        else:
+                            await self._run_single_statement(
+                                service, executor, config, query, run_query, max_rows, lob_plan, start_time
+                            )
+
+                if completed and keep_insert_mode:
+                    self._restore_insert_mode()
+
+            except RuntimeError as e:
+                # A failed or cancelled statement may still have changed data.
+                self._invalidate_query_result_cache(config)
+                if "cancelled" in str(e).lower():
+                    timings.status = "cancelled"
+                else:
+                    timings.status = "error"
+                    self._display_query_error(str(e))
+            except Exception as e:
+                timings.status = "error"
+                self._invalidate_query_result_cache(config)
+                self._display_query_error(str(e))
+            finally:
+                if not timings.awaiting:
+                    self._finish_query_timings(timings)
+                self._stop_query_spinner()
+
+    def _resolve_query_config(self: QueryMixinHost, provider: Any, config: Any) -> Any:
+        """Apply the tree's target database or the active database to ``config``."""
         # If we have a target database from clicking a table in the tree,
         # use that database for the query execution (needed for Azure SQL)
         target_db = getattr(self, "_query_target_database", None)
@@ -249,110 +471,240 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
         current_db = endpoint.database if endpoint else ""
         if active_db and active_db != current_db and not target_db:
             config = provider.apply_database_override(config, active_db)
+        return config
 
-        # Handle USE database statements
-        db_name = parse_use_statement(query)
-        if db_name is not None:
-            self._stop_query_spinner()
-            self._display_non_query_result(0, 0)
-            tree_db_switching.set_default_database(self, db_name)
-            if keep_insert_mode:
-                self._restore_insert_mode()
-            return
+    async def _display_statement_result(self: QueryMixinHost, result: Any, elapsed_ms: float) -> None:
+        from sqlit.domains.query.app.query_service import QueryResult
 
-        # Use TransactionExecutor for transaction-aware query execution
-        executor = self._get_transaction_executor(config, provider)
-        service = self._get_query_service(provider)
+        if isinstance(result, QueryResult):
+            await self._display_query_results(
+                result.columns, result.rows, result.row_count, result.truncated, elapsed_ms
+            )
+        else:
+            self._display_non_query_result(result.rows_affected, elapsed_ms)
+
+    async def _serve_cached_query(
+        self: QueryMixinHost,
+        service: Any,
+        config: Any,
+        query: str,
+        run_query: str,
+        max_rows: int,
+        lob_plan: LobPreviewPlan | None,
+    ) -> bool:
+        """Show a prefetched or cached result for ``query``; False when there is none."""
+        if self.in_transaction:
+            return False
+        cached = tree_preview_prefetch.take_prefetched(self, config, query, max_rows)
+        if cached is not None:
+            lob_plan = None
+        else:
+            cached = service.cached_result(config, run_query, max_rows)
+        if cached is None:
+            return False
+        await self._save_query_history(service, config.name, query)
+        result = self._apply_lob_preview(lob_plan, cached.result)
+        await self._display_query_results(
+            result.columns,
+            result.rows,
+            result.row_count,
+            result.truncated,
+            0,
+            cache_age_s=cached.age_s,
+        )
+        self._last_cached_query = query
+        return True
 
-        # Check if this is a multi-statement query
-        statements = split_statements(query)
-        is_multi_statement = len(statements) > 1
+    async def _get_query_process_worker(self: QueryMixinHost, provider: Any, statements: list[str]) -> Any | None:
+        """Return the process worker client for this query, or None to run in-process."""
+        from sqlit.domains.query.app.transaction import is_transaction_end, is_transaction_start
 
-        try:
-            start_time = time.perf_counter()
-            max_rows = self.services.runtime.max_rows or MAX_FETCH_ROWS
-
-            use_process_worker = self._use_process_worker(provider)
-            if use_process_worker and statements:
-                statement = statements[0].strip()
-                if self.in_transaction or is_transaction_start(statement) or is_transaction_end(statement):
-                    use_process_worker = False
-
-            if use_process_worker and not is_multi_statement:
-                client = await self._get_process_worker_client_async()
-                if client is None:
-                    error = getattr(self, "_process_worker_client_error", None)
-                    if error:
-                        self.notify(
-                            f"Process worker unavailable; falling back. ({error})",
-                            severity="error",
-                            title="Process Worker",
-                        )
-                    else:
-                        self.notify(
-                            "Process worker unavailable; falling back.",
-                            severity="error",
-                            title="Process Worker",
-                        )
-                    use_process_worker = False
-
-                if use_process_worker:
-                    outcome = await asyncio.to_thread(client.execute, query, config, max_rows)
-                    if outcome.cancelled:
-                        return
-                    if outcome.error:
-                        self._display_query_error(outcome.error)
-                        return
-
-                    try:
-                        await asyncio.to_thread(service._save_to_history, config.name, query)
-                    except Exception:
-                        pass
-                    result = outcome.result
-                    elapsed_ms = outcome.elapsed_ms
-
-                    if isinstance(result, QueryResult):
-                        await self._display_query_results(
-                            result.columns,
-                            result.rows,
-                            result.row_count,
-                            result.truncated,
-                            elapsed_ms,
-                        )
-                    else:
-                        self._display_non_query_result(result.rows_affected, elapsed_ms)
-                    if keep_insert_mode:
-                        self._restore_insert_mode()
-                    return
-
-            if is_multi_statement:
-                # Multi-statement execution with stacked results
-                multi_executor = MultiStatementExecutor(executor)
-                multi_result = await asyncio.to_thread(
-                    multi_executor.execute,
-                    query,
-                    max_rows,
+        if not self._use_process_worker(provider) or not statements:
+            return None
+        statement = statements[0].strip()
+        if self.in_transaction or is_transaction_start(statement) or is_transaction_end(statement):
+            return None
+        client = await self._get_process_worker_client_async()
+        if client is None:
+            error = getattr(self, "_process_worker_client_error", None)
+            if error:
+                self.notify(
+                    f"Process worker unavailable; falling back. ({error})",
+                    severity="error",
+                    title="Process Worker",
                 )
-                elapsed_ms = (time.perf_counter() - start_time) * 1000
-
-                try:
-                    await asyncio.to_thread(service._save_to_history, config.name, query)
-                except Exception:
-                    pass
-                self._display_multi_statement_results(multi_result, elapsed_ms)
             else:
-                # Single statement - existing behavior
-                result = await asyncio.to_thread(
-                    executor.execute,
-                    query,
-                    max_rows,
+                self.notify(
+                    "Process worker unavailable; falling back.",
+                    severity="error",
+                    title="Process Worker",
                 )
-                elapsed_ms = (time.perf_counter() - start_time) * 1000
+        return client
+
+    async def _run_query_in_process_worker(
+        self: QueryMixinHost,
+        client: Any,
+        service: Any,
+        config: Any,
+        query: str,
+        run_query: str,
+        max_rows: int,
+        lob_plan: LobPreviewPlan | None,
+        timings: QueryTimings,
+    ) -> bool:
+        """Run one statement in the process worker; False if it was cancelled or failed."""
+        import asyncio
 
-                try:
-                    await asyncio.to_thread(service._save_to_history, config.name, query)
-                except Exception:
-                    pass
+        from sqlit.domains.query.app.query_service import QueryResult
+
+        dispatch_ms = timings.elapsed_ms()
+        outcome = await asyncio.to_thread(client.execute, run_query, config, max_rows)
+        timings.merge(outcome.spans, offset_ms=dispatch_ms)
+        if outcome.ipc_ms:
+            timings.record("ipc", outcome.ipc_ms)
+        if outcome.cancelled or outcome.error:
+            self._invalidate_query_result_cache(config)
+        if outcome.cancelled:
+            timings.status = "cancelled"
+            return False
+        if outcome.error:
+            timings.status = "error"
+            self._display_query_error(outcome.error)
+            return False
+
+        await self._save_query_history(service, config.name, query)
+        result = outcome.result
+        service.record_result(config, run_query, max_rows, result)
+        if not isinstance(result, QueryResult):
+            self._invalidate_query_result_cache(config)
+        await self._display_statement_result(self._apply_lob_preview(lob_plan, result), outcome.elapsed_ms)
+        return True
+
+    async def _run_script_statements(
+        self: QueryMixinHost,
+        service: Any,
+        config: Any,
+        provider: Any,
+        query: str,
+        statements: list[str],
+        max_rows: int,
+        start_time: float,
+    ) -> None:
+        """Run a script on one connection, streaming stacked results."""
+        import asyncio
+        import time
+
+        from sqlit.domains.query.app.script_runner import ScriptRunner
+
+        runner = ScriptRunner(config=config, provider=provider)
+
+        def on_progress(start_index: int, results: list[Any]) -> None:
+            self.call_from_thread(self._append_stacked_results, start_index, results)
+
+        self._invalidate_query_result_cache(config)
+        self._begin_stacked_results(len(statements))
+        multi_result = await asyncio.to_thread(runner.run, statements, max_rows, on_progress)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        await self._save_query_history(service, config.name, query)
+        self._finish_multi_statement_results(multi_result, elapsed_ms)
+
+    async def _run_multi_statements(
+        self: QueryMixinHost,
+        service: Any,
+        executor: TransactionExecutor,
+        config: Any,
+        query: str,
+        max_rows: int,
+        start_time: float,
+    ) -> None:
+        """Run statements one by one on the transaction-aware executor, with stacked results."""
+        import asyncio
+        import time
+
+        from sqlit.domains.query.app.multi_statement import MultiStatementExecutor
+
+        multi_executor = MultiStatementExecutor(executor)
+        self._invalidate_query_result_cache(config)
+        multi_result = await asyncio.to_thread(
+            multi_executor.execute,
+            query,
+            max_rows,
+        )
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        await self._save_query_history(service, config.name, query)
+        self._display_multi_statement_results(multi_result, elapsed_ms)
+
+    async def _run_single_statement(
+        self: QueryMixinHost,
+        service: Any,
+        executor: TransactionExecutor,
+        config: Any,
+        query: str,
+        run_query: str,
+        max_rows: int,
+        lob_plan: LobPreviewPlan | None,
+        start_time: float,
+    ) -> None:
+        """Run one statement on the transaction-aware executor."""
+        import asyncio
+        import time
+
+        from sqlit.domains.query.app.query_service import QueryResult
+
+        result = await asyncio.to_thread(
+            executor.execute,
+            run_query,
+            max_rows,
+        )
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        service.record_result(config, run_query, max_rows, result, in_transaction=self.in_transaction)
+        if not isinstance(result, QueryResult):
+            self._invalidate_query_result_cache(config)
+        result = self._apply_lob_preview(lob_plan, result)
+
+        await self._save_query_history(service, config.name, query)
+        await self._display_statement_result(result, elapsed_ms)
+
+    def action_toggle_results_target(self: QueryMixinHost) -> None:
+        """Switch queries between the connection and the held results."""
+        if self._query_target == QUERY_TARGET_RESULTS:
+            self._set_query_target(QUERY_TARGET_DATABASE)
+        else:
+            self._set_query_target(QUERY_TARGET_RESULTS)
+
+    def _set_query_target(self: QueryMixinHost, target: str) -> None:
+        """Run editor queries on the connection or on the held results."""
+        self._query_target = target
+        if target == QUERY_TARGET_RESULTS:
+            names = [result.name for result in self._get_results_workspace().results]
+            if names:
+                available = names[0] if len(names) == 1 else f"{names[0]}..{names[-1]}"
+                self.notify(f"Queries run on results ({available}); :results list to see them")
+            else:
+                self.notify("Queries run on results; run a query to add one")
+        else:
+            self.notify("Queries run on the connection")
+        self._update_status_bar()
+
+    async def _run_results_query_async(self: QueryMixinHost, query: str, keep_insert_mode: bool) -> None:
+        """Run ``query`` against the held results in the local DuckDB workspace."""
+        import asyncio
+        import time
+
+        from sqlit.domains.query.app.query_service import QueryResult
+        from sqlit.shared.core.query_timing import QueryTimings, activate
+
+        workspace = self._get_results_workspace()
+        timings = QueryTimings(query, connection=QUERY_TARGET_RESULTS)
+
+        with activate(timings):
+            try:
+                start_time = time.perf_counter()
+                max_rows = self.services.runtime.max_rows or MAX_FETCH_ROWS
+                result = await asyncio.to_thread(workspace.execute, query, max_rows)
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
 
                 if isinstance(result, QueryResult):
                     await self._display_query_results(
@@ -360,19 +712,15 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
                     )
                 else:
                     self._display_non_query_result(result.rows_affected, elapsed_ms)
-
-            if keep_insert_mode:
-                self._restore_insert_mode()
-
-        except RuntimeError as e:
-            if "cancelled" in str(e).lower():
-                pass  # Already handled by action_cancel_query
-            else:
+                if keep_insert_mode:
+                    self._restore_insert_mode()
+            except Exception as e:
+                timings.status = "error"
                 self._display_query_error(str(e))
-        except Exception as e:
-            self._display_query_error(str(e))
-        finally:
-            self._stop_query_spinner()
+            finally:
+                if not timings.awaiting:
+                    self._finish_query_timings(timings)
+                self._stop_query_spinner()
 
     async def _run_query_atomic_async(self: QueryMixinHost, query: str) -> None:
         """Run query atomically (BEGIN/COMMIT with rollback on error)."""
@@ -381,6 +729,7 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
 
         from sqlit.domains.query.app.query_service import QueryResult
         from sqlit.domains.query.app.transaction import TransactionExecutor
+        from sqlit.shared.core.query_timing import QueryTimings, activate
 
         provider = self.current_provider
         config = self.current_config
@@ -403,35 +752,39 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
         executor = TransactionExecutor(config=config, provider=provider)
         service = self._get_query_service(provider)
 
-        try:
-            start_time = time.perf_counter()
-            max_rows = self.services.runtime.max_rows or MAX_FETCH_ROWS
-            result = await asyncio.to_thread(
-                executor.atomic_execute,
-                query,
-                max_rows,
-            )
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
+        timings = QueryTimings(query, connection=config.name)
 
+        with activate(timings):
             try:
-                await asyncio.to_thread(service._save_to_history, config.name, query)
-            except Exception:
-                pass
-
-            if isinstance(result, QueryResult):
-                await self._display_query_results(
-                    result.columns, result.rows, result.row_count, result.truncated, elapsed_ms
+                start_time = time.perf_counter()
+                max_rows = self.services.runtime.max_rows or MAX_FETCH_ROWS
+                self._invalidate_query_result_cache(config)
+                result = await asyncio.to_thread(
+                    executor.atomic_execute,
+                    query,
+                    max_rows,
                 )
-            else:
-                self._display_non_query_result(result.rows_affected, elapsed_ms)
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
 
-            self.notify("Query executed atomically (committed)", severity="information")
+                await self._save_query_history(service, config.name, query)
 
-        except Exception as e:
-            self._display_query_error(f"Transaction rolled back: {e}")
-        finally:
-            executor.close()
-            self._stop_query_spinner()
+                if isinstance(result, QueryResult):
+                    await self._display_query_results(
+                        result.columns, result.rows, result.row_count, result.truncated, elapsed_ms
+                    )
+                else:
+                    self._display_non_query_result(result.rows_affected, elapsed_ms)
+
+                self.notify("Query executed atomically (committed)", severity="information")
+
+            except Exception as e:
+                timings.status = "error"
+                self._display_query_error(f"Transaction rolled back: {e}")
+            finally:
+                executor.close()
+                if not timings.awaiting:
+                    self._finish_query_timings(timings)
+                self._stop_query_spinner()
 
     def _restore_insert_mode(self: QueryMixinHost) -> None:
         """Restore INSERT mode after query execution (called on main thread)."""
@@ -459,6 +812,10 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
         if hasattr(self, "_cancellable_query") and self._cancellable_query is not None:
             self._cancellable_query.cancel()
 
+        if getattr(self, "_fan_out_query", None) is not None:
+            self._fan_out_query.cancel()
+            self._fan_out_query = None
+
         if hasattr(self, "_query_worker") and self._query_worker is not None:
             self._query_worker.cancel()
             self._query_worker = None
@@ -484,6 +841,9 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
                     pass
             if hasattr(self, "_cancellable_query") and self._cancellable_query is not None:
                 self._cancellable_query.cancel()
+            if getattr(self, "_fan_out_query", None) is not None:
+                self._fan_out_query.cancel()
+                self._fan_out_query = None
 
             if hasattr(self, "_query_worker") and self._query_worker is not None:
                 self._query_worker.cancel()
@@ -499,6 +859,9 @@ class QueryExecutionMixin(ProcessWorkerLifecycleMixin):
             if hasattr(self, "_schema_worker") and self._schema_worker is not None:
                 self._schema_worker.cancel()
                 self._schema_worker = None
+            if getattr(self, "_schema_indexer", None) is not None:
+                self._schema_indexer.cancel()
+                self._schema_indexer = None
             self._stop_schema_spinner()
             cancelled = True
 
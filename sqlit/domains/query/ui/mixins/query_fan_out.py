@@ -0,0 +1,122 @@
+"""Fan-out query execution for SSMSTUI: one query on every selected connection."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlit.shared.ui.protocols import QueryMixinHost
+
+from .query_constants import MAX_FETCH_ROWS
+
+if TYPE_CHECKING:
+    from sqlit.domains.query.app.fan_out import FanOutQuery, FanOutResult
+
+
+class QueryFanOutMixin:
+    """Mixin running the editor query on all connections selected in the explorer.
+
+    Shards run concurrently on dedicated connections. The results show as
+    stacked sections: the rows of every shard merged into one grid with a
+    ``__connection`` column, then one summary row per shard with its status,
+    row count, latency and error.
+    """
+
+    _fan_out_query: FanOutQuery | None = None
+
+    def action_execute_query_fan_out(self: QueryMixinHost, max_workers: int | None = None) -> None:
+        """Run the editor query on every selected connection."""
+        from sqlit.domains.connections.domain.passwords import needs_db_password, needs_ssh_password
+        from sqlit.domains.query.app.fan_out import DEFAULT_FAN_OUT_WORKERS, FanOutQuery
+
+        configs = self._get_selected_connection_configs()
+        if not configs:
+            self.notify("Select connections in the explorer to run a query on all of them", severity="warning")
+            return
+        query = self.query_input.text.strip()
+        if not query:
+            self.notify("No query to execute", severity="warning")
+            return
+
+        targets = []
+        skipped = []
+        flow = self._get_connection_flow()
+        for config in configs:
+            flow.populate_credentials_if_missing(config)
+            if needs_ssh_password(config) or needs_db_password(config):
+                skipped.append(config.name)
+                continue
+            targets.append((config, self.services.provider_factory(config.db_type)))
+        if skipped:
+            self.notify(
+                f"Skipping {', '.join(skipped)}: password not saved (connect once to enter it)",
+                severity="warning",
+            )
+        if not targets:
+            return
+
+        if self._fan_out_query is not None:
+            self._fan_out_query.cancel()
+        if self._query_worker is not None:
+            self._query_worker.cancel()
+        self._fan_out_query = FanOutQuery(
+            query,
+            targets,
+            max_workers=max_workers or DEFAULT_FAN_OUT_WORKERS,
+            limit_pushdown=bool(self.services.runtime.limit_pushdown),
+        )
+        self._start_query_spinner()
+        self._query_worker = self.run_worker(
+            self._run_fan_out_async(self._fan_out_query),
+            name="query_execution_fan_out",
+            exclusive=True,
+        )
+
+    async def _run_fan_out_async(self: QueryMixinHost, fan_out: FanOutQuery) -> None:
+        import asyncio
+
+        max_rows = self.services.runtime.max_rows or MAX_FETCH_ROWS
+        try:
+            result = await asyncio.to_thread(fan_out.execute, max_rows)
+        except Exception as error:
+            self._display_query_error(str(error))
+            return
+        finally:
+            if self._fan_out_query is fan_out:
+                self._fan_out_query = None
+                self._stop_query_spinner()
+
+        if fan_out.is_cancelled:
+            return
+        history = self._get_history_store()
+        for shard in result.shards:
+            if shard.ok:
+                try:
+                    history.save_query(shard.connection_name, fan_out.sql)
+                except Exception:
+                    pass
+        self._display_fan_out_results(result, fan_out.sql)
+
+    def _display_fan_out_results(self: QueryMixinHost, result: FanOutResult, sql: str) -> None:
+        """Show the merged rows and the per-shard summary as stacked sections."""
+        from sqlit.domains.query.app.fan_out import SUMMARY_COLUMNS, format_fan_out_summary
+        from sqlit.domains.query.app.multi_statement import StatementResult
+        from sqlit.domains.query.app.query_service import QueryResult
+
+        sections = []
+        if result.returns_rows:
+            columns, rows = result.merged()
+            merged = QueryResult(columns=columns, rows=rows, row_count=len(rows), truncated=result.truncated)
+            sections.append(StatementResult(statement=sql, result=merged, success=True))
+        summary_rows = result.summary_rows()
+        summary = QueryResult(
+            columns=list(SUMMARY_COLUMNS), rows=summary_rows, row_count=len(summary_rows), truncated=False
+        )
+        shards_label = f"Connections: {len(result.shards) - len(result.failed)}/{len(result.shards)} ok"
+        sections.append(StatementResult(statement=shards_label, result=summary, success=True))
+
+        self._begin_stacked_results(len(sections))
+        self._append_stacked_results(0, sections)
+        self.notify(
+            format_fan_out_summary(result),
+            severity="warning" if result.failed else "information",
+        )
@@ -0,0 +1,158 @@
+"""Background query jobs for SSMSTUI: run, list, open and reattach."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlit.shared.ui.protocols import QueryMixinHost
+
+from .query_constants import MAX_FETCH_ROWS
+
+if TYPE_CHECKING:
+    from sqlit.domains.query.app.query_jobs import QueryJob, QueryJobManager
+
+
+class QueryJobsMixin:
+    """Mixin running editor queries as background jobs.
+
+    Jobs run on their own thread and connection, so the editor stays free
+    for other queries on the same connection while they run. Finished jobs
+    keep their results until opened from the jobs panel or removed.
+    """
+
+    _query_job_manager: QueryJobManager | None = None
+
+    def _get_query_job_manager(self: QueryMixinHost) -> QueryJobManager:
+        """Return the job manager, loading persisted server-side jobs on first use."""
+        manager = self._query_job_manager
+        if manager is None:
+            from sqlit.domains.query.app.query_jobs import QueryJobManager
+            from sqlit.domains.query.store.jobs import QueryJobStore
+
+            job_store = None if self.services.runtime.mock.enabled else QueryJobStore()
+            manager = QueryJobManager(self._get_result_store(), job_store, on_change=self._on_query_job_changed)
+            self._query_job_manager = manager
+        return manager
+
+    def _running_query_job_count(self: QueryMixinHost) -> int:
+        manager = self._query_job_manager
+        return manager.running_count if manager is not None else 0
+
+    def _on_query_job_changed(self: QueryMixinHost, job: QueryJob) -> None:
+        """Job callback; runs on worker threads as well as the UI thread."""
+        try:
+            self.call_from_thread(self._handle_query_job_change, job)
+        except RuntimeError:
+            self._handle_query_job_change(job)
+
+    def _handle_query_job_change(self: QueryMixinHost, job: QueryJob) -> None:
+        from sqlit.domains.query.app.query_jobs import JOB_CANCELLED, JOB_DONE, JOB_ERROR
+        from sqlit.domains.query.ui.screens.query_jobs import QueryJobsScreen
+        from sqlit.shared.core.utils import format_duration_ms
+
+        self._update_status_bar()
+        screen = self.screen
+        if isinstance(screen, QueryJobsScreen):
+            screen.refresh_jobs()
+        elapsed = format_duration_ms(job.elapsed_s * 1000)
+        if job.status == JOB_DONE:
+            if job.rows is not None:
+                suffix = "+" if job.truncated else ""
+                detail = f"{job.rows_fetched:,}{suffix} rows"
+            else:
+                detail = "done"
+            self.notify(f"Job #{job.job_id} finished in {elapsed}: {detail}")
+        elif job.status == JOB_ERROR:
+            self.notify(f"Job #{job.job_id} failed: {job.error}", severity="error")
+        elif job.status == JOB_CANCELLED:
+            self.notify(f"Job #{job.job_id} cancelled", severity="warning")
+
+    def _query_job_config(self: QueryMixinHost) -> Any:
+        """The current connection config with the active database applied."""
+        provider = self.current_provider
+        config = self.current_config
+        if provider is None or config is None:
+            return None
+        active_db = self._get_effective_database() if hasattr(self, "_get_effective_database") else None
+        endpoint = config.tcp_endpoint
+        current_db = endpoint.database if endpoint else ""
+        if active_db and active_db != current_db:
+            config = provider.apply_database_override(config, active_db)
+        return config
+
+    def action_execute_query_background(self: QueryMixinHost) -> None:
+        """Run the editor query as a background job."""
+        from sqlit.core.state_base import resolve_display_key
+
+        provider = self.current_provider
+        config = self._query_job_config()
+        if self.current_connection is None or provider is None or config is None:
+            self.notify("Connect to a server to execute queries", severity="warning")
+            return
+        query = self.query_input.text.strip()
+        if not query:
+            self.notify("No query to execute", severity="warning")
+            return
+        max_rows = self.services.runtime.max_rows or MAX_FETCH_ROWS
+        job = self._get_query_job_manager().submit(query, config, provider, max_rows)
+        self._invalidate_query_result_cache(config)
+        jobs_key = resolve_display_key("leader_show_query_jobs") or "<space>j"
+        self.notify(f"Started job #{job.job_id} in the background ({jobs_key} or :jobs to view)")
+
+    def action_show_query_jobs(self: QueryMixinHost) -> None:
+        """Show the background jobs panel."""
+        from sqlit.domains.query.ui.screens.query_jobs import QueryJobsScreen
+
+        manager = self._get_query_job_manager()
+
+        def handle_result(result: tuple[str, int] | None) -> None:
+            if not result:
+                return
+            action, job_id = result
+            if action == "open":
+                self._open_query_job(job_id)
+            elif action == "reattach":
+                self._reattach_query_job(job_id)
+
+        self.push_screen(QueryJobsScreen(manager), handle_result)
+
+    def _open_query_job(self: QueryMixinHost, job_id: int) -> None:
+        """Show a finished job's result in the results grid."""
+        job = self._get_query_job_manager().get(job_id)
+        if job is None:
+            return
+        if job.error:
+            self._display_query_error(job.error)
+            return
+        if job.rows is None:
+            affected = job.rows_affected if job.rows_affected is not None else -1
+            self._display_non_query_result(affected, job.elapsed_s * 1000)
+            return
+        self._last_query_table = None
+        self.run_worker(
+            self._display_query_results(
+                job.columns, job.rows, job.rows_fetched, job.truncated, job.elapsed_s * 1000
+            ),
+            name=f"open-query-job-{job_id}",
+            group="open-query-job",
+            exclusive=True,
+        )
+
+    def _reattach_query_job(self: QueryMixinHost, job_id: int) -> None:
+        """Reattach a job persisted by an earlier session using its saved connection."""
+        manager = self._get_query_job_manager()
+        job = manager.get(job_id)
+        if job is None:
+            return
+        config = next((conn for conn in self.connections if conn.name == job.connection_name), None)
+        if config is None:
+            self.notify(f"Connection '{job.connection_name}' no longer exists", severity="error")
+            return
+        try:
+            provider = self.services.provider_factory(config.db_type)
+            max_rows = self.services.runtime.max_rows or MAX_FETCH_ROWS
+            manager.reattach(job_id, config, provider, max_rows)
+        except Exception as error:
+            self.notify(f"Cannot reattach job #{job_id}: {error}", severity="error")
+            return
+        self.notify(f"Reattached job #{job_id}")
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
 from typing import Any
 
+from sqlit.shared.core.query_timing import current_query_timings
 from sqlit.shared.core.utils import format_duration_ms
 from sqlit.shared.ui.protocols import QueryMixinHost
 from sqlit.shared.ui.widgets import SqlitDataTable
@@ -13,6 +13,8 @@ from .query_constants import MAX_COLUMN_CONTENT_WIDTH, MAX_RENDER_ROWS
 
 RESULTS_RENDER_CHUNK_SIZE = 200
 RESULTS_RENDER_INITIAL_ROWS = 20
+# Rows per Arrow batch appended by the incremental renderer.
+RESULTS_RENDER_BATCH_ROWS = 1000
 
 
 class QueryResultsMixin:
@@ -82,41 +84,6 @@ class QueryResultsMixin:
             null_rep="NULL",
         )
 
-    def _get_decimal_column_types(self: QueryMixinHost, rows: list[tuple]) -> dict[int, Any]:
-        from decimal import Decimal
-
-        max_precision: dict[int, int] = {}
-        max_scale: dict[int, int] = {}
-
-        for row in rows:
-            for idx, value in enumerate(row):
-                if isinstance(value, Decimal):
-                    digits = len(value.as_tuple().digits)
-                    exponent = value.as_tuple().exponent
-                    scale = -exponent if exponent < 0 else 0
-                    precision = digits + (exponent if exponent > 0 else 0)
-                    if precision < 1:
-                        precision = 1
-                    max_precision[idx] = max(max_precision.get(idx, 0), precision)
-                    max_scale[idx] = max(max_scale.get(idx, 0), scale)
-
-        if not max_precision:
-            return {}
-
-        import pyarrow as pa
-
-        types: dict[int, Any] = {}
-        for idx, precision in max_precision.items():
-            scale = max_scale.get(idx, 0)
-            if precision < scale:
-                precision = scale
-            if precision > 38:
-                types[idx] = pa.decimal256(precision, scale)
-            else:
-                types[idx] = pa.decimal128(precision, scale)
-
-        return types
-
     def _replace_results_table_with_table(self: QueryMixinHost, table: SqlitDataTable) -> None:
         """Replace the results table with a prebuilt table."""
         container = self.results_area
@@ -149,54 +116,52 @@ class QueryResultsMixin:
         table: SqlitDataTable,
         columns: list[str],
         rows: list[tuple],
+        batches: list[Any],
         *,
         escape: bool,
-        coerce_to_str_columns: set[int] | None = None,
-        start_index: int,
-        row_limit: int,
         render_token: int,
+        timings: Any | None = None,
     ) -> None:
-        if not rows or row_limit <= 0:
-            return
+        """Append ready-made Arrow batches to the table, one per idle slice.
 
-        index = max(0, start_index)
-        total = min(len(rows), row_limit)
-        if index >= total:
+        ``timings`` gets its full-render span when the last batch is in.
+        """
+        if not batches:
             return
 
+        pending = iter(batches)
+        start_ms = timings.elapsed_ms() if timings is not None else 0.0
+        if timings is not None:
+            timings.expect("render")
+
+        def finish(status: str | None = None) -> None:
+            if timings is None:
+                return
+            timings.record_since("render", start_ms)
+            if timings.done("render") or status:
+                self._finish_query_timings(timings, status=status)
+
         def add_batch() -> None:
-            nonlocal index
             if render_token != getattr(self, "_results_render_token", 0):
+                finish("superseded")
                 return
-            end = min(index + RESULTS_RENDER_CHUNK_SIZE, total)
-            if end <= index:
+            batch = next(pending, None)
+            if batch is None:
+                finish()
                 return
-            batch = rows[index:end]
-            if coerce_to_str_columns:
-                coerced: list[tuple] = []
-                for row in batch:
-                    new_row = []
-                    for col_idx, value in enumerate(row):
-                        if col_idx in coerce_to_str_columns and value is not None:
-                            new_row.append(str(value))
-                        else:
-                            new_row.append(value)
-                    coerced.append(tuple(new_row))
-                batch = coerced
             try:
-                table.add_rows(batch)
+                table.append_arrow_batch(batch)
             except Exception as exc:
-                # Fall back to full render if incremental append fails (e.g., Arrow schema mismatch).
+                # Fall back to full render if incremental append fails.
                 try:
                     self.log.error(f"Results incremental render failed; falling back to full render: {exc}")
                 except Exception:
                     pass
                 if render_token == getattr(self, "_results_render_token", 0):
                     self._replace_results_table_with_data(columns, rows, escape=escape)
+                finish()
                 return
-            index = end
-            if index < total:
-                schedule_next()
+            schedule_next()
 
         def schedule_next() -> None:
             try:
@@ -208,7 +173,7 @@ class QueryResultsMixin:
             if scheduler:
                 scheduler.request_idle_callback(
                     add_batch,
-                    priority=Priority.NORMAL,
+                    priority=Priority.HIGH,
                     name="results-render",
                 )
             else:
@@ -216,7 +181,7 @@ class QueryResultsMixin:
 
         schedule_next()
 
-    def _render_results_table_incremental(
+    async def _render_results_table_incremental(
         self: QueryMixinHost,
         columns: list[str],
         rows: list[tuple],
@@ -224,44 +189,32 @@ class QueryResultsMixin:
         escape: bool,
         row_limit: int,
         render_token: int,
-    ) -> None:
-        initial_count = min(RESULTS_RENDER_INITIAL_ROWS, row_limit)
-        initial_rows = rows[:initial_count] if initial_count > 0 else []
-        has_decimal_in_initial = any(
-            isinstance(value, Decimal) for row in initial_rows for value in row
-        )
-        coerce_to_str_columns: set[int] | None = None
+        timings: Any | None = None,
+    ) -> bool:
+        """Render a large result from Arrow batches built on a worker thread.
+
+        Type inference and value conversion run off the UI thread; the UI
+        thread mounts the table with the first batch and then only appends
+        the remaining batches. Returns True if batches are still to be appended.
+        """
+        import asyncio
+
+        from sqlit.domains.query.app.render_batches import build_render_batches
+
         try:
-            if has_decimal_in_initial:
-                decimal_types = self._get_decimal_column_types(rows)
-                if decimal_types:
-                    from textual_fastdatatable.backend import ArrowBackend
-                    import pyarrow as pa
-
-                    arrays = []
-                    coerce_to_str_columns = set()
-                    for idx, _name in enumerate(columns):
-                        values = [row[idx] for row in initial_rows] if initial_rows else []
-                        col_type = decimal_types.get(idx)
-                        try:
-                            if col_type is not None:
-                                arrays.append(pa.array(values, type=col_type))
-                            else:
-                                arrays.append(pa.array(values))
-                        except (TypeError, ValueError, pa.ArrowInvalid, pa.ArrowTypeError):
-                            coerce_to_str_columns.add(idx)
-                            arrays.append(
-                                pa.array(
-                                    [str(value) if value is not None else None for value in values],
-                                    type=pa.string(),
-                                )
-                            )
-                    table_backend = ArrowBackend(pa.Table.from_arrays(arrays, names=columns))
-                    table = self._build_results_table(columns, initial_rows, escape=escape, backend=table_backend)
-                else:
-                    table = self._build_results_table(columns, initial_rows, escape=escape)
-            else:
-                table = self._build_results_table(columns, initial_rows, escape=escape)
+            batches = await asyncio.to_thread(
+                build_render_batches,
+                columns,
+                rows,
+                row_limit=row_limit,
+                first_batch_rows=RESULTS_RENDER_INITIAL_ROWS,
+                batch_rows=RESULTS_RENDER_BATCH_ROWS,
+            )
+            if render_token != getattr(self, "_results_render_token", 0):
+                return False
+            from textual_fastdatatable.backend import ArrowBackend
+
+            table = self._build_results_table(columns, [], escape=escape, backend=ArrowBackend(batches[0]))
         except Exception as exc:
             try:
                 self.log.error(f"Results table build failed; falling back to full render: {exc}")
@@ -269,41 +222,89 @@ class QueryResultsMixin:
                 pass
             if render_token == getattr(self, "_results_render_token", 0):
                 self._replace_results_table_with_data(columns, rows, escape=escape)
-            return
+            return False
         if render_token != getattr(self, "_results_render_token", 0):
-            return
+            return False
         self._replace_results_table_with_table(table)
         self._schedule_results_render(
             table,
             columns,
             rows,
+            batches[1:],
             escape=escape,
-            coerce_to_str_columns=coerce_to_str_columns,
-            start_index=initial_count,
-            row_limit=row_limit,
             render_token=render_token,
+            timings=timings,
         )
+        return len(batches) > 1
+
+    def _render_arrow_results_table(
+        self: QueryMixinHost,
+        columns: list[str],
+        arrow_table: Any,
+        render_token: int,
+    ) -> bool:
+        """Render an Arrow-backed result directly, without converting rows.
+
+        Returns False if the table could not be built, so the caller can fall
+        back to the row-based render path.
+        """
+        try:
+            from textual_fastdatatable.backend import ArrowBackend
+
+            backend = ArrowBackend(arrow_table, max_rows=MAX_RENDER_ROWS)
+            table = self._build_results_table(columns, [], escape=True, backend=backend)
+        except Exception as exc:
+            try:
+                self.log.error(f"Arrow results render failed; falling back to row render: {exc}")
+            except Exception:
+                pass
+            return False
+        if render_token == getattr(self, "_results_render_token", 0):
+            self._replace_results_table_with_table(table)
+        return True
 
     async def _display_query_results(
-        self: QueryMixinHost, columns: list[str], rows: list[tuple], row_count: int, truncated: bool, elapsed_ms: float
+        self: QueryMixinHost,
+        columns: list[str],
+        rows: list[tuple],
+        row_count: int,
+        truncated: bool,
+        elapsed_ms: float,
+        *,
+        cache_age_s: float | None = None,
     ) -> None:
-        """Display query results in the results table (called on main thread)."""
+        """Display query results in the results table (called on main thread).
+
+        ``cache_age_s`` is set when the results were served from the result
+        cache rather than the database.
+        """
+        rows = self._retain_last_result(columns, rows)
+        timings = current_query_timings()
+        self._register_workspace_result(columns, rows, timings.query if timings is not None else "")
         self._last_result_columns = columns
         self._last_result_rows = rows
         self._last_result_row_count = row_count
+        self._last_result_cached_rows = rows if cache_age_s is not None else None
+        self._last_result_cache_age_s = cache_age_s
 
         # Switch to single result mode (in case we were showing stacked results)
         self._show_single_result_mode()
         self._cancel_results_render()
         render_token = getattr(self, "_results_render_token", 0)
         row_limit = min(len(rows), MAX_RENDER_ROWS)
-        if row_limit > RESULTS_RENDER_CHUNK_SIZE:
-            self._render_results_table_incremental(
+        arrow_table = getattr(rows, "arrow_table", None)
+        build_start_ms = timings.elapsed_ms() if timings is not None else 0.0
+        render_pending = False
+        if arrow_table is not None and self._render_arrow_results_table(columns, arrow_table, render_token):
+            pass
+        elif row_limit > RESULTS_RENDER_CHUNK_SIZE:
+            render_pending = await self._render_results_table_incremental(
                 columns,
                 rows,
                 escape=True,
                 row_limit=row_limit,
                 render_token=render_token,
+                timings=timings,
             )
         else:
             render_rows = rows[:row_limit] if row_limit else []
@@ -311,6 +312,21 @@ class QueryResultsMixin:
             if render_token != getattr(self, "_results_render_token", 0):
                 return
             self._replace_results_table_with_table(table)
+        if timings is not None:
+            timings.record_since("table_build", build_start_ms)
+            self._track_results_paint(timings, render_pending=render_pending)
+
+        if cache_age_s is not None:
+            from sqlit.core.state_base import resolve_display_key
+            from sqlit.domains.query.app.result_cache import format_cache_age
+
+            refresh_key = resolve_display_key("refresh_results") or "R"
+            suffix = "+" if truncated else ""
+            self.notify(
+                f"Query returned {row_count}{suffix} rows (cached, {format_cache_age(cache_age_s)} old; "
+                f"{refresh_key} in results to refresh)"
+            )
+            return
 
         time_str = format_duration_ms(elapsed_ms)
         if truncated:
@@ -321,10 +337,27 @@ class QueryResultsMixin:
         else:
             self.notify(f"Query returned {row_count} rows in {time_str}")
 
+    def _track_results_paint(self: QueryMixinHost, timings: Any, *, render_pending: bool) -> None:
+        """Record first paint after the next refresh, and finish unless batches are still coming."""
+        mounted_ms = timings.elapsed_ms()
+        timings.expect("first_paint")
+
+        def painted() -> None:
+            timings.record_since("first_paint", mounted_ms)
+            if not render_pending:
+                timings.record_since("render", mounted_ms)
+            if timings.done("first_paint"):
+                self._finish_query_timings(timings)
+
+        try:
+            self.call_after_refresh(painted)
+        except Exception:
+            timings.done("first_paint")
+
     def _display_non_query_result(self: QueryMixinHost, affected: int, elapsed_ms: float) -> None:
         """Display non-query result (called on main thread)."""
         self._last_result_columns = ["Result"]
-        self._last_result_rows = [(f"{affected} row(s) affected",)]
+        self._last_result_rows = self._retain_last_result(["Result"], [(f"{affected} row(s) affected",)])
         self._last_result_row_count = 1
 
         # Switch to single result mode (in case we were showing stacked results)
@@ -346,6 +379,12 @@ class QueryResultsMixin:
         elapsed_ms: float,
     ) -> None:
         """Display stacked results for multi-statement query."""
+        self._begin_stacked_results(len(multi_result.results))
+        self._append_stacked_results(0, multi_result.results)
+        self._finish_multi_statement_results(multi_result, elapsed_ms)
+
+    def _begin_stacked_results(self: QueryMixinHost, statement_count: int) -> None:
+        """Clear and show the stacked results container for a new script run."""
         self._cancel_results_render()
         from sqlit.shared.ui.widgets_stacked_results import (
             AUTO_COLLAPSE_THRESHOLD,
@@ -353,19 +392,30 @@ class QueryResultsMixin:
 
         # Get or create stacked results container
         container = self._get_stacked_results_container()
+        container.result_store = self._get_result_store()
         container.clear_results()
 
         # Determine if we should auto-collapse
-        auto_collapse = len(multi_result.results) > AUTO_COLLAPSE_THRESHOLD
-
-        # Add each result section
-        for i, stmt_result in enumerate(multi_result.results):
-            container.add_result_section(stmt_result, i, auto_collapse=auto_collapse)
+        self._stacked_results_auto_collapse = statement_count > AUTO_COLLAPSE_THRESHOLD
 
         # Show the stacked results container, hide single result table
         self._show_stacked_results_mode()
 
-        # Update notification
+    def _append_stacked_results(self: QueryMixinHost, start_index: int, results: list[Any]) -> None:
+        """Add result sections for statements as they finish."""
+        from sqlit.domains.query.app.query_service import QueryResult
+
+        container = self._get_stacked_results_container()
+        for offset, stmt_result in enumerate(results):
+            section = container.add_result_section(
+                stmt_result, start_index + offset, auto_collapse=self._stacked_results_auto_collapse
+            )
+            if stmt_result.success and isinstance(stmt_result.result, QueryResult):
+                # Register the rows the section holds in the result store rather than the raw result.
+                self._register_workspace_result(section.result_columns, section.result_rows, stmt_result.statement)
+
+    def _finish_multi_statement_results(self: QueryMixinHost, multi_result: Any, elapsed_ms: float) -> None:
+        """Notify the outcome of a multi-statement run."""
         time_str = format_duration_ms(elapsed_ms)
         success_count = multi_result.successful_count
         total = len(multi_result.results)
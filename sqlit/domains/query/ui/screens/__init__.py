@@ -2,10 +2,12 @@
 
 from .char_pending_menu import CharPendingMenuScreen
 from .query_history import QueryHistoryScreen
+from .query_jobs import QueryJobsScreen
 from .text_object_menu import TextObjectMenuScreen
 
 __all__ = [
     "CharPendingMenuScreen",
     "QueryHistoryScreen",
+    "QueryJobsScreen",
     "TextObjectMenuScreen",
 ]
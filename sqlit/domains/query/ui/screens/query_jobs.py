@@ -0,0 +1,224 @@
+"""Background query jobs panel."""
+
+from __future__ import annotations
+
+from rich.markup import escape
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import ModalScreen
+from textual.timer import Timer
+from textual.widgets import OptionList, Static
+from textual.widgets.option_list import Option
+
+from sqlit.domains.query.app.query_jobs import (
+    JOB_CANCELLED,
+    JOB_DETACHED,
+    JOB_DONE,
+    JOB_ERROR,
+    JOB_RUNNING,
+    QueryJob,
+    QueryJobManager,
+)
+from sqlit.shared.core.utils import format_duration_ms
+from sqlit.shared.ui.widgets import Dialog
+
+_STATUS_STYLES = {
+    JOB_RUNNING: "bold cyan",
+    JOB_DONE: "green",
+    JOB_ERROR: "red",
+    JOB_CANCELLED: "yellow",
+    JOB_DETACHED: "magenta",
+}
+
+# Seconds between refreshes of elapsed times and server status.
+JOBS_REFRESH_INTERVAL_S = 1.0
+
+
+def describe_job(job: QueryJob) -> str:
+    """One-line markup summary of a job for the jobs list."""
+    style = _STATUS_STYLES.get(job.status, "")
+    status = f"[{style}]{job.status:<9}[/]" if style else f"{job.status:<9}"
+    if job.status == JOB_DETACHED:
+        elapsed = "-"
+    else:
+        elapsed = format_duration_ms(job.elapsed_s * 1000)
+    if job.rows is not None:
+        detail = f"{job.rows_fetched:,} rows" + ("+" if job.truncated else "")
+    elif job.rows_affected is not None:
+        detail = f"{job.rows_affected:,} affected" if job.rows_affected >= 0 else "ok"
+    elif job.server_status:
+        detail = job.server_status
+    elif job.error:
+        detail = job.error
+    else:
+        detail = ""
+    sql = " ".join(job.sql.split())
+    if len(sql) > 60:
+        sql = sql[:57] + "..."
+    return (
+        f"#{job.job_id:<3} {status} {elapsed:>8}  [dim]{escape(job.connection_name)}[/]  "
+        f"{escape(detail)}  [dim]{escape(sql)}[/]"
+    )
+
+
+class QueryJobsScreen(ModalScreen):
+    """Lists background jobs; dismisses with ("open" | "reattach", job_id) or None."""
+
+    BINDINGS = [
+        Binding("escape", "close", "Close", priority=True),
+        Binding("q", "close", "Close"),
+        Binding("enter", "open_job", "Open"),
+        Binding("x", "cancel_job", "Cancel"),
+        Binding("a", "reattach_job", "Reattach"),
+        Binding("d", "remove_job", "Remove"),
+    ]
+
+    CSS = """
+    QueryJobsScreen {
+        align: center middle;
+        background: transparent;
+    }
+
+    #jobs-dialog {
+        width: 110;
+        max-width: 95%;
+        height: auto;
+        max-height: 80%;
+    }
+
+    #jobs-list {
+        height: auto;
+        max-height: 20;
+        background: $surface;
+        border: none;
+        padding: 0;
+    }
+
+    #jobs-empty {
+        text-align: center;
+        color: $text-muted;
+        padding: 2;
+    }
+
+    #jobs-detail {
+        height: auto;
+        max-height: 6;
+        margin-top: 1;
+        color: $text-muted;
+    }
+    """
+
+    def __init__(self, manager: QueryJobManager) -> None:
+        super().__init__()
+        self.manager = manager
+        self._job_ids: list[int] = []
+        self._refresh_timer: Timer | None = None
+
+    def compose(self) -> ComposeResult:
+        shortcuts = [("Open", "<enter>"), ("Cancel", "x"), ("Reattach", "a"), ("Remove", "d")]
+        with Dialog(id="jobs-dialog", title="Background jobs", shortcuts=shortcuts):
+            yield OptionList(id="jobs-list")
+            yield Static("No background jobs. Run one with <space>b or :bg", id="jobs-empty")
+            yield Static("", id="jobs-detail")
+
+    def on_mount(self) -> None:
+        self.refresh_jobs()
+        self.query_one("#jobs-list", OptionList).focus()
+        self._refresh_timer = self.set_interval(JOBS_REFRESH_INTERVAL_S, self.refresh_jobs)
+
+    def on_unmount(self) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self._refresh_timer = None
+
+    def refresh_jobs(self) -> None:
+        """Redraw the list from the manager, keeping the highlighted job."""
+        try:
+            option_list = self.query_one("#jobs-list", OptionList)
+            empty = self.query_one("#jobs-empty", Static)
+        except Exception:
+            return
+        selected = self._selected_job_id()
+        jobs = list(reversed(self.manager.jobs))
+        self._job_ids = [job.job_id for job in jobs]
+        option_list.clear_options()
+        option_list.add_options([Option(describe_job(job), id=str(job.job_id)) for job in jobs])
+        option_list.display = bool(jobs)
+        empty.display = not jobs
+        if jobs:
+            index = self._job_ids.index(selected) if selected in self._job_ids else 0
+            option_list.highlighted = index
+        self._update_detail()
+
+    def _selected_job_id(self) -> int | None:
+        try:
+            index = self.query_one("#jobs-list", OptionList).highlighted
+        except Exception:
+            return None
+        if index is None or index >= len(self._job_ids):
+            return None
+        return self._job_ids[index]
+
+    def _selected_job(self) -> QueryJob | None:
+        job_id = self._selected_job_id()
+        return self.manager.get(job_id) if job_id is not None else None
+
+    def _update_detail(self) -> None:
+        job = self._selected_job()
+        text = ""
+        if job is not None:
+            text = job.sql if not job.error else f"{job.error}\n{job.sql}"
+        try:
+            self.query_one("#jobs-detail", Static).update(escape(text))
+        except Exception:
+            pass
+
+    def on_option_list_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
+        if event.option_list.id == "jobs-list":
+            self._update_detail()
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        if event.option_list.id == "jobs-list":
+            self.action_open_job()
+
+    def action_open_job(self) -> None:
+        job = self._selected_job()
+        if job is None:
+            return
+        if job.status in (JOB_DONE, JOB_ERROR):
+            self.dismiss(("open", job.job_id))
+        elif job.status == JOB_DETACHED:
+            self.app.notify("Job is detached; press a to reattach", severity="warning")
+        else:
+            self.app.notify(f"Job #{job.job_id} is {job.status}")
+
+    def action_cancel_job(self) -> None:
+        job = self._selected_job()
+        if job is not None and self.manager.cancel(job.job_id):
+            self.app.notify(f"Cancelling job #{job.job_id}", severity="warning")
+        self.refresh_jobs()
+
+    def action_reattach_job(self) -> None:
+        job = self._selected_job()
+        if job is None:
+            return
+        if job.status != JOB_DETACHED:
+            self.app.notify("Only detached jobs can be reattached", severity="warning")
+            return
+        self.dismiss(("reattach", job.job_id))
+
+    def action_remove_job(self) -> None:
+        job = self._selected_job()
+        if job is None:
+            return
+        if not self.manager.remove(job.job_id):
+            self.app.notify("Cancel the job before removing it", severity="warning")
+        self.refresh_jobs()
+
+    def action_close(self) -> None:
+        self.dismiss(None)
+
+    def check_action(self, action: str, parameters: tuple) -> bool | None:
+        if self.app.screen is not self:
+            return False
+        return super().check_action(action, parameters)
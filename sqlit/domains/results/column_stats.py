@@ -0,0 +1,227 @@
+"""Per-column statistics for stored result sets.
+
+Statistics are built chunk by chunk so a worker can report partial numbers
+while it scans a large result. Each chunk is an Arrow array: nulls and
+min/max come from ``pyarrow.compute``, value counts feed a bounded top-k
+counter, and the distinct values of each chunk are hashed into a
+HyperLogLog sketch. Distinct counts are exact until the counter has to be
+trimmed, and estimates after that.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from .hashing import splitmix64, value_hash
+from .sorting import column_array, text_array
+
+DEFAULT_STATS_CHUNK_ROWS = 65_536
+DEFAULT_TOP_K = 5
+# Distinct values tracked exactly before the counter is trimmed to its most common half.
+TOP_K_CAPACITY = 50_000
+HLL_PRECISION = 14
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch over 64-bit hashes."""
+
+    def __init__(self, precision: int = HLL_PRECISION) -> None:
+        import numpy as np
+
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: Any) -> None:
+        """Add an array of 64-bit hashes (any integer dtype)."""
+        import numpy as np
+
+        if len(hashes) == 0:
+            return
+        mixed = splitmix64(np.asarray(hashes).astype(np.uint64, copy=False))
+        width = 64 - self.precision
+        index = (mixed >> np.uint64(width)).astype(np.intp)
+        rest = mixed & np.uint64((1 << width) - 1)
+        # rest has at most 50 bits, so its bit length is exact in float64.
+        _mantissa, bit_length = np.frexp(rest.astype(np.float64))
+        rank = (width + 1 - bit_length).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def add(self, values: Sequence[Any]) -> None:
+        """Add Python values by their hash."""
+        import numpy as np
+
+        self.add_hashes(np.fromiter((value_hash(value) for value in values), dtype=np.int64, count=len(values)))
+
+    def estimate(self) -> int:
+        import numpy as np
+
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / float(np.sum(np.ldexp(1.0, -self.registers.astype(np.int64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * math.log(size / zeros)
+        return round(estimate)
+
+
+@dataclass
+class ColumnStats:
+    """A snapshot of one column's statistics."""
+
+    name: str
+    total_rows: int
+    rows: int = 0  # Rows scanned so far
+    nulls: int = 0
+    distinct: int = 0
+    distinct_exact: bool = True
+    minimum: Any = None
+    maximum: Any = None
+    top: list[tuple[Any, int]] = field(default_factory=list)
+    top_exact: bool = True
+
+    @property
+    def complete(self) -> bool:
+        return self.rows >= self.total_rows
+
+
+class ColumnStatsBuilder:
+    """Accumulates statistics for one column from Arrow chunks."""
+
+    def __init__(self, name: str, total_rows: int, *, top_k: int = DEFAULT_TOP_K) -> None:
+        self.name = name
+        self.total_rows = total_rows
+        self.top_k = top_k
+        self.rows = 0
+        self.nulls = 0
+        self.minimum: Any = None
+        self.maximum: Any = None
+        self.counts: Counter[Any] = Counter()
+        self.trimmed = False
+        self.sketch = HyperLogLog()
+        self._compare_as_text = False
+
+    def update(self, chunk: Any) -> None:
+        """Fold an Arrow array of column values into the statistics."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.types as pt
+
+        self.rows += len(chunk)
+        self.nulls += chunk.null_count
+        if pt.is_nested(chunk.type) or pt.is_null(chunk.type):
+            chunk = text_array(chunk)
+        try:
+            value_counts = pc.value_counts(chunk)
+        except (pa.ArrowNotImplementedError, pa.ArrowInvalid, pa.ArrowTypeError):
+            chunk = text_array(chunk)
+            value_counts = pc.value_counts(chunk)
+        values = value_counts.field("values").to_pylist()
+        counts = value_counts.field("counts").to_pylist()
+        pairs = [(value, count) for value, count in zip(values, counts, strict=True) if value is not None]
+        if not pairs:
+            return
+        self.sketch.add([value for value, _count in pairs])
+        for value, count in pairs:
+            self.counts[value] += count
+        if len(self.counts) > TOP_K_CAPACITY:
+            self.counts = Counter(dict(self.counts.most_common(TOP_K_CAPACITY // 2)))
+            self.trimmed = True
+        self._update_range(chunk, [value for value, _count in pairs])
+
+    def _update_range(self, chunk: Any, values: list[Any]) -> None:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        try:
+            bounds = pc.min_max(chunk)
+            low, high = bounds["min"].as_py(), bounds["max"].as_py()
+        except (pa.ArrowNotImplementedError, pa.ArrowInvalid, pa.ArrowTypeError):
+            low, high = min(values, key=str), max(values, key=str)
+        candidates = [value for value in (self.minimum, low) if value is not None]
+        self.minimum = self._pick(min, candidates)
+        candidates = [value for value in (self.maximum, high) if value is not None]
+        self.maximum = self._pick(max, candidates)
+
+    def _pick(self, choose: Callable[..., Any], candidates: list[Any]) -> Any:
+        if not candidates:
+            return None
+        if not self._compare_as_text:
+            try:
+                return choose(candidates)
+            except TypeError:
+                # Chunks inferred different types; compare by text from now on.
+                self._compare_as_text = True
+        return choose(candidates, key=str)
+
+    def snapshot(self) -> ColumnStats:
+        distinct_exact = not self.trimmed
+        return ColumnStats(
+            name=self.name,
+            total_rows=self.total_rows,
+            rows=self.rows,
+            nulls=self.nulls,
+            distinct=len(self.counts) if distinct_exact else self.sketch.estimate(),
+            distinct_exact=distinct_exact,
+            minimum=self.minimum,
+            maximum=self.maximum,
+            top=self.counts.most_common(self.top_k),
+            top_exact=not self.trimmed,
+        )
+
+
+def compute_column_stats(
+    rows: Sequence[tuple],
+    index: int,
+    name: str,
+    *,
+    chunk_rows: int = DEFAULT_STATS_CHUNK_ROWS,
+    on_progress: Callable[[ColumnStats], None] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> ColumnStats | None:
+    """Scan one column of ``rows`` and return its statistics.
+
+    ``on_progress`` receives a snapshot after every chunk. Returns None if
+    ``should_stop`` asks to stop before the scan finishes.
+    """
+    total = len(rows)
+    builder = ColumnStatsBuilder(name, total)
+    for start in range(0, total, max(1, chunk_rows)):
+        if should_stop is not None and should_stop():
+            return None
+        builder.update(column_array(rows, index, start, start + chunk_rows))
+        if on_progress is not None:
+            on_progress(builder.snapshot())
+    return builder.snapshot()
+
+
+def _format_value(value: Any, width: int = 40) -> str:
+    if value is None:
+        return "NULL"
+    text = str(value).replace("\n", " ")
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+def format_column_stats(stats: ColumnStats) -> str:
+    """Render statistics as aligned text for the stats panel."""
+    lines = []
+    if stats.complete:
+        lines.append(f"Rows       {stats.total_rows:,}")
+    else:
+        lines.append(f"Rows       {stats.total_rows:,} (scanned {stats.rows:,}…)")
+    share = f" ({stats.nulls / stats.rows:.1%})" if stats.rows else ""
+    lines.append(f"Nulls      {stats.nulls:,}{share}")
+    approx = "" if stats.distinct_exact else "≈ "
+    lines.append(f"Distinct   {approx}{stats.distinct:,}")
+    lines.append(f"Min        {_format_value(stats.minimum)}")
+    lines.append(f"Max        {_format_value(stats.maximum)}")
+    if stats.top:
+        heading = "Top values" if stats.top_exact else "Top values (approximate)"
+        lines.append("")
+        lines.append(heading)
+        width = max(len(_format_value(value)) for value, _count in stats.top)
+        for value, count in stats.top:
+            lines.append(f"  {_format_value(value).ljust(width)}  {count:,}")
+    return "\n".join(lines)
@@ -0,0 +1,248 @@
+"""Hash-based comparison of two result sets.
+
+Both results are read in column chunks and reduced to one record per row:
+a hash of the whole row, a hash of the key columns and the row index. Rows
+are matched by hash, with repeated rows matched one for one, so the diff
+does not depend on row order. Without key columns a row is either
+unchanged, added or removed; with keys, unmatched rows that share a key are
+reported as changed.
+
+Records are partitioned by key hash. Small results keep their partition in
+memory; large ones write each partition to a temporary file and compare
+one partition at a time, so memory stays bounded by the partition size.
+Hashes are 64-bit, so a collision could in theory hide a difference.
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .hashing import column_hashes, combine_hashes, splitmix64
+from .sorting import column_array
+
+DIFF_CHUNK_ROWS = 65_536
+# Hash records per partition; results larger than this are partitioned to disk.
+DIFF_PARTITION_ROWS = 262_144
+
+
+@dataclass
+class ResultDiff:
+    """Row indices that differ between an old and a new result."""
+
+    columns: list[str]  # Compared columns, in new-result order
+    key: list[str]
+    added: Any  # Indices into the new rows
+    removed: Any  # Indices into the old rows
+    changed: Any  # (old index, new index) pairs, shape (n, 2)
+    unchanged: int
+    partitions: int = 1
+
+    @property
+    def identical(self) -> bool:
+        return not (len(self.added) or len(self.removed) or len(self.changed))
+
+
+def compared_columns(old_columns: list[str], new_columns: list[str]) -> list[tuple[int, int]]:
+    """Pair columns present in both results by name, in new-result order."""
+    old_positions: dict[str, int] = {}
+    for index, name in enumerate(old_columns):
+        old_positions.setdefault(str(name).lower(), index)
+    return [
+        (old_positions[str(name).lower()], index)
+        for index, name in enumerate(new_columns)
+        if str(name).lower() in old_positions
+    ]
+
+
+def diff_results(
+    old_rows: Sequence[tuple],
+    old_columns: list[str],
+    new_rows: Sequence[tuple],
+    new_columns: list[str],
+    *,
+    key: list[str] | None = None,
+    chunk_rows: int = DIFF_CHUNK_ROWS,
+    partition_rows: int = DIFF_PARTITION_ROWS,
+    spill_dir: Path | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> ResultDiff | None:
+    """Compare two results on the columns they share.
+
+    Returns None if ``should_stop`` asks to stop. Raises ValueError when the
+    results share no columns or a key column is not compared.
+    """
+    import numpy as np
+
+    pairs = compared_columns(old_columns, new_columns)
+    if not pairs:
+        raise ValueError("Results have no columns in common")
+    names = [str(new_columns[new_index]) for _old_index, new_index in pairs]
+    lowered = [name.lower() for name in names]
+    key_positions = []
+    for column in key or []:
+        if column.lower() not in lowered:
+            raise ValueError(f"Key column not in both results: {column}")
+        key_positions.append(lowered.index(column.lower()))
+
+    total = max(len(old_rows), len(new_rows))
+    partitions = 1
+    while partitions * max(1, partition_rows) < total:
+        partitions *= 2
+    store = _PartitionStore(partitions, spill_dir)
+    try:
+        for side, rows, positions in (
+            (0, old_rows, [old_index for old_index, _new_index in pairs]),
+            (1, new_rows, [new_index for _old_index, new_index in pairs]),
+        ):
+            for start in range(0, len(rows), max(1, chunk_rows)):
+                if should_stop is not None and should_stop():
+                    return None
+                stop = min(len(rows), start + chunk_rows)
+                store.add(side, _hash_records(rows, positions, key_positions, start, stop))
+
+        added, removed, changed = [], [], []
+        unchanged = 0
+        for partition in range(partitions):
+            if should_stop is not None and should_stop():
+                return None
+            result = _diff_partition(store.load(0, partition), store.load(1, partition), keyed=bool(key_positions))
+            added.append(result[0])
+            removed.append(result[1])
+            changed.append(result[2])
+            unchanged += result[3]
+    finally:
+        store.close()
+
+    changed_pairs = np.concatenate(changed) if changed else np.empty((0, 2), dtype=np.int64)
+    if len(changed_pairs):
+        changed_pairs = changed_pairs[np.argsort(changed_pairs[:, 1], kind="stable")]
+    return ResultDiff(
+        columns=names,
+        key=[names[position] for position in key_positions],
+        added=np.sort(np.concatenate(added)),
+        removed=np.sort(np.concatenate(removed)),
+        changed=changed_pairs,
+        unchanged=unchanged,
+        partitions=partitions,
+    )
+
+
+_RECORD_FIELDS = [("key", "<u8"), ("row", "<u8"), ("index", "<i8")]
+
+
+def _hash_records(rows: Sequence[tuple], positions: list[int], key_positions: list[int], start: int, stop: int) -> Any:
+    import numpy as np
+
+    length = stop - start
+    hashes = [column_hashes(column_array(rows, position, start, stop)) for position in positions]
+    records = np.empty(length, dtype=_RECORD_FIELDS)
+    records["row"] = combine_hashes(hashes, length)
+    if key_positions:
+        records["key"] = combine_hashes([hashes[position] for position in key_positions], length)
+    else:
+        records["key"] = records["row"]
+    records["index"] = np.arange(start, stop, dtype=np.int64)
+    return records
+
+
+class _PartitionStore:
+    """Hash records split by key hash, in memory or in one file per partition and side."""
+
+    def __init__(self, partitions: int, spill_dir: Path | None) -> None:
+        self.partitions = partitions
+        self._shift = 64 - (partitions.bit_length() - 1)
+        self._memory: dict[tuple[int, int], list[Any]] = {}
+        self._directory: Path | None = None
+        if partitions > 1:
+            self._directory = Path(tempfile.mkdtemp(prefix="sqlit-diff-", dir=spill_dir))
+
+    def add(self, side: int, records: Any) -> None:
+        import numpy as np
+
+        if self._directory is None:
+            self._memory.setdefault((side, 0), []).append(records)
+            return
+        buckets = (records["key"] >> np.uint64(self._shift)).astype(np.intp)
+        order = np.argsort(buckets, kind="stable")
+        bounds = np.searchsorted(buckets[order], np.arange(self.partitions + 1))
+        for partition in range(self.partitions):
+            chunk = records[order[bounds[partition] : bounds[partition + 1]]]
+            if len(chunk):
+                with self._path(side, partition).open("ab") as handle:
+                    chunk.tofile(handle)
+
+    def load(self, side: int, partition: int) -> Any:
+        import numpy as np
+
+        if self._directory is None:
+            chunks = self._memory.get((side, partition), [])
+            return np.concatenate(chunks) if chunks else np.empty(0, dtype=_RECORD_FIELDS)
+        path = self._path(side, partition)
+        if not path.exists():
+            return np.empty(0, dtype=_RECORD_FIELDS)
+        return np.fromfile(path, dtype=_RECORD_FIELDS)
+
+    def close(self) -> None:
+        self._memory.clear()
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+    def _path(self, side: int, partition: int) -> Path:
+        assert self._directory is not None
+        return self._directory / f"{side}-{partition}.bin"
+
+
+def _diff_partition(old: Any, new: Any, *, keyed: bool) -> tuple[Any, Any, Any, int]:
+    """Return (added, removed, changed pairs, unchanged count) for one partition."""
+    import numpy as np
+
+    old_at, new_at = _match(old["row"], new["row"])
+    unchanged = len(old_at)
+    old, new = _unmatched(old, old_at), _unmatched(new, new_at)
+
+    changed = np.empty((0, 2), dtype=np.int64)
+    if keyed and len(old) and len(new):
+        old_at, new_at = _match(old["key"], new["key"])
+        changed = np.column_stack([old["index"][old_at], new["index"][new_at]])
+        old, new = _unmatched(old, old_at), _unmatched(new, new_at)
+    return new["index"], old["index"], changed, unchanged
+
+
+def _unmatched(records: Any, matched: Any) -> Any:
+    import numpy as np
+
+    keep = np.ones(len(records), dtype=bool)
+    keep[matched] = False
+    return records[keep]
+
+
+def _match(old_hashes: Any, new_hashes: Any) -> tuple[Any, Any]:
+    """Positions of matching hashes, pairing repeated values one for one."""
+    import numpy as np
+
+    old_keys = _occurrence_keys(old_hashes)
+    new_keys = _occurrence_keys(new_hashes)
+    _common, old_at, new_at = np.intersect1d(old_keys, new_keys, assume_unique=True, return_indices=True)
+    return old_at, new_at
+
+
+def _occurrence_keys(hashes: Any) -> Any:
+    """Make hashes unique by mixing in each value's occurrence number."""
+    import numpy as np
+
+    count = len(hashes)
+    if not count:
+        return hashes.copy()
+    order = np.argsort(hashes, kind="stable")
+    ordered = hashes[order]
+    starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+    occurrence = np.arange(count) - np.repeat(starts, np.diff(np.r_[starts, count]))
+    keys = np.empty(count, dtype=np.uint64)
+    keys[order] = splitmix64(ordered ^ splitmix64(occurrence.astype(np.uint64)))
+    return keys
@@ -0,0 +1,101 @@
+"""Vectorized 64-bit hashing of result columns and rows.
+
+Hashes are only meaningful within one process: text values go through
+Python's (salted) ``hash``. Integral floats hash like the equal integer, so
+``1`` and ``1.0`` from two drivers compare equal, and nulls share one hash.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+_MASK64 = (1 << 64) - 1
+NULL_HASH = 0x6E756C6C6E756C6C  # "nullnull"
+_ROW_MULTIPLIER = 0x100000001B3
+
+
+def splitmix64(values: Any) -> Any:
+    """Spread hash bits; Python hashes of small ints are the ints themselves."""
+    import numpy as np
+
+    with np.errstate(over="ignore"):
+        z = values + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+
+def value_hash(value: Any) -> int:
+    """Python hash of ``value`` folded into the signed 64-bit range NumPy expects."""
+    try:
+        result = hash(value)
+    except TypeError:
+        result = hash(repr(value))
+    result &= _MASK64
+    return result - (1 << 64) if result >= 1 << 63 else result
+
+
+def column_hashes(array: Any) -> Any:
+    """Hash every value of an Arrow array, returning a uint64 NumPy array."""
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.types as pt
+
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    kind = array.type
+    if pt.is_dictionary(kind):
+        array = array.cast(kind.value_type)
+        kind = array.type
+    if pt.is_null(kind):
+        return np.full(len(array), NULL_HASH, dtype=np.uint64)
+    if pt.is_integer(kind) or pt.is_boolean(kind):
+        raw = array.cast(pa.int64(), safe=False).fill_null(0).to_numpy().view(np.uint64)
+    elif pt.is_floating(kind):
+        raw = _float_bits(array.cast(pa.float64()).fill_null(0.0).to_numpy())
+    else:
+        raw = _text_hashes(array)
+    hashes = splitmix64(raw)
+    if array.null_count:
+        hashes[array.is_null().to_numpy(zero_copy_only=False)] = np.uint64(NULL_HASH)
+    return hashes
+
+
+def _float_bits(values: Any) -> Any:
+    import numpy as np
+
+    with np.errstate(invalid="ignore"):
+        as_int = values.astype(np.int64)
+        integral = as_int == values
+    bits = (values + 0.0).view(np.uint64)  # + 0.0 folds -0.0 into 0.0
+    return np.where(integral, as_int.view(np.uint64), bits)
+
+
+def _text_hashes(array: Any) -> Any:
+    """Hash non-numeric values once per distinct value."""
+    import numpy as np
+    import pyarrow as pa
+
+    from .sorting import text_array
+
+    try:
+        encoded = array.dictionary_encode()
+    except (pa.ArrowNotImplementedError, pa.ArrowInvalid, pa.ArrowTypeError):
+        encoded = text_array(array).dictionary_encode()
+    dictionary = encoded.dictionary.to_pylist()
+    unique = np.fromiter((value_hash(value) for value in dictionary), dtype=np.int64, count=len(dictionary))
+    indices = encoded.indices.fill_null(0).to_numpy(zero_copy_only=False).astype(np.intp, copy=False)
+    if not len(unique):
+        return np.zeros(len(array), dtype=np.uint64)
+    return unique.view(np.uint64)[indices]
+
+
+def combine_hashes(hashes: list[Any], length: int) -> Any:
+    """Combine per-column hashes into one hash per row (order-sensitive)."""
+    import numpy as np
+
+    combined = np.full(length, len(hashes), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for column in hashes:
+            combined = splitmix64((combined * np.uint64(_ROW_MULTIPLIER)) ^ column)
+    return combined
@@ -0,0 +1,278 @@
+"""Pending edits on a results grid, committed as one batched transaction.
+
+Cell edits and row deletes are staged against grid rows instead of being
+turned into one SQL string each. A row is identified by its primary key
+values when the key columns are in the result, otherwise by all of its
+values. On commit, the staged changes are grouped into parameterized
+statements by kind, SET columns and WHERE shape (a NULL key needs
+``IS NULL``), and each group runs as one ``executemany`` inside a single
+transaction that is rolled back if any group fails.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class PendingRow:
+    """Staged changes for one grid row."""
+
+    key: tuple[Any, ...]
+    updates: dict[str, Any] = field(default_factory=dict)
+    delete: bool = False
+
+
+@dataclass
+class EditBatch:
+    """One parameterized statement and the parameter sets it runs with."""
+
+    kind: str  # "update" | "delete"
+    sql: str
+    params: list[tuple[Any, ...]]
+
+    @property
+    def description(self) -> str:
+        count = len(self.params)
+        return f"{self.kind.upper()} x{count:,}"
+
+
+@dataclass
+class EditCommitResult:
+    """Outcome of a committed set of edits."""
+
+    statements: int
+    rows_affected: int  # -1 when the driver does not report row counts
+    elapsed_s: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.statements / self.elapsed_s if self.elapsed_s > 0 and self.statements > 0 else 0.0
+
+
+class EditCommitError(RuntimeError):
+    """Raised after a failed commit has been rolled back."""
+
+    def __init__(self, batch: EditBatch, statements: int, error: Exception) -> None:
+        super().__init__(f"{batch.description} failed: {error}")
+        self.batch = batch
+        self.statements = statements
+        self.error = error
+
+    @property
+    def summary(self) -> str:
+        return f"Rolled back all {self.statements:,} changes; {self}"
+
+
+class PendingEdits:
+    """Cell updates and row deletes staged against one table's result rows.
+
+    Usage:
+        edits = PendingEdits("t", ["id", "name"], key_columns=["id"])
+        edits.stage_update(0, (1, "a"), "name", "b")
+        batches = edits.build_batches(quote_identifier, "qmark")
+    """
+
+    def __init__(self, table: str, columns: Sequence[str], key_columns: Sequence[str] | None = None) -> None:
+        self.table = table
+        self.columns = list(columns)
+        keys = [column for column in key_columns or [] if column in self.columns]
+        self.key_columns = keys or list(self.columns)
+        self._key_positions = [self.columns.index(column) for column in self.key_columns]
+        self._rows: dict[int, PendingRow] = {}
+
+    def __len__(self) -> int:
+        """Number of staged changes: edited cells plus deleted rows."""
+        return sum(1 if row.delete else len(row.updates) for row in self._rows.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._rows)
+
+    def _row(self, row_index: int, row_values: Sequence[Any]) -> PendingRow:
+        row = self._rows.get(row_index)
+        if row is None:
+            key = tuple(row_values[position] for position in self._key_positions)
+            row = PendingRow(key=key)
+            self._rows[row_index] = row
+        return row
+
+    def stage_update(self, row_index: int, row_values: Sequence[Any], column: str, value: Any) -> None:
+        """Stage ``column = value`` for a row; setting the original value unstages it."""
+        if column in self.key_columns and self.key_columns != self.columns:
+            raise ValueError(f"Cannot edit key column {column}")
+        row = self._row(row_index, row_values)
+        original = row_values[self.columns.index(column)]
+        if value == original and type(value) is type(original):
+            row.updates.pop(column, None)
+        else:
+            row.updates[column] = value
+        self._prune(row_index)
+
+    def toggle_delete(self, row_index: int, row_values: Sequence[Any]) -> bool:
+        """Mark or unmark a row for deletion; returns whether it is now marked."""
+        row = self._row(row_index, row_values)
+        row.delete = not row.delete
+        self._prune(row_index)
+        return row.delete
+
+    def _prune(self, row_index: int) -> None:
+        row = self._rows[row_index]
+        if not row.delete and not row.updates:
+            del self._rows[row_index]
+
+    def discard(self) -> None:
+        self._rows.clear()
+
+    def cell_value(self, row_index: int, column: str, default: Any = None) -> Any:
+        row = self._rows.get(row_index)
+        if row is None:
+            return default
+        return row.updates.get(column, default)
+
+    def updated_cells(self) -> dict[tuple[int, int], Any]:
+        """Staged values by (row index, column index), for highlighting."""
+        return {
+            (row_index, self.columns.index(column)): value
+            for row_index, row in self._rows.items()
+            if not row.delete
+            for column, value in row.updates.items()
+        }
+
+    def deleted_rows(self) -> set[int]:
+        return {row_index for row_index, row in self._rows.items() if row.delete}
+
+    def build_batches(self, quote: Callable[[str], str], paramstyle: str) -> list[EditBatch]:
+        """Group staged changes into parameterized ``executemany`` statements.
+
+        Updates come before deletes; a deleted row's updates are dropped.
+        """
+        updates: dict[tuple[Any, ...], EditBatch] = {}
+        deletes: dict[tuple[Any, ...], EditBatch] = {}
+        for row_index in sorted(self._rows):
+            row = self._rows[row_index]
+            null_keys = tuple(value is None for value in row.key)
+            key_params = tuple(value for value in row.key if value is not None)
+            if row.delete:
+                batch = deletes.get(null_keys)
+                if batch is None:
+                    where = self._where_clause(quote, paramstyle, null_keys, start=1)
+                    batch = EditBatch("delete", f"DELETE FROM {self.table} WHERE {where}", [])
+                    deletes[null_keys] = batch
+                batch.params.append(key_params)
+                continue
+            set_columns = tuple(column for column in self.columns if column in row.updates)
+            signature = (set_columns, null_keys)
+            batch = updates.get(signature)
+            if batch is None:
+                assignments = ", ".join(
+                    f"{quote(column)} = {_placeholder(paramstyle, index)}"
+                    for index, column in enumerate(set_columns, start=1)
+                )
+                where = self._where_clause(quote, paramstyle, null_keys, start=len(set_columns) + 1)
+                batch = EditBatch("update", f"UPDATE {self.table} SET {assignments} WHERE {where}", [])
+                updates[signature] = batch
+            batch.params.append(tuple(row.updates[column] for column in set_columns) + key_params)
+        return [*updates.values(), *deletes.values()]
+
+    def _where_clause(self, quote: Callable[[str], str], paramstyle: str, null_keys: tuple[bool, ...], start: int) -> str:
+        parts = []
+        index = start
+        for column, is_null in zip(self.key_columns, null_keys):
+            if is_null:
+                parts.append(f"{quote(column)} IS NULL")
+            else:
+                parts.append(f"{quote(column)} = {_placeholder(paramstyle, index)}")
+                index += 1
+        return " AND ".join(parts)
+
+
+def _placeholder(paramstyle: str, index: int) -> str:
+    if paramstyle in ("format", "pyformat"):
+        return "%s"
+    if paramstyle in ("numeric", "named"):
+        return f":{index}"
+    return "?"
+
+
+def coerce_edit_value(text: str, original: Any) -> Any:
+    """Convert typed text to the original value's type when it parses as one."""
+    if isinstance(original, bool):
+        lowered = text.strip().lower()
+        if lowered in ("true", "t", "1", "yes"):
+            return True
+        if lowered in ("false", "f", "0", "no"):
+            return False
+        return text
+    for kind in (int, float):
+        if isinstance(original, kind):
+            try:
+                return kind(text.strip())
+            except ValueError:
+                return text
+    return text
+
+
+def apply_edit_batches(conn: Any, batches: Sequence[EditBatch]) -> EditCommitResult:
+    """Run every batch with ``executemany`` in one transaction and commit.
+
+    Rolls back and raises EditCommitError if any batch fails.
+    """
+    statements = sum(len(batch.params) for batch in batches)
+    start = time.perf_counter()
+    restore_autocommit = _begin_transaction(conn)
+    try:
+        cursor = conn.cursor()
+        rows_affected = 0
+        for batch in batches:
+            try:
+                cursor.executemany(batch.sql, batch.params)
+            except Exception as error:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+                raise EditCommitError(batch, statements, error) from error
+            count = getattr(cursor, "rowcount", -1)
+            if rows_affected >= 0 and isinstance(count, int) and count >= 0:
+                rows_affected += count
+            else:
+                rows_affected = -1
+        try:
+            conn.commit()
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            raise
+    finally:
+        if restore_autocommit:
+            try:
+                conn.autocommit = True
+            except Exception:
+                pass
+    return EditCommitResult(statements=statements, rows_affected=rows_affected, elapsed_s=time.perf_counter() - start)
+
+
+def _begin_transaction(conn: Any) -> bool:
+    """Make sure the batches run in a transaction; True if autocommit was turned off.
+
+    Connections in autocommit mode (psycopg2, pyodbc and mysql-connector set
+    ``conn.autocommit = True``) would otherwise commit every statement as it
+    runs, leaving nothing for rollback() to undo.
+    """
+    # Drivers that start transactions explicitly (DuckDB, PyMySQL) expose begin().
+    begin = getattr(conn, "begin", None)
+    if callable(begin):
+        begin()
+        return False
+    if getattr(conn, "autocommit", None) is True:
+        conn.autocommit = False
+        return True
+    if getattr(conn, "isolation_level", "") is None:
+        # sqlite3 in autocommit mode never opens a transaction implicitly.
+        conn.execute("BEGIN")
+    return False
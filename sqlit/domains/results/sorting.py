@@ -0,0 +1,94 @@
+"""Client-side sorting of stored result sets.
+
+Sorting never copies rows. The sort column is converted to an Arrow array,
+``pyarrow.compute`` computes a stable permutation, and the sorted result is
+a ``RowIndexView`` over the original rows. Columns that Arrow cannot order,
+such as mixed or nested values, are sorted by their text.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from .store import RowIndexView
+
+
+def column_array(rows: Sequence[tuple], index: int, start: int = 0, stop: int | None = None) -> Any:
+    """Return rows ``start:stop`` of one column as an Arrow array."""
+    import pyarrow as pa
+
+    stop = len(rows) if stop is None else min(stop, len(rows))
+    arrow_table = getattr(rows, "arrow_table", None)
+    if arrow_table is not None:
+        return arrow_table.column(index).slice(start, max(0, stop - start)).combine_chunks()
+    if isinstance(rows, RowIndexView):
+        indices = pa.array(rows.indices[start:stop], type=pa.int64())
+        base_table = getattr(rows.base, "arrow_table", None)
+        if base_table is not None:
+            return base_table.column(index).take(indices).combine_chunks()
+    column_values = getattr(rows, "column_values", None)
+    if callable(column_values) and start == 0 and stop == len(rows):
+        values = column_values(index)
+    else:
+        values = [row[index] for row in rows[start:stop]]
+    return arrow_array(values)
+
+
+def arrow_array(values: list[Any]) -> Any:
+    """Build an Arrow array, falling back to text for mixed or unsupported values."""
+    import pyarrow as pa
+
+    try:
+        return pa.array(values)
+    except (TypeError, ValueError, pa.ArrowInvalid, pa.ArrowTypeError):
+        return text_array(values)
+
+
+def text_array(values: Any) -> Any:
+    """Render values (a list or Arrow array) as an Arrow string array, keeping nulls."""
+    import pyarrow as pa
+
+    if not isinstance(values, list):
+        values = values.to_pylist()
+    return pa.array([str(value) if value is not None else None for value in values], type=pa.string())
+
+
+def sort_indices(rows: Sequence[tuple], index: int, *, descending: bool = False) -> Any:
+    """Return a stable permutation (int64 NumPy array) that sorts ``rows`` by a column.
+
+    Nulls sort last in both directions.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    array = column_array(rows, index)
+    order = "descending" if descending else "ascending"
+    try:
+        permutation = pc.array_sort_indices(array, order=order, null_placement="at_end")
+    except (pa.ArrowNotImplementedError, pa.ArrowInvalid, pa.ArrowTypeError):
+        permutation = pc.array_sort_indices(text_array(array), order=order, null_placement="at_end")
+    return permutation.to_numpy().astype("int64")
+
+
+def sorted_view(rows: Sequence[tuple], index: int, *, descending: bool = False) -> RowIndexView:
+    """Return ``rows`` sorted by a column, as a view over the underlying rows.
+
+    Sorting a view re-indexes its base rows, so views never nest.
+    """
+    permutation = sort_indices(rows, index, descending=descending)
+    if isinstance(rows, RowIndexView):
+        import numpy as np
+
+        return RowIndexView(rows.base, np.asarray(rows.indices, dtype="int64")[permutation])
+    return RowIndexView(rows, permutation)
+
+
+def view_arrow_table(view: RowIndexView, limit: int) -> Any | None:
+    """Gather the first ``limit`` rows of a view over Arrow-backed rows, or None."""
+    import pyarrow as pa
+
+    arrow_table = getattr(view.base, "arrow_table", None)
+    if arrow_table is None:
+        return None
+    return arrow_table.take(pa.array(view.indices[:limit], type=pa.int64()))
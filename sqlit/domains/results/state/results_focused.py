@@ -19,9 +19,59 @@ class ResultsFocusedState(State):
         self.allows("view_cell_full", has_results, key="V", label="View full", help="View full cell value")
         self.allows("edit_cell", has_results, key="u", label="Update cell", help="Update cell (generate UPDATE)")
         self.allows("delete_row", has_results, key="d", label="Delete row", help="Delete row (generate DELETE)")
+
+        def has_pending_edits(app: InputContext) -> bool:
+            return app.pending_edit_count > 0
+
+        self.allows("stage_cell_edit", has_results, key="c", label="Edit cell", help="Stage a cell edit")
+        self.allows("stage_row_delete", has_results, key="X", label="Mark delete", help="Mark or unmark row for deletion")
+        self.allows(
+            "commit_pending_edits",
+            has_pending_edits,
+            key="^s",
+            label="Commit edits",
+            help="Commit pending edits in one transaction",
+        )
+        self.allows("discard_pending_edits", has_pending_edits, key="U", label="Discard edits", help="Discard pending edits")
         self.allows("results_yank_leader_key", has_results, key="y", label="Copy", help="Copy menu (cell/row/all)")
         self.allows("clear_results", has_results, key="x", label="Clear", help="Clear results")
+        self.allows(
+            "refresh_results",
+            has_results,
+            key="R",
+            label="Refresh",
+            help="Re-run the query, bypassing the result cache",
+        )
+        self.allows(
+            "show_query_timings",
+            has_results,
+            key="T",
+            label="Timings",
+            help="Show where time went on the last query",
+        )
         self.allows("results_filter", has_results, key="slash", label="Filter", help="Filter rows")
+        self.allows(
+            "sort_results_column",
+            has_results,
+            key="s",
+            label="Sort",
+            help="Sort by column (ascending, descending, off)",
+        )
+        self.allows(
+            "results_column_stats",
+            has_results,
+            key="S",
+            label="Column stats",
+            help="Show nulls, distinct, min/max and top values for the column",
+        )
+        self.allows("pin_result", has_results, key="p", label="Pin", help="Pin result as the diff baseline")
+        self.allows(
+            "diff_results",
+            has_results,
+            key="D",
+            label="Diff",
+            help="Diff result against the pinned or previous result",
+        )
         self.allows("results_cursor_left", has_results)  # vim h
         self.allows("results_cursor_down", has_results)  # vim j
         self.allows("results_cursor_up", has_results)  # vim k
@@ -107,6 +157,24 @@ class ResultsFocusedState(State):
                 action="results_filter",
             )
         )
+        if app.pending_edit_count:
+            left.append(
+                DisplayBinding(
+                    key=resolve_display_key("commit_pending_edits") or "^s",
+                    label=f"Commit {app.pending_edit_count} edits",
+                    action="commit_pending_edits",
+                )
+            )
+        if app.results_cache_age_s is not None:
+            from sqlit.domains.query.app.result_cache import format_cache_age
+
+            left.append(
+                DisplayBinding(
+                    key=resolve_display_key("refresh_results") or "R",
+                    label=f"Refresh (cached, {format_cache_age(app.results_cache_age_s)} old)",
+                    action="refresh_results",
+                )
+            )
         if app.stacked_result_count > 1:
             left.append(
                 DisplayBinding(
@@ -128,9 +196,19 @@ class ResultsFocusedState(State):
                 "view_cell",
                 "view_cell_full",
                 "delete_row",
+                "stage_cell_edit",
+                "stage_row_delete",
+                "commit_pending_edits",
+                "discard_pending_edits",
                 "results_yank_leader_key",
                 "clear_results",
                 "results_filter",
+                "sort_results_column",
+                "results_column_stats",
+                "pin_result",
+                "diff_results",
+                "refresh_results",
+                "show_query_timings",
                 "next_result_section",
                 "prev_result_section",
             ]
@@ -0,0 +1,249 @@
+"""Memory-budgeted ownership of query result sets.
+
+The TUI keeps every displayed result set in a single ``ResultStore``. Each
+result is held once and tracked by approximate size; when the resident total
+exceeds the RAM budget, the least recently used results are written to Arrow
+IPC (feather v2) files and read back through a memory map on demand. Views
+(filter matches, accepted filters) hold row indices into a stored result
+rather than copies of its rows. A result shown in several places (the grid
+and the results workspace, say) is put once per holder and stays tracked
+until every holder has released it.
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, overload
+
+from sqlit.domains.query.app.arrow_rows import ArrowRowView
+
+DEFAULT_RESULT_MEMORY_BUDGET_MB = 512.0
+
+
+def estimate_rows_bytes(rows: Sequence[Any]) -> int:
+    """Approximate in-memory size of a result's rows."""
+    arrow_table = getattr(rows, "arrow_table", None)
+    if arrow_table is not None:
+        return int(arrow_table.nbytes)
+    nbytes = getattr(rows, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if not rows:
+        return 0
+    from sqlit.domains.connections.providers.adapters.fetch import estimate_row_bytes
+
+    sample = rows[:: max(1, len(rows) // 64)][:64]
+    return int(estimate_row_bytes(list(sample)) * len(rows)) + 8 * len(rows)
+
+
+class StoredResult(Sequence[tuple]):
+    """Read-only rows of a result set owned by a ResultStore."""
+
+    def __init__(self, store: ResultStore, result_id: int, columns: list[str], rows: Sequence[tuple], nbytes: int):
+        self.result_id = result_id
+        self.columns = list(columns)
+        self.nbytes = nbytes
+        self.spill_path: Path | None = None
+        self.holders = 1
+        self._store = store
+        self._rows = rows
+
+    @property
+    def spilled(self) -> bool:
+        return self.spill_path is not None
+
+    @property
+    def arrow_table(self) -> Any | None:
+        return getattr(self._rows, "arrow_table", None)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple]: ...
+
+    def __getitem__(self, index: int | slice) -> tuple | list[tuple]:
+        if isinstance(index, slice):
+            return list(self._rows[index])
+        return self._rows[index]
+
+    def __iter__(self) -> Iterator[tuple]:
+        self._store.touch(self)
+        return iter(self._rows)
+
+    def __repr__(self) -> str:
+        state = "spilled" if self.spilled else "resident"
+        return f"StoredResult(id={self.result_id}, rows={len(self)}, {state})"
+
+
+class RowIndexView(Sequence[tuple]):
+    """Subset of another row sequence, addressed by row index."""
+
+    def __init__(self, base: Sequence[tuple], indices: Sequence[int]) -> None:
+        self.base = base
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple]: ...
+
+    def __getitem__(self, index: int | slice) -> tuple | list[tuple]:
+        if isinstance(index, slice):
+            return [self.base[i] for i in self.indices[index]]
+        return self.base[self.indices[index]]
+
+    def __iter__(self) -> Iterator[tuple]:
+        base = self.base
+        for i in self.indices:
+            yield base[i]
+
+    def __repr__(self) -> str:
+        return f"RowIndexView(rows={len(self)})"
+
+
+class ResultStore:
+    """Owns result sets under a RAM budget, spilling cold ones to disk.
+
+    Thread-safe: background query jobs put their results from worker threads.
+    """
+
+    def __init__(self, budget_bytes: int, *, spill_dir: Path | None = None) -> None:
+        self._budget_bytes = max(0, int(budget_bytes))
+        self._spill_root = spill_dir
+        self._spill_dir: Path | None = None
+        self._results: OrderedDict[int, StoredResult] = OrderedDict()
+        self._resident_bytes = 0
+        self._next_id = 1
+        self._lock = threading.RLock()
+
+    @property
+    def budget_bytes(self) -> int:
+        return self._budget_bytes
+
+    @budget_bytes.setter
+    def budget_bytes(self, value: int) -> None:
+        with self._lock:
+            self._budget_bytes = max(0, int(value))
+            self._enforce_budget()
+
+    @property
+    def resident_bytes(self) -> int:
+        return self._resident_bytes
+
+    @property
+    def results(self) -> list[StoredResult]:
+        with self._lock:
+            return list(self._results.values())
+
+    def put(self, columns: list[str], rows: Sequence[tuple]) -> StoredResult:
+        """Take ownership of a result set and return its read-only rows.
+
+        Putting rows this store already owns adds a holder instead of storing
+        them again; each put is balanced by one ``release``.
+        """
+        with self._lock:
+            if isinstance(rows, StoredResult) and self._results.get(rows.result_id) is rows:
+                rows.holders += 1
+                self.touch(rows)
+                return rows
+            stored = StoredResult(self, self._next_id, columns, rows, estimate_rows_bytes(rows))
+            self._next_id += 1
+            self._results[stored.result_id] = stored
+            self._resident_bytes += stored.nbytes
+            self._enforce_budget()
+            return stored
+
+    def touch(self, stored: StoredResult) -> None:
+        """Mark a result as recently used."""
+        with self._lock:
+            if stored.result_id in self._results:
+                self._results.move_to_end(stored.result_id)
+
+    def release(self, stored: StoredResult) -> None:
+        """Drop a holder; the last one stops tracking the result and deletes its spill file.
+
+        Rows already handed out stay readable: spilled data remains mapped
+        until the last reference is dropped.
+        """
+        with self._lock:
+            if self._results.get(stored.result_id) is not stored:
+                return
+            stored.holders -= 1
+            if stored.holders <= 0:
+                self._drop(stored)
+
+    def release_rows(self, rows: Sequence[tuple]) -> None:
+        """Release rows if they are a result owned by this store."""
+        if isinstance(rows, StoredResult):
+            self.release(rows)
+
+    def close(self) -> None:
+        """Release every result and remove the spill directory."""
+        with self._lock:
+            for stored in list(self._results.values()):
+                self._drop(stored)
+            self._resident_bytes = 0
+            if self._spill_dir is not None:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+
+    def _drop(self, stored: StoredResult) -> None:
+        del self._results[stored.result_id]
+        if stored.spill_path is None:
+            self._resident_bytes -= stored.nbytes
+        else:
+            try:
+                stored.spill_path.unlink()
+            except OSError:
+                pass
+
+    def _enforce_budget(self) -> None:
+        if self._resident_bytes <= self._budget_bytes:
+            return
+        for stored in list(self._results.values()):
+            if self._resident_bytes <= self._budget_bytes:
+                break
+            if stored.spill_path is not None or stored.nbytes == 0 or not stored.columns:
+                continue
+            self._spill(stored)
+
+    def _spill(self, stored: StoredResult) -> bool:
+        """Write a result to an Arrow IPC file and swap in a memory-mapped view."""
+        try:
+            import pyarrow as pa
+
+            from sqlit.domains.connections.providers.arrow_results import arrow_table_from_rows
+
+            table = stored.arrow_table
+            if table is None:
+                table = arrow_table_from_rows(stored.columns, stored._rows)
+            path = self._get_spill_dir() / f"result-{stored.result_id}.arrow"
+            with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            mapped = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+        except Exception:
+            return False
+        stored._rows = ArrowRowView(mapped)
+        stored.spill_path = path
+        self._resident_bytes -= stored.nbytes
+        return True
+
+    def _get_spill_dir(self) -> Path:
+        if self._spill_dir is None:
+            if self._spill_root is not None:
+                self._spill_root.mkdir(parents=True, exist_ok=True)
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="sqlit-results-", dir=self._spill_root))
+        return self._spill_dir
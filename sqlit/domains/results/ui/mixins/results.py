@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Callable, Sequence
 from typing import Any
 
+from sqlit.domains.query.app.arrow_rows import snapshot_rows
+from sqlit.domains.results.store import DEFAULT_RESULT_MEMORY_BUDGET_MB, ResultStore, StoredResult
+from sqlit.domains.results.workspace import ResultsWorkspace
 from sqlit.shared.ui.protocols import ResultsMixinHost
 from sqlit.shared.ui.widgets import SqlitDataTable
 
@@ -18,6 +22,56 @@ class ResultsMixin:
     _tooltip_cell_coord: tuple[int, int] | None = None
     _tooltip_showing: bool = False
     _tooltip_timer: Any | None = None
+    _result_store: ResultStore | None = None
+    _results_workspace: ResultsWorkspace | None = None
+    _last_result_handle: StoredResult | None = None
+    _last_result_cached_rows: Sequence[tuple[Any, ...]] | None = None
+    _last_result_cache_age_s: float | None = None
+
+    def _get_result_store(self: ResultsMixinHost) -> ResultStore:
+        """Return the app-wide result store, creating it on first use."""
+        store = self._result_store
+        if store is None:
+            runtime = getattr(getattr(self, "services", None), "runtime", None)
+            budget_mb = getattr(runtime, "result_memory_budget_mb", DEFAULT_RESULT_MEMORY_BUDGET_MB)
+            store = ResultStore(int(float(budget_mb) * 1024 * 1024))
+            self._result_store = store
+        return store
+
+    def _retain_last_result(self: ResultsMixinHost, columns: list[str], rows: Sequence[tuple]) -> Sequence[tuple]:
+        """Move the single-result rows into the result store, releasing the previous result."""
+        store = self._get_result_store()
+        stored = store.put(columns, rows)
+        previous = self._last_result_handle
+        if previous is not None:
+            store.release(previous)
+        self._last_result_handle = stored
+        return stored
+
+    def _release_last_result(self: ResultsMixinHost) -> None:
+        previous = self._last_result_handle
+        self._last_result_handle = None
+        if previous is not None and self._result_store is not None:
+            self._result_store.release(previous)
+
+    def _get_results_workspace(self: ResultsMixinHost) -> ResultsWorkspace:
+        """Return the workspace that names results for the "results" query target."""
+        workspace = self._results_workspace
+        if workspace is None:
+            workspace = ResultsWorkspace(result_store=self._get_result_store())
+            self._results_workspace = workspace
+        return workspace
+
+    def _register_workspace_result(
+        self: ResultsMixinHost, columns: list[str], rows: Sequence[tuple], label: str = ""
+    ) -> str | None:
+        """Make a displayed result queryable as ``rN``; returns the name, or None on failure."""
+        if not columns:
+            return None
+        try:
+            return self._get_results_workspace().add(columns, rows, label)
+        except Exception:
+            return None
 
     def _copy_text(self: ResultsMixinHost, text: str) -> bool:
         """Copy text to clipboard if possible, otherwise store internally."""
@@ -82,11 +136,11 @@ class ResultsMixin:
                         table = None
 
                 columns = list(getattr(section, "result_columns", [])) if section else []
-                rows = list(getattr(section, "result_rows", [])) if section else []
+                rows = snapshot_rows(getattr(section, "result_rows", [])) if section else []
                 return table, columns, rows, True
             except Exception:
                 return None, [], [], True
-        return self.results_table, list(self._last_result_columns), list(self._last_result_rows), False
+        return self.results_table, list(self._last_result_columns), snapshot_rows(self._last_result_rows), False
 
     def _find_results_section(self: ResultsMixinHost, widget: Any) -> Any | None:
         """Find the ResultSection ancestor for a widget."""
@@ -164,7 +218,7 @@ class ResultsMixin:
             self._hide_cell_tooltip(table)
             return
 
-        self._show_cell_tooltip(table, cursor_coord, value)
+        self._with_full_cell_value(value, lambda full: self._show_cell_tooltip(table, cursor_coord, full))
 
     def action_view_cell_full(self: ResultsMixinHost) -> None:
         """View the full value of the selected cell inline."""
@@ -187,15 +241,60 @@ class ResultsMixin:
         if self._last_result_columns and cursor_col < len(self._last_result_columns):
             column_name = self._last_result_columns[cursor_col]
 
-        # Show inline value view
+        def show(full_value: Any) -> None:
+            # Show inline value view
+            try:
+                value_view = self.query_one("#value-view", InlineValueView)
+                value_view.set_value(str(full_value) if full_value is not None else "NULL", column_name)
+                value_view.show()
+                if hasattr(self, "_value_view_active"):
+                    self._value_view_active = True
+            except Exception:
+                pass
+
+        self._with_full_cell_value(value, show)
+
+    def _with_full_cell_value(self: ResultsMixinHost, value: Any, on_value: Callable[[Any], None]) -> None:
+        """Call ``on_value`` with the selected cell's value.
+
+        If preview mode truncated the cell server-side, the full value is
+        fetched by primary key first.
+        """
+        from sqlit.domains.query.app.lob_preview import fetch_full_value
+
+        plan = self._lob_preview_plan
+        table, columns, rows, stacked = self._get_active_results_context()
+        if plan is None or stacked or table is None:
+            on_value(value)
+            return
         try:
-            value_view = self.query_one("#value-view", InlineValueView)
-            value_view.set_value(str(value) if value is not None else "NULL", column_name)
-            value_view.show()
-            if hasattr(self, "_value_view_active"):
-                self._value_view_active = True
+            row_index, col_index = table.cursor_coordinate
+            row = rows[row_index]
+            column = columns[col_index]
         except Exception:
-            pass
+            on_value(value)
+            return
+        if plan.truncated_length(row, column) is None:
+            on_value(value)
+            return
+        provider = self.current_provider
+        sql = plan.full_value_query(column, row, provider.dialect) if provider is not None else None
+        if sql is None or plan.config is None:
+            on_value(value)
+            return
+
+        async def work() -> None:
+            import asyncio
+
+            try:
+                full_value = await asyncio.to_thread(fetch_full_value, plan.config, provider, sql)
+            except Exception as error:
+                self.notify(f"Showing preview; full value failed to load: {error}", severity="warning")
+                full_value = value
+            if self._lob_preview_plan is plan:
+                on_value(full_value)
+
+        self.run_worker(work(), name="lob-full-value", group="lob-full-value", exclusive=True)
 
     def action_close_value_view(self: ResultsMixinHost) -> None:
         """Close the inline value view and return to results table."""
@@ -328,8 +427,12 @@ class ResultsMixin:
             value = table.get_cell_at(table.cursor_coordinate)
         except Exception:
             return
-        self._copy_text(str(value) if value is not None else "NULL")
-        self._flash_table_yank(table, "cell")
+
+        def copy(full_value: Any) -> None:
+            self._copy_text(str(full_value) if full_value is not None else "NULL")
+            self._flash_table_yank(table, "cell")
+
+        self._with_full_cell_value(value, copy)
 
     def _show_cell_tooltip(
         self: ResultsMixinHost,
@@ -445,8 +548,12 @@ class ResultsMixin:
             value = table.get_cell_at(table.cursor_coordinate)
         except Exception:
             return
-        self._copy_text(str(value) if value is not None else "NULL")
-        self._flash_table_yank(table, "cell")
+
+        def copy(full_value: Any) -> None:
+            self._copy_text(str(full_value) if full_value is not None else "NULL")
+            self._flash_table_yank(table, "cell")
+
+        self._with_full_cell_value(value, copy)
 
     def action_ry_row(self: ResultsMixinHost) -> None:
         """Copy row (from yank menu)."""
@@ -575,6 +682,7 @@ class ResultsMixin:
                 pass
             self._show_single_result_mode()
         self._replace_results_table([], [])
+        self._release_last_result()
         self._last_result_columns = []
         self._last_result_rows = []
         self._last_result_row_count = 0
@@ -0,0 +1,202 @@
+"""Client-side column sort and statistics for SSMSTUI results."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlit.shared.ui.protocols import ResultsMixinHost
+
+# Minimum seconds between stats panel refreshes while a scan is running.
+STATS_PROGRESS_INTERVAL_S = 0.1
+SORT_ASCENDING_MARK = " ▲"
+SORT_DESCENDING_MARK = " ▼"
+
+
+class ResultsColumnsMixin:
+    """Mixin providing column sort and column statistics on the held result.
+
+    Sorting computes a permutation on a worker thread and shows the result
+    as a view over the stored rows, so nothing is re-queried or copied.
+    Repeated sorts on a column cycle ascending, descending and unsorted.
+    """
+
+    # (column index, descending) of the active sort, with the unsorted rows
+    # and the sorted view it produced.
+    _results_sort: tuple[int, bool] | None = None
+    _results_sort_base: Sequence[tuple[Any, ...]] | None = None
+    _results_sort_view: Sequence[tuple[Any, ...]] | None = None
+
+    def _results_cursor_column(self: ResultsMixinHost, table: Any) -> int | None:
+        try:
+            return int(table.cursor_coordinate.column)
+        except Exception:
+            return None
+
+    def action_sort_results_column(self: ResultsMixinHost) -> None:
+        """Sort the results by the cursor column, cycling asc → desc → unsorted."""
+        if self.results_area.has_class("stacked-mode"):
+            self.notify("Sorting works on single results", severity="warning")
+            return
+        if self._results_filter_visible:
+            self.notify("Close the filter before sorting", severity="warning")
+            return
+        if self._pending_edit_count():
+            # Sorting re-renders the grid, which would drop edits staged against it.
+            self.notify("Commit or discard pending edits before sorting", severity="warning")
+            return
+        columns = list(self._last_result_columns)
+        rows = self._last_result_rows
+        column = self._results_cursor_column(self.results_table)
+        if not columns or not rows or column is None or column >= len(columns):
+            self.notify("No results to sort", severity="warning")
+            return
+
+        sort = self._results_sort
+        if sort is not None and rows is self._results_sort_view and self._results_sort_base is not None:
+            base = self._results_sort_base
+        else:
+            # Rows changed since the last sort (new query, accepted filter).
+            sort = None
+            base = rows
+        if sort is not None and sort[0] == column:
+            if sort[1]:
+                self._show_sorted_results(base, None, columns, column)
+                return
+            descending = True
+        else:
+            descending = False
+
+        async def work() -> None:
+            import asyncio
+
+            from sqlit.domains.results.sorting import sorted_view
+
+            try:
+                view = await asyncio.to_thread(sorted_view, base, column, descending=descending)
+            except Exception as error:
+                self.notify(f"Sort failed: {error}", severity="error")
+                return
+            if self._last_result_rows is not rows:
+                return
+            self._show_sorted_results(base, (column, descending, view), columns, column)
+
+        self.run_worker(work(), name="results-sort", group="results-sort", exclusive=True)
+
+    def _show_sorted_results(
+        self: ResultsMixinHost,
+        base: Sequence[tuple[Any, ...]],
+        sorted_result: tuple[int, bool, Sequence[tuple[Any, ...]]] | None,
+        columns: list[str],
+        cursor_column: int,
+    ) -> None:
+        """Display a sorted view, or ``base`` again when ``sorted_result`` is None."""
+        labels = list(columns)
+        if sorted_result is None:
+            rows = base
+            self._results_sort = None
+            self._results_sort_base = None
+            self._results_sort_view = None
+            message = "Sort cleared"
+        else:
+            column, descending, rows = sorted_result
+            self._results_sort = (column, descending)
+            self._results_sort_base = base
+            self._results_sort_view = rows
+            labels[column] = f"{labels[column]}{SORT_DESCENDING_MARK if descending else SORT_ASCENDING_MARK}"
+            message = f"Sorted by {columns[column]} {'descending' if descending else 'ascending'}"
+        self._last_result_rows = rows
+        self.run_worker(
+            self._render_sorted_results(labels, rows, cursor_column),
+            name="results-sort-render",
+            group="results-sort-render",
+            exclusive=True,
+        )
+        self.notify(message)
+
+    async def _render_sorted_results(
+        self: ResultsMixinHost, labels: list[str], rows: Sequence[tuple[Any, ...]], cursor_column: int
+    ) -> None:
+        import asyncio
+
+        from sqlit.domains.query.ui.mixins.query_constants import MAX_RENDER_ROWS
+        from sqlit.domains.query.ui.mixins.query_results import RESULTS_RENDER_CHUNK_SIZE
+        from sqlit.domains.results.sorting import view_arrow_table
+        from sqlit.domains.results.store import RowIndexView
+
+        self._cancel_results_render()
+        render_token = self._results_render_token
+        row_limit = min(len(rows), MAX_RENDER_ROWS)
+        arrow_table = getattr(rows, "arrow_table", None)
+        if arrow_table is None and isinstance(rows, RowIndexView):
+            arrow_table = await asyncio.to_thread(view_arrow_table, rows, row_limit)
+        if render_token != self._results_render_token:
+            return
+        if arrow_table is not None and self._render_arrow_results_table(labels, arrow_table, render_token):
+            pass
+        elif row_limit > RESULTS_RENDER_CHUNK_SIZE:
+            await self._render_results_table_incremental(
+                labels, rows, escape=True, row_limit=row_limit, render_token=render_token
+            )
+        else:
+            self._replace_results_table(labels, rows[:row_limit] if row_limit else [])
+
+        def restore_cursor() -> None:
+            try:
+                self.results_table.move_cursor(row=0, column=cursor_column)
+            except Exception:
+                pass
+
+        self.call_after_refresh(restore_cursor)
+
+    def action_results_column_stats(self: ResultsMixinHost) -> None:
+        """Show statistics for the cursor column, computed in the background."""
+        from sqlit.domains.results.ui.screens.column_stats import ColumnStatsScreen
+
+        table, columns, rows, _stacked = self._get_active_results_context()
+        column = self._results_cursor_column(table) if table is not None else None
+        if not columns or not rows or column is None or column >= len(columns):
+            self.notify("No results", severity="warning")
+            return
+
+        state = {"stop": False}
+
+        def stop() -> None:
+            state["stop"] = True
+
+        screen = ColumnStatsScreen(str(columns[column]), on_close=stop)
+        self.push_screen(screen)
+        last_update = 0.0
+
+        def on_progress(stats: Any) -> None:
+            import time
+
+            nonlocal last_update
+            now = time.monotonic()
+            if now - last_update < STATS_PROGRESS_INTERVAL_S and not stats.complete:
+                return
+            last_update = now
+            self.call_from_thread(screen.update_stats, stats)
+
+        async def work() -> None:
+            import asyncio
+
+            from sqlit.domains.results.column_stats import compute_column_stats
+
+            try:
+                stats = await asyncio.to_thread(
+                    compute_column_stats,
+                    rows,
+                    column,
+                    str(columns[column]),
+                    on_progress=on_progress,
+                    should_stop=lambda: state["stop"],
+                )
+            except Exception as error:
+                if not state["stop"]:
+                    self.notify(f"Column stats failed: {error}", severity="error")
+                return
+            if stats is not None and not state["stop"]:
+                screen.update_stats(stats)
+
+        self.run_worker(work(), name="results-column-stats", group="results-column-stats", exclusive=True)
@@ -0,0 +1,131 @@
+"""Result diffs for SSMSTUI: compare a result with a pinned or earlier one."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlit.shared.ui.protocols import ResultsMixinHost
+
+if TYPE_CHECKING:
+    from sqlit.domains.results.diff import ResultDiff
+    from sqlit.domains.results.workspace import WorkspaceResult
+
+PINNED_RESULT_NAME = "pinned"
+
+
+class ResultsDiffMixin:
+    """Mixin providing pinning and diffing of results.
+
+    Results come from the results workspace, which names every displayed
+    result ``rN``. A diff compares the latest result with the pinned one,
+    or with the result before it when nothing is pinned, and shows changed,
+    added and removed rows as stacked sections.
+    """
+
+    _pinned_result: WorkspaceResult | None = None
+
+    def action_pin_result(self: ResultsMixinHost) -> None:
+        """Pin the latest result as the baseline for later diffs."""
+        results = self._get_results_workspace().results
+        if not results:
+            self.notify("No results to pin", severity="warning")
+            return
+        pinned = results[-1]
+        self._pinned_result = pinned
+        self.notify(f"Pinned {pinned.name} ({pinned.row_count:,} rows) as the diff baseline")
+
+    def action_diff_results(self: ResultsMixinHost) -> None:
+        """Diff the latest result against the pinned (or previous) result."""
+        self._diff_results()
+
+    def _diff_results(
+        self: ResultsMixinHost,
+        old_name: str | None = None,
+        new_name: str | None = None,
+        key: list[str] | None = None,
+    ) -> None:
+        workspace = self._get_results_workspace()
+        results = workspace.results
+        new = self._find_diff_result(new_name) if new_name else (results[-1] if results else None)
+        if new is None:
+            self.notify(f"No result named {new_name}" if new_name else "No results to diff", severity="warning")
+            return
+        if old_name:
+            old = self._find_diff_result(old_name)
+        elif self._pinned_result is not None and self._pinned_result is not new:
+            old = self._pinned_result
+        else:
+            earlier = [result for result in results if result is not new]
+            old = earlier[-1] if earlier else None
+        if old is None:
+            message = f"No result named {old_name}" if old_name else "Pin a result (p) or run another query to diff"
+            self.notify(message, severity="warning")
+            return
+
+        async def work() -> None:
+            import asyncio
+
+            from sqlit.domains.results.diff import diff_results
+
+            try:
+                diff = await asyncio.to_thread(
+                    diff_results, old.rows, old.columns, new.rows, new.columns, key=key
+                )
+            except Exception as error:
+                self.notify(f"Diff failed: {error}", severity="error")
+                return
+            if diff is not None:
+                self._show_result_diff(diff, old, new)
+
+        self.run_worker(work(), name="results-diff", group="results-diff", exclusive=True)
+
+    def _find_diff_result(self: ResultsMixinHost, name: str) -> WorkspaceResult | None:
+        if name.lower() == PINNED_RESULT_NAME:
+            return self._pinned_result
+        return self._get_results_workspace().get(name)
+
+    def _show_result_diff(self: ResultsMixinHost, diff: ResultDiff, old: WorkspaceResult, new: WorkspaceResult) -> None:
+        """Show changed, added and removed rows as stacked result sections."""
+        from sqlit.domains.query.app.multi_statement import StatementResult
+        from sqlit.domains.query.app.query_service import QueryResult
+        from sqlit.domains.results.diff import compared_columns
+        from sqlit.shared.ui.widgets_stacked_results import MAX_ROWS_PER_RESULT
+
+        pairs = compared_columns(old.columns, new.columns)
+        old_positions = [old_index for old_index, _new_index in pairs]
+        new_positions = [new_index for _old_index, new_index in pairs]
+
+        def pick(rows: Any, index: Any, positions: list[int]) -> tuple:
+            row = rows[int(index)]
+            return tuple(row[position] for position in positions)
+
+        changed_rows = []
+        for old_index, new_index in diff.changed[: MAX_ROWS_PER_RESULT // 2]:
+            changed_rows.append(("-", *pick(old.rows, old_index, old_positions)))
+            changed_rows.append(("+", *pick(new.rows, new_index, new_positions)))
+        sections = [
+            ("Changed", changed_rows, len(diff.changed)),
+            ("Added", [("+", *pick(new.rows, i, new_positions)) for i in diff.added[:MAX_ROWS_PER_RESULT]], len(diff.added)),
+            ("Removed", [("-", *pick(old.rows, i, old_positions)) for i in diff.removed[:MAX_ROWS_PER_RESULT]], len(diff.removed)),
+        ]
+        if not diff.key:
+            sections = sections[1:]
+
+        columns = ["", *diff.columns]
+        self._begin_stacked_results(len(sections))
+        container = self._get_stacked_results_container()
+        for index, (title, rows, count) in enumerate(sections):
+            result = QueryResult(columns=columns, rows=rows, row_count=count, truncated=len(rows) < count)
+            statement = f"{title}: {count:,} row{'' if count == 1 else 's'} ({old.name} → {new.name})"
+            container.add_result_section(StatementResult(statement, result, success=True), index, auto_collapse=not count)
+
+        if diff.identical:
+            message = f"{old.name} and {new.name} match ({diff.unchanged:,} rows)"
+        else:
+            message = (
+                f"{old.name} → {new.name}: {len(diff.changed):,} changed, {len(diff.added):,} added, "
+                f"{len(diff.removed):,} removed, {diff.unchanged:,} unchanged"
+            )
+        if len(diff.columns) < max(len(old.columns), len(new.columns)):
+            message += f" (compared {len(diff.columns)} shared columns)"
+        self.notify(message)
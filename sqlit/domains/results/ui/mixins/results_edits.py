@@ -0,0 +1,192 @@
+"""Pending grid edits for SSMSTUI: stage cell updates and row deletes, commit in one transaction."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlit.domains.results.pending_edits import PendingEdits
+from sqlit.shared.ui.protocols import ResultsMixinHost
+from sqlit.shared.ui.widgets import SqlitDataTable
+
+
+class ResultsEditsMixin:
+    """Mixin providing a pending-changes buffer on the results grid.
+
+    Edits are staged against the single results table of a table preview
+    and drawn over the grid until they are committed or discarded. The
+    buffer belongs to one grid; once that grid is replaced, its edits are
+    dropped.
+    """
+
+    _pending_edits: PendingEdits | None = None
+    _pending_edits_table: SqlitDataTable | None = None
+
+    def _pending_edit_count(self: ResultsMixinHost) -> int:
+        edits = self._pending_edits
+        table = self._pending_edits_table
+        if not edits or table is None or not table.is_attached:
+            return 0
+        return len(edits)
+
+    def _get_pending_edits(self: ResultsMixinHost, table: SqlitDataTable, columns: list[str]) -> PendingEdits | None:
+        """Return the buffer for ``table``, starting a new one if the grid changed."""
+        if self.results_area.has_class("stacked-mode") or table is not self.results_table:
+            self.notify("Pending edits work on a single table result", severity="warning")
+            return None
+        table_info = self._last_query_table
+        provider = self.current_provider
+        if not table_info or provider is None:
+            self.notify("Open a table from the explorer to edit its rows", severity="warning")
+            return None
+
+        edits = self._pending_edits
+        if edits is not None and self._pending_edits_table is table and edits.columns == columns:
+            return edits
+        if edits:
+            self.notify(f"Discarded {len(edits):,} pending edits from earlier results", severity="warning")
+
+        from sqlit.domains.query.app.bulk_import import qualified_table_name
+
+        key_columns = [col.name for col in table_info.get("columns", []) if col.is_primary_key]
+        target = qualified_table_name(provider, table_info["name"], table_info.get("schema") or None)
+        edits = PendingEdits(target, columns, key_columns)
+        self._pending_edits = edits
+        self._pending_edits_table = table
+        return edits
+
+    def _refresh_pending_edits(self: ResultsMixinHost) -> None:
+        table = self._pending_edits_table
+        edits = self._pending_edits
+        if table is not None and edits is not None:
+            table.set_pending_edits(edits.updated_cells(), edits.deleted_rows())
+        self._update_footer_bindings()
+
+    def action_stage_cell_edit(self: ResultsMixinHost) -> None:
+        """Ask for a new value for the selected cell and stage it."""
+        from sqlit.domains.results.pending_edits import coerce_edit_value
+        from sqlit.domains.results.ui.screens.cell_edit import SET_NULL, CellEditScreen
+
+        table, columns, _rows, _stacked = self._get_active_results_context()
+        if not table or table.row_count <= 0 or not columns:
+            self.notify("No results", severity="warning")
+            return
+        try:
+            cursor_row, cursor_col = table.cursor_coordinate
+            row_values = tuple(table.get_row_at(cursor_row))
+        except Exception:
+            return
+        if cursor_col >= len(columns):
+            return
+        edits = self._get_pending_edits(table, columns)
+        if edits is None:
+            return
+        column = columns[cursor_col]
+        if column in edits.key_columns and edits.key_columns != edits.columns:
+            self.notify("Cannot edit primary key column", severity="warning")
+            return
+        if cursor_row in edits.deleted_rows():
+            self.notify("Row is marked for deletion", severity="warning")
+            return
+
+        original = row_values[cursor_col]
+        current = edits.cell_value(cursor_row, column, original)
+
+        def handle_result(value: Any) -> None:
+            if value is None:
+                return
+            new_value = None if value is SET_NULL else coerce_edit_value(value, original)
+            edits.stage_update(cursor_row, row_values, column, new_value)
+            self._refresh_pending_edits()
+
+        self.push_screen(
+            CellEditScreen(column, current, description=f"Staged until committed ({len(edits):,} pending)"),
+            handle_result,
+        )
+
+    def action_stage_row_delete(self: ResultsMixinHost) -> None:
+        """Mark or unmark the selected row for deletion."""
+        table, columns, _rows, _stacked = self._get_active_results_context()
+        if not table or table.row_count <= 0 or not columns:
+            self.notify("No results", severity="warning")
+            return
+        try:
+            cursor_row, _cursor_col = table.cursor_coordinate
+            row_values = tuple(table.get_row_at(cursor_row))
+        except Exception:
+            return
+        edits = self._get_pending_edits(table, columns)
+        if edits is None:
+            return
+        edits.toggle_delete(cursor_row, row_values)
+        self._refresh_pending_edits()
+
+    def action_discard_pending_edits(self: ResultsMixinHost) -> None:
+        """Drop every staged edit."""
+        count = self._pending_edit_count()
+        if self._pending_edits is not None:
+            self._pending_edits.discard()
+        self._refresh_pending_edits()
+        self.notify(f"Discarded {count:,} pending edits" if count else "No pending edits")
+
+    def action_commit_pending_edits(self: ResultsMixinHost) -> None:
+        """Commit staged edits in one transaction, batched with executemany."""
+        edits = self._pending_edits
+        provider = self.current_provider
+        config = self.current_config
+        if edits is None or not self._pending_edit_count():
+            self.notify("No pending edits", severity="warning")
+            return
+        if provider is None or config is None:
+            self.notify("Not connected", severity="error")
+            return
+        executor = self._transaction_executor
+        if executor is not None and executor.in_transaction:
+            self.notify("Finish the open transaction before committing edits", severity="warning")
+            return
+
+        table_info = self._last_query_table or {}
+        if table_info.get("database"):
+            config = provider.apply_database_override(config, table_info["database"])
+        quote = provider.dialect.quote_identifier
+
+        def run() -> Any:
+            from sqlit.domains.connections.providers.adapters.bulk import driver_paramstyle
+            from sqlit.domains.results.pending_edits import apply_edit_batches
+
+            conn = provider.connection_factory.connect(config)
+            try:
+                try:
+                    provider.post_connect(conn, config)
+                except Exception:
+                    pass
+                return apply_edit_batches(conn, edits.build_batches(quote, driver_paramstyle(conn)))
+            finally:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+        async def work() -> None:
+            import asyncio
+
+            from sqlit.domains.results.pending_edits import EditCommitError
+
+            try:
+                result = await asyncio.to_thread(run)
+            except EditCommitError as error:
+                self.notify(error.summary, severity="error", timeout=10)
+                return
+            except Exception as error:
+                self.notify(f"Commit failed; edits kept: {error}", severity="error")
+                return
+            edits.discard()
+            self._refresh_pending_edits()
+            self._invalidate_query_result_cache(config)
+            rows = f", {result.rows_affected:,} rows" if result.rows_affected >= 0 else ""
+            self.notify(
+                f"Committed {result.statements:,} changes{rows} in {result.elapsed_s:.2f}s "
+                f"({result.rows_per_second:,.0f} rows/s)"
+            )
+            self.action_refresh_results()
+
+        self.run_worker(work(), name="commit-pending-edits", group="commit-pending-edits", exclusive=True)
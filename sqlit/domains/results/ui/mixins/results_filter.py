@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, Any
 
 from rich.markup import escape as escape_markup
 
+from sqlit.domains.query.app.arrow_rows import arrow_row_texts, snapshot_rows
+from sqlit.domains.results.store import RowIndexView
 from sqlit.shared.core.utils import fuzzy_match, highlight_matches
 from sqlit.shared.ui.protocols import ResultsFilterMixinHost
 from sqlit.shared.ui.widgets import SqlitDataTable
@@ -72,7 +74,7 @@ class ResultsFilterMixin:
                 self.notify("No results to filter", severity="warning")
                 return
             columns = list(getattr(section, "result_columns", []))
-            rows = list(getattr(section, "result_rows", []))
+            rows = snapshot_rows(getattr(section, "result_rows", []))
             if not columns or not rows:
                 self.notify("No results to filter", severity="warning")
                 return
@@ -81,7 +83,7 @@ class ResultsFilterMixin:
             self._results_filter_target_table = table
             self._results_filter_original_columns = columns
             self._results_filter_original_rows = rows
-            self._results_filter_matching_rows = list(rows)
+            self._results_filter_matching_rows = snapshot_rows(rows)
             self._prime_results_filter_cache(rows)
             self.results_area.add_class("results-filter-active")
             try:
@@ -94,9 +96,9 @@ class ResultsFilterMixin:
                 self.notify("No results to filter", severity="warning")
                 return
             self._results_filter_original_columns = list(self._last_result_columns)
-            self._results_filter_original_rows = list(self._last_result_rows)
+            self._results_filter_original_rows = snapshot_rows(self._last_result_rows)
             # Initially all rows match (no filter applied)
-            self._results_filter_matching_rows = list(self._last_result_rows)
+            self._results_filter_matching_rows = snapshot_rows(self._last_result_rows)
             self._prime_results_filter_cache(self._last_result_rows)
 
         self._results_filter_visible = True
@@ -125,7 +127,7 @@ class ResultsFilterMixin:
             # Restore original data
             if self._results_filter_original_rows:
                 self._replace_results_table(self._last_result_columns, self._results_filter_original_rows)
-                self._last_result_rows = list(self._results_filter_original_rows)
+                self._last_result_rows = snapshot_rows(self._results_filter_original_rows)
 
         self._update_footer_bindings()
         self._results_filter_stacked = False
@@ -143,10 +145,10 @@ class ResultsFilterMixin:
         if self._results_filter_stacked:
             self.results_area.remove_class("results-filter-active")
             if self._results_filter_target_section is not None:
-                self._results_filter_target_section.result_rows = list(self._results_filter_matching_rows)
+                self._results_filter_target_section.result_rows = snapshot_rows(self._results_filter_matching_rows)
         else:
             # Update stored rows to the filtered data
-            self._last_result_rows = list(self._results_filter_matching_rows)
+            self._last_result_rows = snapshot_rows(self._results_filter_matching_rows)
 
         self._update_footer_bindings()
         self._results_filter_stacked = False
@@ -289,7 +291,7 @@ class ResultsFilterMixin:
             # Restore all rows
             self._restore_results_table()
             self._results_filter_matches = []
-            self._results_filter_matching_rows = list(self._results_filter_original_rows)
+            self._results_filter_matching_rows = snapshot_rows(self._results_filter_original_rows)
             self._results_filter_fuzzy = False
             self.results_filter_input.set_filter("", 0, total)
             return
@@ -303,7 +305,7 @@ class ResultsFilterMixin:
                 # Just "~" entered, show all rows
                 self._restore_results_table()
                 self._results_filter_matches = []
-                self._results_filter_matching_rows = list(self._results_filter_original_rows)
+                self._results_filter_matching_rows = snapshot_rows(self._results_filter_original_rows)
                 self.results_filter_input.set_filter("~", 0, total)
                 return
         else:
@@ -311,15 +313,15 @@ class ResultsFilterMixin:
 
         # Find matching rows (with early exit for performance)
         matches: list[int] = []
-        matching_rows: list[tuple] = []
         search_lower = search_text.lower()
         hit_limit = False
+        original_rows = self._results_filter_original_rows
 
-        for row_idx, row in enumerate(self._results_filter_original_rows):
+        for row_idx in range(total):
             if row_idx < len(self._results_filter_row_texts):
                 row_text = self._results_filter_row_texts[row_idx]
             else:
-                row_text = self._build_row_text(row)
+                row_text = self._build_row_text(original_rows[row_idx])
 
             if self._results_filter_fuzzy:
                 matched, _ = fuzzy_match(search_text, row_text)
@@ -333,13 +335,13 @@ class ResultsFilterMixin:
 
             if matched:
                 matches.append(row_idx)
-                matching_rows.append(row)
 
                 # Early exit if we've found enough matches
                 if len(matches) >= self.MAX_FILTER_MATCHES:
                     hit_limit = True
                     break
 
+        matching_rows = RowIndexView(original_rows, matches)
         self._results_filter_matches = matches
         self._results_filter_match_index = 0
         self._results_filter_matching_rows = matching_rows
@@ -405,6 +407,16 @@ class ResultsFilterMixin:
 
     def _prime_results_filter_cache(self: ResultsFilterMixinHost, rows: list[tuple]) -> None:
         """Precompute row text caches for faster filtering."""
+        arrow_table = getattr(rows, "arrow_table", None)
+        if arrow_table is not None:
+            try:
+                texts = arrow_row_texts(arrow_table)
+            except Exception:
+                pass
+            else:
+                self._results_filter_row_texts = texts
+                self._results_filter_row_texts_lower = [text.lower() for text in texts]
+                return
         row_texts: list[str] = []
         row_texts_lower: list[str] = []
         for row in rows:
@@ -455,10 +467,10 @@ class ResultsFilterMixin:
         self._replace_results_table_for_filter(columns, self._results_filter_original_rows)
 
         if self._results_filter_stacked and self._results_filter_target_section is not None:
-            self._results_filter_target_section.result_rows = list(self._results_filter_original_rows)
+            self._results_filter_target_section.result_rows = snapshot_rows(self._results_filter_original_rows)
         else:
             # Update stored rows to match original
-            self._last_result_rows = list(self._results_filter_original_rows)
+            self._last_result_rows = snapshot_rows(self._results_filter_original_rows)
 
     def _replace_results_table_raw_for_filter(
         self: ResultsFilterMixinHost, columns: list[str], rows: list[tuple]
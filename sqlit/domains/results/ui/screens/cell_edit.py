@@ -0,0 +1,105 @@
+"""Modal input for staging a new cell value."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Container
+from textual.screen import ModalScreen
+from textual.widgets import Input, Static
+
+from sqlit.shared.ui.widgets import Dialog
+
+# Dismiss value meaning "set the cell to NULL".
+SET_NULL = object()
+
+
+class CellEditScreen(ModalScreen):
+    """Asks for a cell's new value; dismisses with the text, SET_NULL or None."""
+
+    BINDINGS = [
+        Binding("escape", "cancel", "Cancel", priority=True),
+        Binding("enter", "submit", "Stage", show=False),
+        Binding("ctrl+n", "set_null", "NULL", show=False, priority=True),
+    ]
+
+    CSS = """
+    CellEditScreen {
+        align: center middle;
+        background: transparent;
+    }
+
+    #cell-edit-dialog {
+        width: 70;
+        height: auto;
+        max-height: 14;
+    }
+
+    #cell-edit-description {
+        margin-bottom: 1;
+        color: $text-muted;
+        height: auto;
+    }
+
+    #cell-edit-container {
+        border: solid $primary;
+        background: $surface;
+        padding: 0;
+        height: 3;
+        border-title-align: left;
+        border-title-color: $primary;
+        border-title-background: $surface;
+        border-title-style: none;
+    }
+
+    #cell-edit-container Input {
+        border: none;
+        height: 1;
+        padding: 0;
+        background: $surface;
+    }
+
+    #cell-edit-container Input:focus {
+        border: none;
+        background-tint: $foreground 5%;
+    }
+    """
+
+    def __init__(self, column: str, value: Any, *, description: str = "") -> None:
+        super().__init__()
+        self.column = column
+        self._value = "" if value is None else str(value)
+        self._description = description
+
+    def compose(self) -> ComposeResult:
+        shortcuts: list[tuple[str, str]] = [("Stage", "<enter>"), ("NULL", "^n"), ("Cancel", "<esc>")]
+        with Dialog(id="cell-edit-dialog", title=f"Edit {self.column}", shortcuts=shortcuts):
+            if self._description:
+                yield Static(self._description, id="cell-edit-description")
+            container = Container(id="cell-edit-container")
+            container.border_title = "New value"
+            with container:
+                yield Input(value=self._value, id="cell-edit-input")
+
+    def on_mount(self) -> None:
+        self.query_one("#cell-edit-input", Input).focus()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id == "cell-edit-input":
+            self.dismiss(event.value)
+
+    def action_submit(self) -> None:
+        self.dismiss(self.query_one("#cell-edit-input", Input).value)
+
+    def action_set_null(self) -> None:
+        self.dismiss(SET_NULL)
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
+
+    def check_action(self, action: str, parameters: tuple) -> bool | None:
+        if self.app.screen is not self:
+            return False
+        return super().check_action(action, parameters)
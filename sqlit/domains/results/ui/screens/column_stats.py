@@ -0,0 +1,72 @@
+"""Modal panel showing statistics for one results column."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from rich.markup import escape as escape_markup
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import ModalScreen
+from textual.widgets import Static
+
+from sqlit.shared.ui.widgets import Dialog
+
+
+class ColumnStatsScreen(ModalScreen):
+    """Shows column statistics, refreshed while a worker scans the rows."""
+
+    BINDINGS = [
+        Binding("enter", "close", "Close", show=False),
+        Binding("escape", "close", "Close", show=False),
+    ]
+
+    CSS = """
+    ColumnStatsScreen {
+        align: center middle;
+        background: transparent;
+    }
+
+    #column-stats-dialog {
+        width: auto;
+        min-width: 50;
+        max-width: 95%;
+        border: solid $primary;
+        border-subtitle-color: $primary;
+    }
+
+    #column-stats-content {
+        padding: 1 2;
+        color: $text;
+    }
+    """
+
+    def __init__(self, column: str, *, on_close: Callable[[], None] | None = None):
+        super().__init__()
+        self.column = column
+        self._on_close = on_close
+
+    def compose(self) -> ComposeResult:
+        with Dialog(id="column-stats-dialog", title=f"Column stats: {escape_markup(self.column)}", shortcuts=[("Close", "<esc>")]):
+            yield Static("Scanning...", id="column-stats-content", markup=False)
+
+    def update_stats(self, stats: Any) -> None:
+        """Show a ``ColumnStats`` snapshot."""
+        from sqlit.domains.results.column_stats import format_column_stats
+
+        try:
+            self.query_one("#column-stats-content", Static).update(format_column_stats(stats))
+        except Exception:
+            pass
+
+    def action_close(self) -> None:
+        if self._on_close is not None:
+            self._on_close()
+        self.dismiss()
+
+    def check_action(self, action: str, parameters: tuple) -> bool | None:
+        # Prevent underlying screens from receiving actions when another modal is on top.
+        if self.app.screen is not self:
+            return False
+        return super().check_action(action, parameters)
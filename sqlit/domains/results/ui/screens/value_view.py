@@ -12,7 +12,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Static
 
 from sqlit.shared.ui.widgets import Dialog
-from sqlit.shared.ui.widgets_json_tree import JSONTreeView, parse_json_value
+from sqlit.shared.ui.widgets_json_tree import JSONTreeView, probe_json_value
 
 
 class ValueViewScreen(ModalScreen):
@@ -70,7 +70,7 @@ class ValueViewScreen(ModalScreen):
         self._is_json = False
         self._parsed_json: dict | list | None = None
         self._tree_mode = True
-        self._is_json, self._parsed_json = parse_json_value(value)
+        self._is_json, self._parsed_json = probe_json_value(value)
 
     @property
     def value(self) -> str:
@@ -103,11 +103,12 @@ class ValueViewScreen(ModalScreen):
             scroll_widget = self.query_one("#value-scroll", VerticalScroll)
             tree_widget = self.query_one("#json-tree-modal", JSONTreeView)
 
-            if self._is_json and self._tree_mode and self._parsed_json is not None:
+            if self._is_json and self._tree_mode:
                 scroll_widget.add_class("hidden")
                 tree_widget.remove_class("hidden")
 
-                tree_widget.set_json(self._parsed_json, self._title)
+                source = self._parsed_json if self._parsed_json is not None else self._raw_value
+                tree_widget.set_json(source, self._title)
                 tree_widget.focus()
             else:
                 tree_widget.add_class("hidden")
@@ -116,6 +117,12 @@ class ValueViewScreen(ModalScreen):
         except Exception:
             pass
 
+    def on_jsontree_view_invalid_json(self, event: JSONTreeView.InvalidJSON) -> None:
+        """Fall back to the plain text view when a large value was not JSON."""
+        event.stop()
+        self._is_json = False
+        self._rebuild()
+
     def action_dismiss(self) -> None:  # type: ignore[override]
         self.dismiss(None)
 
@@ -0,0 +1,171 @@
+"""Local DuckDB workspace for querying held result sets.
+
+Every displayed result is registered under a short name (``r1``, ``r2``, ...)
+so SQL run against the "results" query target can group, pivot or join
+earlier results without going back to the source database. Queries run in
+an in-process DuckDB connection where each name is a view over the result's
+Arrow table: Arrow-backed (and spilled) results are registered without
+copying, and row results are converted for the duration of the query that
+refers to them. Results are held through the app's ResultStore, so they
+count against its memory budget and can spill like any other held result.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlit.shared.core.utils import unique_column_names
+
+if TYPE_CHECKING:
+    from sqlit.domains.query.app.query_service import NonQueryResult, QueryResult
+    from sqlit.domains.results.store import ResultStore
+
+# Most recent results kept queryable; older names are dropped.
+DEFAULT_WORKSPACE_MAX_RESULTS = 20
+RESULT_NAME_PREFIX = "r"
+
+_RESULT_NAME_PATTERN = re.compile(rf"\b{RESULT_NAME_PREFIX}\d+\b", re.IGNORECASE)
+
+
+@dataclass
+class WorkspaceResult:
+    """A result set registered in the workspace."""
+
+    name: str
+    columns: list[str]
+    rows: Sequence[tuple]
+    label: str = ""
+
+    @property
+    def row_count(self) -> int:
+        return len(self.rows)
+
+
+class ResultsWorkspace:
+    """Names held result sets and runs SQL over them in DuckDB."""
+
+    def __init__(
+        self, max_results: int = DEFAULT_WORKSPACE_MAX_RESULTS, *, result_store: ResultStore | None = None
+    ) -> None:
+        self.max_results = max(1, int(max_results))
+        self._result_store = result_store
+        self._results: OrderedDict[str, WorkspaceResult] = OrderedDict()
+        self._next_id = 1
+        self._lock = threading.Lock()
+        # Serializes use of the DuckDB connection across worker threads.
+        self._execute_lock = threading.Lock()
+        self._connection: Any | None = None
+
+    @property
+    def results(self) -> list[WorkspaceResult]:
+        with self._lock:
+            return list(self._results.values())
+
+    def get(self, name: str) -> WorkspaceResult | None:
+        with self._lock:
+            return self._results.get(name.lower())
+
+    def add(self, columns: list[str], rows: Sequence[tuple], label: str = "") -> str:
+        """Register a result set and return its name.
+
+        The rows are held through the result store (when there is one) and
+        released when the result is evicted; nothing is converted until a
+        query uses the result.
+        """
+        evicted: list[WorkspaceResult] = []
+        with self._lock:
+            if self._result_store is not None:
+                rows = self._result_store.put(list(columns), rows)
+            name = f"{RESULT_NAME_PREFIX}{self._next_id}"
+            self._next_id += 1
+            self._results[name] = WorkspaceResult(name, list(columns), rows, " ".join(label.split()))
+            while len(self._results) > self.max_results:
+                evicted.append(self._results.popitem(last=False)[1])
+        self._release(evicted)
+        return name
+
+    def execute(self, query: str, max_rows: int | None = None) -> QueryResult | NonQueryResult:
+        """Run ``query`` against the registered results (call from a worker thread)."""
+        from sqlit.domains.connections.providers.catalog import get_provider
+        from sqlit.domains.query.app.query_service import DialectQueryAnalyzer, QueryService
+
+        provider = get_provider("duckdb")
+        service = QueryService(analyzer=DialectQueryAnalyzer(provider.dialect))
+        with self._execute_lock:
+            connection = self._connect()
+            registered = self._register_views(connection, query)
+            try:
+                return service.execute(
+                    connection,
+                    provider.query_executor,
+                    query,
+                    max_rows=max_rows,
+                    save_to_history=False,
+                    use_cache=False,
+                )
+            finally:
+                for name in registered:
+                    try:
+                        connection.unregister(name)
+                    except Exception:
+                        pass
+
+    def close(self) -> None:
+        """Drop every result and close the DuckDB connection."""
+        with self._lock:
+            evicted = list(self._results.values())
+            self._results.clear()
+        self._release(evicted)
+        with self._execute_lock:
+            if self._connection is not None:
+                try:
+                    self._connection.close()
+                except Exception:
+                    pass
+            self._connection = None
+
+    def _release(self, results: list[WorkspaceResult]) -> None:
+        if self._result_store is None:
+            return
+        for result in results:
+            self._result_store.release_rows(result.rows)
+
+    def _connect(self) -> Any:
+        if self._connection is None:
+            from sqlit.domains.connections.providers.driver import import_driver_module
+
+            duckdb = import_driver_module("duckdb", driver_name="DuckDB", extra_name="duckdb", package_name="duckdb")
+            self._connection = duckdb.connect(":memory:")
+        return self._connection
+
+    def _register_views(self, connection: Any, query: str) -> list[str]:
+        """Register the results ``query`` refers to as views; returns their names.
+
+        Views live only for one query, so a converted row result is not kept
+        alongside its rows and a result spilled since the last query is read
+        from its spill file.
+        """
+        with self._lock:
+            results = dict(self._results)
+        registered = []
+        for name in {match.lower() for match in _RESULT_NAME_PATTERN.findall(query)}:
+            result = results.get(name)
+            if result is None:
+                continue
+            connection.register(name, _arrow_table(result.columns, result.rows))
+            registered.append(name)
+        return registered
+
+
+def _arrow_table(columns: list[str], rows: Sequence[tuple]) -> Any:
+    arrow_table = getattr(rows, "arrow_table", None)
+    if arrow_table is not None:
+        return arrow_table
+    from sqlit.domains.connections.providers.arrow_results import arrow_table_from_rows
+
+    return arrow_table_from_rows(unique_column_names(columns), rows)
@@ -5,6 +5,10 @@ from __future__ import annotations
 from .router import dispatch_command, register_command_handler
 from . import credentials as _credentials
 from . import debug as _debug
+from . import fan_out as _fan_out
+from . import jobs as _jobs
+from . import results as _results
+from . import timings as _timings
 from . import watchdog as _watchdog
 from . import worker as _worker
 
@@ -0,0 +1,26 @@
+"""Fan-out query command."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .router import register_command_handler
+
+
+def _handle_fan_out_command(app: Any, cmd: str, args: list[str]) -> bool:
+    if cmd not in {"fanout", "fan"}:
+        return False
+    max_workers = None
+    if args:
+        try:
+            max_workers = int(args[0])
+        except ValueError:
+            max_workers = 0
+        if max_workers <= 0:
+            app.notify("Usage: :fanout [N] (N connections at a time)", severity="warning")
+            return True
+    app.action_execute_query_fan_out(max_workers)
+    return True
+
+
+register_command_handler(_handle_fan_out_command)
@@ -0,0 +1,49 @@
+"""Background query job commands."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .router import register_command_handler
+
+
+def _handle_jobs_command(app: Any, cmd: str, args: list[str]) -> bool:
+    if cmd in {"bg", "background"}:
+        app.action_execute_query_background()
+        return True
+    if cmd not in {"jobs", "job"}:
+        return False
+
+    action = args[0].lower() if args else ""
+    if not action:
+        app.action_show_query_jobs()
+        return True
+    if action in {"open", "cancel", "reattach", "rm"} and len(args) > 1:
+        try:
+            job_id = int(args[1].lstrip("#"))
+        except ValueError:
+            app.notify(f"Invalid job id: {args[1]}", severity="warning")
+            return True
+        _run_job_action(app, action, job_id)
+        return True
+
+    app.notify("Usage: :jobs [open|cancel|reattach|rm <id>]", severity="warning")
+    return True
+
+
+def _run_job_action(app: Any, action: str, job_id: int) -> None:
+    manager = app._get_query_job_manager()
+    if manager.get(job_id) is None:
+        app.notify(f"No job #{job_id}", severity="warning")
+    elif action == "open":
+        app._open_query_job(job_id)
+    elif action == "reattach":
+        app._reattach_query_job(job_id)
+    elif action == "cancel":
+        if not manager.cancel(job_id):
+            app.notify(f"Job #{job_id} is not running", severity="warning")
+    elif not manager.remove(job_id):
+        app.notify(f"Cancel job #{job_id} before removing it", severity="warning")
+
+
+register_command_handler(_handle_jobs_command)
@@ -0,0 +1,78 @@
+"""Commands for querying, diffing and editing held results."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .router import register_command_handler
+
+_ENABLE_VALUES = {"on", "1", "true", "yes"}
+_DISABLE_VALUES = {"off", "0", "false", "no", "db", "database"}
+
+
+def _handle_results_command(app: Any, cmd: str, args: list[str]) -> bool:
+    if cmd != "results":
+        return False
+
+    from sqlit.domains.query.ui.mixins.query_execution import (
+        QUERY_TARGET_DATABASE,
+        QUERY_TARGET_RESULTS,
+    )
+
+    value = args[0].lower() if args else ""
+    if not value:
+        app.action_toggle_results_target()
+    elif value in _ENABLE_VALUES:
+        app._set_query_target(QUERY_TARGET_RESULTS)
+    elif value in _DISABLE_VALUES:
+        app._set_query_target(QUERY_TARGET_DATABASE)
+    elif value in {"list", "ls"}:
+        _show_results(app)
+    else:
+        app.notify("Unknown results command. Try :results [on|off|list]", severity="warning")
+    return True
+
+
+def _handle_diff_command(app: Any, cmd: str, args: list[str]) -> bool:
+    if cmd != "diff":
+        return False
+    names = [arg for arg in args if not arg.lower().startswith("key=")]
+    keys = [arg.split("=", 1)[1] for arg in args if arg.lower().startswith("key=")]
+    key = [column for value in keys for column in value.split(",") if column] or None
+    if len(names) > 2:
+        app.notify("Usage: :diff [old] [new] [key=col,...]", severity="warning")
+        return True
+    old_name = names[0] if names else None
+    new_name = names[1] if len(names) > 1 else None
+    app._diff_results(old_name, new_name, key)
+    return True
+
+
+def _handle_edits_command(app: Any, cmd: str, args: list[str]) -> bool:
+    if cmd != "edits":
+        return False
+    action = args[0].lower() if args else "commit"
+    if action == "commit":
+        app.action_commit_pending_edits()
+    elif action == "discard":
+        app.action_discard_pending_edits()
+    else:
+        app.notify("Usage: :edits [commit|discard]", severity="warning")
+    return True
+
+
+def _show_results(app: Any) -> None:
+    results = app._get_results_workspace().results
+    if not results:
+        app.notify("No results to query yet")
+        return
+    rows = [
+        (result.name, result.row_count, ", ".join(str(column) for column in result.columns), result.label)
+        for result in reversed(results)
+    ]
+    app._replace_results_table(["Name", "Rows", "Columns", "Query"], rows)
+
+
+register_command_handler(_handle_results_command)
+register_command_handler(_handle_diff_command)
+register_command_handler(_handle_edits_command)
@@ -0,0 +1,55 @@
+"""Query timing command handlers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from sqlit.shared.core.store import CONFIG_DIR
+
+from .router import register_command_handler
+
+DEFAULT_TIMINGS_EXPORT_PATH = CONFIG_DIR / "query_timings.jsonl"
+
+
+def _handle_timings_command(app: Any, cmd: str, args: list[str]) -> bool:
+    if cmd not in {"timings", "timing"}:
+        return False
+
+    value = args[0].lower() if args else ""
+    if not value or value == "show":
+        action = getattr(app, "action_show_query_timings", None)
+        if callable(action):
+            action()
+        return True
+    if value == "export":
+        path = Path(args[1]).expanduser() if len(args) > 1 else DEFAULT_TIMINGS_EXPORT_PATH
+        _export_timings(app, path)
+        return True
+    if value == "clear":
+        app._query_timings_history = []
+        app.notify("Query timings cleared")
+        return True
+
+    app.notify("Unknown timings command. Try :timings [export [path]|clear]", severity="warning")
+    return True
+
+
+def _export_timings(app: Any, path: Path) -> None:
+    history = list(getattr(app, "_query_timings_history", []) or [])
+    if not history:
+        app.notify("No query timings recorded yet")
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as handle:
+            for timings in history:
+                handle.write(timings.to_json_line())
+                handle.write("\n")
+    except Exception as error:
+        app.notify(f"Failed to export query timings: {error}", severity="warning")
+        return
+    app.notify(f"Exported {len(history)} query timings to {path}")
+
+
+register_command_handler(_handle_timings_command)
@@ -6,8 +6,8 @@ during idle periods to avoid UI hiccups.
 
 from __future__ import annotations
 
+import heapq
 import time
-from collections import deque
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from enum import Enum, auto
@@ -32,17 +32,53 @@ class IdleJob:
     is_async: bool = False
     name: str = ""
     created_at: float = field(default_factory=time.time)
+    seq: int = 0
+    cancelled: bool = False
 
     def __lt__(self, other: IdleJob) -> bool:
         # Higher priority first, then older jobs first
         if self.priority != other.priority:
             return self.priority.value > other.priority.value
-        return self.created_at < other.created_at
+        return self.seq < other.seq
+
+
+@dataclass
+class JobStats:
+    """Timing statistics for all jobs sharing a name."""
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+
+# Highest priority first.
+_PRIORITY_ORDER = sorted(Priority, key=lambda priority: priority.value, reverse=True)
+
+# Smoothing factor for the measured frame lag.
+_LAG_SMOOTHING = 0.3
 
 
 class IdleScheduler:
     """Schedules work to run during user idle periods.
 
+    Jobs live in one heap per priority, so HIGH work never waits behind LOW
+    work, and in an index by name, so ``cancel_all(name)`` and
+    ``replace=True`` only touch jobs with that name. Cancelled jobs are
+    skipped lazily when they reach the top of their heap.
+
+    Each work chunk runs until a deadline. The chunk budget starts at
+    ``max_work_chunk_ms`` and shrinks when the event loop is lagging (timer
+    callbacks arriving late, or a job overrunning the deadline), then grows
+    back as frames get cheap again.
+
     Usage:
         scheduler = IdleScheduler(app)
         scheduler.start()
@@ -64,23 +100,35 @@ class IdleScheduler:
         max_work_chunk_ms: float = 16,       # Max time to work before checking for activity (~1 frame)
         check_interval_ms: float = 150,      # How often to check if we should work
         max_queue_size: int = 1000,          # Prevent unbounded growth
+        min_work_chunk_ms: float = 2,        # Floor for the adaptive chunk budget
+        clock: Callable[[], float] = time.perf_counter,
     ) -> None:
         self.app = app
         self.idle_threshold_ms = idle_threshold_ms
         self.max_work_chunk_ms = max_work_chunk_ms
+        self.min_work_chunk_ms = min(min_work_chunk_ms, max_work_chunk_ms)
         self.check_interval_ms = check_interval_ms
         self.max_queue_size = max_queue_size
+        self._clock = clock
 
-        self._queue: deque[IdleJob] = deque()
+        self._queues: dict[Priority, list[IdleJob]] = {priority: [] for priority in Priority}
+        self._by_name: dict[str, dict[int, IdleJob]] = {}
+        self._pending = 0
+        self._seq = 0
         self._last_activity_time: float = time.time()
         self._running = False
         self._timer: Any = None
+        self._timer_due: float | None = None
         self._paused = False
+        self._frame_lag_ms = 0.0
+        self._chunk_budget_ms = float(max_work_chunk_ms)
 
         # Stats for debugging
         self._jobs_completed = 0
         self._jobs_dropped = 0
+        self._jobs_cancelled = 0
         self._total_work_time_ms = 0.0
+        self._job_stats: dict[str, JobStats] = {}
 
     @property
     def is_idle(self) -> bool:
@@ -97,7 +145,17 @@ class IdleScheduler:
     @property
     def pending_jobs(self) -> int:
         """Number of jobs waiting to be executed."""
-        return len(self._queue)
+        return self._pending
+
+    @property
+    def chunk_budget_ms(self) -> float:
+        """Current time budget for one work chunk."""
+        return self._chunk_budget_ms
+
+    @property
+    def job_stats(self) -> dict[str, JobStats]:
+        """Timing statistics by job name."""
+        return self._job_stats
 
     def on_user_activity(self) -> None:
         """Call this whenever the user interacts with the app.
@@ -112,6 +170,7 @@ class IdleScheduler:
         priority: Priority = Priority.NORMAL,
         is_async: bool = False,
         name: str = "",
+        replace: bool = False,
     ) -> bool:
         """Queue a callback to run during idle time.
 
@@ -119,25 +178,31 @@ class IdleScheduler:
             callback: Function to execute (sync or async)
             priority: Job priority (HIGH runs first)
             is_async: True if callback is an async function
-            name: Optional name for debugging
+            name: Optional name for debugging, cancellation and stats
+            replace: Cancel pending jobs with the same name first
 
         Returns:
             True if queued, False if queue is full
         """
-        if len(self._queue) >= self.max_queue_size:
+        if replace and name:
+            self.cancel_all(name)
+
+        if self._pending >= self.max_queue_size:
             self._jobs_dropped += 1
             return False
 
+        self._seq += 1
         job = IdleJob(
             callback=callback,
             priority=priority,
             is_async=is_async,
             name=name,
+            seq=self._seq,
         )
-
-        # Insert maintaining priority order
-        # For simplicity, just append and sort when executing
-        self._queue.append(job)
+        heapq.heappush(self._queues[priority], job)
+        if name:
+            self._by_name.setdefault(name, {})[job.seq] = job
+        self._pending += 1
         return True
 
     def cancel_all(self, name: str | None = None) -> int:
@@ -151,13 +216,22 @@ class IdleScheduler:
             Number of jobs cancelled
         """
         if name is None:
-            count = len(self._queue)
-            self._queue.clear()
+            count = self._pending
+            for queue in self._queues.values():
+                queue.clear()
+            self._by_name.clear()
+            self._pending = 0
+            self._jobs_cancelled += count
             return count
 
-        original_len = len(self._queue)
-        self._queue = deque(job for job in self._queue if job.name != name)
-        return original_len - len(self._queue)
+        jobs = self._by_name.pop(name, None)
+        if not jobs:
+            return 0
+        for job in jobs.values():
+            job.cancelled = True
+        self._pending -= len(jobs)
+        self._jobs_cancelled += len(jobs)
+        return len(jobs)
 
     def start(self) -> None:
         """Start the idle scheduler."""
@@ -172,6 +246,7 @@ class IdleScheduler:
         if self._timer:
             self._timer.stop()
             self._timer = None
+        self._timer_due = None
 
     def pause(self) -> None:
         """Temporarily pause processing (queue still accepts jobs)."""
@@ -188,15 +263,21 @@ class IdleScheduler:
 
         # Use Textual's timer
         delay = self.check_interval_ms / 1000
+        self._timer_due = self._clock() + delay
         self._timer = self.app.set_timer(delay, self._check_and_work)
 
     def _check_and_work(self) -> None:
         """Check if idle and do work if so."""
+        if self._timer_due is not None:
+            # A timer firing late means the event loop is busy rendering.
+            self._observe_lag((self._clock() - self._timer_due) * 1000)
+            self._timer_due = None
+
         if not self._running or self._paused:
             self._schedule_check()
             return
 
-        if not self._queue:
+        if not self._pending:
             self._schedule_check()
             return
 
@@ -211,19 +292,38 @@ class IdleScheduler:
         # Schedule next check
         self._schedule_check()
 
+    def _observe_lag(self, lag_ms: float) -> None:
+        """Fold a lag sample into the smoothed frame lag and resize the chunk budget."""
+        lag_ms = max(0.0, lag_ms)
+        self._frame_lag_ms += _LAG_SMOOTHING * (lag_ms - self._frame_lag_ms)
+        budget = self.max_work_chunk_ms - self._frame_lag_ms
+        self._chunk_budget_ms = max(self.min_work_chunk_ms, min(self.max_work_chunk_ms, budget))
+
+    def _pop_next(self) -> IdleJob | None:
+        for priority in _PRIORITY_ORDER:
+            queue = self._queues[priority]
+            while queue:
+                job = heapq.heappop(queue)
+                if job.cancelled:
+                    continue
+                if job.name:
+                    named = self._by_name.get(job.name)
+                    if named is not None:
+                        named.pop(job.seq, None)
+                        if not named:
+                            del self._by_name[job.name]
+                self._pending -= 1
+                return job
+        return None
+
     def _do_work_chunk(self) -> None:
-        """Execute jobs for up to max_work_chunk_ms."""
-        start_time = time.time()
-        max_time = self.max_work_chunk_ms / 1000
-
-        # Sort queue by priority (do this lazily)
-        sorted_jobs = sorted(self._queue)
-        self._queue = deque(sorted_jobs)
-
-        while self._queue:
-            # Check if we've exceeded our time budget
-            elapsed = time.time() - start_time
-            if elapsed >= max_time:
+        """Execute jobs until the chunk deadline."""
+        start_time = self._clock()
+        deadline = start_time + self._chunk_budget_ms / 1000
+
+        while self._pending:
+            # Check if we've reached the deadline
+            if self._clock() >= deadline:
                 break
 
             # Check if user became active
@@ -231,42 +331,83 @@ class IdleScheduler:
                 break
 
             # Execute next job
-            job = self._queue.popleft()
+            job = self._pop_next()
+            if job is None:
+                break
+            job_start = self._clock()
             try:
                 if job.is_async:
                     # Schedule async job to run
                     self.app.call_later(self._run_async_job, job)
                 else:
                     job.callback()
-                self._jobs_completed += 1
+                    self._jobs_completed += 1
             except Exception as e:
                 # Log but don't crash
                 self.app.log.error(f"IdleScheduler job failed: {job.name or 'unnamed'}: {e}")
+            if not job.is_async:
+                self._record_job(job, (self._clock() - job_start) * 1000)
 
         # Track stats
-        self._total_work_time_ms += (time.time() - start_time) * 1000
+        now = self._clock()
+        self._total_work_time_ms += (now - start_time) * 1000
+        overrun_ms = (now - deadline) * 1000
+        if overrun_ms > 0:
+            # A job ran past the deadline: the next frame is late by that much.
+            self._observe_lag(overrun_ms)
 
         # Refresh status bar if debug mode is on
         if hasattr(self.app, "_debug_idle_scheduler") and self.app._debug_idle_scheduler:
             if hasattr(self.app, "_update_status_bar"):
                 self.app._update_status_bar()
 
+    def _record_job(self, job: IdleJob, elapsed_ms: float) -> None:
+        name = job.name or "unnamed"
+        stats = self._job_stats.get(name)
+        if stats is None:
+            stats = JobStats()
+            self._job_stats[name] = stats
+        stats.record(elapsed_ms)
+
     async def _run_async_job(self, job: IdleJob) -> None:
         """Run an async job."""
+        job_start = self._clock()
         try:
             callback = cast(Callable[[], Coroutine[Any, Any, Any]], job.callback)
             await callback()
             self._jobs_completed += 1
         except Exception as e:
             self.app.log.error(f"IdleScheduler async job failed: {job.name or 'unnamed'}: {e}")
+        self._record_job(job, (self._clock() - job_start) * 1000)
+
+    def top_jobs(self, limit: int = 3) -> list[tuple[str, JobStats]]:
+        """Job names that used the most time, most expensive first."""
+        ranked = sorted(self._job_stats.items(), key=lambda item: item[1].total_ms, reverse=True)
+        return ranked[:limit]
 
     def get_stats(self) -> dict[str, Any]:
         """Get scheduler statistics for debugging."""
         return {
-            "pending_jobs": len(self._queue),
+            "pending_jobs": self._pending,
+            "pending_by_priority": {
+                priority.name: sum(1 for job in self._queues[priority] if not job.cancelled)
+                for priority in _PRIORITY_ORDER
+            },
             "jobs_completed": self._jobs_completed,
             "jobs_dropped": self._jobs_dropped,
+            "jobs_cancelled": self._jobs_cancelled,
             "total_work_time_ms": round(self._total_work_time_ms, 2),
+            "chunk_budget_ms": round(self._chunk_budget_ms, 2),
+            "frame_lag_ms": round(self._frame_lag_ms, 2),
+            "job_stats": {
+                name: {
+                    "count": stats.count,
+                    "total_ms": round(stats.total_ms, 2),
+                    "avg_ms": round(stats.avg_ms, 2),
+                    "max_ms": round(stats.max_ms, 2),
+                }
+                for name, stats in self._job_stats.items()
+            },
             "is_idle": self.is_idle,
             "time_until_idle_ms": round(self.time_until_idle_ms, 2),
             "is_running": self._running,
@@ -295,6 +436,7 @@ def request_idle_callback(
     priority: Priority = Priority.NORMAL,
     is_async: bool = False,
     name: str = "",
+    replace: bool = False,
 ) -> bool:
     """Queue a callback to run during idle time (uses global scheduler).
 
@@ -302,7 +444,7 @@ def request_idle_callback(
     """
     if _global_scheduler is None:
         return False
-    return _global_scheduler.request_idle_callback(callback, priority, is_async, name)
+    return _global_scheduler.request_idle_callback(callback, priority, is_async, name, replace)
 
 
 def on_user_activity() -> None:
@@ -31,6 +31,9 @@ from sqlit.domains.explorer.ui.mixins.tree_filter import TreeFilterMixin
 from sqlit.domains.query.ui.mixins.autocomplete import AutocompleteMixin
 from sqlit.domains.query.ui.mixins.query import QueryMixin
 from sqlit.domains.results.ui.mixins.results import ResultsMixin
+from sqlit.domains.results.ui.mixins.results_columns import ResultsColumnsMixin
+from sqlit.domains.results.ui.mixins.results_diff import ResultsDiffMixin
+from sqlit.domains.results.ui.mixins.results_edits import ResultsEditsMixin
 from sqlit.domains.results.ui.mixins.results_filter import ResultsFilterMixin
 from sqlit.domains.shell.app.commands import dispatch_command
 from sqlit.domains.shell.app.idle_scheduler import IdleScheduler
@@ -64,6 +67,17 @@ if TYPE_CHECKING:
     from sqlit.domains.connections.app.session import ConnectionSession
 
 
+def _same_context_key(old: tuple[Any, ...], new: tuple[Any, ...]) -> bool:
+    """Compare context keys by identity, and by value for plain scalars and tuples."""
+    if len(old) != len(new):
+        return False
+    for a, b in zip(old, new):
+        if a is b:
+            continue
+        if type(a) is not type(b) or not isinstance(a, (str, int, tuple)) or a != b:
+            return False
+    return True
+
 class SSMSTUI(
     TreeMixin,
     TreeFilterMixin,
@@ -72,6 +86,9 @@ class SSMSTUI(
     AutocompleteMixin,
     ResultsMixin,
     ResultsFilterMixin,
+    ResultsColumnsMixin,
+    ResultsDiffMixin,
+    ResultsEditsMixin,
     UINavigationMixin,
     App,
 ):
@@ -191,6 +208,8 @@ class SSMSTUI(
         self._table_metadata: dict[str, tuple[str, str, str | None]] = {}
         self._columns_loading: set[str] = set()
         self._state_machine = UIStateMachine()
+        self._context_widgets: dict[str, Any] = {}
+        self._input_context_cache: tuple[tuple[Any, ...], InputContext] | None = None
         self._last_query_table: dict[str, Any] | None = None
         self._query_target_database: str | None = None  # Target DB for auto-generated queries
         self._restart_requested: bool = False
@@ -220,13 +239,87 @@ class SSMSTUI(
             widget = getattr(widget, "parent", None)
         return "none"
 
+    def _context_widget(self, selector: str, expect_type: type[Any] | None = None) -> Any | None:
+        """Look up a widget for context building, reusing it while it stays mounted."""
+        widget = self._context_widgets.get(selector)
+        if widget is not None and widget.is_attached:
+            return widget
+        try:
+            widget = self.query_one(selector, expect_type) if expect_type else self.query_one(selector)
+        except Exception:
+            return None
+        self._context_widgets[selector] = widget
+        return widget
+
+    def _input_context_key(self) -> tuple[Any, ...]:
+        """Cheap snapshot of everything the InputContext is derived from."""
+        tree = self._context_widget("#object-tree", Tree)
+        cursor_node = tree.cursor_node if tree is not None else None
+
+        stacked_result_count = -1
+        results_area = self._context_widget("#results-area")
+        if results_area is not None and results_area.has_class("stacked-mode"):
+            container = self._context_widget("#stacked-results", StackedResultsContainer)
+            if container is not None:
+                stacked_result_count = container.section_count
+
+        value_view_modes = None
+        if self._value_view_active:
+            value_view = self._context_widget("#value-view", InlineValueView)
+            if value_view is not None:
+                value_view_modes = (value_view._tree_mode, value_view._is_json)
+
+        selected = getattr(self, "_selected_connection_names", set())
+        return (
+            tuple(self._screen_stack),
+            self.focused,
+            cursor_node,
+            self.vim_mode,
+            self._leader_pending,
+            self._leader_pending_menu,
+            getattr(self, "_tree_filter_visible", False),
+            selected,
+            len(selected),
+            getattr(self, "_tree_visual_mode_anchor", None),
+            self._autocomplete_visible,
+            getattr(self, "_results_filter_visible", False),
+            self._value_view_active,
+            value_view_modes,
+            self.query_executing,
+            self.current_connection,
+            self.current_config,
+            self._last_result_columns,
+            self._last_result_rows,
+            self._last_result_cached_rows,
+            stacked_result_count,
+            self._pending_edit_count(),
+        )
+
     def _get_input_context(self) -> InputContext:
+        """Return the UI-agnostic input context, rebuilt only when its inputs change.
+
+        Key routing, footer updates and Textual's check_action all ask for the
+        context, often several times per key press.
+        """
+        try:
+            key = self._input_context_key()
+        except Exception:
+            return self._build_input_context()
+        cached = self._input_context_cache
+        if cached is not None and _same_context_key(cached[0], key):
+            return cached[1]
+        ctx = self._build_input_context()
+        self._input_context_cache = (key, ctx)
+        return ctx
+
+    def _build_input_context(self) -> InputContext:
         """Build a UI-agnostic input context snapshot."""
         tree_node_kind = None
         tree_node_connection_name = None
         tree_node_connection_selected = False
         try:
-            node = self.object_tree.cursor_node
+            tree = self._context_widget("#object-tree", Tree)
+            node = tree.cursor_node if tree is not None else None
             if node is not None:
                 kind = ""
                 if hasattr(self, "_get_node_kind"):
@@ -246,33 +339,37 @@ class SSMSTUI(
         current_connection_name = self.current_config.name if self.current_config else None
         has_results = bool(self._last_result_columns) and bool(self._last_result_rows)
         stacked_result_count = 0
-        if hasattr(self, "results_area"):
+        results_area = self._context_widget("#results-area")
+        if results_area is not None:
             try:
-                if self.results_area.has_class("stacked-mode"):
-                    from sqlit.shared.ui.widgets_stacked_results import StackedResultsContainer
-
-                    container = self.query_one("#stacked-results", StackedResultsContainer)
-                    stacked_result_count = container.section_count
+                if results_area.has_class("stacked-mode"):
+                    container = self._context_widget("#stacked-results", StackedResultsContainer)
+                    if container is not None:
+                        stacked_result_count = container.section_count
                     if not has_results:
                         has_results = stacked_result_count > 0
             except Exception:
                 pass
 
+        results_cache_age_s = None
+        if (
+            self._last_result_cached_rows is not None
+            and self._last_result_cached_rows is self._last_result_rows
+            and stacked_result_count == 0
+        ):
+            results_cache_age_s = self._last_result_cache_age_s
+
         # Compute modal_open dynamically from screen stack for accurate state
-        modal_open = any(isinstance(screen, ModalScreen) for screen in self.screen_stack)
+        modal_open = any(isinstance(screen, ModalScreen) for screen in self._screen_stack)
 
         # Get value view state for tree/syntax mode
         value_view_tree_mode = False
         value_view_is_json = False
         if self._value_view_active:
-            try:
-                from sqlit.shared.ui.widgets import InlineValueView
-
-                value_view = self.query_one("#value-view", InlineValueView)
+            value_view = self._context_widget("#value-view", InlineValueView)
+            if value_view is not None:
                 value_view_tree_mode = value_view._tree_mode
                 value_view_is_json = value_view._is_json
-            except Exception:
-                pass
 
         return InputContext(
             focus=self._get_focus_pane(),
@@ -297,6 +394,8 @@ class SSMSTUI(
             last_result_is_error=last_result_is_error,
             has_results=has_results,
             stacked_result_count=stacked_result_count,
+            results_cache_age_s=results_cache_age_s,
+            pending_edit_count=self._pending_edit_count(),
         )
 
     def _debug_screen_label(self, screen: Any | None) -> str:
@@ -661,6 +760,43 @@ class SSMSTUI(
             ("Appearance", ":theme", "Open theme selection", ""),
             ("Query", ":run, :r", "Execute query", ""),
             ("Query", ":run!, :r!", "Execute query (stay in INSERT)", ""),
+            (
+                "Query",
+                ":bg",
+                "Run query as a background job",
+                "Runs on its own connection so the editor stays free; <space>b does the same.",
+            ),
+            (
+                "Query",
+                ":jobs [open|cancel|reattach|rm <id>]",
+                "Show or manage background jobs",
+                "Snowflake and BigQuery jobs left running at exit can be reattached in the next session.",
+            ),
+            (
+                "Query",
+                ":fanout [N]",
+                "Run query on every selected connection",
+                "Up to N connections at a time (default 8); rows are merged with a __connection column.",
+            ),
+            (
+                "Query",
+                ":results [on|off]",
+                "Run queries on held results",
+                "Each result is a DuckDB table named r1, r2, ... in a local workspace (<space>r toggles).",
+            ),
+            ("Query", ":results list", "Show result names", ""),
+            (
+                "Query",
+                ":edits [commit|discard]",
+                "Commit or discard pending grid edits",
+                "Stage edits with c (cell) and X (delete row) in results; commit runs them in one transaction.",
+            ),
+            (
+                "Query",
+                ":diff [old] [new] [key=col,...]",
+                "Diff two results",
+                "Defaults to the latest result against the pinned one (p in results) or the one before it.",
+            ),
             (
                 "Worker",
                 ":process-worker, :worker",
@@ -690,6 +826,13 @@ class SSMSTUI(
             ("Debug", ":debug", "Show debug status", ""),
             ("Debug", ":debug list", "Show debug events", ""),
             ("Debug", ":debug clear", "Clear debug event log", ""),
+            (
+                "Debug",
+                ":timings",
+                "Show last query timing breakdown",
+                "Connect, execute, fetch, transfer, history and render times (T in results).",
+            ),
+            ("Debug", ":timings export [path]", "Append query timings as JSON lines", "Defaults to ~/.sqlit/query_timings.jsonl."),
             ("Settings", ":set process_worker_warm on|off", "Warm worker on idle", ""),
             ("Settings", ":set process_worker_lazy on|off", "Lazy worker start", ""),
             ("Settings", ":set process_worker_auto_shutdown <seconds>", "Auto-shutdown worker", ""),
@@ -935,6 +1078,18 @@ class SSMSTUI(
         if self._ui_stall_watchdog_timer is not None:
             self._ui_stall_watchdog_timer.stop()
             self._ui_stall_watchdog_timer = None
+        if self._results_workspace is not None:
+            self._results_workspace.close()
+            self._results_workspace = None
+        if self._query_job_manager is not None:
+            self._query_job_manager.close()
+            self._query_job_manager = None
+        if self._result_store is not None:
+            self._result_store.close()
+            self._result_store = None
+        from sqlit.domains.connections.app.tunnel_broker import close_tunnel_broker
+
+        close_tunnel_broker()
 
     def _startup_stamp(self, name: str) -> None:
         if not self._startup_profile:
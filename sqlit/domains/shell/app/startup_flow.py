@@ -7,6 +7,7 @@ import sys
 import tempfile
 import time
 from pathlib import Path
+from typing import Any
 
 from sqlit.domains.connections.domain.config import ConnectionConfig
 from sqlit.domains.explorer.ui.tree import builder as tree_builder
@@ -36,26 +37,7 @@ def run_on_mount(app: AppProtocol) -> None:
     app._startup_stamp("settings_loaded")
 
     app._expanded_paths = set(settings.get("expanded_nodes", []))
-    if "process_worker" in settings:
-        app.services.runtime.process_worker = bool(settings.get("process_worker"))
-    if "process_worker_warm_on_idle" in settings:
-        app.services.runtime.process_worker_warm_on_idle = bool(
-            settings.get("process_worker_warm_on_idle")
-        )
-    if "process_worker_auto_shutdown_s" in settings:
-        try:
-            app.services.runtime.process_worker_auto_shutdown_s = float(
-                settings.get("process_worker_auto_shutdown_s") or 0
-            )
-        except (TypeError, ValueError):
-            app.services.runtime.process_worker_auto_shutdown_s = 0.0
-    if "ui_stall_watchdog_ms" in settings:
-        try:
-            app.services.runtime.ui_stall_watchdog_ms = float(
-                settings.get("ui_stall_watchdog_ms") or 0
-            )
-        except (TypeError, ValueError):
-            app.services.runtime.ui_stall_watchdog_ms = 0.0
+    _apply_runtime_settings(app, settings)
     app._startup_stamp("settings_applied")
 
     apply_mock_settings(app, settings)
@@ -111,6 +93,44 @@ def run_on_mount(app: AppProtocol) -> None:
     log_startup_timing(app)
 
 
+def _apply_runtime_settings(app: AppProtocol, settings: dict[str, Any]) -> None:
+    """Copy runtime options saved in settings onto ``app.services.runtime``."""
+    runtime = app.services.runtime
+    if "process_worker" in settings:
+        runtime.process_worker = bool(settings.get("process_worker"))
+    if "process_worker_warm_on_idle" in settings:
+        runtime.process_worker_warm_on_idle = bool(settings.get("process_worker_warm_on_idle"))
+    if "process_worker_auto_shutdown_s" in settings:
+        try:
+            runtime.process_worker_auto_shutdown_s = float(settings.get("process_worker_auto_shutdown_s") or 0)
+        except (TypeError, ValueError):
+            runtime.process_worker_auto_shutdown_s = 0.0
+    if "limit_pushdown" in settings:
+        runtime.limit_pushdown = bool(settings.get("limit_pushdown"))
+    if "ui_stall_watchdog_ms" in settings:
+        try:
+            runtime.ui_stall_watchdog_ms = float(settings.get("ui_stall_watchdog_ms") or 0)
+        except (TypeError, ValueError):
+            runtime.ui_stall_watchdog_ms = 0.0
+    if "result_memory_budget_mb" in settings:
+        try:
+            runtime.result_memory_budget_mb = float(settings.get("result_memory_budget_mb"))
+        except (TypeError, ValueError):
+            pass
+    for key in ("result_cache_ttl_s", "result_cache_budget_mb"):
+        if key in settings:
+            try:
+                setattr(runtime, key, float(settings.get(key) or 0))
+            except (TypeError, ValueError):
+                pass
+    for key in ("schema_index_concurrency", "lob_preview_chars"):
+        if key in settings:
+            try:
+                setattr(runtime, key, int(settings.get(key) or 0))
+            except (TypeError, ValueError):
+                pass
+
+
 def _warn_on_missing_actions(app: AppProtocol, is_headless: bool) -> None:
     from sqlit.core.action_validation import validate_actions
 
@@ -20,6 +20,18 @@ class MainScreenState(State):
         self.allows("toggle_fullscreen", help="Toggle fullscreen")
         self.allows("show_help", key="?", label="Help", right=True)
         self.allows("change_theme")
+        self.allows("toggle_results_target", help="Query held results instead of the connection")
+        self.allows(
+            "execute_query_background",
+            guard=lambda app: app.has_connection,
+            help="Run query as a background job",
+        )
+        self.allows("show_query_jobs", help="Show background jobs")
+        self.allows(
+            "execute_query_fan_out",
+            guard=lambda app: app.tree_multi_select_active,
+            help="Run query on every selected connection",
+        )
         self.allows("toggle_process_worker", help="Toggle process worker")
         self.allows("leader_key", key="<space>", label="Leader", right=True)
 
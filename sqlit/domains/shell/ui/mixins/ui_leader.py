@@ -106,6 +106,18 @@ class UILeaderMixin:
     def action_leader_change_theme(self: UINavigationMixinHost) -> None:
         self._execute_leader_command("change_theme")
 
+    def action_leader_toggle_results_target(self: UINavigationMixinHost) -> None:
+        self._execute_leader_command("toggle_results_target")
+
+    def action_leader_execute_query_background(self: UINavigationMixinHost) -> None:
+        self._execute_leader_command("execute_query_background")
+
+    def action_leader_show_query_jobs(self: UINavigationMixinHost) -> None:
+        self._execute_leader_command("show_query_jobs")
+
+    def action_leader_execute_query_fan_out(self: UINavigationMixinHost) -> None:
+        self._execute_leader_command("execute_query_fan_out")
+
     def action_leader_toggle_process_worker(self: UINavigationMixinHost) -> None:
         self._execute_leader_command("toggle_process_worker")
 
@@ -17,6 +17,7 @@ class UIStatusMixin:
     _last_notification_time: str = ""
     _notification_history: list[tuple[str, str, str]] = []
     _last_active_pane: str | None = None
+    _footer_render_key: tuple[Any, ...] | None = None
     def _update_section_labels(self: UINavigationMixinHost) -> None:
         """Update section labels to highlight the active pane."""
         try:
@@ -150,6 +151,35 @@ class UIStatusMixin:
         # Also update the status bar
         self._update_status_bar()
 
+    def _status_indicator_parts(self: UINavigationMixinHost) -> list[str]:
+        """Status indicators shown after the connection info."""
+        status_parts = []
+
+        # Check if schema is indexing (only show during debugging)
+        schema_spinner = getattr(self, "_schema_spinner", None)
+        if schema_spinner and schema_spinner.running:
+            if getattr(self, "_debug_mode", False) or getattr(self, "_debug_idle_scheduler", False):
+                status_parts.append(f"[bold cyan]{schema_spinner.frame} Indexing...[/]")
+
+        # Check if in a transaction
+        if getattr(self, "in_transaction", False):
+            status_parts.append("[bold magenta]⚡ TRANSACTION[/]")
+
+        if getattr(self, "_query_target", None) == "results":
+            status_parts.append("[bold cyan]ON RESULTS[/]")
+
+        job_part = self._status_job_part()
+        if job_part:
+            status_parts.append(job_part)
+        return status_parts
+
+    def _status_job_part(self: UINavigationMixinHost) -> str:
+        """Status bar segment counting running background query jobs."""
+        job_count = self._running_query_job_count()
+        if not job_count:
+            return ""
+        return f"[bold cyan]{job_count} JOB{'S' if job_count != 1 else ''}[/]"
+
     def _update_status_bar(self: UINavigationMixinHost) -> None:
         """Update status bar with connection and vim mode info."""
         from sqlit.core.vim import VimMode
@@ -191,20 +221,7 @@ class UIStatusMixin:
             cmd_buffer = escape_markup(getattr(self, "_command_buffer", ""))
             conn_info = f"[bold cyan]:{cmd_buffer}[/]"
 
-        # Build status indicators
-        status_parts = []
-
-        # Check if schema is indexing (only show during debugging)
-        schema_spinner = getattr(self, "_schema_spinner", None)
-        if schema_spinner and schema_spinner.running:
-            if getattr(self, "_debug_mode", False) or getattr(self, "_debug_idle_scheduler", False):
-                status_parts.append(f"[bold cyan]{schema_spinner.frame} Indexing...[/]")
-
-        # Check if in a transaction
-        if getattr(self, "in_transaction", False):
-            status_parts.append("[bold magenta]⚡ TRANSACTION[/]")
-
-        status_str = "  ".join(status_parts)
+        status_str = "  ".join(self._status_indicator_parts())
         if status_str:
             status_str += "  "
 
@@ -344,6 +361,7 @@ class UIStatusMixin:
         is_idle = scheduler.is_idle
         completed = scheduler._jobs_completed
         work_time = scheduler._total_work_time_ms
+        budget = scheduler.chunk_budget_ms
 
         if pending > 0 and is_idle:
             status = "[bold cyan]⚡ WORKING[/]"
@@ -358,10 +376,15 @@ class UIStatusMixin:
             status = "[dim]👆 USER ACTIVE[/]"
             details = "no pending work"
 
+        top = "  ".join(
+            f"{name} {stats.count}x avg {stats.avg_ms:.1f} max {stats.max_ms:.1f}ms"
+            for name, stats in scheduler.top_jobs()
+        )
         bar.update(
             f"{status}  │  {details}  │  "
             f"[dim]{completed} completed[/]  │  "
-            f"[dim]{work_time:.0f}ms worked[/]"
+            f"[dim]{work_time:.0f}ms worked, {budget:.0f}ms slices[/]"
+            + (f"  │  [dim]{top}[/]" if top else "")
         )
 
     def notify(
@@ -449,6 +472,12 @@ class UIStatusMixin:
         else:
             return
 
+        # Footer content depends only on the context and theme colors.
+        render_key = (footer, ctx, self.theme)
+        if self._footer_render_key == render_key:
+            return
+        self._footer_render_key = render_key
+
         left_display, right_display = self._state_machine.get_display_bindings(ctx)
 
         left_bindings = [KeyBinding(b.key, b.label, b.action) for b in left_display]
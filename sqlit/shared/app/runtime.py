@@ -43,6 +43,12 @@ class RuntimeConfig:
     process_worker_warm_on_idle: bool = True
     process_worker_auto_shutdown_s: float = 0.0
     ui_stall_watchdog_ms: float = 0.0
+    result_memory_budget_mb: float = 512.0
+    result_cache_ttl_s: float = 0.0
+    result_cache_budget_mb: float = 64.0
+    schema_index_concurrency: int = 4
+    lob_preview_chars: int = 256
+    limit_pushdown: bool = False
     mock: MockConfig = field(default_factory=MockConfig)
 
     @classmethod
@@ -108,6 +114,14 @@ class RuntimeConfig:
         process_worker_auto_shutdown_s = _parse_float(shutdown_env)
         stall_env = os.environ.get("SQLIT_UI_STALL_WATCHDOG_MS")
         ui_stall_watchdog_ms = _parse_float(stall_env)
+        budget_env = os.environ.get("SQLIT_RESULT_MEMORY_BUDGET_MB", "").strip()
+        result_memory_budget_mb = _parse_float(budget_env) if budget_env else 512.0
+        result_cache_ttl_s = _parse_float(os.environ.get("SQLIT_RESULT_CACHE_TTL_S"))
+        cache_budget_env = os.environ.get("SQLIT_RESULT_CACHE_BUDGET_MB", "").strip()
+        result_cache_budget_mb = _parse_float(cache_budget_env) if cache_budget_env else 64.0
+        schema_index_concurrency = _parse_int(os.environ.get("SQLIT_SCHEMA_INDEX_CONCURRENCY"))
+        lob_preview_chars = _parse_int(os.environ.get("SQLIT_LOB_PREVIEW_CHARS"))
+        limit_pushdown = _parse_bool(os.environ.get("SQLIT_LIMIT_PUSHDOWN"), False)
         missing_drivers = os.environ.get("SQLIT_MOCK_MISSING_DRIVERS", "")
         missing_driver_set = {item.strip() for item in missing_drivers.split(",") if item.strip()}
 
@@ -137,5 +151,11 @@ class RuntimeConfig:
             process_worker_warm_on_idle=process_worker_warm_on_idle,
             process_worker_auto_shutdown_s=process_worker_auto_shutdown_s,
             ui_stall_watchdog_ms=ui_stall_watchdog_ms,
+            result_memory_budget_mb=result_memory_budget_mb,
+            result_cache_ttl_s=result_cache_ttl_s,
+            result_cache_budget_mb=result_cache_budget_mb,
+            schema_index_concurrency=4 if schema_index_concurrency is None else schema_index_concurrency,
+            lob_preview_chars=256 if lob_preview_chars is None else lob_preview_chars,
+            limit_pushdown=limit_pushdown,
             mock=mock_config,
         )
@@ -238,7 +238,7 @@ def build_app_services(
     """Build the default service container for the app."""
     from sqlit.domains.connections.app.credentials import build_credentials_service
     from sqlit.domains.connections.app.session import ConnectionSession
-    from sqlit.domains.connections.app.tunnel import create_ssh_tunnel
+    from sqlit.domains.connections.app.tunnel_broker import get_tunnel_broker
     from sqlit.domains.connections.providers.catalog import get_provider
     from sqlit.domains.connections.store.connections import ConnectionStore
     from sqlit.domains.query.store.history import HistoryStore
@@ -281,7 +281,7 @@ def build_app_services(
     with startup_span("build_provider_factory"):
         provider_factory = _wrap_provider_factory(provider_factory or get_provider, driver_resolver)
     with startup_span("build_tunnel_factory"):
-        tunnel_factory = tunnel_factory or create_ssh_tunnel
+        tunnel_factory = tunnel_factory or get_tunnel_broker().acquire
     with startup_span("build_process_runners"):
         sync_process_runner, async_process_runner = build_process_runners(
             runtime,
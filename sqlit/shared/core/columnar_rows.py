@@ -0,0 +1,283 @@
+"""Compact column-wise storage for query result rows.
+
+Fetched rows are stored one column at a time instead of as a list of
+tuples: integer and float columns go into typed ``array`` buffers with a
+null mask, low-cardinality text is dictionary-encoded (one ``str`` per
+distinct value plus 4-byte codes), and anything else is kept as a plain
+list of values. ``ColumnarRows`` exposes the result as a read-only
+sequence of row tuples, so callers that index or iterate rows keep working.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload
+
+ROW_CHUNK_SIZE = 1024
+
+# Text columns stay dictionary-encoded while distinct values are at most this
+# fraction of the rows (checked once a column has DICT_MIN_ROWS rows).
+DICT_MAX_UNIQUE_RATIO = 0.5
+DICT_MIN_ROWS = 1024
+
+_NoneType = type(None)
+_NULL, _INT, _FLOAT, _STR, _OBJECT = range(5)
+
+
+def _kind_for(types: set[type]) -> int:
+    if not types:
+        return _NULL
+    if types == {int}:
+        return _INT
+    if types == {float}:
+        return _FLOAT
+    if types == {str}:
+        return _STR
+    return _OBJECT
+
+
+class _Column:
+    """One column of values in the most compact encoding that fits."""
+
+    __slots__ = ("_dict_values", "data", "index", "kind", "length", "nulls")
+
+    def __init__(self) -> None:
+        self.kind = _NULL
+        self.length = 0
+        self.data: Any = None
+        self.nulls: bytearray | None = None
+        self.index: dict[Any, int] | None = None
+        self._dict_values: list[Any] | None = None
+
+    def extend(self, values: list[Any]) -> None:
+        if not values:
+            return
+        types = set(map(type, values))
+        has_null = _NoneType in types
+        types.discard(_NoneType)
+        target = _kind_for(types)
+
+        if target != _NULL and target != self.kind and self.kind != _OBJECT:
+            self._become(target if self.kind == _NULL else _OBJECT)
+
+        kind = self.kind
+        if kind == _NULL:
+            self.length += len(values)
+            return
+        if kind == _OBJECT:
+            self.data.extend(values)
+        elif kind == _STR:
+            index = self.index
+            assert index is not None
+            self.data.extend([index.setdefault(value, len(index)) for value in values])
+            self._dict_values = None
+        else:
+            start = self.length
+            clean = [0 if value is None else value for value in values] if has_null else values
+            try:
+                self.data.extend(clean)
+            except (OverflowError, TypeError):
+                self._become(_OBJECT)
+                self.data.extend(values)
+                self.length += len(values)
+                return
+            if has_null:
+                if self.nulls is None:
+                    self.nulls = bytearray(start)
+                self.nulls.extend(value is None for value in values)
+            elif self.nulls is not None:
+                self.nulls.extend(bytes(len(values)))
+        self.length += len(values)
+
+        if kind == _STR and self.length >= DICT_MIN_ROWS:
+            assert self.index is not None
+            if len(self.index) > self.length * DICT_MAX_UNIQUE_RATIO:
+                self._become(_OBJECT)
+
+    def _become(self, kind: int) -> None:
+        """Re-encode existing values for a new column kind."""
+        existing = self.to_list(0, self.length) if self.length else []
+        self.kind = kind
+        self.nulls = None
+        self.index = None
+        self._dict_values = None
+        if kind == _OBJECT:
+            self.data = existing
+            return
+        if kind == _STR:
+            self.index = {}
+            self.data = array("I", [self.index.setdefault(value, len(self.index)) for value in existing])
+            return
+        self.data = array("q" if kind == _INT else "d", bytes(0))
+        if existing:
+            # Only reachable from _NULL, so every existing value is None.
+            self.data.extend([0] * len(existing))
+            self.nulls = bytearray(b"\x01" * len(existing))
+
+    def finish(self) -> None:
+        """Drop a dictionary that turned out not to pay off."""
+        if self.kind == _STR and self.index is not None and self.length:
+            if len(self.index) > self.length * DICT_MAX_UNIQUE_RATIO:
+                self._become(_OBJECT)
+
+    def truncate(self, length: int) -> None:
+        if length >= self.length:
+            return
+        if self.kind != _NULL:
+            del self.data[length:]
+        if self.nulls is not None:
+            del self.nulls[length:]
+        self.length = length
+
+    def value(self, row: int) -> Any:
+        kind = self.kind
+        if kind == _OBJECT:
+            return self.data[row]
+        if kind == _NULL:
+            return None
+        if kind == _STR:
+            return self._values()[self.data[row]]
+        if self.nulls is not None and self.nulls[row]:
+            return None
+        return self.data[row]
+
+    def to_list(self, start: int, stop: int) -> list[Any]:
+        kind = self.kind
+        if kind == _OBJECT:
+            return self.data[start:stop]
+        if kind == _NULL:
+            return [None] * max(0, min(stop, self.length) - start)
+        if kind == _STR:
+            return list(map(self._values().__getitem__, self.data[start:stop]))
+        values = self.data[start:stop].tolist()
+        if self.nulls is None:
+            return values
+        return [None if null else value for value, null in zip(values, self.nulls[start:stop])]
+
+    def _values(self) -> list[Any]:
+        if self._dict_values is None:
+            assert self.index is not None
+            self._dict_values = list(self.index)
+        return self._dict_values
+
+    @property
+    def nbytes(self) -> int:
+        kind = self.kind
+        if kind == _NULL:
+            return 0
+        size = 0 if self.nulls is None else len(self.nulls)
+        if kind in (_INT, _FLOAT, _STR):
+            size += self.data.itemsize * len(self.data)
+        if kind == _STR:
+            assert self.index is not None
+            size += sum(sys.getsizeof(value) for value in self.index) + 100 * len(self.index)
+        if kind == _OBJECT:
+            size += 8 * len(self.data)
+            step = max(1, len(self.data) // 64)
+            sample = self.data[::step][:64]
+            if sample:
+                size += int(sum(sys.getsizeof(value) for value in sample) / len(sample) * len(self.data))
+        return size
+
+
+class ColumnarRows(Sequence[tuple]):
+    """Read-only sequence of row tuples stored column by column."""
+
+    def __init__(self, columns: list[_Column], length: int) -> None:
+        self._columns = columns
+        self._length = length
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]], width: int | None = None) -> ColumnarRows:
+        builder = ColumnarRowsBuilder(width)
+        builder.extend(rows if isinstance(rows, list) else list(rows))
+        return builder.build()
+
+    @property
+    def width(self) -> int:
+        return len(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the column buffers and values."""
+        return sum(column.nbytes for column in self._columns) + 64
+
+    def column_values(self, index: int) -> list[Any]:
+        """All values of one column as a list."""
+        return self._columns[index].to_list(0, self._length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> tuple: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple]: ...
+
+    def __getitem__(self, index: int | slice) -> tuple | list[tuple]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            if stop <= start:
+                return []
+            if not self._columns:
+                return [()] * (stop - start)
+            return list(zip(*(column.to_list(start, stop) for column in self._columns)))
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError("row index out of range")
+        return tuple(column.value(index) for column in self._columns)
+
+    def __iter__(self) -> Iterator[tuple]:
+        for start in range(0, self._length, ROW_CHUNK_SIZE):
+            yield from self[start : start + ROW_CHUNK_SIZE]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(other) == len(self) and all(a == tuple(b) for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ColumnarRows(rows={self._length}, columns={len(self._columns)})"
+
+
+class ColumnarRowsBuilder:
+    """Accumulates fetched row batches into ColumnarRows."""
+
+    def __init__(self, width: int | None = None) -> None:
+        self._width = width
+        self._columns: list[_Column] = [] if width is None else [_Column() for _ in range(width)]
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def extend(self, batch: Sequence[Sequence[Any]]) -> None:
+        if not batch:
+            return
+        if self._width is None:
+            self._width = len(batch[0])
+            self._columns = [_Column() for _ in range(self._width)]
+        if self._width:
+            for column, values in zip(self._columns, zip(*batch)):
+                column.extend(list(values))
+        self._length += len(batch)
+
+    def truncate(self, length: int) -> None:
+        if length >= self._length:
+            return
+        for column in self._columns:
+            column.truncate(length)
+        self._length = length
+
+    def build(self) -> ColumnarRows:
+        for column in self._columns:
+            column.finish()
+        return ColumnarRows(self._columns, self._length)
@@ -0,0 +1,239 @@
+"""Per-phase timing spans for a single query run.
+
+A ``QueryTimings`` is made active for the duration of a query with
+``activate()``. It lives in a context variable, so code running in
+``asyncio.to_thread`` workers started from the same task records into it
+without being passed the object. ``query_span()`` and ``record_query_span()``
+are no-ops when no query is being timed.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any
+
+PHASE_LABELS: dict[str, str] = {
+    "tunnel": "SSH tunnel",
+    "connect": "Connect",
+    "post_connect": "Post-connect",
+    "execute": "Server execute",
+    "fetch": "Fetch",
+    "ipc": "Worker transfer",
+    "history": "History save",
+    "table_build": "Table build",
+    "first_paint": "First paint",
+    "render": "Full render",
+}
+PHASES = tuple(PHASE_LABELS)
+
+_ids = itertools.count(1)
+_CURRENT: ContextVar[QueryTimings | None] = ContextVar("sqlit_query_timings", default=None)
+
+
+@dataclass(frozen=True)
+class TimingSpan:
+    """One timed phase. Offsets are milliseconds from the start of the query.
+
+    ``self_ms`` excludes nested spans recorded on the same thread, e.g.
+    ``fetch`` inside ``execute``.
+    """
+
+    phase: str
+    start_ms: float
+    duration_ms: float
+    self_ms: float
+
+
+class QueryTimings:
+    """Collects timing spans for one query, from any thread."""
+
+    def __init__(
+        self,
+        query: str = "",
+        *,
+        connection: str = "",
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.query_id = next(_ids)
+        self.query = query
+        self.connection = connection
+        self.started_at = time.time()
+        self.status = "ok"
+        self.total_ms: float | None = None
+        self._awaiting: set[str] = set()
+        self._clock = clock
+        self._origin = clock()
+        self._spans: list[TimingSpan] = []
+        self._lock = threading.Lock()
+        self._open = threading.local()
+
+    def elapsed_ms(self) -> float:
+        return (self._clock() - self._origin) * 1000
+
+    @property
+    def spans(self) -> list[TimingSpan]:
+        with self._lock:
+            return list(self._spans)
+
+    @property
+    def finished(self) -> bool:
+        return self.total_ms is not None
+
+    @property
+    def awaiting(self) -> bool:
+        """True while phases that end after the query returns (e.g. rendering) are open."""
+        return bool(self._awaiting)
+
+    def expect(self, phase: str) -> None:
+        """Mark ``phase`` as still to come; see ``done()``."""
+        self._awaiting.add(phase)
+
+    def done(self, phase: str) -> bool:
+        """Close an expected phase. Returns True once no expected phase is left."""
+        self._awaiting.discard(phase)
+        return not self._awaiting
+
+    def _stack(self) -> list[list[float]]:
+        stack = getattr(self._open, "stack", None)
+        if stack is None:
+            stack = []
+            self._open.stack = stack
+        return stack
+
+    @contextmanager
+    def span(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block as ``phase``."""
+        stack = self._stack()
+        start = self.elapsed_ms()
+        frame = [0.0]  # time spent in nested spans
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            duration = self.elapsed_ms() - start
+            self._add(TimingSpan(phase, start, duration, max(0.0, duration - frame[0])))
+
+    def record(self, phase: str, duration_ms: float, *, start_ms: float | None = None) -> None:
+        """Record a phase measured elsewhere, ending now unless ``start_ms`` is given."""
+        duration_ms = max(0.0, float(duration_ms))
+        if start_ms is None:
+            start_ms = max(0.0, self.elapsed_ms() - duration_ms)
+        self._add(TimingSpan(phase, start_ms, duration_ms, duration_ms))
+
+    def record_since(self, phase: str, start_ms: float) -> None:
+        """Record a phase that started at offset ``start_ms`` and ends now."""
+        self.record(phase, self.elapsed_ms() - start_ms, start_ms=start_ms)
+
+    def merge(self, spans: list[dict[str, Any]], *, offset_ms: float) -> None:
+        """Add spans reported by another process, shifted by ``offset_ms``."""
+        for item in spans:
+            try:
+                self._add(
+                    TimingSpan(
+                        str(item["phase"]),
+                        offset_ms + float(item["start_ms"]),
+                        float(item["duration_ms"]),
+                        float(item.get("self_ms", item["duration_ms"])),
+                    )
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def _add(self, span: TimingSpan) -> None:
+        stack = self._stack()
+        if stack:
+            stack[-1][0] += span.duration_ms
+        with self._lock:
+            self._spans.append(span)
+
+    def finish(self, status: str | None = None) -> float:
+        """Freeze the total wall time; later calls return the first total."""
+        if self.total_ms is None:
+            self.total_ms = self.elapsed_ms()
+            if status:
+                self.status = status
+        return self.total_ms
+
+    def phase_totals(self) -> dict[str, float]:
+        """Self time per phase in pipeline order, then any unknown phases."""
+        totals: dict[str, float] = {}
+        for span in self.spans:
+            totals[span.phase] = totals.get(span.phase, 0.0) + span.self_ms
+        ordered = {phase: totals.pop(phase) for phase in PHASES if phase in totals}
+        ordered.update(totals)
+        return ordered
+
+    def as_dict(self) -> dict[str, Any]:
+        total = self.total_ms if self.total_ms is not None else self.elapsed_ms()
+        return {
+            "query_id": self.query_id,
+            "connection": self.connection,
+            "query": self.query,
+            "started_at": self.started_at,
+            "status": self.status,
+            "total_ms": round(total, 3),
+            "phases": {phase: round(ms, 3) for phase, ms in self.phase_totals().items()},
+            "spans": [{key: _round(value) for key, value in asdict(span).items()} for span in self.spans],
+        }
+
+    def to_json_line(self) -> str:
+        return json.dumps(self.as_dict(), ensure_ascii=True, sort_keys=True)
+
+
+def _round(value: Any) -> Any:
+    return round(value, 3) if isinstance(value, float) else value
+
+
+def current_query_timings() -> QueryTimings | None:
+    return _CURRENT.get()
+
+
+@contextmanager
+def activate(timings: QueryTimings | None) -> Iterator[QueryTimings | None]:
+    """Make ``timings`` the active recorder for this context."""
+    token = _CURRENT.set(timings)
+    try:
+        yield timings
+    finally:
+        _CURRENT.reset(token)
+
+
+@contextmanager
+def query_span(phase: str) -> Iterator[None]:
+    """Time the enclosed block on the active query, if any."""
+    timings = _CURRENT.get()
+    if timings is None:
+        yield
+        return
+    with timings.span(phase):
+        yield
+
+
+def record_query_span(phase: str, duration_ms: float) -> None:
+    """Record a phase that just ended on the active query, if any."""
+    timings = _CURRENT.get()
+    if timings is not None:
+        timings.record(phase, duration_ms)
+
+
+def format_breakdown(timings: QueryTimings, *, width: int = 30) -> str:
+    """Render phase self-times as aligned lines with proportional bars."""
+    totals = timings.phase_totals()
+    total = timings.total_ms if timings.total_ms is not None else timings.elapsed_ms()
+    scale = max([total, *totals.values()]) or 1.0
+    label_width = max([len(PHASE_LABELS.get(phase, phase)) for phase in totals] + [len("Total")])
+    lines = []
+    for phase, ms in totals.items():
+        bar = "█" * max(1 if ms > 0 else 0, round(ms / scale * width))
+        label = PHASE_LABELS.get(phase, phase)
+        lines.append(f"{label:<{label_width}}  {ms:9.1f} ms  {bar}")
+    lines.append(f"{'Total':<{label_width}}  {total:9.1f} ms")
+    return "\n".join(lines)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 
 def fuzzy_match(pattern: str, text: str) -> tuple[bool, list[int]]:
     """Check if pattern fuzzy matches text and return matched indices.
@@ -74,3 +76,15 @@ def format_duration_ms(ms: float, *, always_seconds: bool = False) -> str:
         return f"{ms:.0f}ms"
     else:
         return f"{ms:.2f}ms"
+
+
+def unique_column_names(columns: Sequence[str]) -> list[str]:
+    """Suffix repeated column names (``id``, ``id_2``) so every column is addressable."""
+    seen: dict[str, int] = {}
+    names = []
+    for column in columns:
+        name = str(column) or "column"
+        count = seen.get(name.lower(), 0) + 1
+        seen[name.lower()] = count
+        names.append(name if count == 1 else f"{name}_{count}")
+    return names
@@ -25,6 +25,7 @@ class SchemaCacheStateProtocol(Protocol):
     _schema_total_jobs: int
     _schema_completed_jobs: int
     _schema_scheduler: Any
+    _schema_indexer: Any | None
     _db_object_cache: dict[str, dict[str, list[Any]]]
 
 
@@ -69,6 +69,9 @@ class ConnectionActionsProtocol(Protocol):
     def _populate_credentials_if_missing(self, config: ConnectionConfig) -> None:
         ...
 
+    def _get_selected_connection_configs(self) -> list[ConnectionConfig]:
+        ...
+
     def _connect_with_db_password_check(self, config: ConnectionConfig) -> None:
         ...
 
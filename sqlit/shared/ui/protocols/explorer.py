@@ -10,6 +10,7 @@ class ExplorerStateProtocol(Protocol):
     _loading_nodes: set[str]
     _schema_service: Any | None
     _schema_service_session: Any | None
+    _preview_prefetcher: Any | None
     _tree_filter_visible: bool
     _tree_filter_text: str
     _tree_filter_query: str
@@ -23,6 +23,9 @@ class QueryStateProtocol(Protocol):
     _query_handle: Any | None
     _query_service: Any | None
     _query_service_db_type: str | None
+    _query_result_cache: Any | None
+    _query_cache_bypass_once: bool
+    _last_cached_query: str | None
     _cancellable_query: Any | None
     _query_spinner: Spinner | None
     _process_worker_client: Any | None
@@ -35,6 +38,12 @@ class QueryStateProtocol(Protocol):
     _transaction_executor_config: Any | None
     _results_render_worker: Worker[Any] | None
     _results_render_token: int
+    _stacked_results_auto_collapse: bool
+    _query_timings_history: list[Any]
+    _lob_preview_plan: Any | None
+    _query_target: str
+    _query_job_manager: Any | None
+    _fan_out_query: Any | None
 
 
 class QueryActionsProtocol(Protocol):
@@ -68,13 +77,149 @@ class QueryActionsProtocol(Protocol):
         ...
 
     def _display_query_results(
-        self, columns: list[str], rows: list[tuple[Any, ...]], row_count: int, truncated: bool, elapsed_ms: float
+        self,
+        columns: list[str],
+        rows: list[tuple[Any, ...]],
+        row_count: int,
+        truncated: bool,
+        elapsed_ms: float,
+        *,
+        cache_age_s: float | None = None,
+    ) -> Awaitable[None]:
+        ...
+
+    def _get_query_result_cache(self) -> Any | None:
+        ...
+
+    def _invalidate_query_result_cache(self, config: Any) -> None:
+        ...
+
+    def _save_query_history(self, service: Any, connection_name: str, query: str) -> Awaitable[None]:
+        ...
+
+    def _finish_query_timings(self, timings: Any, *, status: str | None = None) -> None:
+        ...
+
+    def _set_query_target(self, target: str) -> None:
+        ...
+
+    def _run_results_query_async(self, query: str, keep_insert_mode: bool) -> Awaitable[None]:
+        ...
+
+    def _plan_lob_preview(self, query: str, config: Any) -> Awaitable[Any | None]:
+        ...
+
+    def _apply_lob_preview(self, plan: Any | None, result: Any) -> Any:
+        ...
+
+    def _resolve_query_config(self, provider: Any, config: Any) -> Any:
+        ...
+
+    def _display_statement_result(self, result: Any, elapsed_ms: float) -> Awaitable[None]:
+        ...
+
+    def _serve_cached_query(
+        self, service: Any, config: Any, query: str, run_query: str, max_rows: int, lob_plan: Any | None
+    ) -> Awaitable[bool]:
+        ...
+
+    def _get_query_process_worker(self, provider: Any, statements: list[str]) -> Awaitable[Any | None]:
+        ...
+
+    def _run_query_in_process_worker(
+        self,
+        client: Any,
+        service: Any,
+        config: Any,
+        query: str,
+        run_query: str,
+        max_rows: int,
+        lob_plan: Any | None,
+        timings: Any,
+    ) -> Awaitable[bool]:
+        ...
+
+    def _run_script_statements(
+        self,
+        service: Any,
+        config: Any,
+        provider: Any,
+        query: str,
+        statements: list[str],
+        max_rows: int,
+        start_time: float,
     ) -> Awaitable[None]:
         ...
 
+    def _run_multi_statements(
+        self, service: Any, executor: Any, config: Any, query: str, max_rows: int, start_time: float
+    ) -> Awaitable[None]:
+        ...
+
+    def _run_single_statement(
+        self,
+        service: Any,
+        executor: Any,
+        config: Any,
+        query: str,
+        run_query: str,
+        max_rows: int,
+        lob_plan: Any | None,
+        start_time: float,
+    ) -> Awaitable[None]:
+        ...
+
+    def _track_results_paint(self, timings: Any, *, render_pending: bool) -> None:
+        ...
+
+    def _cancel_results_render(self) -> None:
+        ...
+
+    def _render_arrow_results_table(self, columns: list[str], arrow_table: Any, render_token: int) -> bool:
+        ...
+
+    def _render_results_table_incremental(
+        self,
+        columns: list[str],
+        rows: list[tuple[Any, ...]],
+        *,
+        escape: bool,
+        row_limit: int,
+        render_token: int,
+        timings: Any | None = None,
+    ) -> Awaitable[bool]:
+        ...
+
     def _display_non_query_result(self, affected: int, elapsed_ms: float) -> None:
         ...
 
+    def _get_query_job_manager(self) -> Any:
+        ...
+
+    def _running_query_job_count(self) -> int:
+        ...
+
+    def _on_query_job_changed(self, job: Any) -> None:
+        ...
+
+    def _handle_query_job_change(self, job: Any) -> None:
+        ...
+
+    def _query_job_config(self) -> Any:
+        ...
+
+    def _open_query_job(self, job_id: int) -> None:
+        ...
+
+    def _reattach_query_job(self, job_id: int) -> None:
+        ...
+
+    async def _run_fan_out_async(self, fan_out: Any) -> None:
+        ...
+
+    def _display_fan_out_results(self, result: Any, sql: str) -> None:
+        ...
+
     def _restore_insert_mode(self) -> None:
         ...
 
@@ -204,6 +349,15 @@ class QueryActionsProtocol(Protocol):
     def _display_multi_statement_results(self, multi_result: Any, elapsed_ms: float) -> None:
         ...
 
+    def _begin_stacked_results(self, statement_count: int) -> None:
+        ...
+
+    def _append_stacked_results(self, start_index: int, results: list[Any]) -> None:
+        ...
+
+    def _finish_multi_statement_results(self, multi_result: Any, elapsed_ms: float) -> None:
+        ...
+
     def _get_stacked_results_container(self) -> Any:
         ...
 
@@ -5,8 +5,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
     from textual.timer import Timer
 
+    from sqlit.domains.results.diff import ResultDiff
+    from sqlit.domains.results.pending_edits import PendingEdits
+    from sqlit.domains.results.store import ResultStore, StoredResult
+    from sqlit.domains.results.workspace import ResultsWorkspace, WorkspaceResult
     from sqlit.shared.ui.widgets import SqlitDataTable
 
 
@@ -34,10 +40,38 @@ class ResultsStateProtocol(Protocol):
     _tooltip_showing: bool
     _tooltip_timer: Any | None
     _value_view_active: bool
+    _result_store: ResultStore | None
+    _results_workspace: ResultsWorkspace | None
+    _last_result_handle: StoredResult | None
+    _last_result_cached_rows: Sequence[tuple[Any, ...]] | None
+    _last_result_cache_age_s: float | None
+    _results_sort: tuple[int, bool] | None
+    _results_sort_base: Sequence[tuple[Any, ...]] | None
+    _results_sort_view: Sequence[tuple[Any, ...]] | None
+    _pinned_result: WorkspaceResult | None
+    _pending_edits: PendingEdits | None
+    _pending_edits_table: SqlitDataTable | None
     MAX_FILTER_MATCHES: int
 
 
 class ResultsActionsProtocol(Protocol):
+    def _get_result_store(self) -> ResultStore:
+        ...
+
+    def _retain_last_result(self, columns: list[str], rows: Sequence[tuple[Any, ...]]) -> Sequence[tuple[Any, ...]]:
+        ...
+
+    def _release_last_result(self) -> None:
+        ...
+
+    def _get_results_workspace(self) -> ResultsWorkspace:
+        ...
+
+    def _register_workspace_result(
+        self, columns: list[str], rows: Sequence[tuple[Any, ...]], label: str = ""
+    ) -> str | None:
+        ...
+
     def _copy_text(self, text: str) -> bool:
         ...
 
@@ -147,6 +181,52 @@ class ResultsActionsProtocol(Protocol):
     def _show_cell_tooltip(self, table: SqlitDataTable, coordinate: Any, value: Any) -> None:
         ...
 
+    def _with_full_cell_value(self, value: Any, on_value: Callable[[Any], None]) -> None:
+        ...
+
+    def _results_cursor_column(self, table: Any) -> int | None:
+        ...
+
+    def _show_sorted_results(
+        self,
+        base: Sequence[tuple[Any, ...]],
+        sorted_result: tuple[int, bool, Sequence[tuple[Any, ...]]] | None,
+        columns: list[str],
+        cursor_column: int,
+    ) -> None:
+        ...
+
+    def _render_sorted_results(
+        self, labels: list[str], rows: Sequence[tuple[Any, ...]], cursor_column: int
+    ) -> Awaitable[None]:
+        ...
+
+    def _diff_results(
+        self, old_name: str | None = None, new_name: str | None = None, key: list[str] | None = None
+    ) -> None:
+        ...
+
+    def _find_diff_result(self, name: str) -> WorkspaceResult | None:
+        ...
+
+    def _show_result_diff(self, diff: ResultDiff, old: WorkspaceResult, new: WorkspaceResult) -> None:
+        ...
+
+    def _pending_edit_count(self) -> int:
+        ...
+
+    def _get_pending_edits(self, table: SqlitDataTable, columns: list[str]) -> PendingEdits | None:
+        ...
+
+    def _refresh_pending_edits(self) -> None:
+        ...
+
+    def action_commit_pending_edits(self) -> None:
+        ...
+
+    def action_discard_pending_edits(self) -> None:
+        ...
+
 
 class ResultsProtocol(ResultsStateProtocol, ResultsActionsProtocol, Protocol):
     """Composite protocol for results-related mixins."""
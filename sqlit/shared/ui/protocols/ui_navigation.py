@@ -22,6 +22,7 @@ class UIStateProtocol(Protocol):
     _leader_pending: bool
     _leader_pending_menu: str
     _last_active_pane: str | None
+    _footer_render_key: tuple[Any, ...] | None
     _state_machine: Any
     _active_database: str | None
     _query_target_database: str | None
@@ -0,0 +1,81 @@
+"""Modal progress screen for bulk data imports."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Label, ProgressBar
+
+
+class ImportProgressScreen(ModalScreen[None]):
+    """Screen showing import progress with row count and throughput."""
+
+    BINDINGS = [
+        Binding("escape", "cancel", "Cancel", show=False, priority=True),
+    ]
+
+    def __init__(self, title: str, *, on_cancel: Callable[[], None] | None = None):
+        super().__init__()
+        self.title_text = title
+        self._on_cancel = on_cancel
+        self._cancel_requested = False
+
+    def compose(self) -> ComposeResult:
+        yield Vertical(
+            Label(self.title_text, id="import-title"),
+            ProgressBar(total=100, show_eta=False, id="import-progress"),
+            Label("Starting...", id="import-status"),
+            Label("Esc to cancel", id="import-hint"),
+            classes="import-dialog",
+        )
+
+    CSS = """
+    ImportProgressScreen {
+        align: center middle;
+    }
+
+    .import-dialog {
+        background: $surface;
+        padding: 1 2;
+        width: 60;
+        height: auto;
+        border: solid $primary;
+    }
+
+    #import-title {
+        text-style: bold;
+        margin-bottom: 1;
+    }
+
+    #import-hint {
+        color: $text-muted;
+    }
+    """
+
+    def update_progress(self, progress: Any) -> None:
+        """Show an ``ImportProgress`` snapshot."""
+        if self._cancel_requested:
+            return
+        try:
+            self.query_one("#import-progress", ProgressBar).update(progress=progress.fraction * 100)
+            self.query_one("#import-status", Label).update(
+                f"{progress.rows:,} rows  {progress.rows_per_second:,.0f} rows/s"
+            )
+        except Exception:
+            pass
+
+    def action_cancel(self) -> None:
+        if self._cancel_requested:
+            return
+        self._cancel_requested = True
+        if self._on_cancel is not None:
+            self._on_cancel()
+        try:
+            self.query_one("#import-status", Label).update("Cancelling...")
+        except Exception:
+            pass
@@ -1,17 +1,39 @@
-"""JSON tree viewer widget for sqlit."""
+"""JSON tree viewer widget for sqlit.
+
+Nodes are built lazily: a container gets its children only when it is first
+expanded, and arrays or objects with more than ``JSON_TREE_PAGE_SIZE`` entries
+are split into page nodes ("items 0-999", ...). Documents larger than
+``JSON_STREAM_THRESHOLD`` characters are decoded on a worker thread one
+top-level entry at a time, so the top level shows up before the rest of the
+document has been decoded.
+"""
 
 from __future__ import annotations
 
 import ast
 import json
+import re
+from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass
+from itertools import islice
 from typing import Any
 
 from rich.highlighter import ReprHighlighter
 from rich.text import Text
+from textual.message import Message
 from textual.widgets import Tree
 from textual.widgets.tree import TreeNode
 
+JSON_TREE_PAGE_SIZE = 1000
+JSON_STREAM_THRESHOLD = 256 * 1024
+JSON_STREAM_BATCH_SIZE = 200
+JSON_EXPAND_ALL_MAX_NODES = 10_000
+JSON_EXPAND_ALL_STEP = 200
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
 
 def parse_json_value(value: str) -> tuple[bool, dict | list | None]:
     """Parse a string as JSON and return (is_json, parsed_value).
@@ -39,12 +61,95 @@ def parse_json_value(value: str) -> tuple[bool, dict | list | None]:
     return False, None
 
 
+def probe_json_value(value: str) -> tuple[bool, dict | list | None]:
+    """Like ``parse_json_value`` but defers parsing of large documents.
+
+    Values over ``JSON_STREAM_THRESHOLD`` characters that start like JSON
+    return ``(True, None)``; ``JSONTreeView.set_json`` parses the raw string
+    off the UI thread and posts ``JSONTreeView.InvalidJSON`` if it is not JSON.
+    """
+    if len(value) > JSON_STREAM_THRESHOLD:
+        return value.lstrip()[:1] in ("{", "["), None
+    return parse_json_value(value)
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    return _WHITESPACE.match(text, pos).end()  # type: ignore[union-attr]
+
+
+def decode_top_level(text: str, *, batch_size: int = JSON_STREAM_BATCH_SIZE) -> tuple[str, Iterator[list[tuple[Any, Any]]]]:
+    """Decode the top-level container of a JSON document incrementally.
+
+    Returns ``(kind, batches)`` where ``kind`` is ``"object"`` or ``"array"``
+    and ``batches`` yields lists of ``(key, value)`` pairs (the index for
+    arrays) as each top-level entry is decoded. Nested values are decoded by
+    the C scanner in one go. Raises ``ValueError`` if the document is not a
+    JSON object or array; malformed content raises while iterating.
+    """
+    start = _skip_whitespace(text, 0)
+    opener = text[start : start + 1]
+    if opener not in ("{", "["):
+        raise ValueError("Expecting a JSON object or array")
+    is_object = opener == "{"
+    closer = "}" if is_object else "]"
+
+    def batches() -> Iterator[list[tuple[Any, Any]]]:
+        pos = _skip_whitespace(text, start + 1)
+        batch: list[tuple[Any, Any]] = []
+        index = 0
+        if text.startswith(closer, pos):
+            pos += 1
+        else:
+            while True:
+                key: Any = index
+                if is_object:
+                    if not text.startswith('"', pos):
+                        raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, pos)
+                    key, pos = json.decoder.scanstring(text, pos + 1)  # type: ignore[attr-defined]
+                    pos = _skip_whitespace(text, pos)
+                    if not text.startswith(":", pos):
+                        raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+                    pos = _skip_whitespace(text, pos + 1)
+                value, pos = _DECODER.raw_decode(text, pos)
+                batch.append((key, value))
+                index += 1
+                pos = _skip_whitespace(text, pos)
+                if text.startswith(",", pos):
+                    pos = _skip_whitespace(text, pos + 1)
+                elif text.startswith(closer, pos):
+                    pos += 1
+                    break
+                else:
+                    raise json.JSONDecodeError(f"Expecting ',' or '{closer}' delimiter", text, pos)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if _skip_whitespace(text, pos) != len(text):
+            raise json.JSONDecodeError("Extra data", text, pos)
+        if batch:
+            yield batch
+
+    return ("object" if is_object else "array"), batches()
+
+
 @dataclass
 class JSONNodeData:
     """Data stored in each tree node."""
 
-    key: str | None  # The key/index for this node (None for root)
-    value: Any  # The actual value at this node
+    key: str | None  # The key/index for this node (None for root and pages)
+    value: Any  # The actual value at this node (the whole container for pages)
+    page: tuple[int, int] | None = None  # [start, end) entries shown by a page node
+    loaded: bool = False  # Children have been created
+
+    @property
+    def resolved_value(self) -> Any:
+        """The value this node stands for; a page resolves to its slice."""
+        if self.page is None:
+            return self.value
+        start, end = self.page
+        if isinstance(self.value, dict):
+            return dict(islice(self.value.items(), start, end))
+        return self.value[start:end]
 
 
 class JSONTreeView(Tree[JSONNodeData]):
@@ -74,6 +179,9 @@ class JSONTreeView(Tree[JSONNodeData]):
     }
     """
 
+    class InvalidJSON(Message):
+        """Posted when a document parsed off the UI thread turns out not to be JSON."""
+
     def __init__(
         self,
         label: str = "JSON",
@@ -82,60 +190,211 @@ class JSONTreeView(Tree[JSONNodeData]):
         classes: str | None = None,
     ) -> None:
         super().__init__(label, id=id, classes=classes)
-        self._raw_json: str = ""
+        self._raw_json: str | None = ""
+        self._source: Any = None
         self._highlighter = ReprHighlighter()
+        self._generation = 0
+        self._expand_token = 0
+        self._label = label
+        self._streaming = False
+        self._stream_paged = False
+        self._stream_pages = 0
 
     def set_json(self, data: str | dict | list, label: str = "JSON") -> None:
-        """Set JSON data to display in the tree."""
-        self._raw_json = data if isinstance(data, str) else json.dumps(data)
+        """Set JSON data to display in the tree.
+
+        Strings longer than ``JSON_STREAM_THRESHOLD`` are decoded on a worker
+        thread; the top-level entries appear as they are decoded.
+        """
+        self._generation += 1
+        self._expand_token += 1
+        self._streaming = False
+        self._label = label
 
         if isinstance(data, str):
+            self._raw_json = data
+            if len(data) > JSON_STREAM_THRESHOLD:
+                self._start_stream(data, label)
+                return
             try:
                 data = json.loads(data)
             except (json.JSONDecodeError, ValueError):
                 self.root.set_label(Text("Invalid JSON", style="red"))
                 return
+        else:
+            self._raw_json = None
+            self._source = data
 
+        self._show(data, label)
+
+    def _show(self, data: Any, label: str) -> None:
         self.clear()
-        self.root.set_label(Text(f"{{}} {label}" if isinstance(data, dict) else f"[] {label}"))
+        self.root.set_label(self._root_label(data, label))
         self.root.data = JSONNodeData(key=None, value=data)
-        self._add_json_node(self.root, data)
+        self._populate(self.root)
         self.root.expand()
 
-    def _add_json_node(self, node: TreeNode[JSONNodeData], data: Any, key: str | None = None) -> None:
-        """Recursively add JSON data to tree nodes."""
-        if isinstance(data, dict):
-            if key is not None:
-                label = Text.assemble(Text("{} ", style="bold cyan"), Text(key))
-                child = node.add(label, data=JSONNodeData(key=key, value=data))
-            else:
-                child = node
-            for k, v in data.items():
-                self._add_json_node(child, v, k)
-        elif isinstance(data, list):
-            if key is not None:
-                label = Text.assemble(
-                    Text("[] ", style="bold magenta"),
-                    Text(key),
-                    Text(f" ({len(data)})", style="dim"),
-                )
-                child = node.add(label, data=JSONNodeData(key=key, value=data))
-            else:
-                child = node
-            for i, v in enumerate(data):
-                self._add_json_node(child, v, f"[{i}]")
+    @staticmethod
+    def _root_label(data: Any, label: str, *, loading: bool = False) -> Text:
+        text = Text(f"{{}} {label}" if isinstance(data, dict) else f"[] {label}")
+        if loading:
+            text.append(" (loading…)", style="dim")
+        return text
+
+    def _populate(self, node: TreeNode[JSONNodeData]) -> int:
+        """Create the children of ``node`` if not done yet; return how many were added."""
+        data = node.data
+        if data is None or data.loaded or not isinstance(data.value, dict | list):
+            return 0
+        data.loaded = True
+        container = data.value
+        is_dict = isinstance(container, dict)
+        if data.page is None:
+            start, end = 0, len(container)
+            if end > JSON_TREE_PAGE_SIZE:
+                for page_start in range(0, end, JSON_TREE_PAGE_SIZE):
+                    self._add_page(node, container, page_start, min(page_start + JSON_TREE_PAGE_SIZE, end))
+                return len(node.children)
         else:
-            if key is not None:
-                value_text = self._format_value(data)
-                label = Text.assemble(
-                    Text(f"{key}", style="bold"),
-                    Text(": ", style="dim"),
-                    value_text,
-                )
-                leaf = node.add_leaf(label, data=JSONNodeData(key=key, value=data))
-                leaf.allow_expand = False
+            start, end = data.page
+        if is_dict:
+            entries: Any = islice(container.items(), start, end)
+        else:
+            entries = zip(range(start, end), islice(container, start, end), strict=False)
+        added = 0
+        for key, value in entries:
+            self._add_entry(node, key, value)
+            added += 1
+        return added
+
+    def _add_page(self, node: TreeNode[JSONNodeData], container: Any, start: int, end: int) -> None:
+        noun = "keys" if isinstance(container, dict) else "items"
+        label = Text.assemble(Text("… ", style="bold yellow"), Text(f"{noun} {start}-{end - 1}", style="dim"))
+        node.add(label, data=JSONNodeData(key=None, value=container, page=(start, end)))
+
+    def _add_entry(self, node: TreeNode[JSONNodeData], key: Any, value: Any) -> None:
+        """Add one child for ``key``; containers get their own children on expand."""
+        if not isinstance(key, str):
+            key = f"[{key}]"
+        if isinstance(value, dict):
+            label = Text.assemble(Text("{} ", style="bold cyan"), Text(key))
+            node.add(label, data=JSONNodeData(key=key, value=value), allow_expand=bool(value))
+        elif isinstance(value, list):
+            label = Text.assemble(
+                Text("[] ", style="bold magenta"),
+                Text(key),
+                Text(f" ({len(value)})", style="dim"),
+            )
+            node.add(label, data=JSONNodeData(key=key, value=value), allow_expand=bool(value))
+        else:
+            label = Text.assemble(
+                Text(f"{key}", style="bold"),
+                Text(": ", style="dim"),
+                self._format_value(value),
+            )
+            leaf = node.add_leaf(label, data=JSONNodeData(key=key, value=value, loaded=True))
+            leaf.allow_expand = False
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded[JSONNodeData]) -> None:
+        if event.node.tree is self:
+            self._populate(event.node)
+
+    def _start_stream(self, text: str, label: str) -> None:
+        """Decode ``text`` on a worker thread, adding top-level entries as they arrive."""
+        generation = self._generation
+        self._streaming = True
+        self.clear()
+        self.root.data = None
+        self.root.set_label(Text(f"Parsing {label}…", style="dim"))
+
+        def call(callback: Any, *args: Any) -> bool:
+            if generation != self._generation:
+                return False
+            try:
+                self.app.call_from_thread(callback, generation, *args)
+            except Exception:
+                return False
+            return True
+
+        def work() -> None:
+            try:
+                kind, batches = decode_top_level(text)
+                if not call(self._begin_stream, {} if kind == "object" else []):
+                    return
+                for batch in batches:
+                    if not call(self._append_stream_batch, batch):
+                        return
+            except ValueError:
+                # Python-literal dicts and lists are not streamable JSON.
+                is_json, parsed = parse_json_value(text)
+                call(self._end_stream, parsed if is_json else None, not is_json)
+                return
+            call(self._end_stream, None, False)
+
+        self.run_worker(work, thread=True, exclusive=True, group="json-tree-parse", exit_on_error=False)
+
+    def _begin_stream(self, generation: int, container: dict | list) -> None:
+        if generation != self._generation:
+            return
+        self._stream_paged = False
+        self._stream_pages = 0
+        self._source = container
+        self.clear()
+        self.root.set_label(self._root_label(container, self._label, loading=True))
+        self.root.data = JSONNodeData(key=None, value=container, loaded=True)
+        self.root.expand()
+
+    def _append_stream_batch(self, generation: int, batch: list[tuple[Any, Any]]) -> None:
+        if generation != self._generation or self.root.data is None:
+            return
+        container = self.root.data.value
+        for key, value in batch:
+            if isinstance(container, dict):
+                container[key] = value
             else:
-                node.add_leaf(self._format_value(data), data=JSONNodeData(key=None, value=data))
+                container.append(value)
+        if not self._stream_paged and len(container) > JSON_TREE_PAGE_SIZE:
+            # Too many entries to list directly: switch the root to pages.
+            self.root.remove_children()
+            self._stream_paged = True
+        if self._stream_paged:
+            self._add_stream_pages(final=False)
+        else:
+            for key, value in batch:
+                self._add_entry(self.root, key, value)
+
+    def _add_stream_pages(self, *, final: bool) -> None:
+        """Add page nodes for pages that are complete (or all pages when ``final``)."""
+        container = self.root.data.value  # type: ignore[union-attr]
+        count = len(container)
+        while self._stream_pages * JSON_TREE_PAGE_SIZE < count:
+            start = self._stream_pages * JSON_TREE_PAGE_SIZE
+            end = min(start + JSON_TREE_PAGE_SIZE, count)
+            if end - start < JSON_TREE_PAGE_SIZE and not final:
+                break
+            self._add_page(self.root, container, start, end)
+            self._stream_pages += 1
+
+    def _end_stream(self, generation: int, parsed: Any, failed: bool) -> None:
+        if generation != self._generation:
+            return
+        self._streaming = False
+        if failed:
+            self.clear()
+            self.root.set_label(Text("Invalid JSON", style="red"))
+            self.post_message(self.InvalidJSON())
+        elif parsed is not None:
+            self._source = parsed
+            self._show(parsed, self._label)
+        elif self.root.data is not None:
+            if self._stream_paged:
+                self._add_stream_pages(final=True)
+            self.root.set_label(self._root_label(self.root.data.value, self._label))
+
+    @property
+    def is_loading(self) -> bool:
+        """Whether a large document is still being decoded."""
+        return self._streaming
 
     def _format_value(self, value: Any) -> Text:
         """Format a leaf value with syntax highlighting."""
@@ -155,17 +414,44 @@ class JSONTreeView(Tree[JSONNodeData]):
             return self._highlighter(repr(value))
 
     def action_expand_all(self) -> None:
-        """Expand all nodes in the tree."""
+        """Expand nodes breadth-first, a few hundred per refresh.
+
+        Stops after creating ``JSON_EXPAND_ALL_MAX_NODES`` nodes, and is
+        cancelled by ``cancel_expand_all``, ``action_collapse_all`` or new data.
+        """
+        self._expand_token += 1
+        token = self._expand_token
+        queue: deque[TreeNode[JSONNodeData]] = deque([self.root])
+        budget = JSON_EXPAND_ALL_MAX_NODES
+
+        def step() -> None:
+            nonlocal budget
+            if token != self._expand_token:
+                return
+            expanded = 0
+            while queue and budget > 0 and expanded < JSON_EXPAND_ALL_STEP:
+                node = queue.popleft()
+                budget -= self._populate(node)
+                node.expand()
+                queue.extend(child for child in node.children if child.allow_expand)
+                expanded += 1
+            if queue and budget > 0:
+                self.set_timer(0.01, step)
+            elif queue:
+                self.notify(
+                    f"Expanded the first {JSON_EXPAND_ALL_MAX_NODES:,} nodes; expand the rest individually",
+                    timeout=3,
+                )
 
-        def expand_recursive(node: TreeNode[JSONNodeData]) -> None:
-            node.expand()
-            for child in node.children:
-                expand_recursive(child)
+        step()
 
-        expand_recursive(self.root)
+    def cancel_expand_all(self) -> None:
+        """Stop an expand-all that is still in progress."""
+        self._expand_token += 1
 
     def action_collapse_all(self) -> None:
         """Collapse all nodes except root."""
+        self.cancel_expand_all()
 
         def collapse_recursive(node: TreeNode[JSONNodeData]) -> None:
             for child in node.children:
@@ -178,6 +464,8 @@ class JSONTreeView(Tree[JSONNodeData]):
     @property
     def raw_json(self) -> str:
         """Get the raw JSON string for copying."""
+        if self._raw_json is None:
+            self._raw_json = json.dumps(self._source)
         return self._raw_json
 
     def get_cursor_key(self) -> str | None:
@@ -192,7 +480,7 @@ class JSONTreeView(Tree[JSONNodeData]):
         node = self.cursor_node
         if node is None or node.data is None:
             return None
-        return node.data.value
+        return node.data.resolved_value
 
     def get_cursor_value_json(self) -> str:
         """Get the value of the currently selected node as JSON string."""
@@ -207,9 +495,9 @@ class JSONTreeView(Tree[JSONNodeData]):
         if node is None or node.data is None:
             return None
         key = node.data.key
-        value = node.data.value
+        value = node.data.resolved_value
         if key is None:
-            # Root node - just return the value
+            # Root or page node - just return the value
             return json.dumps(value, indent=2, ensure_ascii=False)
         # Check if key is an array index like [0]
         if key.startswith("[") and key.endswith("]"):
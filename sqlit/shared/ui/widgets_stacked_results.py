@@ -12,6 +12,7 @@ from .widgets_tables import SqlitDataTable
 if TYPE_CHECKING:
     from sqlit.domains.query.app.multi_statement import StatementResult
     from sqlit.domains.query.app.query_service import QueryResult
+    from sqlit.domains.results.store import ResultStore
 
 # Maximum characters for statement in title
 MAX_STATEMENT_TITLE_LENGTH = 60
@@ -143,10 +144,13 @@ class StackedResultsContainer(VerticalScroll):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._section_count = 0
+        self.result_store: ResultStore | None = None
 
     def clear_results(self) -> None:
         """Remove all result sections."""
         for child in list(self.children):
+            if self.result_store is not None and isinstance(child, ResultSection):
+                self.result_store.release_rows(child.result_rows)
             child.remove()
         self._section_count = 0
 
@@ -156,8 +160,8 @@ class StackedResultsContainer(VerticalScroll):
         index: int,
         *,
         auto_collapse: bool = False,
-    ) -> None:
-        """Add a result section for a statement result."""
+    ) -> ResultSection:
+        """Add a result section for a statement result and return it."""
         from sqlit.domains.query.app.query_service import QueryResult
 
         # Build the content widget first
@@ -169,6 +173,8 @@ class StackedResultsContainer(VerticalScroll):
                 # SELECT result - build a DataTable
                 result_columns, result_rows = self._get_result_table_data(stmt_result.result)
                 content = self._build_result_table_from_rows(result_columns, result_rows, index)
+                if self.result_store is not None:
+                    result_rows = self.result_store.put(result_columns, result_rows)
             else:
                 # Non-query result (INSERT/UPDATE/DELETE)
                 content = NonQueryDisplay(stmt_result.result.rows_affected)
@@ -189,6 +195,7 @@ class StackedResultsContainer(VerticalScroll):
 
         self.mount(section)
         self._section_count += 1
+        return section
 
     def _get_result_table_data(self, result: QueryResult) -> tuple[list[str], list[tuple]]:
         """Normalize QueryResult into columns/rows for display."""
@@ -27,6 +27,16 @@ class SqlitDataTable(FastDataTable):
 
     # Track if a manual tooltip is being shown (via 'v' key)
     _manual_tooltip_active: bool = False
+    # Staged edits drawn over the data: values by (row, column), and deleted rows
+    _pending_cells: dict[tuple[int, int], Any] = {}
+    _pending_deleted_rows: set[int] = set()
+
+    def set_pending_edits(self, cells: dict[tuple[int, int], Any], deleted_rows: set[int]) -> None:
+        """Highlight staged cell values and rows marked for deletion."""
+        self._pending_cells = cells
+        self._pending_deleted_rows = deleted_rows
+        self._update_count += 1
+        self.refresh()
 
     def _set_tooltip_from_cell_at(self, coordinate: Any) -> None:
         """Override to disable hover tooltips entirely."""
@@ -41,6 +51,38 @@ class SqlitDataTable(FastDataTable):
         # Call parent implementation
         super().action_copy_selection()
 
+    def append_arrow_batch(self, batch: Any) -> int:
+        """Append a pre-built Arrow table or record batch to an Arrow-backed table.
+
+        The batch must have the backend's column types. Columns are chunked
+        rather than copied, and content widths are widened using only the new
+        rows instead of being re-measured over the whole table.
+        """
+        import pyarrow as pa
+
+        backend = self.backend
+        if backend is None or not isinstance(getattr(backend, "data", None), pa.Table):
+            raise TypeError("append_arrow_batch requires an Arrow-backed table")
+        if isinstance(batch, pa.RecordBatch):
+            batch = pa.Table.from_batches([batch])
+        # The backend may have renamed duplicate column names.
+        batch = batch.rename_columns(backend.data.column_names)
+        widths = list(backend._column_content_widths)
+        backend.data = pa.concat_tables([backend.data, batch])
+        if widths:
+            backend._column_content_widths = [
+                max(width, backend._measure(column) or 0) for width, column in zip(widths, batch.columns)
+            ]
+
+        self._require_update_dimensions = True
+        self.cursor_coordinate = self.cursor_coordinate
+        cell_now_available = self.row_count == batch.num_rows > 0 and len(self.ordered_columns) > 0
+        if cell_now_available and self.show_cursor and self.cursor_type != "none":
+            self._highlight_cursor()
+        self._update_count += 1
+        self.check_idle()
+        return int(batch.num_rows)
+
     def render_line(self, y: int) -> Strip:
         width, _ = self.size
         scroll_x, scroll_y = self.scroll_offset
@@ -63,10 +105,34 @@ class SqlitDataTable(FastDataTable):
         if row_index == -1:
             return self.ordered_columns[column_index].label
 
-        datum = self.get_cell_at(Coordinate(row=row_index, column=column_index))
         column = self.ordered_columns[column_index]
+        if row_index in self._pending_deleted_rows:
+            datum = self.get_cell_at(Coordinate(row=row_index, column=column_index))
+            return self._pending_text(self._format_cell(datum, column), "strike red")
+        if (row_index, column_index) in self._pending_cells:
+            datum = self._pending_cells[(row_index, column_index)]
+            return self._pending_text(self._format_cell(datum, column), "bold yellow")
+
+        datum = self.get_cell_at(Coordinate(row=row_index, column=column_index))
         return self._format_cell(datum, column)
 
+    @staticmethod
+    def _pending_text(renderable: Any, style: str) -> Any:
+        alignment = None
+        if isinstance(renderable, Align):
+            alignment = renderable.align
+            renderable = renderable.renderable
+        if isinstance(renderable, str):
+            try:
+                renderable = Text.from_markup(renderable)  # _format_cell escapes markup
+            except MarkupError:
+                renderable = Text(renderable)
+        if not isinstance(renderable, Text):
+            return renderable
+        text = renderable.copy()
+        text.stylize(style)
+        return Align(text, align=alignment) if alignment else text
+
     def _format_cell(self, obj: object, col: Any | None) -> Any:
         if obj is None:
             return self._format_null()
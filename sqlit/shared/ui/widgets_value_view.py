@@ -10,7 +10,7 @@ from textual.app import ComposeResult
 from textual.containers import Container, VerticalScroll
 from textual.widgets import Static
 
-from sqlit.shared.ui.widgets_json_tree import JSONTreeView, parse_json_value
+from sqlit.shared.ui.widgets_json_tree import JSONTreeView, probe_json_value
 
 
 class InlineValueView(Container):
@@ -70,7 +70,7 @@ class InlineValueView(Container):
         """Set the value to display."""
         self._raw_value = value
         self._column_name = column_name
-        self._is_json, self._parsed_json = parse_json_value(value)
+        self._is_json, self._parsed_json = probe_json_value(value)
         self._rebuild()
 
     def toggle_view_mode(self) -> None:
@@ -101,12 +101,14 @@ class InlineValueView(Container):
             static_widget = self.query_one("#value-content", Static)
             tree_widget = self.query_one("#json-tree", JSONTreeView)
 
-            if self._is_json and self._tree_mode and self._parsed_json is not None:
+            if self._is_json and self._tree_mode:
                 scroll_widget.add_class("hidden")
                 tree_widget.remove_class("hidden")
 
                 label = self._column_name or "JSON"
-                tree_widget.set_json(self._parsed_json, label)
+                # Large documents arrive unparsed; the tree decodes them off the UI thread.
+                source = self._parsed_json if self._parsed_json is not None else self._raw_value
+                tree_widget.set_json(source, label)
                 tree_widget.focus()
             else:
                 tree_widget.add_class("hidden")
@@ -126,6 +128,8 @@ class InlineValueView(Container):
         if self._is_json and self._parsed_json is not None:
             formatted = json.dumps(self._parsed_json, indent=2, ensure_ascii=False)
             return Syntax(formatted, "json", theme="ansi_dark", word_wrap=True)
+        if self._is_json:
+            return self._raw_value
 
         wrap_width = max(self.size.width - 4, 20) if self.size.width > 0 else 100
         if len(self._raw_value) > wrap_width and "\n" not in self._raw_value:
@@ -133,6 +137,12 @@ class InlineValueView(Container):
 
         return self._raw_value
 
+    def on_jsontree_view_invalid_json(self, event: JSONTreeView.InvalidJSON) -> None:
+        """Fall back to the plain text view when a large value was not JSON."""
+        event.stop()
+        self._is_json = False
+        self._rebuild()
+
     def on_resize(self, event: Any) -> None:
         """Re-wrap text when widget is resized."""
         if self.is_visible and not self._tree_mode:
@@ -0,0 +1,90 @@
+"""Performance tests comparing tuple-based and Arrow-backed query results.
+
+Run with: pytest tests/performance/test_arrow_result_path.py -v -s
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from sqlit.domains.query.app.arrow_rows import ArrowRowView  # noqa: E402
+from sqlit.domains.shell.app.main import SSMSTUI  # noqa: E402
+
+from ..ui.mocks import MockConnectionStore, MockSettingsStore, build_test_services, create_test_connection  # noqa: E402
+
+ROW_COUNT = 100_000
+
+
+def _arrow_table(count: int) -> pa.Table:
+    ids = pa.array(range(count), type=pa.int64())
+    return pa.table(
+        {
+            "id": ids,
+            "name": pa.array([f"user-{i}" for i in range(count)]),
+            "score": pa.array([i * 0.5 for i in range(count)]),
+        }
+    )
+
+
+def _peak_bytes(build) -> tuple[object, int]:
+    tracemalloc.start()
+    try:
+        value = build()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return value, peak
+
+
+def _build_app() -> SSMSTUI:
+    services = build_test_services(
+        connection_store=MockConnectionStore([create_test_connection("perf-test", "sqlite")]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    return SSMSTUI(services=services)
+
+
+class TestArrowResultMemory:
+    def test_row_view_is_smaller_than_tuples(self):
+        """Holding an Arrow view should cost far less Python heap than tuple rows."""
+        table = _arrow_table(ROW_COUNT)
+
+        _tuples, tuple_peak = _peak_bytes(lambda: list(zip(*(c.to_pylist() for c in table.columns))))
+        _view, view_peak = _peak_bytes(lambda: ArrowRowView(table))
+
+        print(f"\n  tuples: {tuple_peak / 1e6:.1f}MB  arrow view: {view_peak / 1e6:.3f}MB (python heap)")
+        assert view_peak * 10 < tuple_peak
+
+
+class TestArrowResultRendering:
+    @pytest.mark.asyncio
+    async def test_render_time_tuple_vs_arrow(self):
+        """Compare time-to-table for tuple rows and an Arrow-backed result."""
+        table = _arrow_table(ROW_COUNT)
+        columns = list(table.column_names)
+        tuple_rows = list(zip(*(c.to_pylist() for c in table.columns)))
+        arrow_rows = ArrowRowView(table)
+
+        app = _build_app()
+        async with app.run_test(size=(120, 50)) as pilot:
+            await pilot.pause()
+            timings: dict[str, float] = {}
+            for label, rows in (("tuples", tuple_rows), ("arrow", arrow_rows)):
+                start = time.perf_counter()
+                await app._display_query_results(
+                    columns=columns,
+                    rows=rows,
+                    row_count=len(rows),
+                    truncated=False,
+                    elapsed_ms=0,
+                )
+                await pilot.pause()
+                timings[label] = (time.perf_counter() - start) * 1000
+                assert app.results_table.row_count > 0
+
+        print(f"\n  first paint: tuples {timings['tuples']:.1f}ms, arrow {timings['arrow']:.1f}ms")
@@ -0,0 +1,73 @@
+"""Benchmark for bulk file import.
+
+Compares BulkImporter with executing one committed INSERT per CSV row, which
+is what running generated INSERTs statement by statement amounts to. The
+per-row path is timed on a sample and extrapolated.
+
+Run with: pytest tests/performance/test_bulk_import_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import csv
+import sqlite3
+import time
+
+import pytest
+
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.query.app.bulk_import import BulkImporter
+
+IMPORT_ROWS = 100_000
+BASELINE_SAMPLE = 2_000
+
+
+def _write_csv(path, rows: int) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "name", "score"])
+        writer.writerows((i, f"name-{i}", i * 0.5) for i in range(rows))
+
+
+def _connect(db_type: str, path: str):
+    if db_type == "duckdb":
+        duckdb = pytest.importorskip("duckdb")
+        return duckdb.connect(path)
+    return sqlite3.connect(path)
+
+
+@pytest.mark.parametrize("db_type", ["sqlite", "duckdb"])
+def test_bulk_import_throughput(db_type, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    _write_csv(csv_path, IMPORT_ROWS)
+    timings: dict[str, float] = {}
+
+    for label in ("row inserts", "bulk import"):
+        conn = _connect(db_type, str(tmp_path / f"{label.replace(' ', '_')}.db"))
+        conn.execute("CREATE TABLE t (id INTEGER, name VARCHAR, score DOUBLE)")
+        conn.commit()
+
+        start = time.perf_counter()
+        if label == "row inserts":
+            cursor = conn.cursor()
+            with open(csv_path, encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                next(reader)
+                for _, row in zip(range(BASELINE_SAMPLE), reader):
+                    cursor.execute("INSERT INTO t (id, name, score) VALUES (?, ?, ?)", row)
+                    conn.commit()
+            expected = BASELINE_SAMPLE
+        else:
+            BulkImporter(get_provider(db_type)).run(conn, csv_path, "t")
+            expected = IMPORT_ROWS
+        timings[label] = (time.perf_counter() - start) / expected
+
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == expected
+        conn.close()
+
+    speedup = timings["row inserts"] / timings["bulk import"]
+    print(
+        f"\n  {db_type}: row inserts {1 / timings['row inserts']:,.0f} rows/s"
+        f"  bulk import {1 / timings['bulk import']:,.0f} rows/s  speedup {speedup:.0f}x"
+    )
+    assert speedup > 5
@@ -0,0 +1,66 @@
+"""Benchmark for key press dispatch throughput.
+
+Holds j/k on a large results grid by feeding Key events straight into
+SSMSTUI.on_key, followed by the footer refresh the UI performs after actions.
+The uncached run rebuilds the InputContext and the footer on every call,
+which is how dispatch behaved before the context cache.
+
+Run with: pytest tests/performance/test_key_dispatch_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from textual.events import Key
+
+from sqlit.domains.shell.app.main import SSMSTUI
+
+from ..ui.mocks import MockConnectionStore, MockSettingsStore, build_test_services
+
+KEY_PRESSES = 2000
+RESULT_ROWS = 10_000
+
+
+def _press_keys(app: SSMSTUI, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        key = "j" if i % 2 == 0 else "k"
+        app.on_key(Key(key, key))
+        app._update_footer_bindings()
+    return count / (time.perf_counter() - start)
+
+
+@pytest.mark.asyncio
+async def test_key_dispatch_throughput(monkeypatch):
+    services = build_test_services(
+        connection_store=MockConnectionStore(),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    app = SSMSTUI(services=services)
+
+    async with app.run_test(size=(120, 50)) as pilot:
+        await pilot.pause()
+        rows = [(i, f"name-{i}") for i in range(RESULT_ROWS)]
+        await app._display_query_results(
+            columns=["id", "name"], rows=rows, row_count=len(rows), truncated=False, elapsed_ms=0
+        )
+        await pilot.pause()
+        app.results_table.focus()
+        await pilot.pause()
+
+        cached = _press_keys(app, KEY_PRESSES)
+
+        footer_update = app._update_footer_bindings
+
+        def rebuild_footer() -> None:
+            app._footer_render_key = None
+            footer_update()
+
+        monkeypatch.setattr(app, "_get_input_context", app._build_input_context)
+        monkeypatch.setattr(app, "_update_footer_bindings", rebuild_footer)
+        uncached = _press_keys(app, KEY_PRESSES)
+
+    print(f"\n  uncached {uncached:,.0f} keys/s  cached {cached:,.0f} keys/s  speedup {cached / uncached:.1f}x")
+    assert cached > uncached * 1.5
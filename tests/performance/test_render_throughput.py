@@ -0,0 +1,116 @@
+"""Render throughput and main-thread pauses for large tuple results.
+
+Compares appending Python rows on the UI thread (the previous incremental
+path) with appending Arrow batches built on a worker thread.
+
+Run with: pytest tests/performance/test_render_throughput.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from sqlit.domains.query.ui.mixins.query_results import (
+    RESULTS_RENDER_CHUNK_SIZE,
+    RESULTS_RENDER_INITIAL_ROWS,
+)
+from sqlit.domains.shell.app.main import SSMSTUI
+
+from ..ui.mocks import MockConnectionStore, MockSettingsStore, build_test_services, create_test_connection
+
+ROW_COUNT = 20_000
+COLUMNS = ["id", "name", "email", "amount", "created_at"]
+
+
+def _rows(count: int) -> list[tuple]:
+    return [
+        (i, f"user-{i}", f"user{i}@example.com", Decimal(f"{i}.{i % 100:02d}"), f"2024-01-{i % 28 + 1:02d}")
+        for i in range(count)
+    ]
+
+
+def _build_app() -> SSMSTUI:
+    services = build_test_services(
+        connection_store=MockConnectionStore([create_test_connection("perf-test", "sqlite")]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    return SSMSTUI(services=services)
+
+
+class _PauseProbe:
+    """Measures the longest gap between event loop turns while running."""
+
+    def __init__(self) -> None:
+        self.worst_ms = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    async def _tick(self) -> None:
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            self.worst_ms = max(self.worst_ms, (now - last) * 1000)
+            last = now
+
+    def __enter__(self) -> _PauseProbe:
+        self._task = asyncio.get_running_loop().create_task(self._tick())
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+
+async def _wait_for_rows(app: SSMSTUI, pilot, count: int, timeout_s: float = 60.0) -> None:
+    deadline = time.perf_counter() + timeout_s
+    while app.results_table.row_count < count and time.perf_counter() < deadline:
+        await pilot.pause(0.001)
+
+
+async def _render_python_rows(app: SSMSTUI, pilot, rows: list[tuple]) -> None:
+    """Previous path: build the table from Python rows, then add_rows per chunk on the UI thread."""
+    initial = rows[:RESULTS_RENDER_INITIAL_ROWS]
+    table = app._build_results_table(COLUMNS, [tuple(str(v) for v in row) for row in initial], escape=True)
+    app._replace_results_table_with_table(table)
+    await pilot.pause()
+    for start in range(RESULTS_RENDER_INITIAL_ROWS, len(rows), RESULTS_RENDER_CHUNK_SIZE):
+        batch = [tuple(str(v) for v in row) for row in rows[start : start + RESULTS_RENDER_CHUNK_SIZE]]
+        table.add_rows(batch)
+        await asyncio.sleep(0)
+
+
+class TestRenderThroughput:
+    @pytest.mark.asyncio
+    async def test_rows_per_second_and_worst_pause(self):
+        rows = _rows(ROW_COUNT)
+        app = _build_app()
+        results: dict[str, tuple[float, float]] = {}
+
+        async with app.run_test(size=(120, 50)) as pilot:
+            await pilot.pause()
+
+            with _PauseProbe() as probe:
+                start = time.perf_counter()
+                await _render_python_rows(app, pilot, rows)
+                await _wait_for_rows(app, pilot, ROW_COUNT)
+                elapsed = time.perf_counter() - start
+            assert app.results_table.row_count == ROW_COUNT
+            results["python rows"] = (ROW_COUNT / elapsed, probe.worst_ms)
+
+            with _PauseProbe() as probe:
+                start = time.perf_counter()
+                await app._display_query_results(COLUMNS, rows, ROW_COUNT, False, 0)
+                await _wait_for_rows(app, pilot, ROW_COUNT)
+                elapsed = time.perf_counter() - start
+            assert app.results_table.row_count == ROW_COUNT
+            results["arrow batches"] = (ROW_COUNT / elapsed, probe.worst_ms)
+
+        for label, (rows_per_s, worst_ms) in results.items():
+            print(f"\n  {label}: {rows_per_s:,.0f} rows/s, worst main-thread pause {worst_ms:.1f}ms")
+        assert results["arrow batches"][0] > 0
@@ -0,0 +1,91 @@
+"""Benchmark for running large INSERT scripts.
+
+Compares the per-statement path (one connection per statement through
+TransactionExecutor) with ScriptRunner (one connection, multi-row INSERTs).
+The per-statement path is timed on a sample and extrapolated, since a full
+10k-statement run takes minutes on DuckDB.
+
+Run with: pytest tests/performance/test_script_runner_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.query.app.multi_statement import MultiStatementExecutor, split_statements
+from sqlit.domains.query.app.script_runner import ScriptRunner
+from sqlit.domains.query.app.transaction import TransactionExecutor
+
+SCRIPT_STATEMENTS = 10_000
+BASELINE_SAMPLE = 100
+
+
+def _script(count: int) -> str:
+    return ";\n".join(
+        f"INSERT INTO t (id, name, score) VALUES ({i}, 'name-{i}', {i * 0.5})" for i in range(count)
+    )
+
+
+def _create_database(db_type: str, path: str) -> None:
+    if db_type == "duckdb":
+        duckdb = pytest.importorskip("duckdb")
+        conn = duckdb.connect(path)
+    else:
+        conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE t (id INTEGER, name VARCHAR, score DOUBLE)")
+    conn.commit()
+    conn.close()
+
+
+def _row_count(db_type: str, path: str) -> int:
+    if db_type == "duckdb":
+        import duckdb
+
+        conn = duckdb.connect(path)
+    else:
+        conn = sqlite3.connect(path)
+    try:
+        return int(conn.execute("SELECT COUNT(*) FROM t").fetchone()[0])
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("db_type", ["sqlite", "duckdb"])
+def test_insert_script_throughput(db_type, tmp_path):
+    provider = get_provider(db_type)
+    timings: dict[str, float] = {}
+
+    for label, count in (("per-statement", BASELINE_SAMPLE), ("script runner", SCRIPT_STATEMENTS)):
+        path = str(tmp_path / f"{label.replace(' ', '_')}.db")
+        _create_database(db_type, path)
+        config = ConnectionConfig.from_dict({"name": "bench", "db_type": db_type, "file_path": path})
+        script = _script(count)
+
+        start = time.perf_counter()
+        if label == "per-statement":
+            executor = TransactionExecutor(config=config, provider=provider)
+            try:
+                result = MultiStatementExecutor(executor).execute(script)
+            finally:
+                executor.close()
+        else:
+            result = ScriptRunner(config, provider).run(split_statements(script))
+        elapsed = time.perf_counter() - start
+
+        assert result.completed and not result.has_error
+        assert _row_count(db_type, path) == count
+        timings[label] = elapsed / count
+
+    speedup = timings["per-statement"] / timings["script runner"]
+    print(
+        f"\n  {db_type}: per-statement {timings['per-statement'] * 1e3:.3f}ms/stmt"
+        f" (~{timings['per-statement'] * SCRIPT_STATEMENTS:.1f}s for {SCRIPT_STATEMENTS})"
+        f"  script runner {timings['script runner'] * 1e3:.3f}ms/stmt"
+        f" ({timings['script runner'] * SCRIPT_STATEMENTS:.2f}s)  speedup {speedup:.0f}x"
+    )
+    assert speedup > 5
@@ -0,0 +1,84 @@
+"""Tests for the cached input context and footer refresh."""
+
+from __future__ import annotations
+
+import pytest
+
+from sqlit.core.vim import VimMode
+from sqlit.domains.shell.app.main import SSMSTUI
+
+from ..mocks import MockConnectionStore, MockSettingsStore, build_test_services
+
+
+def _make_app() -> SSMSTUI:
+    services = build_test_services(
+        connection_store=MockConnectionStore(),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    return SSMSTUI(services=services)
+
+
+class TestInputContextCache:
+    @pytest.mark.asyncio
+    async def test_context_is_reused_until_an_input_changes(self):
+        app = _make_app()
+
+        async with app.run_test(size=(100, 35)) as pilot:
+            app.action_focus_query()
+            await pilot.pause()
+
+            ctx = app._get_input_context()
+            assert app._get_input_context() is ctx
+            assert ctx.focus == "query"
+
+            app.vim_mode = VimMode.INSERT
+            insert_ctx = app._get_input_context()
+            assert insert_ctx is not ctx
+            assert insert_ctx.vim_mode == VimMode.INSERT
+
+            app._last_result_columns = ["id"]
+            app._last_result_rows = [(1,)]
+            assert app._get_input_context().has_results
+
+            app.action_focus_explorer()
+            await pilot.pause()
+            assert app._get_input_context().focus == "explorer"
+
+    @pytest.mark.asyncio
+    async def test_context_tracks_modal_screens(self):
+        from sqlit.shared.ui.screens.message import MessageScreen
+
+        app = _make_app()
+
+        async with app.run_test(size=(100, 35)) as pilot:
+            assert not app._get_input_context().modal_open
+            app.push_screen(MessageScreen("Title", "Body"))
+            await pilot.pause()
+            assert app._get_input_context().modal_open
+            app.pop_screen()
+            await pilot.pause()
+            assert not app._get_input_context().modal_open
+
+    @pytest.mark.asyncio
+    async def test_footer_is_only_rebuilt_when_context_changes(self, monkeypatch):
+        app = _make_app()
+
+        async with app.run_test(size=(100, 35)) as pilot:
+            await pilot.pause()
+            calls: list[object] = []
+            original = app._state_machine.get_display_bindings
+
+            def counting(ctx):
+                calls.append(ctx)
+                return original(ctx)
+
+            monkeypatch.setattr(app._state_machine, "get_display_bindings", counting)
+
+            app._update_footer_bindings()
+            calls.clear()
+            app._update_footer_bindings()
+            assert calls == []
+
+            app.vim_mode = VimMode.INSERT if app.vim_mode == VimMode.NORMAL else VimMode.NORMAL
+            app._update_footer_bindings()
+            assert calls and calls[-1].vim_mode == app.vim_mode
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from sqlit.core.key_router import resolve_action
 from sqlit.core.keymap import (
     ActionKeyDef,
     LeaderCommandDef,
@@ -10,8 +11,10 @@ from sqlit.core.keymap import (
     set_keymap,
 )
 from sqlit.core.leader_commands import get_leader_commands
+from sqlit.core.vim import VimMode
 
 from .conftest import MockKeymapProvider
+from .test_state_machine import make_context
 
 
 class TestKeymapProvider:
@@ -84,3 +87,47 @@ class TestKeymapProvider:
 
         reset_keymap()
         assert get_keymap().leader("quit") == default_quit_key
+
+
+class TestKeyDispatchTable:
+    """Test the precompiled key dispatch table."""
+
+    def test_resolve_follows_keymap_order_within_active_contexts(self):
+        set_keymap(
+            MockKeymapProvider(
+                action_keys=[
+                    ActionKeyDef("d", "delete_connection", "tree"),
+                    ActionKeyDef("d", "delete_row", "results"),
+                    ActionKeyDef("d", "fallback_d", None),
+                ]
+            )
+        )
+
+        tree_ctx = make_context(focus="explorer", vim_mode=VimMode.NORMAL)
+        results_ctx = make_context(focus="results", vim_mode=VimMode.NORMAL)
+        assert resolve_action("d", tree_ctx, is_allowed=lambda _name: True) == "delete_connection"
+        assert resolve_action("d", results_ctx, is_allowed=lambda _name: True) == "delete_row"
+        assert resolve_action("d", results_ctx, is_allowed=lambda name: name != "delete_row") == "fallback_d"
+        assert resolve_action("x", results_ctx, is_allowed=lambda _name: True) is None
+
+    def test_action_key_lookups_use_primary_keys_first(self):
+        set_keymap(
+            MockKeymapProvider(
+                action_keys=[
+                    ActionKeyDef("delete", "delete_connection", "tree", primary=False),
+                    ActionKeyDef("d", "delete_connection", "tree"),
+                    ActionKeyDef("d", "delete_row", "results"),
+                ]
+            )
+        )
+
+        keymap = get_keymap()
+        assert keymap.action("delete_connection") == "d"
+        assert keymap.keys_for_action("delete_connection") == ["d", "delete"]
+        assert keymap.keys_for_action("delete_connection", include_secondary=False) == ["d"]
+        assert keymap.actions_for_key("d") == ["delete_connection", "delete_row"]
+        assert keymap.action("missing") is None
+
+    def test_dispatch_table_is_compiled_once(self):
+        keymap = get_keymap()
+        assert keymap.dispatch_table() is keymap.dispatch_table()
@@ -2,7 +2,20 @@
 
 from __future__ import annotations
 
-from sqlit.shared.ui.widgets_json_tree import parse_json_value
+import asyncio
+import json
+
+import pytest
+from textual.app import App, ComposeResult
+
+from sqlit.shared.ui import widgets_json_tree
+from sqlit.shared.ui.widgets_json_tree import (
+    JSON_TREE_PAGE_SIZE,
+    JSONTreeView,
+    decode_top_level,
+    parse_json_value,
+    probe_json_value,
+)
 
 
 class TestParseJsonValue:
@@ -49,3 +62,144 @@ class TestParseJsonValue:
         is_json, parsed = parse_json_value("   \n\t  ")
         assert is_json is False
         assert parsed is None
+
+
+class TestDecodeTopLevel:
+    """Tests for the incremental top-level decoder used for large documents."""
+
+    def test_object_entries_are_batched(self):
+        text = json.dumps({f"k{i}": {"n": i} for i in range(5)})
+        kind, batches = decode_top_level(text, batch_size=2)
+        chunks = list(batches)
+        assert kind == "object"
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert chunks[0][1] == ("k1", {"n": 1})
+
+    def test_array_entries_are_indexed(self):
+        kind, batches = decode_top_level(" [1, [2, 3], {\"a\": null}] ")
+        assert kind == "array"
+        assert [entry for chunk in batches for entry in chunk] == [(0, 1), (1, [2, 3]), (2, {"a": None})]
+
+    def test_empty_containers(self):
+        assert list(decode_top_level("{}")[1]) == []
+        assert list(decode_top_level("[ ]")[1]) == []
+
+    @pytest.mark.parametrize("text", ['{"a": 1,}', '[1 2]', '{"a": 1} x', "{'a': 1}"])
+    def test_malformed_documents_raise(self, text):
+        _, batches = decode_top_level(text)
+        with pytest.raises(ValueError):
+            list(batches)
+
+    def test_scalar_document_is_rejected(self):
+        with pytest.raises(ValueError):
+            decode_top_level("42")
+
+
+def test_probe_defers_large_documents(monkeypatch):
+    monkeypatch.setattr(widgets_json_tree, "JSON_STREAM_THRESHOLD", 10)
+    assert probe_json_value('  {"a": [1, 2, 3, 4]}') == (True, None)
+    assert probe_json_value("plain text that is long") == (False, None)
+    assert probe_json_value("[1]") == (True, [1])
+
+
+class _TreeApp(App):
+    def compose(self) -> ComposeResult:
+        yield JSONTreeView("JSON", id="tree")
+
+
+class TestLazyTree:
+    """The tree builds children on expand and pages large containers."""
+
+    @pytest.mark.asyncio
+    async def test_children_are_built_on_expand(self):
+        app = _TreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one(JSONTreeView)
+            tree.set_json({"outer": {"inner": {"leaf": 1}}, "n": 2})
+            outer = tree.root.children[0]
+            assert [child.data.key for child in tree.root.children] == ["outer", "n"]
+            assert len(outer.children) == 0
+            outer.expand()
+            await pilot.pause()
+            assert [child.data.key for child in outer.children] == ["inner"]
+            assert len(outer.children[0].children) == 0
+
+    @pytest.mark.asyncio
+    async def test_large_arrays_are_paged(self):
+        app = _TreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one(JSONTreeView)
+            data = list(range(JSON_TREE_PAGE_SIZE * 2 + 5))
+            tree.set_json({"items": data})
+            items = tree.root.children[0]
+            items.expand()
+            await pilot.pause()
+            pages = [child.data.page for child in items.children]
+            assert pages == [(0, 1000), (1000, 2000), (2000, 2005)]
+            last = items.children[2]
+            last.expand()
+            await pilot.pause()
+            assert [child.data.key for child in last.children] == [f"[{i}]" for i in range(2000, 2005)]
+            tree.move_cursor(last)
+            assert json.loads(tree.get_cursor_value_json()) == [2000, 2001, 2002, 2003, 2004]
+
+    @pytest.mark.asyncio
+    async def test_expand_all_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(widgets_json_tree, "JSON_EXPAND_ALL_MAX_NODES", 50)
+        app = _TreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one(JSONTreeView)
+            tree.set_json([[[i, i + 1] for i in range(20)] for _ in range(20)])
+            tree.action_expand_all()
+            for _ in range(20):
+                await pilot.pause()
+            created = 0
+            stack = list(tree.root.children)
+            while stack:
+                node = stack.pop()
+                created += 1
+                stack.extend(node.children)
+            assert created < 200
+
+    @pytest.mark.asyncio
+    async def test_collapse_cancels_expand_all(self, monkeypatch):
+        monkeypatch.setattr(widgets_json_tree, "JSON_EXPAND_ALL_STEP", 1)
+        app = _TreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one(JSONTreeView)
+            tree.set_json({f"k{i}": {"v": [i]} for i in range(30)})
+            tree.action_expand_all()
+            tree.action_collapse_all()
+            await asyncio.sleep(0.1)
+            await pilot.pause()
+            assert not any(child.is_expanded for child in tree.root.children)
+
+    @pytest.mark.asyncio
+    async def test_large_document_streams_off_the_ui_thread(self, monkeypatch):
+        monkeypatch.setattr(widgets_json_tree, "JSON_STREAM_THRESHOLD", 100)
+        app = _TreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one(JSONTreeView)
+            document = {f"key{i}": {"nested": list(range(i))} for i in range(JSON_TREE_PAGE_SIZE + 10)}
+            tree.set_json(json.dumps(document), "audit")
+            for _ in range(200):
+                await pilot.pause()
+                if not tree.is_loading:
+                    break
+            assert not tree.is_loading
+            assert tree.root.data.value == document
+            assert [child.data.page for child in tree.root.children] == [(0, 1000), (1000, 1010)]
+            assert str(tree.root.label) == "{} audit"
+
+    @pytest.mark.asyncio
+    async def test_invalid_large_document_posts_message(self, monkeypatch):
+        monkeypatch.setattr(widgets_json_tree, "JSON_STREAM_THRESHOLD", 10)
+        app = _TreeApp()
+        async with app.run_test() as pilot:
+            tree = app.query_one(JSONTreeView)
+            tree.set_json('{"not": "finished"')
+            for _ in range(100):
+                await pilot.pause()
+                if not tree.is_loading:
+                    break
+            assert str(tree.root.label) == "Invalid JSON"
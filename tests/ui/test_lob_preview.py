@@ -0,0 +1,68 @@
+"""UI tests for table previews with large columns truncated server-side."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.shell.app.main import SSMSTUI
+from sqlit.shared.ui.widgets import InlineValueView
+
+from .mocks import MockConnectionStore, MockSettingsStore, build_test_services
+
+
+@pytest.mark.asyncio
+async def test_preview_truncates_and_view_fetches_full_value(tmp_path):
+    db_path = tmp_path / "db.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE docs (id INTEGER PRIMARY KEY, body TEXT)")
+    conn.execute("INSERT INTO docs VALUES (1, ?), (2, 'short')", ("y" * 4000,))
+    conn.commit()
+
+    config = ConnectionConfig.from_dict({"name": "local", "db_type": "sqlite", "file_path": str(db_path)})
+    services = build_test_services(
+        connection_store=MockConnectionStore([config]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    services.runtime.process_worker = False
+    services.runtime.lob_preview_chars = 50
+    app = SSMSTUI(services=services)
+    provider = get_provider("sqlite")
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        app.current_config = config
+        app.current_provider = provider
+        app.current_connection = conn
+        query = provider.dialect.build_select_query("docs", 100)
+        app._last_query_table = {
+            "database": None,
+            "schema": None,
+            "name": "docs",
+            "columns": provider.schema_inspector.get_columns(conn, "docs"),
+            "query": query,
+        }
+
+        await app._run_query_async(query, False)
+        await pilot.pause()
+
+        assert app._last_result_columns == ["id", "body"]
+        assert app._last_result_rows[0][1] == "y" * 50
+        assert app._lob_preview_plan is not None
+
+        table = app.results_table
+        table.focus()
+        table.move_cursor(row=0, column=1)
+        app.action_view_cell_full()
+        value_view = app.query_one("#value-view", InlineValueView)
+        for _ in range(100):
+            if value_view.value:
+                break
+            await asyncio.sleep(0.01)
+            await pilot.pause()
+
+        assert value_view.value == "y" * 4000
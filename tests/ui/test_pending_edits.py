@@ -0,0 +1,119 @@
+"""UI tests for staging grid edits and committing them in one transaction."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.results.ui.screens.cell_edit import CellEditScreen
+from sqlit.domains.shell.app.main import SSMSTUI
+
+from .mocks import MockConnectionStore, MockSettingsStore, build_test_services
+
+
+def _app(tmp_path) -> tuple[SSMSTUI, sqlite3.Connection]:
+    db_path = tmp_path / "db.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO t VALUES (?, ?)", [(1, "a"), (2, "b"), (3, "c")])
+    conn.commit()
+
+    config = ConnectionConfig.from_dict({"name": "local", "db_type": "sqlite", "file_path": str(db_path)})
+    services = build_test_services(
+        connection_store=MockConnectionStore([config]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    services.runtime.process_worker = False
+    app = SSMSTUI(services=services)
+    app.current_config = config
+    return app, conn
+
+
+async def _open_table(app: SSMSTUI, conn: sqlite3.Connection) -> None:
+    provider = get_provider("sqlite")
+    app.current_provider = provider
+    app.current_connection = conn
+    query = provider.dialect.build_select_query("t", 100)
+    app._last_query_table = {
+        "database": None,
+        "schema": None,
+        "name": "t",
+        "columns": provider.schema_inspector.get_columns(conn, "t"),
+        "query": query,
+    }
+    app.query_input.text = query
+    await app._run_query_async(query, False)
+
+
+async def _commit(app: SSMSTUI, pilot, remaining_rows: int) -> None:
+    app.action_commit_pending_edits()
+    for _ in range(200):
+        if app._last_result_rows and len(app._last_result_rows) == remaining_rows:
+            break
+        await asyncio.sleep(0.01)
+        await pilot.pause()
+
+
+@pytest.mark.asyncio
+async def test_staged_edits_commit_together(tmp_path):
+    app, conn = _app(tmp_path)
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        await _open_table(app, conn)
+        await pilot.pause()
+
+        table = app.results_table
+        table.focus()
+        table.move_cursor(row=1, column=1)
+        app.action_stage_cell_edit()
+        await pilot.pause()
+        assert isinstance(app.screen, CellEditScreen)
+        app.screen.dismiss("B")
+        await pilot.pause()
+        table.move_cursor(row=2, column=0)
+        app.action_stage_row_delete()
+        await pilot.pause()
+
+        assert app._pending_edit_count() == 2
+        assert table._pending_cells == {(1, 1): "B"}
+        assert table._pending_deleted_rows == {2}
+        assert conn.execute("SELECT name FROM t WHERE id = 2").fetchone() == ("b",)
+
+        await _commit(app, pilot, 2)
+
+        assert conn.execute("SELECT id, name FROM t ORDER BY id").fetchall() == [(1, "a"), (2, "B")]
+        assert list(app._last_result_rows) == [(1, "a"), (2, "B")]
+        assert app._pending_edit_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_sort_is_refused_while_edits_are_pending(tmp_path):
+    app, conn = _app(tmp_path)
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        await _open_table(app, conn)
+        await pilot.pause()
+
+        table = app.results_table
+        table.focus()
+        table.move_cursor(row=2, column=0)
+        app.action_stage_row_delete()
+        await pilot.pause()
+
+        app.action_sort_results_column()
+        await pilot.pause()
+
+        assert app._results_sort is None
+        assert app.results_table is table
+        assert app._pending_edit_count() == 1
+
+        await _commit(app, pilot, 2)
+
+        assert conn.execute("SELECT id FROM t ORDER BY id").fetchall() == [(1,), (2,)]
+        assert app._pending_edit_count() == 0
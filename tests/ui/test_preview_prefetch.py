@@ -0,0 +1,90 @@
+"""UI tests for speculative table preview prefetch."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.explorer.domain.tree_nodes import TableNode
+from sqlit.domains.explorer.ui.tree import preview_prefetch
+from sqlit.domains.shell.app.main import SSMSTUI
+
+from .mocks import MockConnectionStore, MockSettingsStore, build_test_services
+
+
+@pytest.mark.asyncio
+async def test_highlighted_table_preview_is_served_from_prefetch(tmp_path):
+    db_path = tmp_path / "db.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER)")
+    conn.execute("INSERT INTO t VALUES (1)")
+    conn.commit()
+
+    config = ConnectionConfig.from_dict({"name": "local", "db_type": "sqlite", "file_path": str(db_path)})
+    services = build_test_services(
+        connection_store=MockConnectionStore([config]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    services.runtime.process_worker = False
+    app = SSMSTUI(services=services)
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        provider = get_provider("sqlite")
+        app.current_config = config
+        app.current_provider = provider
+        app.current_connection = conn
+        node = app.object_tree.root.add_leaf("t", data=TableNode(database=None, schema="", name="t"))
+
+        preview_prefetch.schedule_preview_prefetch(app, node)
+        request = preview_prefetch._build_request(app, node)
+        assert request is not None
+        prefetcher = preview_prefetch.get_prefetcher(app)
+        for _ in range(50):
+            if prefetcher.has(request.config, request.query, request.max_rows):
+                break
+            await asyncio.sleep(0.05)
+        assert prefetcher.has(request.config, request.query, request.max_rows)
+
+        conn.execute("INSERT INTO t VALUES (2)")
+        conn.commit()
+        await app._run_query_async(request.query, False)
+        assert app._last_result_row_count == 1
+        assert app._get_input_context().results_cache_age_s is not None
+
+        await app._run_query_async(request.query, False)
+        assert app._last_result_row_count == 2
+
+    app._reset_transaction_executor()
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_is_skipped_when_disabled_for_connection(tmp_path):
+    config = ConnectionConfig.from_dict(
+        {
+            "name": "local",
+            "db_type": "sqlite",
+            "file_path": str(tmp_path / "db.sqlite"),
+            "options": {"preview_prefetch": "off"},
+        }
+    )
+    services = build_test_services(
+        connection_store=MockConnectionStore([config]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    app = SSMSTUI(services=services)
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        app.current_config = config
+        app.current_provider = get_provider("sqlite")
+        app.current_connection = object()
+        node = app.object_tree.root.add_leaf("t", data=TableNode(database=None, schema="", name="t"))
+
+        preview_prefetch.schedule_preview_prefetch(app, node)
+        assert app._preview_prefetcher is None
@@ -0,0 +1,93 @@
+"""UI tests for running the editor query on every selected connection."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.query.app.fan_out import CONNECTION_COLUMN
+from sqlit.domains.query.ui.mixins.query_execution import QUERY_TARGET_RESULTS
+from sqlit.domains.shell.app.main import SSMSTUI
+
+from .mocks import MockConnectionStore, MockSettingsStore, build_test_services
+
+
+def _shard(tmp_path, name: str, create: bool = True) -> ConnectionConfig:
+    path = tmp_path / f"{name}.sqlite"
+    conn = sqlite3.connect(path)
+    if create:
+        conn.execute("CREATE TABLE t (id INTEGER)")
+        conn.execute("INSERT INTO t VALUES (1)")
+        conn.commit()
+    conn.close()
+    return ConnectionConfig.from_dict({"name": name, "db_type": "sqlite", "file_path": str(path)})
+
+
+@pytest.mark.asyncio
+async def test_fan_out_shows_merged_rows_and_shard_summary(tmp_path):
+    configs = [_shard(tmp_path, "a"), _shard(tmp_path, "b"), _shard(tmp_path, "broken", create=False)]
+    services = build_test_services(
+        connection_store=MockConnectionStore(configs),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    services.runtime.process_worker = False
+    app = SSMSTUI(services=services)
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        app._get_selected_connection_names().update({"a", "b", "broken"})
+        app.query_input.text = "SELECT id FROM t"
+
+        app.action_execute_query_fan_out()
+        for _ in range(300):
+            if not app.query_executing:
+                break
+            await asyncio.sleep(0.01)
+        await pilot.pause()
+
+        container = app._get_stacked_results_container()
+        assert container.section_count == 2
+        merged = container.get_section(0)
+        summary = container.get_section(1)
+        assert merged is not None and summary is not None
+        assert merged.result_columns == [CONNECTION_COLUMN, "id"]
+        assert sorted(merged.result_rows) == [("a", 1), ("b", 1)]
+        statuses = {row[0]: row[1] for row in summary.result_rows}
+        assert statuses == {"a": "ok", "b": "ok", "broken": "error"}
+        assert app._fan_out_query is None
+
+
+@pytest.mark.asyncio
+async def test_running_another_query_cancels_the_fan_out(tmp_path):
+    slow = _shard(tmp_path, "slow", create=False)
+    conn = sqlite3.connect(slow.file_path)
+    conn.execute(
+        "CREATE VIEW t AS WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 10000000000) "
+        "SELECT i AS id FROM n"
+    )
+    conn.close()
+    services = build_test_services(
+        connection_store=MockConnectionStore([slow]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    services.runtime.process_worker = False
+    app = SSMSTUI(services=services)
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        app._get_selected_connection_names().add("slow")
+        app.query_input.text = "SELECT count(*) FROM t"
+        app.action_execute_query_fan_out()
+        fan_out = app._fan_out_query
+        assert fan_out is not None
+        await pilot.pause(0.2)
+
+        app._query_target = QUERY_TARGET_RESULTS
+        app.query_input.text = "SELECT 1"
+        app.action_execute_query()
+
+        assert fan_out.is_cancelled
+        assert app._fan_out_query is None
@@ -0,0 +1,59 @@
+"""UI tests for serving repeated queries from the result cache."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.shell.app.main import SSMSTUI
+
+from .mocks import MockConnectionStore, MockSettingsStore, build_test_services
+
+
+@pytest.mark.asyncio
+async def test_repeated_select_is_served_from_cache_until_dml(tmp_path):
+    db_path = tmp_path / "db.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER)")
+    conn.execute("INSERT INTO t VALUES (1)")
+    conn.commit()
+
+    config = ConnectionConfig.from_dict({"name": "local", "db_type": "sqlite", "file_path": str(db_path)})
+    services = build_test_services(
+        connection_store=MockConnectionStore([config]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    services.runtime.process_worker = False
+    services.runtime.result_cache_ttl_s = 60
+    app = SSMSTUI(services=services)
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        app.current_config = config
+        app.current_provider = get_provider("sqlite")
+        app.current_connection = conn
+
+        await app._run_query_async("SELECT id FROM t", False)
+        assert app._get_input_context().results_cache_age_s is None
+
+        conn.execute("INSERT INTO t VALUES (2)")
+        conn.commit()
+        await app._run_query_async("SELECT id\nFROM t;", False)
+        assert app._last_result_row_count == 1
+        assert app._get_input_context().results_cache_age_s is not None
+
+        app.action_refresh_results()
+        await app.workers.wait_for_complete()
+        assert app._last_result_row_count == 2
+        assert app._get_input_context().results_cache_age_s is None
+
+        await app._run_query_async("INSERT INTO t VALUES (3)", False)
+        await app._run_query_async("SELECT id FROM t", False)
+        assert app._last_result_row_count == 3
+        assert app._get_input_context().results_cache_age_s is None
+
+    app._reset_transaction_executor()
+    conn.close()
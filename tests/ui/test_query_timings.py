@@ -0,0 +1,64 @@
+"""UI tests for per-query timing spans."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.shell.app.main import SSMSTUI
+from sqlit.shared.ui.screens.message import MessageScreen
+
+from .mocks import MockConnectionStore, MockSettingsStore, build_test_services
+
+
+@pytest.mark.asyncio
+async def test_query_records_phase_spans_and_emits_debug_event(tmp_path):
+    db_path = tmp_path / "db.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(500)])
+    conn.commit()
+
+    config = ConnectionConfig.from_dict({"name": "local", "db_type": "sqlite", "file_path": str(db_path)})
+    services = build_test_services(
+        connection_store=MockConnectionStore([config]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    services.runtime.process_worker = False
+    app = SSMSTUI(services=services)
+    events = []
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        app._debug_event_bus.subscribe(events.append)
+        app.current_config = config
+        app.current_provider = get_provider("sqlite")
+        app.current_connection = conn
+
+        await app._run_query_async("SELECT id FROM t", False)
+        for _ in range(100):
+            if app._query_timings_history:
+                break
+            await asyncio.sleep(0.01)
+            await pilot.pause()
+
+        timings = app._query_timings_history[-1]
+        phases = timings.phase_totals()
+        for phase in ("connect", "execute", "fetch", "history", "table_build", "first_paint", "render"):
+            assert phase in phases
+        assert timings.status == "ok"
+        assert timings.total_ms >= max(span.start_ms + span.duration_ms for span in timings.spans) - 1
+
+        event = next(event for event in events if event.name == "query.timings")
+        assert event.data["query_id"] == timings.query_id
+
+        app.action_show_query_timings()
+        await pilot.pause()
+        assert isinstance(app.screen, MessageScreen)
+
+    app._reset_transaction_executor()
+    conn.close()
@@ -0,0 +1,64 @@
+"""UI tests for diffing a result against a pinned result."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.shell.app.main import SSMSTUI
+from sqlit.shared.ui.widgets_stacked_results import ResultSection
+
+from .mocks import MockConnectionStore, MockSettingsStore, build_test_services
+
+
+@pytest.mark.asyncio
+async def test_diff_against_pinned_result_shows_sections(tmp_path):
+    db_path = tmp_path / "db.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO t VALUES (?, ?)", [(1, "a"), (2, "b"), (3, "c")])
+    conn.commit()
+
+    config = ConnectionConfig.from_dict({"name": "local", "db_type": "sqlite", "file_path": str(db_path)})
+    services = build_test_services(
+        connection_store=MockConnectionStore([config]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    services.runtime.process_worker = False
+    app = SSMSTUI(services=services)
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        app.current_config = config
+        app.current_provider = get_provider("sqlite")
+        app.current_connection = conn
+
+        await app._run_query_async("SELECT id, name FROM t", False)
+        await pilot.pause()
+        app.action_pin_result()
+        conn.execute("UPDATE t SET name = 'B' WHERE id = 2")
+        conn.execute("DELETE FROM t WHERE id = 3")
+        conn.execute("INSERT INTO t VALUES (4, 'd')")
+        conn.commit()
+        await app._run_query_async("SELECT id, name FROM t", False)
+        await pilot.pause()
+
+        app._run_command("diff key=id")
+        sections: list[ResultSection] = []
+        for _ in range(200):
+            sections = list(app.query(ResultSection))
+            if len(sections) == 3:
+                break
+            await asyncio.sleep(0.01)
+            await pilot.pause()
+
+        assert [section.result_rows[:] for section in sections] == [
+            [("-", 2, "b"), ("+", 2, "B")],
+            [("+", 4, "d")],
+            [("-", 3, "c")],
+        ]
+        assert sections[0].statement.startswith("Changed: 1 row (r1 → r2)")
@@ -0,0 +1,70 @@
+"""UI tests for result retention through the result store."""
+
+from __future__ import annotations
+
+import pytest
+
+from sqlit.domains.results.store import RowIndexView, StoredResult
+from sqlit.domains.shell.app.main import SSMSTUI
+
+from .mocks import MockConnectionStore, MockSettingsStore, build_test_services, create_test_connection
+
+
+def _build_app() -> SSMSTUI:
+    services = build_test_services(
+        connection_store=MockConnectionStore([create_test_connection("test-db", "sqlite")]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    return SSMSTUI(services=services)
+
+
+@pytest.mark.asyncio
+async def test_results_are_owned_by_store_and_released_by_their_last_holder():
+    app = _build_app()
+    columns = ["id", "name"]
+    first_rows = [(i, f"user-{i}") for i in range(50)]
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+
+        await app._display_query_results(columns, first_rows, len(first_rows), False, 0)
+        first = app._last_result_rows
+        assert isinstance(first, StoredResult)
+        assert first._rows is first_rows
+
+        await app._display_query_results(columns, [(1, "a")], 1, False, 0)
+        store = app._get_result_store()
+        second = app._last_result_rows
+        assert store.results == [first, second]
+        assert [result.rows for result in app._get_results_workspace().results] == [first, second]
+
+        app._get_results_workspace().close()
+        assert store.results == [second]
+
+
+@pytest.mark.asyncio
+async def test_filter_matches_reference_stored_rows():
+    app = _build_app()
+    columns = ["id", "name"]
+    rows = [(i, f"user-{i}") for i in range(50)]
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+
+        await app._display_query_results(columns, rows, len(rows), False, 0)
+        stored = app._last_result_rows
+
+        app.action_results_filter()
+        assert app._results_filter_original_rows is stored
+
+        app._results_filter_text = "user-4"
+        app._update_results_filter()
+        await pilot.pause()
+
+        matching = app._results_filter_matching_rows
+        assert isinstance(matching, RowIndexView)
+        assert matching.base is stored
+        assert list(matching) == [rows[4]] + rows[40:50]
+
+        app.action_results_filter_accept()
+        assert app._last_result_rows is matching
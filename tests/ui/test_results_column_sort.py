@@ -0,0 +1,80 @@
+"""UI tests for sorting results by a column and showing column statistics."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.results.ui.screens.column_stats import ColumnStatsScreen
+from sqlit.domains.shell.app.main import SSMSTUI
+
+from .mocks import MockConnectionStore, MockSettingsStore, build_test_services
+
+
+async def _wait_for(pilot, predicate) -> None:
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+        await pilot.pause()
+
+
+@pytest.mark.asyncio
+async def test_sort_cycles_and_stats_panel_opens(tmp_path):
+    db_path = tmp_path / "db.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER, name TEXT)")
+    conn.executemany("INSERT INTO t VALUES (?, ?)", [(2, "b"), (3, None), (1, "a")])
+    conn.commit()
+
+    config = ConnectionConfig.from_dict({"name": "local", "db_type": "sqlite", "file_path": str(db_path)})
+    services = build_test_services(
+        connection_store=MockConnectionStore([config]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    services.runtime.process_worker = False
+    app = SSMSTUI(services=services)
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        app.current_config = config
+        app.current_provider = get_provider("sqlite")
+        app.current_connection = conn
+
+        await app._run_query_async("SELECT id, name FROM t", False)
+        await pilot.pause()
+        unsorted = app._last_result_rows
+        table = app.results_table
+        table.focus()
+        table.move_cursor(row=0, column=0)
+
+        app.action_sort_results_column()
+        await _wait_for(pilot, lambda: app._results_sort == (0, False))
+        assert [row[0] for row in app._last_result_rows] == [1, 2, 3]
+
+        app.action_sort_results_column()
+        await _wait_for(pilot, lambda: app._results_sort == (0, True))
+        assert [row[0] for row in app._last_result_rows] == [3, 2, 1]
+
+        app.action_sort_results_column()
+        await _wait_for(pilot, lambda: app._results_sort is None)
+        assert app._last_result_rows is unsorted
+        await _wait_for(
+            pilot, lambda: not any(worker.name == "results-sort-render" and worker.is_running for worker in app.workers)
+        )
+        await pilot.pause()
+
+        table = app.results_table
+        table.move_cursor(row=0, column=1)
+        await pilot.pause()
+        app.action_results_column_stats()
+        await pilot.pause()
+        screen = app.screen
+        assert isinstance(screen, ColumnStatsScreen)
+        content = screen.query_one("#column-stats-content")
+        await _wait_for(pilot, lambda: "Nulls" in str(content.render()))
+        assert "Nulls      1" in str(content.render())
@@ -118,12 +118,12 @@ async def test_incremental_rendering_fallback_on_append_error(monkeypatch):
     columns = ["id", "amount"]
     rows = [(i + 1, Decimal(f"{i + 1}.25")) for i in range(201)]
 
-    original_add_rows = SqlitDataTable.add_rows
+    original_append = SqlitDataTable.append_arrow_batch
 
-    def _failing_add_rows(self, _rows):
+    def _failing_append(self, _batch):
         raise RuntimeError("forced append failure")
 
-    monkeypatch.setattr(SqlitDataTable, "add_rows", _failing_add_rows)
+    monkeypatch.setattr(SqlitDataTable, "append_arrow_batch", _failing_append)
 
     async with app.run_test(size=(120, 40)) as pilot:
         await pilot.pause()
@@ -151,7 +151,7 @@ async def test_incremental_rendering_fallback_on_append_error(monkeypatch):
         assert app.results_table.row_count == len(rows)
         assert fallback_called["value"] is True
 
-    monkeypatch.setattr(SqlitDataTable, "add_rows", original_add_rows)
+    monkeypatch.setattr(SqlitDataTable, "append_arrow_batch", original_append)
 
 
 class _WeirdType:
@@ -205,3 +205,54 @@ async def test_incremental_rendering_coerces_unsupported_initial_types():
 
         assert app.results_table.row_count == len(rows)
         assert fallback_called["value"] is False
+
+
+@pytest.mark.asyncio
+async def test_arrow_results_render_without_row_conversion():
+    """Arrow-backed results should render through the Arrow backend and stay filterable."""
+    pa = pytest.importorskip("pyarrow")
+    from sqlit.domains.query.app.arrow_rows import ArrowRowView
+
+    connections = [create_test_connection("test-db", "sqlite")]
+    mock_connections = MockConnectionStore(connections)
+    mock_settings = MockSettingsStore({"theme": "tokyo-night"})
+
+    services = build_test_services(
+        connection_store=mock_connections,
+        settings_store=mock_settings,
+    )
+    app = SSMSTUI(services=services)
+
+    table = pa.table({"id": list(range(500)), "name": [f"user-{i}" for i in range(500)]})
+    rows = ArrowRowView(table)
+
+    def _unexpected_incremental(*_args, **_kwargs):
+        raise AssertionError("Arrow results should not use the incremental row renderer")
+
+    app._render_results_table_incremental = MethodType(_unexpected_incremental, app)
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+
+        await app._display_query_results(
+            columns=list(table.column_names),
+            rows=rows,
+            row_count=len(rows),
+            truncated=False,
+            elapsed_ms=0,
+        )
+        await pilot.pause()
+
+        assert app.results_table.row_count == 500
+        assert app._last_result_rows.arrow_table is table
+
+        _table, columns, context_rows, _stacked = app._get_active_results_context()
+        assert columns == ["id", "name"]
+        assert context_rows is app._last_result_rows
+
+        app.action_results_filter()
+        app._results_filter_text = "user-49"
+        app._update_results_filter()
+        await pilot.pause()
+
+        assert len(app._results_filter_matches) == 11
@@ -0,0 +1,57 @@
+"""UI tests for running queries against held results."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.shell.app.main import SSMSTUI
+
+from .mocks import MockConnectionStore, MockSettingsStore, build_test_services
+
+pytest.importorskip("duckdb")
+
+
+@pytest.mark.asyncio
+async def test_results_target_queries_earlier_results_without_the_database(tmp_path):
+    db_path = tmp_path / "db.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE sales (region TEXT, amount INTEGER)")
+    conn.executemany("INSERT INTO sales VALUES (?, ?)", [("east", 5), ("west", 7), ("east", 3)])
+    conn.commit()
+
+    config = ConnectionConfig.from_dict({"name": "local", "db_type": "sqlite", "file_path": str(db_path)})
+    services = build_test_services(
+        connection_store=MockConnectionStore([config]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    services.runtime.process_worker = False
+    app = SSMSTUI(services=services)
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        app.current_config = config
+        app.current_provider = get_provider("sqlite")
+        app.current_connection = conn
+
+        await app._run_query_async("SELECT region, amount FROM sales", False)
+        await pilot.pause()
+        conn.execute("DELETE FROM sales")
+        conn.commit()
+
+        app._run_command("results on")
+        await app._run_query_async("SELECT region, sum(amount) AS total FROM r1 GROUP BY region ORDER BY region", False)
+        await pilot.pause()
+
+        assert app._last_result_columns == ["region", "total"]
+        assert list(app._last_result_rows) == [("east", 8), ("west", 7)]
+        assert [result.name for result in app._get_results_workspace().results] == ["r1", "r2"]
+
+        app._run_command("results off")
+        await app._run_query_async("SELECT count(*) FROM sales", False)
+        await pilot.pause()
+
+        assert list(app._last_result_rows) == [(0,)]
@@ -0,0 +1,107 @@
+"""UI tests for indexing several databases on dedicated metadata connections."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.shell.app.main import SSMSTUI
+
+from .mocks import MockConnectionStore, MockSettingsStore, build_test_services
+
+
+class _Inspector:
+    def __init__(self) -> None:
+        self.session_calls = 0
+
+    def get_tables(self, conn: Any, database: str | None = None) -> list[tuple[str, str]]:
+        if conn == "session":
+            self.session_calls += 1
+        return [("dbo", f"{database}_orders")]
+
+    def get_views(self, conn: Any, database: str | None = None) -> list[tuple[str, str]]:
+        return []
+
+    def get_procedures(self, conn: Any, database: str | None = None) -> list[str]:
+        return []
+
+
+class _Factory:
+    def __init__(self, fail: bool) -> None:
+        self.fail = fail
+        self.opened = 0
+
+    def connect(self, config: ConnectionConfig) -> Any:
+        if self.fail:
+            raise ConnectionError("no more connections")
+        self.opened += 1
+        return SimpleNamespace(close=lambda: None)
+
+
+def _provider(inspector: _Inspector, factory: _Factory) -> Any:
+    return SimpleNamespace(
+        schema_inspector=inspector,
+        connection_factory=factory,
+        capabilities=SimpleNamespace(
+            supports_cross_database_queries=True,
+            supports_multiple_databases=True,
+            supports_stored_procedures=True,
+            system_databases=(),
+        ),
+        dialect=get_provider("sqlite").dialect,
+        post_connect=lambda conn, config: None,
+    )
+
+
+async def _index(fail: bool) -> tuple[SSMSTUI, _Inspector, _Factory, list[str]]:
+    config = ConnectionConfig.from_dict({"name": "server", "db_type": "mssql", "server": "db", "port": "1433"})
+    services = build_test_services(
+        connection_store=MockConnectionStore([config]),
+        settings_store=MockSettingsStore({"theme": "tokyo-night"}),
+    )
+    services.runtime.process_worker = False
+    services.runtime.schema_index_concurrency = 2
+    app = SSMSTUI(services=services)
+    inspector = _Inspector()
+    factory = _Factory(fail)
+    databases = ["sales", "hr", "ops"]
+
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        app.current_config = config
+        app.current_provider = _provider(inspector, factory)
+        app.current_connection = "session"
+        app._schema_cache = {"tables": [], "views": [], "columns": {}, "procedures": []}
+        app._db_object_cache = {}
+        app._on_databases_loaded(databases)
+        for _ in range(100):
+            if all(db in app._db_object_cache for db in databases) and not app._schema_indexing:
+                break
+            await asyncio.sleep(0.02)
+            await pilot.pause()
+        tables = list(app._schema_cache["tables"])
+    return app, inspector, factory, tables
+
+
+@pytest.mark.asyncio
+async def test_databases_are_indexed_on_dedicated_connections():
+    _, inspector, factory, tables = await _index(fail=False)
+
+    assert 1 <= factory.opened <= 2
+    assert inspector.session_calls == 0
+    assert any("sales_orders" in table for table in tables)
+    assert any("ops_orders" in table for table in tables)
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_session_connection_when_pool_cannot_connect():
+    _, inspector, factory, tables = await _index(fail=True)
+
+    assert factory.opened == 0
+    assert inspector.session_calls == 3
+    assert any("hr_orders" in table for table in tables)
@@ -0,0 +1,145 @@
+"""Tests for adaptive, byte-budgeted cursor fetching."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from sqlit.domains.connections.providers.adapters.fetch import (
+    MAX_FETCH_BATCH_ROWS,
+    MIN_FETCH_BATCH_ROWS,
+    AdaptiveFetchPlanner,
+    FetchStats,
+    apply_fetch_hints,
+    estimate_row_bytes,
+    fetch_rows,
+    iter_fetch_batches,
+)
+from sqlit.domains.connections.providers.sqlite.adapter import SQLiteAdapter
+from sqlit.shared.core.columnar_rows import ColumnarRows
+
+
+class _RecordingCursor:
+    """DB-API cursor stand-in that records fetchmany sizes."""
+
+    def __init__(self, rows: list[tuple]) -> None:
+        self._rows = rows
+        self._pos = 0
+        self.requested: list[int] = []
+        self.arraysize = 1
+
+    def fetchmany(self, size: int) -> list[tuple]:
+        self.requested.append(size)
+        batch = self._rows[self._pos : self._pos + size]
+        self._pos += len(batch)
+        return batch
+
+
+class TestAdaptiveFetchPlanner:
+    def test_wide_rows_get_smaller_batches_than_narrow_rows(self):
+        narrow = AdaptiveFetchPlanner(budget_bytes=1024 * 1024)
+        wide = AdaptiveFetchPlanner(budget_bytes=1024 * 1024)
+
+        narrow.observe([(i,) for i in range(100)])
+        wide.observe([("x" * 50_000,) for _ in range(100)])
+
+        assert wide.batch_rows < narrow.batch_rows
+        assert wide.batch_rows * 50_000 <= 1024 * 1024 + 50_000
+
+    def test_batch_size_is_clamped(self):
+        planner = AdaptiveFetchPlanner(budget_bytes=1)
+        planner.observe([("x" * 1000,)])
+        assert planner.batch_rows == MIN_FETCH_BATCH_ROWS
+
+        planner = AdaptiveFetchPlanner(budget_bytes=10**12)
+        planner.observe([(1,)])
+        assert planner.batch_rows == MAX_FETCH_BATCH_ROWS
+
+    def test_next_batch_respects_remaining(self):
+        planner = AdaptiveFetchPlanner(initial_rows=500)
+
+        assert planner.next_batch_size() == 500
+        assert planner.next_batch_size(remaining=7) == 7
+
+    def test_estimate_row_bytes_grows_with_payload(self):
+        assert estimate_row_bytes([("a" * 1000,)]) > estimate_row_bytes([("a",)])
+        assert estimate_row_bytes([]) == 0.0
+
+
+class TestFetchRows:
+    def test_limit_fetches_one_extra_row_and_truncates(self):
+        cursor = _RecordingCursor([(i,) for i in range(1000)])
+
+        rows, truncated = fetch_rows(cursor, 100, planner=AdaptiveFetchPlanner(initial_rows=32))
+
+        assert truncated is True
+        assert isinstance(rows, ColumnarRows)
+        assert rows == [(i,) for i in range(100)]
+        assert sum(cursor.requested) == 101
+
+    def test_no_limit_reads_until_exhausted(self):
+        cursor = _RecordingCursor([(i, "x") for i in range(3000)])
+        stats = FetchStats()
+
+        rows, truncated = fetch_rows(cursor, None, stats=stats)
+
+        assert truncated is False
+        assert len(rows) == 3000
+        assert stats.rows == 3000
+        assert stats.batches == len(cursor.requested) - 1
+        assert stats.bytes > 0
+
+    def test_batches_grow_for_narrow_rows(self):
+        cursor = _RecordingCursor([(i,) for i in range(10_000)])
+
+        list(iter_fetch_batches(cursor, planner=AdaptiveFetchPlanner(initial_rows=16)))
+
+        assert cursor.requested[1] > cursor.requested[0]
+        assert cursor.arraysize == cursor.requested[-1]
+
+
+class TestFetchHints:
+    def test_sets_known_hint_attributes(self):
+        class OracleLikeCursor:
+            arraysize = 100
+            prefetchrows = 2
+
+        cursor = OracleLikeCursor()
+        apply_fetch_hints(cursor, 512)
+
+        assert cursor.arraysize == 512
+        assert cursor.prefetchrows == 512
+        assert not hasattr(cursor, "itersize")
+
+    def test_ignores_read_only_attributes(self):
+        class ReadOnlyCursor:
+            @property
+            def arraysize(self) -> int:
+                return 1
+
+        apply_fetch_hints(ReadOnlyCursor(), 512)
+
+
+class TestCursorBasedAdapters:
+    @pytest.fixture
+    def conn(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (id INTEGER, body TEXT)")
+        conn.executemany("INSERT INTO t VALUES (?, ?)", [(i, "x" * (i % 50)) for i in range(5000)])
+        yield conn
+        conn.close()
+
+    def test_sqlite_execute_query_uses_adaptive_fetch(self, conn):
+        columns, rows, truncated = SQLiteAdapter().execute_query(conn, "SELECT * FROM t ORDER BY id", max_rows=4000)
+
+        assert columns == ["id", "body"]
+        assert len(rows) == 4000
+        assert truncated is True
+        assert rows[-1] == (3999, "x" * (3999 % 50))
+
+    def test_sqlite_execute_query_without_limit(self, conn):
+        _columns, rows, truncated = SQLiteAdapter().execute_query(conn, "SELECT * FROM t")
+
+        assert len(rows) == 5000
+        assert truncated is False
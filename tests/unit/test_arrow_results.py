@@ -0,0 +1,196 @@
+"""Tests for the Arrow-native query result path."""
+
+from __future__ import annotations
+
+import pickle
+from unittest.mock import MagicMock
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from sqlit.domains.connections.providers.arrow_results import (  # noqa: E402
+    arrow_table_from_rows,
+    empty_arrow_table,
+    read_record_batches,
+)
+from sqlit.domains.query.app.arrow_rows import (  # noqa: E402
+    ARROW_ROW_CHUNK_SIZE,
+    ArrowRowView,
+    arrow_row_texts,
+    snapshot_rows,
+)
+from sqlit.domains.query.app.query_service import (  # noqa: E402
+    ArrowQueryResult,
+    QueryResult,
+    execute_rows_query,
+)
+
+
+def _table(count: int) -> pa.Table:
+    return pa.table({"id": list(range(count)), "name": [f"row-{i}" for i in range(count)]})
+
+
+class TestReadRecordBatches:
+    def test_stops_consuming_after_limit(self):
+        consumed = []
+
+        def batches():
+            for start in range(0, 100, 10):
+                consumed.append(start)
+                yield pa.record_batch({"id": list(range(start, start + 10))})
+
+        table, truncated = read_record_batches(batches(), None, max_rows=25)
+
+        assert truncated is True
+        assert table.num_rows == 25
+        assert consumed == [0, 10, 20]
+
+    def test_empty_stream_uses_schema(self):
+        schema = pa.schema([("id", pa.int64())])
+        table, truncated = read_record_batches(iter([]), schema, max_rows=10)
+
+        assert truncated is False
+        assert table.column_names == ["id"]
+        assert table.num_rows == 0
+
+    def test_empty_stream_without_schema(self):
+        table, truncated = read_record_batches(iter([]), None)
+
+        assert truncated is False
+        assert table.num_columns == 0
+
+    def test_accepts_tables(self):
+        table, truncated = read_record_batches([_table(3), _table(3)], None, max_rows=None)
+
+        assert truncated is False
+        assert table.num_rows == 6
+
+
+class TestTableBuilders:
+    def test_empty_arrow_table_keeps_column_names(self):
+        table = empty_arrow_table(["a", "b"])
+
+        assert table.column_names == ["a", "b"]
+        assert table.num_rows == 0
+
+    def test_mixed_column_is_cast_to_string(self):
+        table = arrow_table_from_rows(["v"], [(1,), ("x",), (None,)])
+
+        assert table.column("v").to_pylist() == ["1", "x", None]
+
+
+class TestArrowRowView:
+    def test_sequence_access_matches_tuples(self):
+        count = ARROW_ROW_CHUNK_SIZE * 2 + 5
+        view = ArrowRowView(_table(count))
+
+        assert len(view) == count
+        assert view[0] == (0, "row-0")
+        assert view[-1] == (count - 1, f"row-{count - 1}")
+        assert view[ARROW_ROW_CHUNK_SIZE + 1] == (ARROW_ROW_CHUNK_SIZE + 1, f"row-{ARROW_ROW_CHUNK_SIZE + 1}")
+        assert view[2:4] == [(2, "row-2"), (3, "row-3")]
+        assert list(view) == [(i, f"row-{i}") for i in range(count)]
+        with pytest.raises(IndexError):
+            view[count]
+
+    def test_equality_with_lists(self):
+        view = ArrowRowView(_table(3))
+
+        assert view == [(0, "row-0"), (1, "row-1"), (2, "row-2")]
+        assert view != [(0, "row-0")]
+
+    def test_pickle_round_trip(self):
+        view = ArrowRowView(_table(10))
+        view[0]
+
+        restored = pickle.loads(pickle.dumps(view))
+
+        assert isinstance(restored, ArrowRowView)
+        assert restored == view
+
+    def test_snapshot_shares_view_and_copies_lists(self):
+        view = ArrowRowView(_table(3))
+        rows = [(1,), (2,)]
+
+        assert snapshot_rows(view) is view
+        copied = snapshot_rows(rows)
+        assert copied == rows
+        assert copied is not rows
+
+    def test_row_texts_match_tuple_join(self):
+        table = pa.table(
+            {
+                "id": [1, None, 3],
+                "name": ["a", "b", None],
+                "score": [1.5, 2.0, None],
+            }
+        )
+        expected = [
+            " ".join(str(cell) if cell is not None else "" for cell in row)
+            for row in ArrowRowView(table)
+        ]
+
+        assert arrow_row_texts(table) == expected
+
+
+class TestExecuteRowsQuery:
+    def test_uses_arrow_executor_when_available(self):
+        class ArrowExecutor:
+            def execute_query(self, conn, query, max_rows=None):
+                raise AssertionError("row path should not be used")
+
+            def execute_non_query(self, conn, query):
+                return 0
+
+            def execute_query_arrow(self, conn, query, max_rows=None):
+                return _table(5), True
+
+        result = execute_rows_query(ArrowExecutor(), object(), "SELECT 1", 5)
+
+        assert isinstance(result, ArrowQueryResult)
+        assert isinstance(result, QueryResult)
+        assert result.columns == ["id", "name"]
+        assert result.row_count == 5
+        assert result.truncated is True
+        assert result.rows[4] == (4, "row-4")
+
+    def test_falls_back_to_row_executor(self):
+        executor = MagicMock(spec=["execute_query", "execute_non_query"])
+        executor.execute_query.return_value = (["a"], [(1,), (2,)], False)
+
+        result = execute_rows_query(executor, object(), "SELECT 1", 10)
+
+        assert type(result) is QueryResult
+        assert result.rows == [(1,), (2,)]
+        assert result.row_count == 2
+
+
+class TestDuckDBArrowPath:
+    @pytest.fixture
+    def conn(self):
+        duckdb = pytest.importorskip("duckdb")
+        conn = duckdb.connect(":memory:")
+        yield conn
+        conn.close()
+
+    def test_limits_rows_without_tuples(self, conn):
+        from sqlit.domains.connections.providers.duckdb.adapter import DuckDBAdapter
+
+        table, truncated = DuckDBAdapter().execute_query_arrow(conn, "SELECT * FROM range(5000) t(id)", max_rows=1000)
+
+        assert truncated is True
+        assert table.num_rows == 1000
+        assert table.column_names == ["id"]
+
+    def test_matches_row_path(self, conn):
+        from sqlit.domains.connections.providers.duckdb.adapter import DuckDBAdapter
+
+        adapter = DuckDBAdapter()
+        query = "SELECT 1.25::DECIMAL(10, 2) AS amount, 'x' AS name, NULL AS missing"
+        columns, rows, _ = adapter.execute_query(conn, query)
+        result = execute_rows_query(adapter, conn, query, None)
+
+        assert isinstance(result, ArrowQueryResult)
+        assert result.columns == columns
+        assert list(result.rows) == rows
@@ -0,0 +1,253 @@
+"""Tests for bulk file import."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from argparse import Namespace
+from dataclasses import replace
+from typing import Any
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.adapters.bulk import (
+    CsvBatchStream,
+    build_insert_sql,
+    executemany_batches,
+)
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.query.app.bulk_import import (
+    BulkImporter,
+    ImportCancelledError,
+    ImportProgress,
+    detect_import_format,
+    format_import_progress,
+    prefetch,
+)
+from sqlit.domains.query.cli.commands import cmd_import
+from tests.ui.mocks import MockConnectionStore, build_test_services
+
+
+def _write_csv(path, rows: int) -> None:
+    lines = ["id,name,note"] + [f"{i},name-{i},{'' if i % 2 else 'n'}" for i in range(rows)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _sqlite_table(path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE t (id INTEGER, name TEXT, note TEXT)")
+    conn.commit()
+    return conn
+
+
+class TestHelpers:
+    def test_detects_format_from_extension(self):
+        assert detect_import_format("a.CSV") == "csv"
+        assert detect_import_format("a.tsv") == "csv"
+        assert detect_import_format("a.parquet") == "parquet"
+        assert detect_import_format("a.jsonl") == "ndjson"
+        with pytest.raises(ValueError):
+            detect_import_format("a.xlsx")
+
+    def test_build_insert_sql_uses_driver_paramstyle(self):
+        assert build_insert_sql('"t"', ['"a"', '"b"'], "qmark") == 'INSERT INTO "t" ("a", "b") VALUES (?, ?)'
+        assert build_insert_sql("`t`", ["`a`"], "format") == "INSERT INTO `t` (`a`) VALUES (%s)"
+
+    def test_csv_batch_stream_renders_nulls_as_empty_fields(self):
+        stream = CsvBatchStream([[(1, "a,b", None)], [(2, {"k": 1}, b"\x01")]])
+        chunks = []
+        while chunk := stream.read(7):
+            chunks.append(chunk)
+        assert b"".join(chunks) == b'1,"a,b",\n2,"{""k"": 1}",\\x01\n'
+        assert stream.rows == 2
+
+    def test_executemany_batches_rolls_back_on_error(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "db.sqlite")
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+        with pytest.raises(sqlite3.IntegrityError):
+            executemany_batches(conn, "INSERT INTO t (id) VALUES (?)", [[(1,), (2,)], [(2,)]])
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_prefetch_reraises_reader_errors(self):
+        def batches():
+            yield [(1,)]
+            raise ValueError("bad row")
+
+        consumed = []
+        with pytest.raises(ValueError, match="bad row"):
+            for batch in prefetch(batches()):
+                consumed.append(batch)
+        assert consumed == [[(1,)]]
+
+    def test_format_import_progress(self):
+        progress = ImportProgress(rows=1500, bytes_read=50, total_bytes=100, elapsed_s=1.5)
+        line = format_import_progress(progress, width=10)
+        assert line.startswith("[#####-----]")
+        assert "1,500 rows" in line and "1,000 rows/s" in line
+
+
+class TestSQLiteImport:
+    def test_csv_import_streams_batches_with_progress(self, tmp_path):
+        csv_path = tmp_path / "data.csv"
+        _write_csv(csv_path, 2500)
+        conn = _sqlite_table(tmp_path / "db.sqlite")
+        updates: list[int] = []
+
+        result = BulkImporter(get_provider("sqlite"), batch_rows=1000).run(
+            conn, csv_path, "t", on_progress=lambda p: updates.append(p.rows)
+        )
+
+        assert result.rows == 2500
+        assert result.method == "SQLite bulk load"
+        assert updates == [1000, 2000, 2500]
+        assert conn.execute("SELECT COUNT(*), COUNT(note) FROM t").fetchone() == (2500, 1250)
+
+    def test_ndjson_import_serializes_nested_values(self, tmp_path):
+        path = tmp_path / "data.ndjson"
+        records = [{"id": 1, "name": "a", "note": {"x": [1]}}, {"id": 2, "name": "b"}]
+        path.write_text("\n".join(json.dumps(r) for r in records) + "\n", encoding="utf-8")
+        conn = _sqlite_table(tmp_path / "db.sqlite")
+
+        BulkImporter(get_provider("sqlite")).run(conn, path, "t")
+
+        rows = conn.execute("SELECT id, name, note FROM t ORDER BY id").fetchall()
+        assert rows == [(1, "a", '{"x": [1]}'), (2, "b", None)]
+
+    def test_parquet_import(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "data.parquet"
+        pq.write_table(pa.table({"id": [1, 2], "name": ["a", None], "note": ["x", "y"]}), path)
+        conn = _sqlite_table(tmp_path / "db.sqlite")
+
+        result = BulkImporter(get_provider("sqlite")).run(conn, path, "t")
+
+        assert result.rows == 2
+        assert conn.execute("SELECT * FROM t ORDER BY id").fetchall() == [(1, "a", "x"), (2, None, "y")]
+
+    def test_cancel_commits_nothing(self, tmp_path):
+        csv_path = tmp_path / "data.csv"
+        _write_csv(csv_path, 500)
+        conn = _sqlite_table(tmp_path / "db.sqlite")
+        importer = BulkImporter(get_provider("sqlite"), batch_rows=100)
+
+        with pytest.raises(ImportCancelledError):
+            importer.run(conn, csv_path, "t", on_progress=lambda _p: importer.cancel())
+
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_generic_executemany_fallback(self, tmp_path):
+        from sqlit.domains.connections.providers.sqlite.adapter import SQLiteAdapter
+
+        class _PlainAdapter(SQLiteAdapter):
+            load_rows = None  # type: ignore[assignment]
+
+        csv_path = tmp_path / "data.csv"
+        _write_csv(csv_path, 10)
+        conn = _sqlite_table(tmp_path / "db.sqlite")
+        provider = replace(get_provider("sqlite"), query_executor=_PlainAdapter())
+
+        result = BulkImporter(provider).run(conn, csv_path, "t")
+
+        assert result.method == "executemany"
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 10
+
+
+class TestDuckDBImport:
+    @pytest.mark.parametrize("suffix", ["csv", "ndjson", "parquet"])
+    def test_duckdb_reads_files_natively(self, tmp_path, suffix):
+        duckdb = pytest.importorskip("duckdb")
+        path = tmp_path / f"data.{suffix}"
+        if suffix == "csv":
+            path.write_text("id,name\n1,a\n2,\n", encoding="utf-8")
+        elif suffix == "ndjson":
+            path.write_text('{"id": 1, "name": "a"}\n{"id": 2, "name": null}\n', encoding="utf-8")
+        else:
+            pa = pytest.importorskip("pyarrow")
+            pq = pytest.importorskip("pyarrow.parquet")
+            pq.write_table(pa.table({"id": [1, 2], "name": ["a", None]}), path)
+        conn = duckdb.connect()
+        conn.execute("CREATE TABLE t (id INTEGER, name VARCHAR)")
+
+        result = BulkImporter(get_provider("duckdb")).run(conn, path, "t")
+
+        assert result.rows == 2
+        assert result.method == "DuckDB file load"
+        assert conn.execute("SELECT * FROM t ORDER BY id").fetchall() == [(1, "a"), (2, None)]
+
+
+class TestMySQLLoadFile:
+    class _Cursor:
+        rowcount = 2
+
+        def __init__(self, executed: list[tuple[str, tuple]]) -> None:
+            self.executed = executed
+
+        def execute(self, sql: str, params: tuple) -> None:
+            self.executed.append((sql, params))
+
+    class _Conn:
+        client_flag = 1 << 7
+
+        def __init__(self) -> None:
+            self.executed: list[tuple[str, tuple]] = []
+
+        def cursor(self):
+            return TestMySQLLoadFile._Cursor(self.executed)
+
+        def commit(self) -> None:
+            pass
+
+    @pytest.mark.parametrize(("newline", "terminator"), [("\n", "\n"), ("\r\n", "\r\n")])
+    def test_load_data_treats_backslashes_literally(self, tmp_path, newline, terminator):
+        from sqlit.domains.connections.providers.mysql.adapter import MySQLAdapter
+
+        path = tmp_path / "data.csv"
+        path.write_bytes(newline.join(["id,path", "1,C:\\new", ""]).encode())
+        conn = self._Conn()
+
+        assert MySQLAdapter().load_file(conn, "`t`", ["id", "path"], str(path), "csv") == 2
+
+        [(sql, params)] = conn.executed
+        assert "ESCAPED BY ''" in sql
+        assert params == (str(path), ",", terminator)
+
+
+class TestImportCommand:
+    def _args(self, file: str, **overrides: Any) -> Namespace:
+        values = {
+            "file": file,
+            "connection": "local",
+            "table": "t",
+            "schema": None,
+            "database": None,
+            "format": None,
+            "delimiter": None,
+            "batch_size": 5000,
+        }
+        values.update(overrides)
+        return Namespace(**values)
+
+    def test_imports_into_saved_connection(self, tmp_path, capsys):
+        db_path = tmp_path / "db.sqlite"
+        _sqlite_table(db_path).close()
+        tsv_path = tmp_path / "data.tsv"
+        tsv_path.write_text("id\tname\tnote\n1\ta\tx\n2\tb\t\n", encoding="utf-8")
+        config = ConnectionConfig.from_dict({"name": "local", "db_type": "sqlite", "file_path": str(db_path)})
+        services = build_test_services(connection_store=MockConnectionStore([config]))
+
+        assert cmd_import(self._args(str(tsv_path)), services=services) == 0
+
+        assert "2 row(s) imported" in capsys.readouterr().out
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT * FROM t ORDER BY id").fetchall() == [(1, "a", "x"), (2, "b", None)]
+
+    def test_missing_file_reports_error(self, tmp_path, capsys):
+        db_path = tmp_path / "db.sqlite"
+        _sqlite_table(db_path).close()
+        config = ConnectionConfig.from_dict({"name": "local", "db_type": "sqlite", "file_path": str(db_path)})
+        services = build_test_services(connection_store=MockConnectionStore([config]))
+
+        assert cmd_import(self._args(str(tmp_path / "missing.csv")), services=services) == 1
+        assert "not found" in capsys.readouterr().out
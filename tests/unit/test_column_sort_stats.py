@@ -0,0 +1,76 @@
+"""Tests for client-side column sort and column statistics on results."""
+
+from __future__ import annotations
+
+import pyarrow as pa
+
+from sqlit.domains.results.column_stats import HyperLogLog, compute_column_stats, format_column_stats
+from sqlit.domains.results.sorting import sorted_view, view_arrow_table
+from sqlit.domains.results.store import RowIndexView
+
+
+class _ArrowRows(list):
+    def __init__(self, table: pa.Table) -> None:
+        super().__init__(tuple(row.values()) for row in table.to_pylist())
+        self.arrow_table = table
+
+
+def test_sort_is_stable_with_nulls_last():
+    rows = [(2, "a"), (None, "b"), (1, "c"), (2, "d"), (1, "e")]
+
+    ascending = sorted_view(rows, 0)
+    descending = sorted_view(rows, 0, descending=True)
+
+    assert isinstance(ascending, RowIndexView)
+    assert [row[1] for row in ascending] == ["c", "e", "a", "d", "b"]
+    assert [row[1] for row in descending] == ["a", "d", "c", "e", "b"]
+
+
+def test_sort_of_a_view_reindexes_the_base_rows():
+    rows = [(3,), (1,), (2,)]
+    view = sorted_view(sorted_view(rows, 0), 0, descending=True)
+
+    assert view.base is rows
+    assert list(view) == [(3,), (2,), (1,)]
+
+
+def test_mixed_types_sort_by_text():
+    rows = [(10,), ("b",), (2,), ("a",)]
+
+    assert [row[0] for row in sorted_view(rows, 0)] == [10, 2, "a", "b"]
+
+
+def test_arrow_backed_rows_sort_without_materializing():
+    rows = _ArrowRows(pa.table({"n": [3, 1, 2], "s": ["c", "a", "b"]}))
+    view = sorted_view(rows, 0)
+
+    assert list(view) == [(1, "a"), (2, "b"), (3, "c")]
+    assert view_arrow_table(view, 2).column("s").to_pylist() == ["a", "b"]
+
+
+def test_hyperloglog_estimate_is_close():
+    sketch = HyperLogLog()
+    sketch.add(range(200_000))
+
+    assert abs(sketch.estimate() - 200_000) < 200_000 * 0.03
+
+
+def test_column_stats_counts_nulls_range_and_top_values():
+    rows = [(value,) for value in ["x", "y", None, "x", "z", "x", None, "y"]]
+    progress = []
+
+    stats = compute_column_stats(rows, 0, "col", chunk_rows=3, on_progress=progress.append)
+
+    assert stats is not None and stats.complete
+    assert [snapshot.rows for snapshot in progress] == [3, 6, 8]
+    assert stats.nulls == 2
+    assert stats.distinct == 3 and stats.distinct_exact
+    assert (stats.minimum, stats.maximum) == ("x", "z")
+    assert stats.top[:2] == [("x", 3), ("y", 2)]
+    assert "Distinct   3" in format_column_stats(stats)
+
+
+def test_column_stats_stops_when_asked():
+    rows = [(i,) for i in range(10)]
+
+    assert compute_column_stats(rows, 0, "n", chunk_rows=2, should_stop=lambda: True) is None
@@ -0,0 +1,127 @@
+"""Tests for the compact column-wise row container."""
+
+from __future__ import annotations
+
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from sqlit.shared.core.columnar_rows import (
+    DICT_MIN_ROWS,
+    ColumnarRows,
+    ColumnarRowsBuilder,
+)
+
+
+def _kinds(rows: ColumnarRows) -> list[str]:
+    names = {0: "null", 1: "int", 2: "float", 3: "str", 4: "object"}
+    return [names[column.kind] for column in rows._columns]
+
+
+class TestColumnarRows:
+    def test_round_trips_mixed_rows(self):
+        rows = [
+            (i, f"cat-{i % 4}", i * 0.25, None if i % 3 else "x", i % 2 == 0, Decimal(i))
+            for i in range(3000)
+        ]
+
+        columnar = ColumnarRows.from_rows(rows)
+
+        assert len(columnar) == 3000
+        assert columnar == rows
+        assert list(columnar) == rows
+        assert columnar[7] == rows[7]
+        assert columnar[-1] == rows[-1]
+        assert columnar[100:110] == rows[100:110]
+        assert columnar[::500] == rows[::500]
+        with pytest.raises(IndexError):
+            columnar[3000]
+
+    def test_picks_compact_encodings(self):
+        rows = [(i, i * 0.5, f"cat-{i % 4}", True) for i in range(DICT_MIN_ROWS)]
+
+        assert _kinds(ColumnarRows.from_rows(rows)) == ["int", "float", "str", "object"]
+
+    def test_high_cardinality_text_is_not_dictionary_encoded(self):
+        rows = [(f"unique-{i}",) for i in range(DICT_MIN_ROWS * 2)]
+
+        columnar = ColumnarRows.from_rows(rows)
+
+        assert _kinds(columnar) == ["object"]
+        assert columnar == rows
+
+    def test_type_changes_between_batches_fall_back_to_objects(self):
+        builder = ColumnarRowsBuilder()
+        builder.extend([(None, None)] * 3)
+        builder.extend([(1, "a")] * 3)
+        builder.extend([(2.5, 2**80)])
+
+        columnar = builder.build()
+
+        assert columnar == [(None, None)] * 3 + [(1, "a")] * 3 + [(2.5, 2**80)]
+        assert _kinds(columnar)[0] == "object"
+
+    def test_object_column_is_not_re_encoded_per_batch(self, monkeypatch):
+        from sqlit.shared.core import columnar_rows
+
+        calls: list[int] = []
+        become = columnar_rows._Column._become
+
+        def counting_become(column, kind):
+            calls.append(kind)
+            become(column, kind)
+
+        monkeypatch.setattr(columnar_rows._Column, "_become", counting_become)
+        builder = ColumnarRowsBuilder()
+        for batch in range(20):
+            builder.extend([(f"unique-{batch}-{i}",) for i in range(DICT_MIN_ROWS)])
+
+        columnar = builder.build()
+
+        assert _kinds(columnar) == ["object"]
+        assert len(columnar) == 20 * DICT_MIN_ROWS
+        # Once to dictionary-encoded text, once to objects; never again per batch.
+        assert len(calls) == 2
+
+    def test_nulls_in_typed_columns(self):
+        rows = [(None, 1.5), (2, None), (None, None), (4, 4.5)]
+
+        columnar = ColumnarRows.from_rows(rows)
+
+        assert _kinds(columnar) == ["int", "float"]
+        assert list(columnar) == rows
+
+    def test_int_overflow_falls_back_to_objects(self):
+        rows = [(1,), (2**70,), (3,)]
+
+        assert ColumnarRows.from_rows(rows) == rows
+
+    def test_truncate(self):
+        builder = ColumnarRowsBuilder()
+        builder.extend([(i, str(i % 2)) for i in range(10)])
+        builder.truncate(4)
+
+        columnar = builder.build()
+
+        assert columnar == [(0, "0"), (1, "1"), (2, "0"), (3, "1")]
+
+    def test_pickle_round_trip(self):
+        rows = [(i, f"cat-{i % 3}") for i in range(100)]
+
+        restored = pickle.loads(pickle.dumps(ColumnarRows.from_rows(rows)))
+
+        assert restored == rows
+
+    def test_column_values_and_zero_width(self):
+        columnar = ColumnarRows.from_rows([(1, "a"), (None, "b")])
+        assert columnar.column_values(0) == [1, None]
+        assert columnar.column_values(1) == ["a", "b"]
+
+        empty = ColumnarRows.from_rows([(), ()])
+        assert list(empty) == [(), ()]
+
+    def test_nbytes_smaller_than_tuple_estimate_for_narrow_rows(self):
+        columnar = ColumnarRows.from_rows([(i, i * 0.5) for i in range(10_000)])
+
+        assert 0 < columnar.nbytes < 10_000 * 100
@@ -444,6 +444,8 @@ class TestFlightSQLAdapterExecute:
 
             mock_cursor = MagicMock()
             mock_cursor.fetch_arrow_table.return_value = mock_table
+            # Older drivers without a record batch reader
+            del mock_cursor.fetch_record_batch
 
             mock_conn = MagicMock()
             mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
@@ -467,16 +469,15 @@ class TestFlightSQLAdapterExecute:
 
             adapter = FlightSQLAdapter()
 
-            # Mock Arrow table with more rows than max_rows
-            mock_table = MagicMock()
-            mock_table.column_names = ["id"]
-            mock_table.__len__ = lambda self: 5
-            mock_table.to_pydict.return_value = {
-                "id": [1, 2, 3, 4, 5],
-            }
+            import pyarrow as pa
+
+            # Arrow table with more rows than max_rows
+            mock_table = pa.table({"id": [1, 2, 3, 4, 5]})
 
             mock_cursor = MagicMock()
             mock_cursor.fetch_arrow_table.return_value = mock_table
+            # Older drivers without a record batch reader
+            del mock_cursor.fetch_record_batch
 
             mock_conn = MagicMock()
             mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
@@ -531,3 +532,110 @@ class TestFlightSQLAdapterExecute:
             result = adapter.execute_non_query(mock_conn, "CREATE TABLE test (id INT)")
 
             assert result == -1
+
+
+class _FakeRecordBatchReader:
+    """Record batch reader that counts how many batches were pulled."""
+
+    def __init__(self, batches):
+        self.schema = batches[0].schema
+        self._batches = batches
+        self.pulled = 0
+        self.closed = False
+
+    def __iter__(self):
+        for batch in self._batches:
+            self.pulled += 1
+            yield batch
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeFlightCursor:
+    def __init__(self, reader):
+        self._reader = reader
+        self.description = [("id",), ("name",)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query):
+        self.query = query
+
+    def fetch_record_batch(self):
+        return self._reader
+
+    def fetch_arrow_table(self):
+        raise AssertionError("execute_query should stream record batches")
+
+
+class TestFlightSQLAdapterRowLimit:
+    """Test that row limits are pushed into the record batch stream."""
+
+    def _make_reader(self, batch_count: int, batch_size: int = 10):
+        import pyarrow as pa
+
+        batches = [
+            pa.record_batch(
+                {
+                    "id": list(range(i * batch_size, (i + 1) * batch_size)),
+                    "name": [f"row{n}" for n in range(i * batch_size, (i + 1) * batch_size)],
+                }
+            )
+            for i in range(batch_count)
+        ]
+        return _FakeRecordBatchReader(batches)
+
+    def _execute(self, reader, max_rows):
+        from sqlit.domains.connections.providers.flight.adapter import FlightSQLAdapter
+
+        conn = MagicMock()
+        conn.cursor.return_value = _FakeFlightCursor(reader)
+        return FlightSQLAdapter().execute_query(conn, "SELECT * FROM big", max_rows)
+
+    def test_stops_reading_once_limit_exceeded(self):
+        reader = self._make_reader(batch_count=100)
+
+        columns, rows, truncated = self._execute(reader, max_rows=25)
+
+        assert columns == ["id", "name"]
+        assert len(rows) == 25
+        assert rows[0] == (0, "row0")
+        assert rows[-1] == (24, "row24")
+        assert truncated is True
+        assert reader.pulled == 3
+        assert reader.closed is True
+
+    def test_exact_limit_is_not_truncated(self):
+        reader = self._make_reader(batch_count=2)
+
+        _columns, rows, truncated = self._execute(reader, max_rows=20)
+
+        assert len(rows) == 20
+        assert truncated is False
+
+    def test_no_limit_reads_everything(self):
+        reader = self._make_reader(batch_count=5)
+
+        _columns, rows, truncated = self._execute(reader, max_rows=None)
+
+        assert len(rows) == 50
+        assert truncated is False
+        assert reader.pulled == 5
+
+    def test_fetch_arrow_table_stays_columnar(self):
+        import pyarrow as pa
+
+        from sqlit.domains.connections.providers.flight.adapter import FlightSQLAdapter
+
+        cursor = _FakeFlightCursor(self._make_reader(batch_count=3))
+        table, truncated = FlightSQLAdapter()._fetch_arrow_table(cursor, max_rows=15)
+
+        assert isinstance(table, pa.Table)
+        assert table.num_rows == 15
+        assert table.column_names == ["id", "name"]
+        assert truncated is True
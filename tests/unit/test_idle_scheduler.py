@@ -0,0 +1,139 @@
+"""Tests for the idle scheduler's priority queues, cancellation and time slicing."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlit.domains.shell.app.idle_scheduler import IdleScheduler, Priority
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Log:
+    def error(self, message: str) -> None:
+        pass
+
+
+class _App:
+    def __init__(self) -> None:
+        self.log = _Log()
+        self.timers: list[tuple[float, Any]] = []
+
+    def set_timer(self, delay: float, callback: Any) -> Any:
+        self.timers.append((delay, callback))
+        return None
+
+    def call_later(self, callback: Any, *args: Any) -> None:
+        pass
+
+
+def _scheduler(clock: _Clock | None = None, **kwargs: Any) -> IdleScheduler:
+    scheduler = IdleScheduler(_App(), idle_threshold_ms=0, clock=clock or _Clock(), **kwargs)
+    return scheduler
+
+
+def test_high_priority_runs_before_older_low_priority_jobs():
+    scheduler = _scheduler()
+    ran: list[str] = []
+    for i in range(3):
+        scheduler.request_idle_callback(lambda i=i: ran.append(f"low-{i}"), Priority.LOW, name="preload-columns")
+    scheduler.request_idle_callback(lambda: ran.append("normal"), Priority.NORMAL)
+    scheduler.request_idle_callback(lambda: ran.append("high-0"), Priority.HIGH, name="results-render")
+    scheduler.request_idle_callback(lambda: ran.append("high-1"), Priority.HIGH, name="results-render")
+
+    scheduler._do_work_chunk()
+
+    assert ran == ["high-0", "high-1", "normal", "low-0", "low-1", "low-2"]
+    assert scheduler.pending_jobs == 0
+
+
+def test_cancel_and_replace_by_name():
+    scheduler = _scheduler()
+    ran: list[str] = []
+    scheduler.request_idle_callback(lambda: ran.append("a1"), name="a")
+    scheduler.request_idle_callback(lambda: ran.append("a2"), name="a")
+    scheduler.request_idle_callback(lambda: ran.append("b"), name="b")
+
+    assert scheduler.cancel_all("a") == 2
+    assert scheduler.cancel_all("a") == 0
+    scheduler.request_idle_callback(lambda: ran.append("b-old"), name="b")
+    scheduler.request_idle_callback(lambda: ran.append("b-new"), name="b", replace=True)
+    assert scheduler.pending_jobs == 1
+
+    scheduler._do_work_chunk()
+    assert ran == ["b-new"]
+    assert scheduler.get_stats()["jobs_cancelled"] == 4
+
+
+def test_queue_limit_counts_only_live_jobs():
+    scheduler = _scheduler(max_queue_size=2)
+    assert scheduler.request_idle_callback(lambda: None, name="x")
+    assert scheduler.request_idle_callback(lambda: None, name="x")
+    assert not scheduler.request_idle_callback(lambda: None)
+    scheduler.cancel_all("x")
+    assert scheduler.request_idle_callback(lambda: None)
+
+
+def test_chunk_stops_at_deadline_and_budget_adapts_to_lag():
+    clock = _Clock()
+    scheduler = _scheduler(clock, max_work_chunk_ms=16, min_work_chunk_ms=2)
+
+    def slow_job() -> None:
+        clock.now += 0.010
+
+    for _ in range(5):
+        scheduler.request_idle_callback(slow_job, name="slow")
+
+    scheduler._do_work_chunk()
+    assert scheduler.pending_jobs == 3
+    assert scheduler.chunk_budget_ms < 16
+
+    for _ in range(20):
+        scheduler._observe_lag(40)
+    assert scheduler.chunk_budget_ms == 2
+
+    for _ in range(20):
+        scheduler._observe_lag(0)
+    assert scheduler.chunk_budget_ms > 15
+
+
+def test_late_timer_counts_as_lag():
+    clock = _Clock()
+    scheduler = _scheduler(clock)
+    scheduler.start()
+    clock.now += scheduler.check_interval_ms / 1000 + 0.030
+
+    scheduler._check_and_work()
+
+    assert scheduler.get_stats()["frame_lag_ms"] > 0
+    assert scheduler.chunk_budget_ms < scheduler.max_work_chunk_ms
+
+
+def test_per_name_statistics():
+    clock = _Clock()
+    scheduler = _scheduler(clock, max_work_chunk_ms=1000)
+
+    def job(ms: float) -> Any:
+        def run() -> None:
+            clock.now += ms / 1000
+
+        return run
+
+    scheduler.request_idle_callback(job(2), name="results-render")
+    scheduler.request_idle_callback(job(6), name="results-render")
+    scheduler.request_idle_callback(job(1), name="preload-columns")
+    scheduler._do_work_chunk()
+
+    stats = scheduler.job_stats["results-render"]
+    assert stats.count == 2
+    assert round(stats.total_ms) == 8
+    assert round(stats.avg_ms) == 4
+    assert round(stats.max_ms) == 6
+    assert [name for name, _ in scheduler.top_jobs()] == ["results-render", "preload-columns"]
+    assert scheduler.get_stats()["job_stats"]["preload-columns"]["count"] == 1
@@ -0,0 +1,83 @@
+"""Tests for pushing the fetch limit of ad-hoc queries down to the server."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.query.app.limit_pushdown import push_down_limit
+from sqlit.domains.query.app.query_service import QueryResult, QueryService
+from sqlit.shared.core.debug_events import set_debug_emitter
+
+
+@pytest.mark.parametrize(
+    ("db_type", "query", "expected"),
+    [
+        ("sqlite", "SELECT * FROM t ORDER BY a;", "SELECT * FROM t ORDER BY a\nLIMIT 11"),
+        ("snowflake", "WITH x AS (SELECT 1 LIMIT 2) SELECT * FROM x", "WITH x AS (SELECT 1 LIMIT 2) SELECT * FROM x\nLIMIT 11"),
+        ("mssql", "SELECT DISTINCT a FROM t ORDER BY a", "SELECT DISTINCT TOP 11 a FROM t ORDER BY a"),
+        ("mssql", "WITH x AS (SELECT TOP 5 a FROM t) SELECT a FROM x", "WITH x AS (SELECT TOP 5 a FROM t) SELECT TOP 11 a FROM x"),
+        ("oracle", "SELECT a FROM t -- note", "SELECT a FROM t -- note\nFETCH FIRST 11 ROWS ONLY"),
+        ("oracle_legacy", "SELECT a FROM t", "SELECT * FROM (\nSELECT a FROM t\n) WHERE ROWNUM <= 11"),
+    ],
+)
+def test_rewrites_with_dialect_syntax(db_type, query, expected):
+    assert push_down_limit(query, 10, get_provider(db_type).dialect) == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT * FROM t LIMIT 5",
+        "SELECT * FROM t FETCH FIRST 5 ROWS ONLY",
+        "SELECT * FROM t OFFSET 10",
+        "SELECT * FROM t FOR UPDATE",
+        "SELECT * INTO backup FROM t",
+        "UPDATE t SET a = 1",
+        "WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d",
+        "SELECT 1; SELECT 2",
+        "PRAGMA table_info(t)",
+        "SELECT 'unterminated FROM t",
+    ],
+)
+def test_leaves_other_queries_untouched(query):
+    assert push_down_limit(query, 10, get_provider("sqlite").dialect) is None
+
+
+def test_keywords_in_literals_and_comments_do_not_count():
+    dialect = get_provider("sqlite").dialect
+    assert push_down_limit("SELECT 'limit 5' /* TOP */ FROM t", 10, dialect) is not None
+
+
+def test_top_dialect_skips_compound_queries():
+    assert push_down_limit("SELECT a FROM t UNION SELECT a FROM u", 10, get_provider("mssql").dialect) is None
+    assert push_down_limit("SELECT a FROM t UNION SELECT a FROM u", 10, get_provider("sqlite").dialect) is not None
+
+
+def test_query_service_pushes_limit_and_detects_truncation():
+    provider = get_provider("sqlite")
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (a INTEGER)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(50)])
+    events: list[tuple[str, dict]] = []
+    set_debug_emitter(lambda name, category="", **data: events.append((name, data)))
+    try:
+        service = QueryService(limit_dialect=provider.dialect)
+        result = service.execute(conn, provider.query_executor, "SELECT a FROM t ORDER BY a", max_rows=10)
+    finally:
+        set_debug_emitter(None)
+
+    assert isinstance(result, QueryResult)
+    assert result.row_count == 10 and result.truncated
+    assert [event for event in events if event[0] == "query.limit_pushdown"] == [
+        (
+            "query.limit_pushdown",
+            {"limit": 11, "original": "SELECT a FROM t ORDER BY a", "rewritten": "SELECT a FROM t ORDER BY a\nLIMIT 11"},
+        )
+    ]
+
+
+def test_query_service_without_dialect_does_not_rewrite():
+    assert QueryService().limited_query("SELECT a FROM t", 10) == "SELECT a FROM t"
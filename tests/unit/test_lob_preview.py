@@ -0,0 +1,95 @@
+"""Tests for server-side truncation of large columns in table previews."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from sqlit.domains.connections.providers.adapters.base import ColumnInfo
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.query.app.lob_preview import build_lob_preview, sql_literal
+from sqlit.domains.query.app.query_service import QueryResult
+
+
+def _database() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE docs (id INTEGER PRIMARY KEY, title TEXT, body TEXT, size INTEGER, raw BLOB)")
+    conn.execute("INSERT INTO docs VALUES (1, 'big', ?, 10, ?)", ("x" * 5000, b"\x00" * 3000))
+    conn.execute("INSERT INTO docs VALUES (2, 'small', 'short', 20, x'01')")
+    return conn
+
+
+def _run(conn: sqlite3.Connection, sql: str) -> QueryResult:
+    cursor = conn.execute(sql)
+    rows = cursor.fetchall()
+    return QueryResult([d[0] for d in cursor.description], rows, len(rows), False)
+
+
+def test_preview_truncates_large_columns_and_restores_shape():
+    provider = get_provider("sqlite")
+    conn = _database()
+    columns = provider.schema_inspector.get_columns(conn, "docs")
+    query = provider.dialect.build_select_query("docs", 100)
+
+    plan = build_lob_preview(provider, query, columns, 64)
+    assert plan is not None
+    assert plan.lob_columns == ("title", "body", "raw")
+    assert "SUBSTR" in plan.query and plan.query.endswith("LIMIT 100")
+
+    result = plan.apply(_run(conn, plan.query))
+
+    assert result.columns == ["id", "title", "body", "size", "raw"]
+    big, small = result.rows
+    assert big[2] == "x" * 64 and len(big[4]) == 64
+    assert small == (2, "small", "short", 20, b"\x01")
+    assert plan.truncated_length(big, "body") == 5000
+    assert plan.truncated_length(big, "raw") == 3000
+    assert plan.truncated_length(big, "title") is None
+    assert plan.truncated_length(small, "body") is None
+
+
+def test_full_value_query_selects_one_cell_by_primary_key():
+    provider = get_provider("sqlite")
+    conn = _database()
+    columns = provider.schema_inspector.get_columns(conn, "docs")
+    plan = build_lob_preview(provider, provider.dialect.build_select_query("docs", 100), columns, 64)
+    result = plan.apply(_run(conn, plan.query))
+
+    sql = plan.full_value_query("body", result.rows[0], provider.dialect)
+
+    assert sql == 'SELECT "body" FROM "docs" WHERE "id" = 1'
+    assert conn.execute(sql).fetchone()[0] == "x" * 5000
+
+
+def test_preview_is_skipped_without_key_large_columns_or_plain_select():
+    provider = get_provider("sqlite")
+    query = provider.dialect.build_select_query("t", 100)
+    keyed = [ColumnInfo("id", "INTEGER", True), ColumnInfo("body", "TEXT")]
+
+    assert build_lob_preview(provider, query, [ColumnInfo("body", "TEXT")], 64) is None
+    assert build_lob_preview(provider, query, [ColumnInfo("id", "INTEGER", True)], 64) is None
+    assert build_lob_preview(provider, "SELECT id FROM t", keyed, 64) is None
+    assert build_lob_preview(provider, query, keyed, 0) is None
+    assert build_lob_preview(get_provider("mssql"), "SELECT TOP 100 * FROM [dbo].[t]", keyed, 64) is not None
+
+
+def test_character_columns_are_sized_in_characters():
+    mysql = get_provider("mysql").dialect
+    mssql = get_provider("mssql").dialect
+
+    def size(dialect, data_type: str) -> str:
+        return dialect.lob_preview_expressions("c", data_type, 64)[1]
+
+    assert size(mysql, "LONGTEXT") == "CHAR_LENGTH(c)"
+    assert size(mysql, "json") == "CHAR_LENGTH(c)"
+    assert size(mysql, "mediumblob") == "LENGTH(c)"
+    assert size(mssql, "varchar") == "LEN(c)"
+    assert size(mssql, "nvarchar") == size(mssql, "ntext") == "(DATALENGTH(c) / 2)"
+    assert size(mssql, "varbinary") == size(mssql, "text") == "DATALENGTH(c)"
+
+
+def test_sql_literal():
+    assert sql_literal(3) == "3"
+    assert sql_literal("it's") == "'it''s'"
+    assert sql_literal(True) == "TRUE"
+    assert sql_literal(None) is None
+    assert sql_literal(b"\x00") is None
@@ -0,0 +1,143 @@
+"""Tests for staging grid edits and committing them in one transaction."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from sqlit.domains.results.pending_edits import (
+    EditCommitError,
+    PendingEdits,
+    apply_edit_batches,
+    coerce_edit_value,
+)
+
+COLUMNS = ["id", "name", "score"]
+ROWS = [(1, "a", 10), (2, "b", 20), (3, None, 30)]
+
+
+def _quote(name: str) -> str:
+    return f'"{name}"'
+
+
+def _db() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT, score INTEGER CHECK (score >= 0))")
+    conn.executemany("INSERT INTO t VALUES (?, ?, ?)", ROWS)
+    conn.commit()
+    return conn
+
+
+def test_edits_group_by_set_columns_and_where_shape():
+    edits = PendingEdits('"t"', COLUMNS, ["id"])
+    edits.stage_update(0, ROWS[0], "name", "x")
+    edits.stage_update(1, ROWS[1], "name", "y")
+    edits.stage_update(1, ROWS[1], "score", 21)
+    edits.stage_update(2, ROWS[2], "name", "z")
+    edits.toggle_delete(0, ROWS[0])
+
+    batches = edits.build_batches(_quote, "qmark")
+
+    assert [(batch.sql, batch.params) for batch in batches] == [
+        ('UPDATE "t" SET "name" = ?, "score" = ? WHERE "id" = ?', [("y", 21, 2)]),
+        ('UPDATE "t" SET "name" = ? WHERE "id" = ?', [("z", 3)]),
+        ('DELETE FROM "t" WHERE "id" = ?', [(1,)]),
+    ]
+    assert len(edits) == 4
+    assert edits.deleted_rows() == {0}
+    assert edits.updated_cells() == {(1, 1): "y", (1, 2): 21, (2, 1): "z"}
+
+
+def test_without_key_columns_rows_match_on_all_values():
+    edits = PendingEdits("t", COLUMNS)
+    edits.toggle_delete(2, ROWS[2])
+
+    (batch,) = edits.build_batches(_quote, "format")
+
+    assert batch.sql == 'DELETE FROM t WHERE "id" = %s AND "name" IS NULL AND "score" = %s'
+    assert batch.params == [(3, 30)]
+
+
+def test_restoring_the_original_value_unstages_the_cell():
+    edits = PendingEdits("t", COLUMNS, ["id"])
+    edits.stage_update(0, ROWS[0], "name", "x")
+    edits.stage_update(0, ROWS[0], "name", "a")
+
+    assert not edits
+    with pytest.raises(ValueError):
+        edits.stage_update(0, ROWS[0], "id", 5)
+
+
+def test_apply_commits_every_batch_and_reports_counts():
+    conn = _db()
+    edits = PendingEdits("t", COLUMNS, ["id"])
+    edits.stage_update(0, ROWS[0], "score", 11)
+    edits.stage_update(1, ROWS[1], "score", 22)
+    edits.toggle_delete(2, ROWS[2])
+
+    result = apply_edit_batches(conn, edits.build_batches(_quote, "qmark"))
+
+    assert result.statements == 3
+    assert result.rows_affected == 3
+    assert conn.execute("SELECT id, score FROM t ORDER BY id").fetchall() == [(1, 11), (2, 22)]
+
+
+def test_failed_batch_rolls_back_everything():
+    conn = _db()
+    edits = PendingEdits("t", COLUMNS, ["id"])
+    edits.toggle_delete(2, ROWS[2])
+    edits.stage_update(0, ROWS[0], "score", -1)
+
+    with pytest.raises(EditCommitError) as info:
+        apply_edit_batches(conn, edits.build_batches(_quote, "qmark"))
+
+    assert info.value.batch.kind == "update"
+    assert info.value.summary.startswith("Rolled back all 2 changes; UPDATE x1 failed")
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone() == (3,)
+
+
+class _AutocommitConnection:
+    """sqlite3 connection exposing autocommit the way psycopg2 and pyodbc do."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        conn.isolation_level = None
+        self._conn = conn
+
+    @property
+    def autocommit(self) -> bool:
+        return self._conn.isolation_level is None
+
+    @autocommit.setter
+    def autocommit(self, value: bool) -> None:
+        self._conn.isolation_level = None if value else "DEFERRED"
+
+    def __getattr__(self, name: str):
+        return getattr(self._conn, name)
+
+
+@pytest.mark.parametrize("autocommit_flag", [True, False], ids=["autocommit-attribute", "sqlite-isolation-none"])
+def test_failed_batch_rolls_back_on_autocommit_connection(autocommit_flag):
+    raw = _db()
+    conn = _AutocommitConnection(raw) if autocommit_flag else raw
+    raw.isolation_level = None
+    edits = PendingEdits("t", COLUMNS, ["id"])
+    edits.stage_update(0, ROWS[0], "name", "x")
+    edits.stage_update(1, ROWS[1], "score", -1)
+
+    with pytest.raises(EditCommitError) as info:
+        apply_edit_batches(conn, edits.build_batches(_quote, "qmark"))
+
+    assert info.value.batch.sql.startswith('UPDATE t SET "score"')
+    assert raw.execute("SELECT name FROM t WHERE id = 1").fetchone() == ("a",)
+    assert raw.isolation_level is None
+    if autocommit_flag:
+        assert conn.autocommit is True
+
+
+def test_typed_text_takes_the_original_type():
+    assert coerce_edit_value("42", 1) == 42
+    assert coerce_edit_value("1.5", 2.0) == 1.5
+    assert coerce_edit_value("false", True) is False
+    assert coerce_edit_value("abc", 1) == "abc"
+    assert coerce_edit_value("7", "x") == "7"
@@ -0,0 +1,140 @@
+"""Tests for speculative table preview prefetch."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.explorer.app.preview_prefetch import (
+    PREFETCH_NEIGHBORS,
+    PREFETCH_OFF,
+    PREFETCH_TABLE,
+    PreviewPrefetcher,
+    PreviewRequest,
+    prefetch_mode,
+)
+from sqlit.domains.query.app.query_service import QueryResult
+
+
+def _sqlite_config(tmp_path, rows: int = 3) -> ConnectionConfig:
+    db_path = tmp_path / "db.sqlite"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER)")
+    conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(rows)])
+    conn.commit()
+    conn.close()
+    return ConnectionConfig.from_dict({"name": "local", "db_type": "sqlite", "file_path": str(db_path)})
+
+
+def _request(config: ConnectionConfig, query: str = "SELECT id FROM t") -> PreviewRequest:
+    return PreviewRequest(config=config, provider=get_provider("sqlite"), query=query, max_rows=100)
+
+
+class TestPrefetchMode:
+    def test_defaults_off_for_metered_warehouses(self):
+        snowflake = ConnectionConfig.from_dict({"name": "wh", "db_type": "snowflake", "server": "acct"})
+        postgres = ConnectionConfig.from_dict({"name": "pg", "db_type": "postgresql", "server": "db"})
+        assert prefetch_mode(snowflake) == PREFETCH_OFF
+        assert prefetch_mode(postgres) == PREFETCH_TABLE
+
+    def test_per_connection_option_overrides_default(self):
+        snowflake = ConnectionConfig.from_dict(
+            {"name": "wh", "db_type": "snowflake", "server": "acct", "options": {"preview_prefetch": "neighbors"}}
+        )
+        postgres = ConnectionConfig.from_dict(
+            {"name": "pg", "db_type": "postgresql", "server": "db", "options": {"preview_prefetch": "off"}}
+        )
+        assert prefetch_mode(snowflake) == PREFETCH_NEIGHBORS
+        assert prefetch_mode(postgres) == PREFETCH_OFF
+
+
+class TestPreviewPrefetcher:
+    def test_prefetched_result_is_taken_once(self, tmp_path):
+        config = _sqlite_config(tmp_path)
+        prefetcher = PreviewPrefetcher()
+
+        assert prefetcher.run_batch([_request(config)], prefetcher.generation) == 1
+        hit = prefetcher.take(config, "SELECT id\nFROM t;", 100)
+
+        assert hit is not None and isinstance(hit.result, QueryResult)
+        assert hit.result.row_count == 3
+        assert prefetcher.take(config, "SELECT id FROM t", 100) is None
+
+    def test_skips_writes_and_results_over_budget(self, tmp_path):
+        config = _sqlite_config(tmp_path, rows=2000)
+        prefetcher = PreviewPrefetcher(max_bytes_per_connection=1024)
+
+        assert not prefetcher.run(_request(config, "DELETE FROM t RETURNING id"))
+        assert not prefetcher.run(_request(config))
+        assert prefetcher.take(config, "SELECT id FROM t", 100) is None
+
+    def test_cancel_aborts_in_flight_query_and_stale_batch(self, tmp_path):
+        config = _sqlite_config(tmp_path)
+        started = threading.Event()
+        release = threading.Event()
+        cancelled: list[bool] = []
+
+        class _BlockingQuery:
+            def execute(self, max_rows):
+                started.set()
+                release.wait(5)
+                return QueryResult(columns=["id"], rows=[(1,)], row_count=1, truncated=False)
+
+            def cancel(self):
+                cancelled.append(True)
+                release.set()
+
+        prefetcher = PreviewPrefetcher(query_factory=lambda request: _BlockingQuery())
+        generation = prefetcher.generation
+        worker = threading.Thread(
+            target=prefetcher.run_batch,
+            args=([_request(config), _request(config, "SELECT 1")], generation),
+        )
+        worker.start()
+        assert started.wait(5)
+
+        assert prefetcher.cancel() == 1
+        worker.join(5)
+
+        assert cancelled == [True]
+        assert prefetcher.take(config, "SELECT id FROM t", 100) is None
+        assert prefetcher.take(config, "SELECT 1", 100) is None
+
+    def test_invalidate_drops_connection_results(self, tmp_path):
+        config = _sqlite_config(tmp_path)
+        prefetcher = PreviewPrefetcher()
+        prefetcher.run(_request(config))
+
+        prefetcher.invalidate(config)
+        assert prefetcher.take(config, "SELECT id FROM t", 100) is None
+
+    def test_invalidate_discards_prefetch_already_running(self, tmp_path):
+        config = _sqlite_config(tmp_path)
+        started = threading.Event()
+        release = threading.Event()
+        cancelled: list[bool] = []
+
+        class _SlowQuery:
+            """Finishes with pre-DML rows even after being cancelled."""
+
+            def execute(self, max_rows):
+                started.set()
+                release.wait(5)
+                return QueryResult(columns=["id"], rows=[(1,)], row_count=1, truncated=False)
+
+            def cancel(self):
+                cancelled.append(True)
+
+        prefetcher = PreviewPrefetcher(query_factory=lambda request: _SlowQuery())
+        worker = threading.Thread(target=prefetcher.run, args=(_request(config),))
+        worker.start()
+        assert started.wait(5)
+
+        prefetcher.invalidate(config)
+        release.set()
+        worker.join(5)
+
+        assert cancelled == [True]
+        assert prefetcher.take(config, "SELECT id FROM t", 100) is None
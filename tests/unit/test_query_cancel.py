@@ -0,0 +1,140 @@
+"""Tests for native query cancellation."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.adapters.cancel import ActiveCursors, call_cancel
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.connections.providers.model import QueryCanceller
+from sqlit.domains.query.app.cancellable import CancellableQuery
+
+# A recursive count that runs for far longer than any test timeout.
+LONG_QUERY = (
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 10000000000) "
+    "SELECT count(*) FROM n"
+)
+
+# Upper bound on cancel latency; native cancels land in milliseconds.
+MAX_CANCEL_SECONDS = 2.0
+
+
+def _config(tmp_path, db_type: str) -> ConnectionConfig:
+    path = tmp_path / f"db.{db_type}"
+    return ConnectionConfig.from_dict({"name": "local", "db_type": db_type, "file_path": str(path)})
+
+
+def _start(query: CancellableQuery) -> tuple[threading.Thread, dict[str, Any]]:
+    outcome: dict[str, Any] = {}
+
+    def run() -> None:
+        try:
+            outcome["result"] = query.execute(max_rows=10)
+        except Exception as error:
+            outcome["error"] = error
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while query._connection is None and thread.is_alive() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.2)  # let the statement get going
+    return thread, outcome
+
+
+@pytest.mark.parametrize("db_type", ["sqlite", "duckdb"])
+def test_cancel_latency_for_long_running_query(tmp_path, db_type):
+    if db_type == "duckdb":
+        pytest.importorskip("duckdb")
+    provider = get_provider(db_type)
+    assert isinstance(provider.query_executor, QueryCanceller)
+    query = CancellableQuery(sql=LONG_QUERY, config=_config(tmp_path, db_type), provider=provider)
+
+    thread, outcome = _start(query)
+    assert thread.is_alive()
+
+    start = time.perf_counter()
+    assert query.cancel() is True
+    thread.join(timeout=10)
+    latency = time.perf_counter() - start
+
+    assert not thread.is_alive()
+    assert "error" in outcome
+    assert latency < MAX_CANCEL_SECONDS, f"{db_type} cancel took {latency:.3f}s"
+    assert query.cancel() is False
+
+
+@pytest.mark.parametrize("db_type", ["sqlite", "duckdb"])
+def test_interrupt_keeps_connection_usable(tmp_path, db_type):
+    if db_type == "duckdb":
+        pytest.importorskip("duckdb")
+    provider = get_provider(db_type)
+    config = _config(tmp_path, db_type)
+    conn = provider.connection_factory.connect(config)
+    try:
+        errors: list[Exception] = []
+
+        def run() -> None:
+            try:
+                provider.query_executor.execute_query(conn, LONG_QUERY)
+            except Exception as error:
+                errors.append(error)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        time.sleep(0.2)
+        assert provider.query_executor.cancel_query(conn, config) is True
+        thread.join(timeout=10)
+
+        assert not thread.is_alive()
+        assert errors
+        columns, rows, _truncated = provider.query_executor.execute_query(conn, "SELECT 1")
+        assert len(columns) == 1
+        assert rows == [(1,)]
+    finally:
+        conn.close()
+
+
+def test_cancel_falls_back_to_close_without_native_support(tmp_path):
+    class Conn:
+        closed = False
+
+        def close(self) -> None:
+            self.closed = True
+
+    provider = get_provider("sqlite")
+    query = CancellableQuery(sql="SELECT 1", config=_config(tmp_path, "sqlite"), provider=provider)
+    conn = Conn()
+    query._connection = conn
+    query._connect_config = query.config
+    query.provider = type("P", (), {"query_executor": object()})()
+
+    assert query.cancel() is True
+    assert conn.closed
+    assert query._connection is None
+
+
+def test_active_cursors_track_only_while_running():
+    cursors = ActiveCursors()
+    conn, cursor = object(), object()
+    with cursors.tracking(conn, cursor):
+        assert cursors.get(conn) is cursor
+    assert cursors.get(conn) is None
+
+
+def test_call_cancel_reports_missing_method():
+    calls: list[str] = []
+
+    class Cursor:
+        def cancel(self) -> None:
+            calls.append("cancel")
+
+    assert call_cancel(Cursor()) is True
+    assert call_cancel(object()) is False
+    assert call_cancel(None) is False
+    assert calls == ["cancel"]
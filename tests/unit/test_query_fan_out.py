@@ -0,0 +1,191 @@
+"""Tests for running a query on several connections at once."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from argparse import Namespace
+from typing import Any
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.query.app.fan_out import (
+    CONNECTION_COLUMN,
+    FanOutQuery,
+    FanOutResult,
+    ShardResult,
+)
+from sqlit.domains.query.cli.commands import cmd_query
+from tests.ui.mocks import MockConnectionStore, build_test_services
+
+LONG_QUERY = (
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 10000000000) "
+    "SELECT i AS id FROM n"
+)
+
+
+def _shard(tmp_path, name: str, rows: list[tuple[int, str]] | None = None) -> ConnectionConfig:
+    path = tmp_path / f"{name}.sqlite"
+    conn = sqlite3.connect(path)
+    if rows is not None:
+        conn.execute("CREATE TABLE t (id INTEGER, name TEXT)")
+        conn.executemany("INSERT INTO t VALUES (?, ?)", rows)
+        conn.commit()
+    conn.close()
+    return ConnectionConfig.from_dict({"name": name, "db_type": "sqlite", "file_path": str(path)})
+
+
+def _targets(configs: list[ConnectionConfig]) -> list[tuple[ConnectionConfig, Any]]:
+    return [(config, get_provider("sqlite")) for config in configs]
+
+
+def test_fan_out_merges_rows_and_reports_failures(tmp_path):
+    configs = [
+        _shard(tmp_path, "a", [(1, "x"), (2, "y")]),
+        _shard(tmp_path, "b", [(3, "z")]),
+        _shard(tmp_path, "empty"),
+    ]
+    finished: list[str] = []
+
+    result = FanOutQuery("SELECT id, name FROM t ORDER BY id", _targets(configs), max_workers=2).execute(
+        max_rows=10, on_shard=lambda shard: finished.append(shard.connection_name)
+    )
+
+    assert [shard.connection_name for shard in result.shards] == ["a", "b", "empty"]
+    assert sorted(finished) == ["a", "b", "empty"]
+    columns, rows = result.merged()
+    assert columns == [CONNECTION_COLUMN, "id", "name"]
+    assert rows == [("a", 1, "x"), ("a", 2, "y"), ("b", 3, "z")]
+    [failed] = result.failed
+    assert failed.connection_name == "empty"
+    assert "no such table" in (failed.error or "")
+    assert result.summary_rows()[0][:3] == ("a", "ok", 2)
+    assert result.summary_rows()[2][1] == "error"
+
+
+def test_merge_aligns_differing_columns():
+    result = FanOutResult(
+        shards=[
+            ShardResult("a", columns=["id", "name"], rows=[(1, "x")]),
+            ShardResult("b", columns=["id", "extra"], rows=[(2, True)]),
+            ShardResult("c", error="boom"),
+        ]
+    )
+
+    columns, rows = result.merged()
+
+    assert columns == [CONNECTION_COLUMN, "id", "name", "extra"]
+    assert rows == [("a", 1, "x", None), ("b", 2, None, True)]
+
+
+def test_slow_shard_times_out_without_blocking_others(tmp_path):
+    fast = _shard(tmp_path, "fast", [(1, "x")])
+    slow = _shard(tmp_path, "slow")
+    conn = sqlite3.connect(tmp_path / "slow.sqlite")
+    conn.execute(f"CREATE VIEW t AS {LONG_QUERY}")
+    conn.close()
+
+    result = FanOutQuery("SELECT count(*) AS c FROM t", _targets([fast, slow]), timeout_s=0.3).execute()
+
+    fast_shard, slow_shard = result.shards
+    assert fast_shard.ok
+    assert list(fast_shard.rows) == [(1,)]
+    assert slow_shard.timed_out
+    assert slow_shard.status == "timeout"
+    assert slow_shard.elapsed_ms < 5000
+    assert result.merged()[1] == [("fast", 1)]
+
+
+def test_shard_finishing_as_timer_fires_keeps_its_result(tmp_path, monkeypatch):
+    from sqlit.domains.query.app.cancellable import CancellableQuery
+    from sqlit.domains.query.app.query_service import QueryResult
+
+    def execute(self, max_rows=None):
+        time.sleep(0.2)
+        return QueryResult(columns=["id"], rows=[(1,)], row_count=1, truncated=False)
+
+    monkeypatch.setattr(CancellableQuery, "execute", execute)
+    monkeypatch.setattr(CancellableQuery, "cancel", lambda self: None)
+
+    result = FanOutQuery("SELECT 1", _targets([_shard(tmp_path, "a")]), timeout_s=0.05).execute()
+
+    [shard] = result.shards
+    assert shard.ok and not shard.timed_out
+    assert list(shard.rows) == [(1,)]
+
+
+def test_merge_keeps_repeated_column_names():
+    same = FanOutResult(
+        shards=[
+            ShardResult("a", columns=["id", "id"], rows=[(1, 10)]),
+            ShardResult("b", columns=["id", "id"], rows=[(2, 20)]),
+        ]
+    )
+    differing = FanOutResult(
+        shards=[
+            ShardResult("a", columns=["id", "id"], rows=[(1, 10)]),
+            ShardResult("b", columns=["id"], rows=[(2,)]),
+        ]
+    )
+
+    assert same.merged() == ([CONNECTION_COLUMN, "id", "id"], [("a", 1, 10), ("b", 2, 20)])
+    assert differing.merged() == ([CONNECTION_COLUMN, "id", "id_2"], [("a", 1, 10), ("b", 2, None)])
+
+
+def test_cancel_skips_remaining_shards(tmp_path):
+    configs = [_shard(tmp_path, name) for name in ("a", "b")]
+    fan_out = FanOutQuery("SELECT 1", _targets(configs), max_workers=1)
+    fan_out.cancel()
+
+    result = fan_out.execute()
+
+    assert len(result.failed) == 2
+    assert "cancelled" in (result.shards[0].error or "")
+
+
+class TestQueryCommandFanOut:
+    def _args(self, connections: list[str], **overrides: Any) -> Namespace:
+        values = {
+            "connection": connections,
+            "database": None,
+            "query": "SELECT id, name FROM t ORDER BY id",
+            "file": None,
+            "format": "json",
+            "limit": 1000,
+            "limit_pushdown": False,
+            "parallel": 4,
+            "timeout": 0,
+        }
+        values.update(overrides)
+        return Namespace(**values)
+
+    def test_json_output_has_connection_column(self, tmp_path, capsys):
+        configs = [_shard(tmp_path, "a", [(1, "x")]), _shard(tmp_path, "b", [(2, "y")])]
+        services = build_test_services(connection_store=MockConnectionStore(configs))
+
+        assert cmd_query(self._args(["a", "b"]), services=services) == 0
+
+        captured = capsys.readouterr()
+        assert json.loads(captured.out) == [
+            {CONNECTION_COLUMN: "a", "id": 1, "name": "x"},
+            {CONNECTION_COLUMN: "b", "id": 2, "name": "y"},
+        ]
+        assert "2/2 connections ok" in captured.err
+
+    def test_failed_shard_sets_exit_code(self, tmp_path, capsys):
+        configs = [_shard(tmp_path, "a", [(1, "x")]), _shard(tmp_path, "b")]
+        services = build_test_services(connection_store=MockConnectionStore(configs))
+
+        assert cmd_query(self._args(["a", "b"], format="table"), services=services) == 1
+
+        out = capsys.readouterr().out
+        assert CONNECTION_COLUMN in out
+        assert "no such table" in out
+        assert "1/2 connections ok" in out
+
+    def test_unknown_connection(self, tmp_path, capsys):
+        services = build_test_services(connection_store=MockConnectionStore([_shard(tmp_path, "a")]))
+
+        assert cmd_query(self._args(["a", "missing"]), services=services) == 1
+        assert "'missing' not found" in capsys.readouterr().out
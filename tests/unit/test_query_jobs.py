@@ -0,0 +1,189 @@
+"""Tests for background query jobs."""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.query.app.query_jobs import (
+    JOB_CANCELLED,
+    JOB_DETACHED,
+    JOB_DONE,
+    JOB_ERROR,
+    QueryJob,
+    QueryJobManager,
+)
+from sqlit.domains.query.store.jobs import QueryJobStore
+from sqlit.domains.results.store import ResultStore
+
+LONG_QUERY = (
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 10000000000) "
+    "SELECT count(*) FROM n"
+)
+
+
+def _sqlite_config(tmp_path) -> ConnectionConfig:
+    path = tmp_path / "db.sqlite"
+    return ConnectionConfig.from_dict({"name": "local", "db_type": "sqlite", "file_path": str(path)})
+
+
+def _wait(job: QueryJob, timeout: float = 10.0) -> QueryJob:
+    deadline = time.monotonic() + timeout
+    while job.is_running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not job.is_running
+    return job
+
+
+class FakeRemoteExecutor:
+    """Server-side jobs that finish after a fixed number of polls."""
+
+    def __init__(self, polls: int = 2) -> None:
+        self.polls = polls
+        self.submitted: list[str] = []
+        self.cancelled: list[dict[str, str]] = []
+        self._poll_counts: dict[str, int] = {}
+
+    def execute_query(self, conn: Any, query: str, max_rows: int | None = None) -> Any:
+        raise AssertionError("remote jobs must not run through execute_query")
+
+    def execute_non_query(self, conn: Any, query: str) -> int:
+        raise AssertionError("remote jobs must not run through execute_non_query")
+
+    def submit_job(self, conn: Any, query: str) -> dict[str, str]:
+        self.submitted.append(query)
+        return {"query_id": f"q{len(self.submitted)}"}
+
+    def poll_job(self, conn: Any, handle: dict[str, str]) -> str | None:
+        count = self._poll_counts.get(handle["query_id"], 0) + 1
+        self._poll_counts[handle["query_id"]] = count
+        return None if count > self.polls else f"running {count}/{self.polls}"
+
+    def fetch_job(self, conn: Any, handle: dict[str, str], max_rows: int | None = None):
+        return ["id"], [(1,), (2,)], False
+
+    def cancel_job(self, conn: Any, handle: dict[str, str]) -> bool:
+        self.cancelled.append(handle)
+        return True
+
+
+def _remote_provider(executor: FakeRemoteExecutor) -> Any:
+    return SimpleNamespace(
+        metadata=SimpleNamespace(db_type="snowflake", display_name="Snowflake"),
+        query_executor=executor,
+        connection_factory=SimpleNamespace(connect=lambda config: SimpleNamespace(close=lambda: None)),
+        post_connect=lambda conn, config: None,
+    )
+
+
+def _remote_config() -> ConnectionConfig:
+    return ConnectionConfig.from_dict({"name": "warehouse", "db_type": "snowflake", "server": "acct"})
+
+
+def test_local_job_keeps_result(tmp_path):
+    changes: list[str] = []
+    store = ResultStore(1024 * 1024)
+    manager = QueryJobManager(store, on_change=lambda job: changes.append(job.status))
+
+    job = _wait(manager.submit("SELECT 1 AS a UNION ALL SELECT 2", _sqlite_config(tmp_path), get_provider("sqlite"), 10))
+
+    assert job.status == JOB_DONE
+    assert job.columns == ["a"]
+    assert list(job.rows) == [(1,), (2,)]
+    assert job.rows in store.results
+    assert changes[-1] == JOB_DONE
+
+    assert manager.remove(job.job_id)
+    assert store.results == []
+    assert manager.jobs == []
+
+
+def test_close_releases_job_results_but_leaves_shared_store_open(tmp_path):
+    store = ResultStore(1024 * 1024)
+    displayed = store.put(["a"], [(1,)])
+    manager = QueryJobManager(store)
+    job = _wait(manager.submit("SELECT 2 AS a", _sqlite_config(tmp_path), get_provider("sqlite"), 10))
+    opened = store.put(job.columns, job.rows)
+    assert opened is job.rows
+
+    manager.close()
+
+    assert job.rows is None
+    assert store.results == [displayed, opened]
+    store.release(opened)
+    assert store.results == [displayed]
+
+
+def test_local_job_cancel_and_error(tmp_path):
+    manager = QueryJobManager(ResultStore(1024 * 1024))
+    config = _sqlite_config(tmp_path)
+    provider = get_provider("sqlite")
+
+    job = manager.submit(LONG_QUERY, config, provider)
+    time.sleep(0.2)
+    assert manager.running_count == 1
+    assert not manager.remove(job.job_id)
+    assert manager.cancel(job.job_id)
+    assert _wait(job).status == JOB_CANCELLED
+
+    failed = _wait(manager.submit("SELECT * FROM missing", config, provider))
+    assert failed.status == JOB_ERROR
+    assert "missing" in (failed.error or "")
+
+
+def test_remote_job_is_persisted_until_fetched(tmp_path):
+    job_store = QueryJobStore(tmp_path / "jobs.json")
+    executor = FakeRemoteExecutor(polls=2)
+    labels: list[str | None] = []
+    manager = QueryJobManager(
+        ResultStore(1024 * 1024),
+        job_store,
+        on_change=lambda job: labels.append(job.server_status),
+        poll_interval_s=0.01,
+    )
+
+    job = _wait(manager.submit("SELECT id FROM big", _remote_config(), _remote_provider(executor)))
+
+    assert job.status == JOB_DONE
+    assert job.remote == {"query_id": "q1"}
+    assert list(job.rows) == [(1,), (2,)]
+    assert "running 1/2" in labels
+    assert job_store.load_all() == {}
+
+
+def test_detached_job_reattaches_after_restart(tmp_path):
+    job_store = QueryJobStore(tmp_path / "jobs.json")
+    previous = QueryJob(job_id=1, connection_name="warehouse", db_type="snowflake", sql="SELECT id FROM big")
+    previous.remote = {"query_id": "q-old"}
+    job_store.save_job(previous.token, previous.to_dict())
+
+    executor = FakeRemoteExecutor(polls=1)
+    manager = QueryJobManager(ResultStore(1024 * 1024), job_store, poll_interval_s=0.01)
+    [job] = manager.jobs
+    assert job.status == JOB_DETACHED
+    assert job.token == previous.token
+
+    manager.reattach(job.job_id, _remote_config(), _remote_provider(executor))
+    _wait(job)
+
+    assert job.status == JOB_DONE
+    assert executor.submitted == []
+    assert list(job.rows) == [(1,), (2,)]
+    assert job_store.load_all() == {}
+
+
+def test_remote_job_cancel_cancels_on_server(tmp_path):
+    executor = FakeRemoteExecutor(polls=10_000)
+    manager = QueryJobManager(ResultStore(1024 * 1024), QueryJobStore(tmp_path / "jobs.json"), poll_interval_s=0.01)
+
+    job = manager.submit("SELECT id FROM big", _remote_config(), _remote_provider(executor))
+    deadline = time.monotonic() + 5
+    while job.remote is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert manager.cancel(job.job_id)
+
+    assert _wait(job).status == JOB_CANCELLED
+    assert executor.cancelled == [{"query_id": "q1"}]
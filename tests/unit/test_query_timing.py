@@ -0,0 +1,109 @@
+"""Tests for per-phase query timing spans."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from sqlit.shared.core.query_timing import (
+    QueryTimings,
+    activate,
+    current_query_timings,
+    format_breakdown,
+    query_span,
+    record_query_span,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, ms: float) -> None:
+        self.now += ms / 1000
+
+
+def test_nested_spans_report_self_time():
+    clock = _Clock()
+    timings = QueryTimings("SELECT 1", connection="local", clock=clock)
+    with activate(timings):
+        with query_span("connect"):
+            clock.advance(5)
+        with query_span("execute"):
+            clock.advance(3)
+            record_query_span("fetch", 7)
+            clock.advance(7)
+    timings.finish()
+
+    assert timings.phase_totals() == {"connect": 5.0, "execute": 3.0, "fetch": 7.0}
+    execute = next(span for span in timings.spans if span.phase == "execute")
+    assert execute.duration_ms == 10.0
+    assert execute.start_ms == 5.0
+    assert timings.total_ms == 15.0
+
+
+def test_spans_are_noops_without_an_active_query():
+    with query_span("execute"):
+        record_query_span("fetch", 1)
+    assert current_query_timings() is None
+
+
+def test_worker_threads_record_into_the_active_query():
+    timings = QueryTimings()
+
+    def work() -> None:
+        with query_span("execute"):
+            pass
+
+    async def run() -> None:
+        with activate(timings):
+            await asyncio.to_thread(work)
+
+    asyncio.run(run())
+    assert [span.phase for span in timings.spans] == ["execute"]
+
+
+def test_merge_shifts_spans_from_another_process():
+    clock = _Clock()
+    timings = QueryTimings(clock=clock)
+    timings.merge(
+        [{"phase": "connect", "start_ms": 1.0, "duration_ms": 4.0, "self_ms": 4.0}, {"phase": "bad"}],
+        offset_ms=10.0,
+    )
+    timings.record("ipc", 2.0, start_ms=15.0)
+
+    assert [(span.phase, span.start_ms) for span in timings.spans] == [("connect", 11.0), ("ipc", 15.0)]
+
+
+def test_json_line_and_breakdown():
+    clock = _Clock()
+    timings = QueryTimings("SELECT 1", connection="local", clock=clock)
+    with timings.span("table_build"):
+        clock.advance(2)
+    with timings.span("connect"):
+        clock.advance(4)
+    timings.finish("cancelled")
+
+    payload = json.loads(timings.to_json_line())
+    assert payload["status"] == "cancelled"
+    assert payload["total_ms"] == 6.0
+    assert list(payload["phases"]) == ["connect", "table_build"]
+    assert payload["spans"][0]["phase"] == "table_build"
+
+    lines = format_breakdown(timings).splitlines()
+    assert lines[0].startswith("Connect")
+    assert lines[-1].startswith("Total")
+
+
+def test_expected_phases_keep_the_query_open():
+    timings = QueryTimings()
+    timings.expect("first_paint")
+    timings.expect("render")
+
+    assert timings.awaiting
+    assert not timings.done("render")
+    assert timings.done("first_paint")
+    assert not timings.awaiting
@@ -0,0 +1,135 @@
+"""Tests for the query result cache."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.sqlite.adapter import SQLiteAdapter
+from sqlit.domains.query.app.query_service import NonQueryResult, QueryResult, QueryService
+from sqlit.domains.query.app.result_cache import (
+    QueryResultCache,
+    format_cache_age,
+    is_cacheable_query,
+    normalize_sql,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _config(name: str = "local", database: str = "app") -> ConnectionConfig:
+    return ConnectionConfig.from_dict(
+        {"name": name, "db_type": "postgresql", "server": "db", "port": "5432", "database": database}
+    )
+
+
+def _result(rows: int = 3) -> QueryResult:
+    data = [(i, f"name-{i}") for i in range(rows)]
+    return QueryResult(columns=["id", "name"], rows=data, row_count=rows, truncated=False)
+
+
+class TestNormalization:
+    def test_collapses_whitespace_and_comments_outside_literals(self):
+        assert normalize_sql("SELECT  *\n  FROM t -- note\nWHERE a = 'x  y';") == "SELECT * FROM t WHERE a = 'x  y'"
+        assert normalize_sql("SELECT /* c */ 1") == normalize_sql("SELECT 1")
+        assert normalize_sql("SELECT 'it''s  ok'") == "SELECT 'it''s  ok'"
+
+    def test_write_keywords_are_not_cacheable(self):
+        assert is_cacheable_query("SELECT * FROM users")
+        assert not is_cacheable_query("WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d")
+        assert not is_cacheable_query("SELECT * INTO backup FROM t")
+
+    def test_format_cache_age(self):
+        assert format_cache_age(12.7) == "12s"
+        assert format_cache_age(185) == "3m"
+        assert format_cache_age(7300) == "2h"
+
+
+class TestQueryResultCache:
+    def test_hit_within_ttl_and_expiry(self):
+        clock = _Clock()
+        cache = QueryResultCache(ttl_s=30, clock=clock)
+        result = _result()
+        cache.put(_config(), "SELECT * FROM t", 100, result)
+
+        clock.now = 12
+        hit = cache.get(_config(), "SELECT *\n FROM t;", 100)
+        assert hit is not None and hit.result is result and hit.age_s == 12
+        assert cache.get(_config(database="other"), "SELECT * FROM t", 100) is None
+        assert cache.get(_config(), "SELECT * FROM t", 10) is None
+
+        clock.now = 30
+        assert cache.get(_config(), "SELECT * FROM t", 100) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction_keeps_budget(self):
+        one = QueryResultCache(ttl_s=60)
+        one.put(_config(), "SELECT 1", None, _result(50))
+        budget = one.bytes_used * 2 + 1
+        cache = QueryResultCache(ttl_s=60, max_bytes=budget)
+
+        cache.put(_config(), "SELECT 1", None, _result(50))
+        cache.put(_config(), "SELECT 2", None, _result(50))
+        assert cache.get(_config(), "SELECT 1", None) is not None
+        cache.put(_config(), "SELECT 3", None, _result(50))
+
+        assert cache.bytes_used <= budget
+        assert cache.get(_config(), "SELECT 2", None) is None
+        assert cache.get(_config(), "SELECT 1", None) is not None
+        assert cache.stats.evictions == 1
+        assert not cache.put(_config(), "SELECT 4", None, _result(5000))
+
+    def test_invalidate_connection_drops_all_databases(self):
+        cache = QueryResultCache(ttl_s=60)
+        cache.put(_config(database="a"), "SELECT 1", None, _result())
+        cache.put(_config(database="b"), "SELECT 1", None, _result())
+        cache.put(_config(name="other"), "SELECT 1", None, _result())
+
+        assert cache.invalidate_connection(_config()) == 2
+        assert cache.get(_config(name="other"), "SELECT 1", None) is not None
+
+
+class TestQueryServiceCaching:
+    @pytest.fixture
+    def conn(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "db.sqlite")
+        conn.execute("CREATE TABLE t (id INTEGER)")
+        conn.execute("INSERT INTO t VALUES (1)")
+        conn.commit()
+        yield conn
+        conn.close()
+
+    def test_select_cached_and_dml_invalidates(self, conn):
+        service = QueryService(result_cache=QueryResultCache(ttl_s=60))
+        executor = SQLiteAdapter()
+        config = _config()
+
+        first = service.execute(conn, executor, "SELECT id FROM t", config, save_to_history=False)
+        conn.execute("INSERT INTO t VALUES (2)")
+        second = service.execute(conn, executor, "SELECT id FROM t", config, save_to_history=False)
+        assert second is first
+
+        affected = service.execute(conn, executor, "INSERT INTO t VALUES (3)", config, save_to_history=False)
+        assert isinstance(affected, NonQueryResult)
+        third = service.execute(conn, executor, "SELECT id FROM t", config, save_to_history=False)
+        assert third.row_count == 3
+
+        fresh = service.execute(conn, executor, "SELECT id FROM t", config, save_to_history=False, use_cache=False)
+        assert fresh is not third
+
+    def test_bypassed_inside_transaction(self, conn):
+        class _TxExecutor(SQLiteAdapter):
+            in_transaction = True
+
+        service = QueryService(result_cache=QueryResultCache(ttl_s=60))
+        config = _config()
+        service.execute(conn, _TxExecutor(), "SELECT id FROM t", config, save_to_history=False)
+        assert len(service.result_cache) == 0
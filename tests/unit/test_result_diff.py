@@ -0,0 +1,85 @@
+"""Tests for hash-based diffs between two result sets."""
+
+from __future__ import annotations
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from sqlit.domains.query.app.arrow_rows import ArrowRowView
+from sqlit.domains.results.diff import diff_results
+from sqlit.domains.results.hashing import column_hashes
+
+COLUMNS = ["id", "name", "score"]
+OLD = [(1, "a", 1.0), (2, "b", 2.0), (2, "b", 2.0), (3, "c", None)]
+NEW = [(2, "b", 2), (1, "a", 1.5), (4, "d", None), (2, "b", 2.0)]
+
+
+def test_unkeyed_diff_matches_rows_as_a_multiset():
+    diff = diff_results(OLD, COLUMNS, NEW, COLUMNS)
+
+    assert diff.added.tolist() == [1, 2]
+    assert diff.removed.tolist() == [0, 3]
+    assert len(diff.changed) == 0
+    assert diff.unchanged == 2
+
+
+def test_keyed_diff_reports_changed_rows():
+    diff = diff_results(OLD, COLUMNS, NEW, ["ID", "name", "score"], key=["id"])
+
+    assert diff.key == ["ID"]
+    assert diff.changed.tolist() == [[0, 1]]
+    assert diff.added.tolist() == [2]
+    assert diff.removed.tolist() == [3]
+
+
+def test_only_shared_columns_are_compared():
+    diff = diff_results([(1, "x")], ["id", "extra"], [("y", 1)], ["other", "id"])
+
+    assert diff.columns == ["id"]
+    assert diff.identical
+
+
+def test_key_must_be_a_shared_column():
+    with pytest.raises(ValueError, match="missing"):
+        diff_results([(1,)], ["id"], [(1,)], ["id"], key=["missing"])
+
+
+def test_partitioned_diff_matches_in_memory_diff(tmp_path):
+    count = 5000
+    ids = np.arange(count)
+    old = pa.table({"id": ids, "label": [f"v{i % 97}" for i in range(count)]})
+    labels = old["label"].to_pylist()
+    labels[10] = "changed"
+    new = pa.table({"id": ids, "label": labels}).slice(5)
+
+    in_memory = diff_results(ArrowRowView(old), old.column_names, ArrowRowView(new), new.column_names, key=["id"])
+    spilled = diff_results(
+        ArrowRowView(old),
+        old.column_names,
+        ArrowRowView(new),
+        new.column_names,
+        key=["id"],
+        chunk_rows=700,
+        partition_rows=1000,
+        spill_dir=tmp_path,
+    )
+
+    assert in_memory.partitions == 1 and spilled.partitions == 8
+    for diff in (in_memory, spilled):
+        assert diff.changed.tolist() == [[10, 5]]
+        assert diff.removed.tolist() == [0, 1, 2, 3, 4]
+        assert len(diff.added) == 0
+        assert diff.unchanged == count - 6
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_integral_floats_hash_like_integers_and_nulls_agree():
+    ints = column_hashes(pa.array([1, None, 3]))
+    floats = column_hashes(pa.array([1.0, None, 3.5]))
+
+    assert ints[0] == floats[0] and ints[1] == floats[1] and ints[2] != floats[2]
+
+
+def test_stops_when_asked():
+    assert diff_results(OLD, COLUMNS, NEW, COLUMNS, should_stop=lambda: True) is None
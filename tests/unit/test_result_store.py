@@ -0,0 +1,127 @@
+"""Tests for the memory-budgeted result store."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from sqlit.domains.query.app.arrow_rows import snapshot_rows
+from sqlit.domains.results.store import ResultStore, RowIndexView, StoredResult, estimate_rows_bytes
+from sqlit.shared.core.columnar_rows import ColumnarRows
+
+pa = pytest.importorskip("pyarrow")
+
+
+def _rows(count: int, width: int = 20) -> list[tuple]:
+    return [(i, "x" * width, i * 0.5) for i in range(count)]
+
+
+COLUMNS = ["id", "text", "score"]
+
+
+class TestResultStore:
+    def test_put_owns_rows_without_copying(self, tmp_path):
+        store = ResultStore(10 * 1024 * 1024, spill_dir=tmp_path)
+        rows = _rows(10)
+
+        stored = store.put(COLUMNS, rows)
+
+        assert isinstance(stored, StoredResult)
+        assert stored._rows is rows
+        assert list(stored) == rows
+        assert store.resident_bytes == stored.nbytes > 0
+        assert snapshot_rows(stored) is stored
+
+    def test_spills_least_recently_used_over_budget(self, tmp_path):
+        first_rows = _rows(2000)
+        budget = estimate_rows_bytes(first_rows) + 1024
+        store = ResultStore(budget, spill_dir=tmp_path)
+
+        first = store.put(COLUMNS, first_rows)
+        second = store.put(COLUMNS, _rows(2000))
+
+        assert first.spilled is True
+        assert second.spilled is False
+        assert store.resident_bytes == second.nbytes
+        assert first.spill_path is not None and first.spill_path.exists()
+        assert first[1999] == (1999, "x" * 20, 999.5)
+        assert first.arrow_table is not None
+
+    def test_touch_changes_spill_order(self, tmp_path):
+        rows = _rows(1000)
+        store = ResultStore(estimate_rows_bytes(rows) * 2 + 1024, spill_dir=tmp_path)
+
+        first = store.put(COLUMNS, rows)
+        second = store.put(COLUMNS, _rows(1000))
+        list(first)
+        store.put(COLUMNS, _rows(1000))
+
+        assert first.spilled is False
+        assert second.spilled is True
+
+    def test_oversized_result_is_spilled_but_readable(self, tmp_path):
+        store = ResultStore(0, spill_dir=tmp_path)
+
+        stored = store.put(["amount"], [(Decimal("1.50"),), (None,)])
+
+        assert stored.spilled is True
+        assert list(stored) == [(Decimal("1.50"),), (None,)]
+
+    def test_release_and_close_remove_spill_files(self, tmp_path):
+        store = ResultStore(0, spill_dir=tmp_path)
+        first = store.put(COLUMNS, _rows(10))
+        second = store.put(COLUMNS, _rows(10))
+        first_path = first.spill_path
+
+        store.release(first)
+        assert first_path is not None and not first_path.exists()
+        assert first[0] == (0, "x" * 20, 0.0)
+
+        spill_dir = second.spill_path.parent
+        store.close()
+        assert not spill_dir.exists()
+        assert store.results == []
+
+    def test_result_put_twice_is_kept_until_both_holders_release(self, tmp_path):
+        store = ResultStore(10 * 1024 * 1024, spill_dir=tmp_path)
+        stored = store.put(COLUMNS, _rows(10))
+
+        assert store.put(COLUMNS, stored) is stored
+        store.release(stored)
+        assert store.results == [stored]
+        assert store.resident_bytes == stored.nbytes
+
+        store.release(stored)
+        assert store.results == []
+        assert store.resident_bytes == 0
+
+    def test_columnar_rows_use_their_own_size_and_spill(self, tmp_path):
+        rows = ColumnarRows.from_rows(_rows(2000))
+        store = ResultStore(0, spill_dir=tmp_path)
+
+        stored = store.put(COLUMNS, rows)
+
+        assert estimate_rows_bytes(rows) == rows.nbytes
+        assert stored.spilled is True
+        assert list(stored) == _rows(2000)
+
+    def test_raising_budget_keeps_results_resident(self, tmp_path):
+        store = ResultStore(0, spill_dir=tmp_path)
+        store.budget_bytes = 10 * 1024 * 1024
+
+        stored = store.put(COLUMNS, _rows(10))
+
+        assert stored.spilled is False
+
+
+class TestRowIndexView:
+    def test_views_rows_by_index(self):
+        base = _rows(10)
+        view = RowIndexView(base, [1, 3, 5])
+
+        assert len(view) == 3
+        assert view[1] == base[3]
+        assert view[1:] == [base[3], base[5]]
+        assert list(view) == [base[1], base[3], base[5]]
+        assert snapshot_rows(view) is view
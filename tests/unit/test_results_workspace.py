@@ -0,0 +1,110 @@
+"""Tests for querying held result sets in the local DuckDB workspace."""
+
+from __future__ import annotations
+
+import pyarrow as pa
+import pytest
+
+from sqlit.domains.query.app.arrow_rows import ArrowRowView
+from sqlit.domains.query.app.query_service import NonQueryResult, QueryResult
+from sqlit.domains.results.store import ResultStore, StoredResult
+from sqlit.domains.results.workspace import ResultsWorkspace
+
+pytest.importorskip("duckdb")
+
+
+def test_joins_and_groups_registered_results():
+    workspace = ResultsWorkspace()
+    orders = workspace.add(["id", "customer"], [(1, "a"), (2, "b"), (3, "a")], "SELECT * FROM orders")
+    customers = workspace.add(["customer", "name"], [("a", "Ann"), ("b", "Bob")])
+
+    result = workspace.execute(
+        f"SELECT c.name, count(*) AS n FROM {orders} o JOIN {customers} c USING (customer) GROUP BY 1 ORDER BY 1"
+    )
+
+    assert (orders, customers) == ("r1", "r2")
+    assert isinstance(result, QueryResult)
+    assert result.columns == ["name", "n"]
+    assert list(result.rows) == [("Ann", 2), ("Bob", 1)]
+
+
+def test_arrow_results_register_without_copy_and_views_last_one_query():
+    table = pa.table({"x": [1, 2, 3]})
+    workspace = ResultsWorkspace()
+    workspace.add(["x"], ArrowRowView(table))
+    workspace.add(["y"], [(1,)])
+    registered: list[tuple[str, object]] = []
+    connection = workspace._connect()
+    workspace._connection = _RecordingConnection(connection, registered)
+
+    result = workspace.execute("SELECT sum(x) + (SELECT y FROM r2) FROM r1")
+
+    assert list(result.rows) == [(7,)]
+    assert dict(registered)["r1"] is table
+    assert connection.execute("SELECT count(*) FROM duckdb_views() WHERE view_name IN ('r1', 'r2')").fetchone() == (0,)
+
+
+class _RecordingConnection:
+    def __init__(self, connection, registered):
+        self._connection = connection
+        self._registered = registered
+
+    def register(self, name, table):
+        self._registered.append((name, table))
+        return self._connection.register(name, table)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+def test_evicted_results_are_dropped():
+    workspace = ResultsWorkspace(max_results=1)
+    workspace.add(["x"], [(1,)])
+    workspace.execute("SELECT * FROM r1")
+    workspace.add(["x"], [(2,)])
+
+    assert [result.name for result in workspace.results] == ["r2"]
+    with pytest.raises(Exception, match="r1"):
+        workspace.execute("SELECT * FROM r1")
+
+
+def test_repeated_column_names_are_suffixed():
+    workspace = ResultsWorkspace()
+    workspace.add(["id", "id"], [(1, 2)])
+
+    result = workspace.execute("SELECT id_2 FROM R1")
+
+    assert list(result.rows) == [(2,)]
+
+
+def test_statements_run_in_the_workspace():
+    workspace = ResultsWorkspace()
+    workspace.add(["x"], [(1,), (2,)])
+
+    created = workspace.execute("CREATE TABLE doubled AS SELECT x * 2 AS x FROM r1")
+    result = workspace.execute("SELECT x FROM doubled ORDER BY x", max_rows=1)
+
+    assert isinstance(created, NonQueryResult)
+    assert list(result.rows) == [(2,)] and result.truncated
+
+
+def test_results_are_held_by_the_result_store(tmp_path):
+    store = ResultStore(0, spill_dir=tmp_path)
+    workspace = ResultsWorkspace(max_results=2, result_store=store)
+    displayed = store.put(["x"], [(1,), (2,)])
+    workspace.add(["x"], displayed)
+    workspace.add(["x"], [(3,)])
+
+    store.release(displayed)
+    first, second = (result.rows for result in workspace.results)
+    assert first is displayed
+    assert isinstance(second, StoredResult)
+    assert store.results == [first, second]
+    assert first.spilled and store.resident_bytes == 0
+    assert list(workspace.execute("SELECT sum(x) FROM r1").rows) == [(3,)]
+
+    workspace.add(["x"], [(4,)])
+    assert first not in store.results
+
+    workspace.close()
+    assert store.results == []
@@ -0,0 +1,156 @@
+"""Tests for parallel schema indexing across databases."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.query.app.schema_indexer import SchemaIndexer, prioritize_databases
+
+
+class _Connection:
+    def __init__(self, factory: _ConnectionFactory) -> None:
+        self.factory = factory
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _ConnectionFactory:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.opened: list[_Connection] = []
+        self._lock = threading.Lock()
+
+    def connect(self, config: ConnectionConfig) -> _Connection:
+        if self.fail:
+            raise ConnectionError("too many connections")
+        conn = _Connection(self)
+        with self._lock:
+            self.opened.append(conn)
+        return conn
+
+
+class _Inspector:
+    def __init__(self, delay: float = 0.0, failing_views: set[str] | None = None) -> None:
+        self.delay = delay
+        self.failing_views = failing_views or set()
+        self.active = 0
+        self.max_active = 0
+        self.calls: list[tuple[str, str | None]] = []
+        self._lock = threading.Lock()
+
+    def _call(self, kind: str, database: str | None) -> None:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append((kind, database))
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+
+    def get_tables(self, conn: Any, database: str | None = None) -> list[tuple[str, str]]:
+        self._call("tables", database)
+        return [("dbo", f"{database}_table")]
+
+    def get_views(self, conn: Any, database: str | None = None) -> list[tuple[str, str]]:
+        self._call("views", database)
+        if database in self.failing_views:
+            raise PermissionError("denied")
+        return [("dbo", f"{database}_view")]
+
+    def get_procedures(self, conn: Any, database: str | None = None) -> list[str]:
+        self._call("procedures", database)
+        return [f"{database}_proc"]
+
+
+def _provider(inspector: _Inspector, factory: _ConnectionFactory) -> Any:
+    return SimpleNamespace(
+        schema_inspector=inspector,
+        connection_factory=factory,
+        capabilities=SimpleNamespace(supports_cross_database_queries=True),
+        post_connect=lambda conn, config: None,
+    )
+
+
+def _config() -> ConnectionConfig:
+    return ConnectionConfig.from_dict({"name": "mssql", "db_type": "mssql", "server": "db", "port": "1433"})
+
+
+DATABASES = [f"db{i}" for i in range(8)]
+
+
+def test_prioritize_databases_moves_current_first():
+    assert prioritize_databases(["a", "b", "C"], "c") == ["C", "a", "b"]
+    assert prioritize_databases(["a", "b"], "missing") == ["a", "b"]
+    assert prioritize_databases(["a", None], None) == ["a", None]
+
+
+def test_concurrency_is_bounded_and_connections_are_reused():
+    inspector = _Inspector(delay=0.01)
+    factory = _ConnectionFactory()
+    indexer = SchemaIndexer(_config(), _provider(inspector, factory), max_connections=3)
+
+    indexed = indexer.run(DATABASES, lambda schema: None)
+
+    assert indexed == len(DATABASES)
+    assert 1 < inspector.max_active <= 3
+    assert len(factory.opened) <= 3
+    assert indexer.connections_opened == len(factory.opened)
+    assert all(conn.closed for conn in factory.opened)
+
+
+def test_current_database_is_indexed_first_and_results_stream():
+    inspector = _Inspector()
+    factory = _ConnectionFactory()
+    indexer = SchemaIndexer(_config(), _provider(inspector, factory), max_connections=1)
+    seen: list[Any] = []
+
+    indexer.run(DATABASES, seen.append, current="db5")
+
+    first = seen[0]
+    assert first.database == "db5"
+    assert sorted(schema.database for schema in seen) == sorted(DATABASES)
+    assert first.tables == [("dbo", "db5_table")]
+    assert first.views == [("dbo", "db5_view")]
+    assert first.procedures == ["db5_proc"]
+
+
+def test_errors_are_reported_per_object_kind():
+    inspector = _Inspector(failing_views={"db1"})
+    indexer = SchemaIndexer(_config(), _provider(inspector, _ConnectionFactory()), max_connections=2)
+    seen: dict[str | None, Any] = {}
+
+    indexer.run(["db0", "db1"], lambda schema: seen.__setitem__(schema.database, schema))
+
+    assert isinstance(seen["db1"].errors["views"], PermissionError)
+    assert seen["db1"].tables == [("dbo", "db1_table")]
+    assert seen["db0"].errors == {}
+
+
+def test_connection_failure_raises_when_nothing_was_indexed():
+    indexer = SchemaIndexer(_config(), _provider(_Inspector(), _ConnectionFactory(fail=True)), max_connections=2)
+
+    with pytest.raises(ConnectionError):
+        indexer.run(DATABASES, lambda schema: None)
+
+
+def test_cancel_skips_remaining_databases():
+    inspector = _Inspector(delay=0.005)
+    factory = _ConnectionFactory()
+    indexer = SchemaIndexer(_config(), _provider(inspector, factory), max_connections=1)
+    seen: list[Any] = []
+
+    def on_database(schema: Any) -> None:
+        seen.append(schema)
+        indexer.cancel()
+
+    assert indexer.run(DATABASES, on_database) == 1
+    assert len(seen) == 1
+    assert all(conn.closed for conn in factory.opened)
@@ -0,0 +1,192 @@
+"""Tests for single-connection script execution."""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import replace
+from typing import Any
+
+import pytest
+
+from sqlit.domains.connections.domain.config import ConnectionConfig
+from sqlit.domains.connections.providers.catalog import get_provider
+from sqlit.domains.connections.providers.sqlite.adapter import SQLiteAdapter
+from sqlit.domains.query.app.multi_statement import split_statements
+from sqlit.domains.query.app.query_service import NonQueryResult, QueryResult
+from sqlit.domains.query.app.script_runner import (
+    MAX_INSERT_BATCH_ROWS,
+    ScriptRunner,
+    can_run_as_script,
+    is_batchable_dml,
+    parse_single_row_insert,
+)
+
+
+class _CountingAdapter(SQLiteAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.connects = 0
+        self.non_queries: list[str] = []
+
+    def connect(self, config: ConnectionConfig) -> Any:
+        self.connects += 1
+        return super().connect(config)
+
+    def execute_non_query(self, conn: Any, query: str) -> int:
+        self.non_queries.append(query)
+        return super().execute_non_query(conn, query)
+
+
+class _BatchingAdapter(_CountingAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def execute_non_query_batch(self, conn: Any, statements: list[str]) -> list[int]:
+        self.batches.append(list(statements))
+        conn.execute("SAVEPOINT batch")
+        try:
+            counts = [conn.execute(statement).rowcount for statement in statements]
+        except Exception:
+            conn.execute("ROLLBACK TO batch")
+            conn.execute("RELEASE batch")
+            raise
+        conn.execute("RELEASE batch")
+        conn.commit()
+        return counts
+
+
+def _sqlite_setup(tmp_path, adapter: SQLiteAdapter) -> tuple[ConnectionConfig, Any, str]:
+    path = tmp_path / "script.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    conn.close()
+    config = ConnectionConfig.from_dict({"name": "script", "db_type": "sqlite", "file_path": str(path)})
+    provider = replace(get_provider("sqlite"), connection_factory=adapter, query_executor=adapter)
+    return config, provider, str(path)
+
+
+def _count(path: str, sql: str = "SELECT COUNT(*) FROM t") -> Any:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(sql).fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestStatementShapes:
+    def test_parses_single_row_insert(self):
+        assert parse_single_row_insert("INSERT INTO t (id, name) VALUES (1, 'a;b)')") == (
+            "INSERT INTO t (id, name) VALUES",
+            "(1, 'a;b)')",
+        )
+        assert parse_single_row_insert('insert  into "s"."t"\nvalues (lower(\'X\'))') == (
+            'insert into "s"."t" values',
+            "(lower('X'))",
+        )
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "INSERT INTO t VALUES (1), (2)",
+            "INSERT INTO t VALUES (1) ON CONFLICT DO NOTHING",
+            "INSERT INTO t VALUES (1) RETURNING id",
+            "INSERT INTO t SELECT * FROM u",
+            "INSERT INTO t VALUES ('unterminated",
+            "UPDATE t SET name = 'x'",
+        ],
+    )
+    def test_rejects_other_statements(self, statement):
+        assert parse_single_row_insert(statement) is None
+
+    def test_batchable_dml(self):
+        assert is_batchable_dml("update t set name = 'x'")
+        assert is_batchable_dml("DELETE FROM t WHERE id = 1")
+        assert not is_batchable_dml("DELETE FROM t RETURNING id")
+        assert not is_batchable_dml("SELECT 1")
+        assert not is_batchable_dml("CREATE TABLE u (id INT)")
+
+    def test_transaction_scripts_are_left_to_transaction_executor(self):
+        assert can_run_as_script(["INSERT INTO t VALUES (1)", "SELECT 1"])
+        assert not can_run_as_script(["BEGIN", "INSERT INTO t VALUES (1)", "COMMIT"])
+
+
+class TestScriptRunner:
+    def test_runs_script_on_one_connection_with_multi_row_inserts(self, tmp_path):
+        adapter = _CountingAdapter()
+        config, provider, path = _sqlite_setup(tmp_path, adapter)
+        count = MAX_INSERT_BATCH_ROWS + 100
+        statements = [f"INSERT INTO t (id, name) VALUES ({i}, 'n{i}')" for i in range(count)]
+        statements += ["UPDATE t SET name = 'x' WHERE id < 10", "SELECT COUNT(*) FROM t"]
+
+        result = ScriptRunner(config, provider).run(statements)
+
+        assert result.completed and not result.has_error
+        assert len(result.results) == len(statements)
+        assert adapter.connects == 1
+        assert len(adapter.non_queries) == 3
+        assert all(r.result == NonQueryResult(rows_affected=1) for r in result.results[:count])
+        assert result.results[count].result == NonQueryResult(rows_affected=10)
+        select = result.results[-1].result
+        assert isinstance(select, QueryResult) and list(select.rows) == [(count,)]
+        assert [r.statement for r in result.results] == statements
+        assert _count(path) == count
+
+    def test_failed_insert_run_reports_the_failing_statement(self, tmp_path):
+        adapter = _CountingAdapter()
+        config, provider, path = _sqlite_setup(tmp_path, adapter)
+        statements = [f"INSERT INTO t (id, name) VALUES ({i}, 'n')" for i in range(10)]
+        statements[7] = "INSERT INTO t (id, name) VALUES (3, 'dup')"
+        statements.append("INSERT INTO t (id, name) VALUES (99, 'never')")
+
+        result = ScriptRunner(config, provider).run(statements)
+
+        assert result.completed is False
+        assert result.error_index == 7
+        assert len(result.results) == 8
+        assert "UNIQUE" in (result.results[7].error or "")
+        assert _count(path) == 7
+
+    def test_dml_batches_use_batch_executor(self, tmp_path):
+        adapter = _BatchingAdapter()
+        config, provider, path = _sqlite_setup(tmp_path, adapter)
+        provider = replace(provider, capabilities=replace(provider.capabilities, supports_multi_row_insert=False))
+        statements = split_statements(
+            "INSERT INTO t VALUES (1, 'a'); INSERT INTO t VALUES (2, 'b'); "
+            "UPDATE t SET name = 'z' WHERE id = 2; SELECT name FROM t ORDER BY id; DELETE FROM t WHERE id = 1"
+        )
+
+        result = ScriptRunner(config, provider).run(statements)
+
+        assert not result.has_error
+        assert adapter.batches == [statements[:3]]
+        assert [r.result.rows_affected for r in result.results[:3]] == [1, 1, 1]
+        assert list(result.results[3].result.rows) == [("a",), ("z",)]
+        assert _count(path, "SELECT name FROM t") == "z"
+
+    def test_failed_dml_batch_is_replayed_statement_by_statement(self, tmp_path):
+        adapter = _BatchingAdapter()
+        config, provider, path = _sqlite_setup(tmp_path, adapter)
+        provider = replace(provider, capabilities=replace(provider.capabilities, supports_multi_row_insert=False))
+        statements = [
+            "INSERT INTO t VALUES (1, 'a')",
+            "UPDATE t SET name = 'b' WHERE id = 1",
+            "INSERT INTO t VALUES (1, 'dup')",
+        ]
+
+        result = ScriptRunner(config, provider).run(statements)
+
+        assert result.error_index == 2
+        assert [r.success for r in result.results] == [True, True, False]
+        assert _count(path, "SELECT name FROM t") == "b"
+
+    def test_reports_progress_per_group(self, tmp_path):
+        adapter = _CountingAdapter()
+        config, provider, _path = _sqlite_setup(tmp_path, adapter)
+        statements = [f"INSERT INTO t VALUES ({i}, 'n')" for i in range(5)] + ["SELECT 1", "SELECT 2"]
+        progress: list[tuple[int, int]] = []
+
+        ScriptRunner(config, provider).run(statements, on_progress=lambda i, rs: progress.append((i, len(rs))))
+
+        assert progress == [(0, 5), (5, 1), (6, 1)]
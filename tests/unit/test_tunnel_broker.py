@@ -0,0 +1,172 @@
+"""Tests for the shared SSH tunnel broker."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from sqlit.domains.connections.app import tunnel_broker
+from sqlit.domains.connections.app.tunnel_broker import TunnelBroker, tunnel_key
+from sqlit.domains.connections.domain.config import ConnectionConfig
+
+
+class _FakeForwarder:
+    _next_port = 40000
+
+    def __init__(self) -> None:
+        _FakeForwarder._next_port += 1
+        self.local_bind_port = _FakeForwarder._next_port
+        self.is_active = True
+        self.stopped = False
+
+    def stop(self) -> None:
+        self.stopped = True
+        self.is_active = False
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _config(server: str = "db.internal", ssh_host: str = "bastion", ssh: bool = True) -> ConnectionConfig:
+    payload: dict[str, Any] = {"name": "remote", "db_type": "postgresql", "server": server, "port": "5432"}
+    if ssh:
+        payload.update(
+            {
+                "ssh_enabled": True,
+                "ssh_host": ssh_host,
+                "ssh_username": "u",
+                "ssh_auth_type": "password",
+                "ssh_password": "p",
+            }
+        )
+    return ConnectionConfig.from_dict(payload)
+
+
+@pytest.fixture
+def started() -> list[_FakeForwarder]:
+    return []
+
+
+@pytest.fixture
+def clock() -> _FakeClock:
+    return _FakeClock()
+
+
+@pytest.fixture
+def broker(started: list[_FakeForwarder], clock: _FakeClock):
+    def start(_config: ConnectionConfig, keepalive_s: float) -> Any:
+        assert keepalive_s == 30.0
+        forwarder = _FakeForwarder()
+        started.append(forwarder)
+        return forwarder
+
+    broker = TunnelBroker(start_tunnel=start, clock=clock)
+    yield broker
+    broker.close_all()
+
+
+class TestTunnelKey:
+    def test_no_tunnel_has_no_key(self):
+        assert tunnel_key(_config(ssh=False)) is None
+
+    def test_key_includes_remote_endpoint(self):
+        assert tunnel_key(_config("a")) != tunnel_key(_config("b"))
+        assert tunnel_key(_config("a")) == tunnel_key(_config("a"))
+
+
+class TestTunnelBroker:
+    def test_without_ssh_returns_original_endpoint(self, broker, started):
+        assert broker.acquire(_config(ssh=False)) == (None, "db.internal", 5432)
+        assert started == []
+
+    def test_reuses_tunnel_for_same_key(self, broker, started):
+        first, host, port = broker.acquire(_config())
+        second, _, second_port = broker.acquire(_config())
+
+        assert len(started) == 1
+        assert host == "127.0.0.1"
+        assert port == second_port == started[0].local_bind_port
+        assert broker.stats.reused == 1
+
+        first.stop()
+        first.stop()
+        assert not started[0].stopped
+        second.stop()
+        assert not started[0].stopped
+        assert broker.open_tunnels == 1
+
+    def test_idle_tunnel_expires_after_ttl(self, broker, started, clock):
+        lease, _, _ = broker.acquire(_config())
+        lease.stop()
+
+        clock.now = broker.idle_ttl_s - 1
+        assert broker.prune() == 0
+        clock.now = broker.idle_ttl_s
+        assert broker.prune() == 1
+        assert started[0].stopped
+        assert broker.open_tunnels == 0
+
+    def test_reacquire_before_ttl_cancels_expiry(self, broker, started, clock):
+        lease, _, _ = broker.acquire(_config())
+        lease.stop()
+        clock.now = broker.idle_ttl_s - 1
+        lease, _, _ = broker.acquire(_config())
+        clock.now = broker.idle_ttl_s * 3
+
+        assert broker.prune() == 0
+        assert len(started) == 1
+        lease.stop()
+
+    def test_keeps_several_tunnels_open(self, broker, started):
+        a, _, port_a = broker.acquire(_config("a"))
+        b, _, port_b = broker.acquire(_config("b"))
+        c, _, _ = broker.acquire(_config("a", ssh_host="other-bastion"))
+
+        assert len(started) == 3
+        assert port_a != port_b
+        assert broker.open_tunnels == 3
+        for lease in (a, b, c):
+            lease.stop()
+
+    def test_recreates_dead_tunnel(self, broker, started):
+        lease, _, _ = broker.acquire(_config())
+        started[0].is_active = False
+
+        assert not lease.is_active
+        replacement, _, port = broker.acquire(_config())
+
+        assert len(started) == 2
+        assert started[0].stopped
+        assert port == started[1].local_bind_port
+        lease.stop()
+        replacement.stop()
+        assert broker.open_tunnels == 1
+
+    def test_close_all_stops_leased_tunnels(self, broker, started):
+        broker.acquire(_config())
+        broker.close_all()
+        assert started[0].stopped
+        assert broker.open_tunnels == 0
+
+
+def test_worker_requests_use_main_process_tunnel(monkeypatch, broker, started):
+    from sqlit.domains.process_worker.app.process_worker_client import _worker_config
+
+    monkeypatch.setattr(tunnel_broker, "_broker", broker)
+
+    with _worker_config(_config()) as worker_config:
+        assert worker_config.tunnel is None or not worker_config.tunnel.enabled
+        assert worker_config.tcp_endpoint.host == "127.0.0.1"
+        assert worker_config.tcp_endpoint.port == str(started[0].local_bind_port)
+        assert broker._entries[tunnel_key(_config())].refs == 1
+
+    assert broker._entries[tunnel_key(_config())].refs == 0
+    with _worker_config(_config(ssh=False)) as worker_config:
+        assert worker_config.tcp_endpoint.host == "db.internal"
+    assert len(started) == 1